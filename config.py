@@ -96,6 +96,75 @@ class Config:
     CACHE_PLAYLIST_TTL = 60  # 1 minute for playlist data (changes frequently)
     CACHE_USER_TTL = 600  # 10 minutes for user profile data
     CACHE_AUDIO_FEATURES_TTL = 86400  # 24 hours for audio features (rarely change)
+    # Track lists keyed by snapshot_id are revalidated with one small
+    # request instead of expiring, so they can be kept far longer than
+    # CACHE_PLAYLIST_TTL.
+    CACHE_PLAYLIST_SNAPSHOT_TTL = int(
+        os.getenv("CACHE_PLAYLIST_SNAPSHOT_TTL", "86400")
+    )
+    # Per-playlist URI sets for raid dedupe, tagged with the snapshot_id
+    # they match. Our own playlist writes update them in place; a playlist
+    # changed anywhere else is re-read on its next raid. The TTL counts
+    # from each full rebuild, which bounds how long updates from our own
+    # writes are trusted.
+    CACHE_URI_INDEX_ENABLED = (
+        os.getenv("CACHE_URI_INDEX_ENABLED", "true").lower() == "true"
+    )
+    CACHE_URI_INDEX_TTL = int(os.getenv("CACHE_URI_INDEX_TTL", "86400"))
+    # Cached value encoding: "json" or "msgpack", optionally "+zlib".
+    # If msgpack cannot be imported the cache falls back to json+zlib.
+    # Track lists are projected to the fields the app reads before caching.
+    # Either setting changes the key format tag, so switching starts a
+    # fresh keyspace and old entries expire on their TTL.
+    CACHE_CODEC = os.getenv("CACHE_CODEC", "msgpack+zlib")
+    CACHE_TRACK_PROJECTION = (
+        os.getenv("CACHE_TRACK_PROJECTION", "true").lower() == "true"
+    )
+    # In-process tier in front of Redis: repeat reads in one worker skip
+    # the round trip. Bounded by total bytes; entries live at most
+    # CACHE_LOCAL_TTL seconds, and invalidations reach every worker over
+    # Redis pub/sub.
+    CACHE_LOCAL_TIER_ENABLED = (
+        os.getenv("CACHE_LOCAL_TIER_ENABLED", "true").lower() == "true"
+    )
+    CACHE_LOCAL_MAX_BYTES = int(
+        os.getenv("CACHE_LOCAL_MAX_BYTES", str(32 * 1024 * 1024))
+    )
+    CACHE_LOCAL_TTL = int(os.getenv("CACHE_LOCAL_TTL", "15"))
+
+    # Spotify rate governor: one token bucket that every Spotify Web API
+    # request passes through, shared across workers via Redis when it is
+    # available. A 429's Retry-After parks every thread, not just the one
+    # that received it. Spotify does not publish its limit (a rolling 30s
+    # window per app), so the defaults are conservative and tunable.
+    SPOTIFY_RATE_LIMIT_ENABLED = (
+        os.getenv("SPOTIFY_RATE_LIMIT_ENABLED", "true").lower() == "true"
+    )
+    SPOTIFY_RATE_LIMIT_PER_SECOND = float(
+        os.getenv("SPOTIFY_RATE_LIMIT_PER_SECOND", "6")
+    )
+    SPOTIFY_RATE_LIMIT_BURST = int(os.getenv("SPOTIFY_RATE_LIMIT_BURST", "30"))
+
+    # Single-flight reads: concurrent cache misses for one playlist share a
+    # single Spotify fetch instead of each paging it in. In-process always;
+    # across workers too (a Redis lock per playlist) when SINGLE_FLIGHT_REDIS
+    # is true and Redis is available.
+    SPOTIFY_SINGLE_FLIGHT_ENABLED = (
+        os.getenv("SPOTIFY_SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+    )
+    SPOTIFY_SINGLE_FLIGHT_REDIS = (
+        os.getenv("SPOTIFY_SINGLE_FLIGHT_REDIS", "false").lower() == "true"
+    )
+    SPOTIFY_SINGLE_FLIGHT_WAIT = float(os.getenv("SPOTIFY_SINGLE_FLIGHT_WAIT", "30"))
+
+    # Access-token cache: the most recent Spotify access token per user,
+    # Fernet-encrypted, kept until REFRESH_MARGIN seconds before it expires
+    # so scheduled jobs and web requests reuse it instead of each refreshing
+    # against accounts.spotify.com. Shared through Redis when available.
+    ACCESS_TOKEN_CACHE_ENABLED = (
+        os.getenv("ACCESS_TOKEN_CACHE_ENABLED", "true").lower() == "true"
+    )
+    ACCESS_TOKEN_REFRESH_MARGIN = int(os.getenv("ACCESS_TOKEN_REFRESH_MARGIN", "120"))
 
     # Source resolver — HTTP timeout (seconds) for public Spotify scrapes.
     # Tunable per-environment so production can dial down latency budget
@@ -103,6 +172,38 @@ class Config:
     # module since they're stable algorithmic knobs, not ops controls.
     SOURCE_RESOLVER_TIMEOUT = int(os.getenv("SOURCE_RESOLVER_TIMEOUT", "10"))
 
+    # Source resolver — raids resolve their upstream sources on a bounded
+    # pool. A source that takes longer than SOURCE_DEADLINE seconds, or is
+    # still running when the raid has spent JOB_DEADLINE seconds resolving,
+    # is reported as failed and the raid continues with the rest. Set
+    # MAX_WORKERS to 1 to resolve sources one after another.
+    SOURCE_RESOLVER_MAX_WORKERS = int(os.getenv("SOURCE_RESOLVER_MAX_WORKERS", "4"))
+    SOURCE_RESOLVER_SOURCE_DEADLINE = float(
+        os.getenv("SOURCE_RESOLVER_SOURCE_DEADLINE", "60")
+    )
+    SOURCE_RESOLVER_JOB_DEADLINE = float(
+        os.getenv("SOURCE_RESOLVER_JOB_DEADLINE", "180")
+    )
+    # Before resolving, a raid asks each playlist source for its current
+    # snapshot_id (or checks the scrape cache's content hash) and skips
+    # sources that haven't changed and had nothing new left last time.
+    RAID_SKIP_UNCHANGED_SOURCES = (
+        os.getenv("RAID_SKIP_UNCHANGED_SOURCES", "true").lower() == "true"
+    )
+    # Public scraper hedging. For a playlist whose embed page has returned
+    # tracks less than EMBED_SUCCESS_BELOW of the time recently (over at
+    # least MIN_SAMPLES scrapes) while the public page did better, the
+    # public page is also requested if the embed hasn't answered within
+    # HEDGE_DELAY seconds; the first to return tracks wins.
+    SCRAPER_HEDGE_ENABLED = (
+        os.getenv("SCRAPER_HEDGE_ENABLED", "true").lower() == "true"
+    )
+    SCRAPER_HEDGE_DELAY = float(os.getenv("SCRAPER_HEDGE_DELAY", "1.0"))
+    SCRAPER_HEDGE_EMBED_SUCCESS_BELOW = float(
+        os.getenv("SCRAPER_HEDGE_EMBED_SUCCESS_BELOW", "0.8")
+    )
+    SCRAPER_HEDGE_MIN_SAMPLES = int(os.getenv("SCRAPER_HEDGE_MIN_SAMPLES", "5"))
+
     # Database configuration
     SQLALCHEMY_DATABASE_URI = _resolve_database_url("sqlite:///shuffify.db")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
@@ -120,6 +221,43 @@ class Config:
     # Scheduler configuration
     SCHEDULER_ENABLED = True
     SCHEDULER_THREAD_POOL_SIZE = int(os.getenv("SCHEDULER_THREAD_POOL_SIZE", "10"))
+    # Sharded scheduling (PostgreSQL only): every worker runs a scheduler for
+    # the schedules in the shards it holds, instead of one process winning
+    # the scheduler lock and running everything. Schedules hash into
+    # SHARD_COUNT shards by target playlist; workers rebalance their share
+    # every REBALANCE_SECONDS, which is also how long a schedule change made
+    # in another process, or a dead worker's shards, take to be picked up.
+    SCHEDULER_SHARDING_ENABLED = (
+        os.getenv("SCHEDULER_SHARDING_ENABLED", "false").lower() == "true"
+    )
+    SCHEDULER_SHARD_COUNT = int(os.getenv("SCHEDULER_SHARD_COUNT", "64"))
+    SCHEDULER_SHARD_REBALANCE_SECONDS = int(
+        os.getenv("SCHEDULER_SHARD_REBALANCE_SECONDS", "30")
+    )
+    # Firing-time smoothing: each schedule fires a deterministic offset into
+    # a JITTER_WINDOW_SECONDS window after its trigger time, in slots of
+    # JITTER_SLOT_SECONDS. At most FIRE_BUDGET schedules due in the same
+    # minute share a slot (defaults to SCHEDULER_THREAD_POOL_SIZE). A window
+    # of 0 fires every schedule exactly on its trigger.
+    SCHEDULER_JITTER_WINDOW_SECONDS = int(
+        os.getenv("SCHEDULER_JITTER_WINDOW_SECONDS", "300")
+    )
+    SCHEDULER_JITTER_SLOT_SECONDS = int(
+        os.getenv("SCHEDULER_JITTER_SLOT_SECONDS", "60")
+    )
+    SCHEDULER_FIRE_BUDGET = int(os.getenv("SCHEDULER_FIRE_BUDGET", "0")) or None
+    # Fair-share dispatch: APScheduler only enqueues due jobs, and
+    # SCHEDULER_THREAD_POOL_SIZE dispatcher workers run them, alternating
+    # between users and favouring cheap job types by weight
+    # ("shuffle=4,raid=1"; unlisted types keep their defaults). Raids never
+    # hold the last RESERVED_LIGHT_WORKERS workers.
+    SCHEDULER_FAIR_SHARE_ENABLED = (
+        os.getenv("SCHEDULER_FAIR_SHARE_ENABLED", "true").lower() == "true"
+    )
+    SCHEDULER_JOB_TYPE_WEIGHTS = os.getenv("SCHEDULER_JOB_TYPE_WEIGHTS", "")
+    SCHEDULER_RESERVED_LIGHT_WORKERS = int(
+        os.getenv("SCHEDULER_RESERVED_LIGHT_WORKERS", "1")
+    )
 
     # Application settings
     DEBUG = False
@@ -213,6 +351,15 @@ class TestConfig(Config):
     SESSION_COOKIE_SECURE = False
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
     SCHEDULER_ENABLED = False
+    # A process-global governor would carry one test's bucket into the next.
+    SPOTIFY_RATE_LIMIT_ENABLED = False
+    # Likewise a process-global token cache would hand one test's token to
+    # the next test that uses the same Spotify user ID.
+    ACCESS_TOKEN_CACHE_ENABLED = False
+    # And a process-global local cache tier (plus its pub/sub listener).
+    CACHE_LOCAL_TIER_ENABLED = False
+    # And a process-global single-flight table.
+    SPOTIFY_SINGLE_FLIGHT_ENABLED = False
 
 
 # Dictionary for easy config selection
@@ -0,0 +1,35 @@
+"""Store HTTP validators on scraped_playlist_cache
+
+Adds etag / last_modified so an expired scrape can be revalidated with a
+conditional request instead of downloading and parsing the page again.
+
+Revision ID: a8b9c0d1e2f3
+Revises: f7a8b9c0d1e2
+Create Date: 2026-10-16 00:00:01.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a8b9c0d1e2f3"
+down_revision = "f7a8b9c0d1e2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("scraped_playlist_cache", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("etag", sa.String(length=255), nullable=True)
+        )
+        batch_op.add_column(
+            sa.Column("last_modified", sa.String(length=64), nullable=True)
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("scraped_playlist_cache", schema=None) as batch_op:
+        batch_op.drop_column("last_modified")
+        batch_op.drop_column("etag")
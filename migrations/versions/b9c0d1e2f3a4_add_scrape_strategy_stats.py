@@ -0,0 +1,38 @@
+"""Add scrape_strategy_stats table
+
+Per-playlist success rates of the embed and public-page scrape
+strategies, used to decide when to hedge the embed request.
+
+Revision ID: b9c0d1e2f3a4
+Revises: a8b9c0d1e2f3
+Create Date: 2026-10-16 00:00:02.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b9c0d1e2f3a4"
+down_revision = "a8b9c0d1e2f3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "scrape_strategy_stats",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("playlist_id", sa.String(length=255), nullable=False),
+        sa.Column("embed_success_rate", sa.Float(), nullable=False),
+        sa.Column("embed_samples", sa.Integer(), nullable=False),
+        sa.Column("public_page_success_rate", sa.Float(), nullable=False),
+        sa.Column("public_page_samples", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("playlist_id"),
+    )
+
+
+def downgrade():
+    op.drop_table("scrape_strategy_stats")
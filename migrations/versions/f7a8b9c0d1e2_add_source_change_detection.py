@@ -0,0 +1,56 @@
+"""Record upstream versions for raid change detection
+
+Adds upstream_sources.last_content_version / last_fresh_count and
+scraped_playlist_cache.content_hash, so a raid can tell a source hasn't
+changed since its last resolve without resolving it again.
+
+Revision ID: f7a8b9c0d1e2
+Revises: e6f7a8b9c0d1
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f7a8b9c0d1e2"
+down_revision = "e6f7a8b9c0d1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("upstream_sources", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "last_content_version",
+                sa.String(length=255),
+                nullable=True,
+            )
+        )
+        batch_op.add_column(
+            sa.Column(
+                "last_fresh_count",
+                sa.Integer(),
+                nullable=True,
+            )
+        )
+
+    with op.batch_alter_table("scraped_playlist_cache", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "content_hash",
+                sa.String(length=64),
+                nullable=True,
+            )
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("scraped_playlist_cache", schema=None) as batch_op:
+        batch_op.drop_column("content_hash")
+
+    with op.batch_alter_table("upstream_sources", schema=None) as batch_op:
+        batch_op.drop_column("last_fresh_count")
+        batch_op.drop_column("last_content_version")
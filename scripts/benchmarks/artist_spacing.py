@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Benchmark ArtistSpacingShuffle's cooldown engine against the list version.
+
+The original engine rebuilt its ``cooldown`` list on every placement and,
+when every artist was blocked, sorted it and ``pop(0)``-ed the head. The
+current engine keeps the cooldown in a FIFO deque (release times only
+grow), so each placement is one heap operation.
+
+At most one artist enters the cooldown per placement and each leaves after
+``min_spacing`` placements, so the list never held more than ``min_spacing``
+(<= 10) entries: the old cost was O(n * min_spacing), not O(n * artists).
+Expect a constant-factor gain that grows with ``--min-spacing`` and with
+how often every artist is blocked (few artists), not an asymptotic one.
+
+``legacy_schedule`` below is a frozen copy of the original loop, kept here
+rather than in the package so production code carries one engine. Both
+engines draw the same random numbers in the same order, so for one seed
+they must produce the same playlist; the script checks that before timing
+anything, which makes it a correctness check as well as a benchmark.
+
+Usage:
+    python scripts/benchmarks/artist_spacing.py
+    python scripts/benchmarks/artist_spacing.py --sizes 1000 10000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import pathlib
+import random
+import sys
+import time
+from collections import defaultdict
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from shuffify.shuffle_algorithms.artist_spacing import ArtistSpacingShuffle  # noqa: E402
+
+DEFAULT_SIZES = (1_000, 10_000, 50_000)
+
+
+def legacy_schedule(artist_tracks, min_spacing):
+    """The pre-deque placement loop, verbatim apart from the dead window."""
+    heap = []
+    for artist, tracks_list in artist_tracks.items():
+        heapq.heappush(heap, (-len(tracks_list), random.random(), artist))
+
+    result = []
+    cooldown = []
+
+    while heap or cooldown:
+        still_waiting = []
+        for wait_until, entry in cooldown:
+            if len(result) >= wait_until:
+                heapq.heappush(heap, entry)
+            else:
+                still_waiting.append((wait_until, entry))
+        cooldown = still_waiting
+
+        if not heap:
+            cooldown.sort(key=lambda x: x[0])
+            _, entry = cooldown.pop(0)
+            neg_count, _, artist = entry
+        else:
+            neg_count, _, artist = heapq.heappop(heap)
+
+        chosen = artist_tracks[artist].pop()
+        result.append(chosen)
+
+        remaining_count = -neg_count - 1
+        if remaining_count > 0:
+            release_at = len(result) + min_spacing
+            cooldown.append((release_at, (-remaining_count, random.random(), artist)))
+
+    return result
+
+
+def make_artist_tracks(size, artists, seed):
+    """Group ``size`` synthetic URIs under ``artists`` artists, skewed."""
+    rng = random.Random(seed)
+    # A few prolific artists and a long tail, like a real large playlist.
+    weights = [1.0 / (rank + 1) for rank in range(artists)]
+    groups = defaultdict(list)
+    for i in range(size):
+        artist = rng.choices(range(artists), weights)[0]
+        groups[f"Artist {artist}"].append(f"spotify:track:{i:07d}")
+    return dict(groups)
+
+
+def _copy(groups):
+    return {artist: list(uris) for artist, uris in groups.items()}
+
+
+def time_engine(engine, groups, min_spacing, repeat, seed):
+    best = float("inf")
+    for _ in range(repeat):
+        work = _copy(groups)
+        random.seed(seed)
+        start = time.perf_counter()
+        engine(work, min_spacing)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--artists", type=int, default=0, help="distinct artists (default: size // 5)")
+    parser.add_argument("--min-spacing", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+
+    current = ArtistSpacingShuffle._schedule
+    print(f"{'tracks':>8} {'artists':>8} {'legacy s':>10} {'deque s':>10} {'speedup':>8}")
+    for size in args.sizes:
+        artists = args.artists or max(1, size // 5)
+        groups = make_artist_tracks(size, artists, args.seed)
+
+        random.seed(args.seed)
+        expected = legacy_schedule(_copy(groups), args.min_spacing)
+        random.seed(args.seed)
+        actual = current(_copy(groups), args.min_spacing)
+        if actual != expected:
+            print(f"engines disagree at {size} tracks", file=sys.stderr)
+            return 1
+
+        legacy = time_engine(legacy_schedule, groups, args.min_spacing, args.repeat, args.seed)
+        fast = time_engine(current, groups, args.min_spacing, args.repeat, args.seed)
+        print(f"{size:>8} {artists:>8} {legacy:>10.3f} {fast:>10.3f} {legacy / fast:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""Benchmark the scraper's streaming URI extraction against the old one.
+
+The original extractor cut the __NEXT_DATA__ blob out with one regex,
+``json.loads``-ed all of it and walked the tree; on a miss it ran a second
+regex over every <script> block (parsing each one with "trackList" in it)
+and then a third scan of the whole document for raw URIs and /track/
+links. A public page with no structured tracks paid for all three passes.
+The current extractor (``_scan_scripts``) searches the page for its
+landmarks (the __NEXT_DATA__ tag, "trackList" keys) and decodes only the
+candidate track arrays; the regex pass still runs only when both
+structured strategies find nothing.
+
+A literal single pass, one alternation regex for every landmark, was
+tried first: CPython's ``re`` can't skip ahead on an alternation with no
+common literal prefix and ran at about a third of the legacy speed.
+
+``legacy_extract_uris`` below is a frozen copy of the original strategies,
+kept here rather than in the package so production code carries one
+extractor. Every page in the saved corpus
+(tests/services/source_resolver/scraper_pages) is checked against its
+expected URIs with both extractors before anything is timed, so the script
+doubles as an accuracy check.
+
+Throughput is measured on each corpus page padded to ``--sizes`` (KiB)
+with track-free markup and script, since real pages run to megabytes.
+
+Usage:
+    python scripts/benchmarks/scrape_extraction.py
+    python scripts/benchmarks/scrape_extraction.py --sizes 256 4096 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import re
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from shuffify.services.source_resolver.base import find_nested_key  # noqa: E402
+from shuffify.services.source_resolver.public_scraper_pathway import (  # noqa: E402
+    _extract_uris,
+    _get_track_uri_from_item,
+)
+
+CORPUS = ROOT / "tests" / "services" / "source_resolver" / "scraper_pages"
+DEFAULT_SIZES = (256, 2048)
+
+NEXT_DATA_PATTERN = re.compile(
+    r'<script\s+id="__NEXT_DATA__"\s+type="application/json"'
+    r"[^>]*>(.*?)</script>",
+    re.DOTALL,
+)
+TRACK_LIST_SCRIPT_PATTERN = re.compile(r"<script[^>]*>(.*?)</script>", re.DOTALL)
+URI_PATTERN = re.compile(r'"(spotify:track:[a-zA-Z0-9]{22})"')
+URL_PATTERN = re.compile(r"/track/([a-zA-Z0-9]{22})")
+
+
+def legacy_extract_uris(html):
+    """The three-pass extractor, verbatim apart from logging."""
+    return (
+        _legacy_from_next_data(html)
+        or _legacy_from_track_list(html)
+        or _legacy_with_regex(html)
+    )
+
+
+def _legacy_from_next_data(html):
+    match = NEXT_DATA_PATTERN.search(html)
+    if not match:
+        return []
+    try:
+        data = json.loads(match.group(1))
+    except (json.JSONDecodeError, ValueError):
+        return []
+    return _legacy_walk_json_for_tracks(data)
+
+
+def _legacy_from_track_list(html):
+    seen = set()
+    uris = []
+    for script_match in TRACK_LIST_SCRIPT_PATTERN.finditer(html):
+        content = script_match.group(1).strip()
+        if "trackList" not in content:
+            continue
+        try:
+            parsed = json.loads(content)
+        except (json.JSONDecodeError, ValueError):
+            continue
+        if not isinstance(parsed, dict):
+            continue
+        track_list = find_nested_key(parsed, "trackList")
+        if not isinstance(track_list, list):
+            continue
+        for item in track_list:
+            uri = _get_track_uri_from_item(item)
+            if uri and uri not in seen:
+                seen.add(uri)
+                uris.append(uri)
+    return uris
+
+
+def _legacy_with_regex(html):
+    seen = set()
+    uris = []
+    for match in URI_PATTERN.finditer(html):
+        uri = match.group(1)
+        if uri not in seen:
+            seen.add(uri)
+            uris.append(uri)
+    for match in URL_PATTERN.finditer(html):
+        uri = f"spotify:track:{match.group(1)}"
+        if uri not in seen:
+            seen.add(uri)
+            uris.append(uri)
+    return uris
+
+
+def _legacy_walk_json_for_tracks(data):
+    seen = set()
+    uris = []
+
+    def _collect(uri):
+        if uri and uri.startswith("spotify:track:") and uri not in seen:
+            seen.add(uri)
+            uris.append(uri)
+
+    def _walk(node, depth=0):
+        if depth > 20:
+            return
+        if isinstance(node, dict):
+            if "tracks" in node and isinstance(node["tracks"], dict):
+                items = node["tracks"].get("items", [])
+                if isinstance(items, list):
+                    for item in items:
+                        _collect(_get_track_uri_from_item(item))
+                    if uris:
+                        return
+            if "trackList" in node and isinstance(node["trackList"], list):
+                for item in node["trackList"]:
+                    _collect(_get_track_uri_from_item(item))
+                if uris:
+                    return
+            if "items" in node and isinstance(node["items"], list):
+                for item in node["items"]:
+                    _collect(_get_track_uri_from_item(item))
+                if uris:
+                    return
+            for value in node.values():
+                _walk(value, depth + 1)
+                if uris:
+                    return
+        elif isinstance(node, list):
+            for item in node:
+                _walk(item, depth + 1)
+                if uris:
+                    return
+
+    _walk(data)
+    return uris
+
+
+def load_corpus():
+    expected = json.loads((CORPUS / "expected.json").read_text())
+    return {name: ((CORPUS / name).read_text(), uris) for name, uris in sorted(expected.items())}
+
+
+def pad(html, size_kb):
+    """``html`` grown to about ``size_kb`` KiB with track-free content.
+
+    The filler is mostly markup with a large inline script every 64 KiB,
+    roughly the mix of a server-rendered page.
+    """
+    markup = (
+        '<div class="c12"><span>Lorem ipsum dolor sit amet</span>'
+        '<a href="/artist/0000000000000000000000">Artist</a></div>\n'
+    )
+    script = (
+        "<script>!function(e){"
+        + 'var t={"locale":"en","items":[1,2,3]};function n(r){return e[r].call(t,n)}' * 200
+        + "}([]);</script>\n"
+    )
+    block = markup * ((64 * 1024 - len(script)) // len(markup)) + script
+    # Whole blocks only: a cut-off <script> would swallow the page after it.
+    blocks = -(-max(0, size_kb * 1024 - len(html)) // len(block))
+    at = html.index("<body>") + len("<body>")
+    return html[:at] + block * blocks + html[at:]
+
+
+def best_time(extract, html, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract(html)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="padded page sizes, KiB")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    corpus = load_corpus()
+    failed = False
+    for name, (html, expected) in corpus.items():
+        for label, extract in (("legacy", legacy_extract_uris), ("current", _extract_uris)):
+            if extract(html) != expected:
+                print(f"{label} extractor is wrong on {name}", file=sys.stderr)
+                failed = True
+            elif extract(pad(html, max(args.sizes))) != expected:
+                print(f"{label} extractor is wrong on padded {name}", file=sys.stderr)
+                failed = True
+    if failed:
+        return 1
+
+    print(f"{'page':<36} {'KiB':>6} {'legacy MB/s':>12} {'current MB/s':>12} {'speedup':>8}")
+    for size_kb in args.sizes:
+        for name, (html, _) in corpus.items():
+            page = pad(html, size_kb)
+            megabytes = len(page) / 1e6
+            legacy = best_time(legacy_extract_uris, page, args.repeat)
+            fast = best_time(_extract_uris, page, args.repeat)
+            print(
+                f"{name:<36} {len(page) // 1024:>6} {megabytes / legacy:>12.1f} "
+                f"{megabytes / fast:>12.1f} {legacy / fast:>7.1f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,6 +22,10 @@ logger = logging.getLogger(__name__)
 _redis_client: Optional[redis.Redis] = None
 _migrate: Optional[Migrate] = None
 _limiter: Optional[Limiter] = None
+_access_token_cache = None
+_local_cache_tier = None
+# Cache codecs by spec string, resolved lazily (see _get_cache_codec)
+_cache_codecs: dict = {}
 
 
 def _create_redis_client(redis_url: str) -> redis.Redis:
@@ -60,6 +64,16 @@ def get_limiter() -> Optional[Limiter]:
     return _limiter
 
 
+def get_access_token_cache():
+    """
+    Get the per-user Spotify access-token cache.
+
+    Returns:
+        AccessTokenCache if enabled, None otherwise.
+    """
+    return _access_token_cache
+
+
 def get_spotify_cache():
     """
     Get a SpotifyCache instance for Spotify API caching.
@@ -80,6 +94,7 @@ def get_spotify_cache():
     from flask import current_app
 
     from shuffify.spotify.cache import SpotifyCache
+    from shuffify.spotify.cache_codec import DEFAULT_CODEC
 
     # Get TTL settings from config if available
     try:
@@ -91,10 +106,37 @@ def get_spotify_cache():
             playlist_ttl=config.get("CACHE_PLAYLIST_TTL", 60),
             user_ttl=config.get("CACHE_USER_TTL", 600),
             audio_features_ttl=config.get("CACHE_AUDIO_FEATURES_TTL", 86400),
+            snapshot_ttl=config.get("CACHE_PLAYLIST_SNAPSHOT_TTL", 86400),
+            codec=_get_cache_codec(config.get("CACHE_CODEC", DEFAULT_CODEC)),
+            project_tracks=config.get("CACHE_TRACK_PROJECTION", True),
+            local_tier=_local_cache_tier,
+            uri_index=config.get("CACHE_URI_INDEX_ENABLED", True),
+            uri_index_ttl=config.get("CACHE_URI_INDEX_TTL", 86400),
         )
     except RuntimeError:
-        # Not in Flask context - use defaults
-        return SpotifyCache(_redis_client)
+        # Not in Flask context - use defaults. The codec and projection
+        # must match the configured defaults, or this caller would read
+        # and write a different keyspace from everyone else.
+        return SpotifyCache(
+            _redis_client,
+            codec=_get_cache_codec(DEFAULT_CODEC),
+            project_tracks=True,
+            local_tier=_local_cache_tier,
+        )
+
+
+def _get_cache_codec(spec):
+    """Resolve a cache codec spec once per process.
+
+    get_spotify_cache runs per request; resolving (and, without msgpack,
+    logging the fallback) every time would be wasted work and log noise.
+    """
+    codec = _cache_codecs.get(spec)
+    if codec is None:
+        from shuffify.spotify.cache_codec import resolve_codec
+
+        codec = _cache_codecs[spec] = resolve_codec(spec)
+    return codec
 
 
 def is_db_available() -> bool:
@@ -196,6 +238,115 @@ def _init_limiter(app, redis_client):
         return None
 
 
+def _init_rate_governor(app, redis_client):
+    """Install the process-wide Spotify rate governor.
+
+    Shares its bucket through Redis when a client is available, otherwise
+    governs this process only. Disabled entirely when
+    SPOTIFY_RATE_LIMIT_ENABLED is false, in which case requests are sent
+    immediately and rate limits are learned from 429s as before.
+    """
+    from shuffify.spotify.http_client import set_rate_governor
+    from shuffify.spotify.rate_governor import RateGovernor
+
+    if not app.config.get("SPOTIFY_RATE_LIMIT_ENABLED", False):
+        set_rate_governor(None)
+        logger.info("Spotify rate governor disabled by configuration")
+        return None
+
+    governor = RateGovernor(
+        rate=app.config.get("SPOTIFY_RATE_LIMIT_PER_SECOND", 6),
+        burst=app.config.get("SPOTIFY_RATE_LIMIT_BURST", 30),
+        redis_client=redis_client,
+    )
+    set_rate_governor(governor)
+    logger.info(
+        "Spotify rate governor enabled (%s/s, burst %s, backend=%s)",
+        app.config.get("SPOTIFY_RATE_LIMIT_PER_SECOND", 6),
+        app.config.get("SPOTIFY_RATE_LIMIT_BURST", 30),
+        governor.backend,
+    )
+    return governor
+
+
+def _init_single_flight(app, redis_client):
+    """Install the process-wide single-flight table for Spotify reads.
+
+    Coalesces within this process, and across workers through Redis when
+    SPOTIFY_SINGLE_FLIGHT_REDIS is true and a client is available.
+    Disabled when SPOTIFY_SINGLE_FLIGHT_ENABLED is false.
+    """
+    from shuffify.spotify.single_flight import SingleFlight, set_single_flight
+
+    if not app.config.get("SPOTIFY_SINGLE_FLIGHT_ENABLED", False):
+        set_single_flight(None)
+        return None
+
+    use_redis = app.config.get("SPOTIFY_SINGLE_FLIGHT_REDIS", False)
+    flight = SingleFlight(
+        redis_client=redis_client if use_redis else None,
+        wait_timeout=app.config.get("SPOTIFY_SINGLE_FLIGHT_WAIT", 30),
+    )
+    set_single_flight(flight)
+    logger.info("Spotify single-flight reads enabled (backend=%s)", flight.backend)
+    return flight
+
+
+def _init_access_token_cache(app, redis_client):
+    """Create the per-user access-token cache.
+
+    Shared through Redis when a client is available, otherwise held in this
+    process. Disabled when ACCESS_TOKEN_CACHE_ENABLED is false, in which
+    case every scheduled job refreshes its token as before.
+    """
+    from shuffify.services.access_token_cache import AccessTokenCache
+
+    if not app.config.get("ACCESS_TOKEN_CACHE_ENABLED", False):
+        logger.info("Access token cache disabled by configuration")
+        return None
+
+    cache = AccessTokenCache(
+        redis_client=redis_client,
+        refresh_margin=app.config.get("ACCESS_TOKEN_REFRESH_MARGIN", 120),
+    )
+    logger.info("Access token cache enabled (backend=%s)", cache.backend)
+    return cache
+
+
+def _init_local_cache_tier(app, redis_client):
+    """Create the in-process tier that fronts SpotifyCache.
+
+    Only useful with Redis (without it there is no SpotifyCache to front),
+    and disabled when CACHE_LOCAL_TIER_ENABLED is false.
+    """
+    from shuffify.spotify.local_cache import LocalCacheTier
+
+    if redis_client is None or not app.config.get("CACHE_LOCAL_TIER_ENABLED", False):
+        return None
+
+    tier = LocalCacheTier(
+        max_bytes=app.config.get("CACHE_LOCAL_MAX_BYTES", 32 * 1024 * 1024),
+        ttl=app.config.get("CACHE_LOCAL_TTL", 15),
+        redis_client=redis_client,
+    )
+    logger.info(
+        "Local cache tier enabled (max_bytes=%d, ttl=%ss)",
+        app.config.get("CACHE_LOCAL_MAX_BYTES", 32 * 1024 * 1024),
+        app.config.get("CACHE_LOCAL_TTL", 15),
+    )
+    return tier
+
+
+def get_local_cache_tier():
+    """
+    Get the in-process cache tier, for its per-tier hit/miss metrics.
+
+    Returns:
+        LocalCacheTier if enabled, None otherwise.
+    """
+    return _local_cache_tier
+
+
 def _init_token_encryption(app):
     """Initialize Fernet token encryption service."""
     from shuffify.services.token_service import TokenService
@@ -875,11 +1026,15 @@ def create_app(config_name=None):
 
     # Initialize extensions
     CSRFProtect(app)
-    global _redis_client, _limiter
+    global _redis_client, _limiter, _access_token_cache, _local_cache_tier
     _redis_client = _init_redis(app)
     Session(app)
     _limiter = _init_limiter(app, _redis_client)
+    _init_rate_governor(app, _redis_client)
+    _init_single_flight(app, _redis_client)
     _init_token_encryption(app)
+    _access_token_cache = _init_access_token_cache(app, _redis_client)
+    _local_cache_tier = _init_local_cache_tier(app, _redis_client)
     _init_database(app)
 
     # Register blueprints
@@ -20,6 +20,7 @@ from shuffify.models.db import (
     RaidPlaylistLink,
     Schedule,
     ScrapedPlaylistCache,
+    ScrapeStrategyStats,
     UpstreamSource,
     User,
     UserSettings,
@@ -44,5 +45,6 @@ __all__ = [
     "PlaylistPreference",
     "PendingRaidTrack",
     "ScrapedPlaylistCache",
+    "ScrapeStrategyStats",
     "Playlist",
 ]
@@ -369,6 +369,12 @@ class UpstreamSource(db.Model):
         db.String(20), nullable=True
     )  # "success", "partial", "failed"
     last_track_count = db.Column(db.Integer, nullable=True)
+    # Upstream version seen at the last resolve: the playlist's snapshot_id,
+    # or a content hash when only a scrape could read it. With
+    # last_fresh_count (new tracks raid_count left unsampled) it lets a raid
+    # skip re-resolving a source that hasn't changed.
+    last_content_version = db.Column(db.String(255), nullable=True)
+    last_fresh_count = db.Column(db.Integer, nullable=True)
     raid_count = db.Column(db.Integer, nullable=False, default=5)
     created_at = db.Column(
         UTCDateTime,
@@ -412,6 +418,8 @@ class UpstreamSource(db.Model):
             "last_resolve_pathway": self.last_resolve_pathway,
             "last_resolve_status": self.last_resolve_status,
             "last_track_count": self.last_track_count,
+            "last_content_version": self.last_content_version,
+            "last_fresh_count": self.last_fresh_count,
             "raid_count": self.raid_count,
             "created_at": (self.created_at.isoformat() if self.created_at else None),
         }
@@ -1266,6 +1274,12 @@ class ScrapedPlaylistCache(db.Model):
         default=lambda: datetime.now(timezone.utc),
     )
     scrape_pathway = db.Column(db.String(50), nullable=True)
+    # sha256 of the sorted, de-duplicated URIs (see content_hash()).
+    content_hash = db.Column(db.String(64), nullable=True)
+    # HTTP validators of the page named by scrape_pathway, sent as
+    # If-None-Match / If-Modified-Since once the row expires.
+    etag = db.Column(db.String(255), nullable=True)
+    last_modified = db.Column(db.String(64), nullable=True)
     expires_at = db.Column(UTCDateTime, nullable=False)
 
     __table_args__ = (
@@ -1301,3 +1315,45 @@ class ScrapedPlaylistCache(db.Model):
 
     def __repr__(self) -> str:
         return f"<ScrapedPlaylistCache playlist={self.playlist_id}>"
+
+
+class ScrapeStrategyStats(db.Model):
+    """
+    Recent success rate of each scrape strategy, per playlist.
+
+    PublicScraperPathway reads these to decide whether to hedge a slow
+    or failing embed request with the public page. Kept apart from
+    ScrapedPlaylistCache, whose rows are replaced on expiry, and shared
+    across users for the same reason.
+    """
+
+    __tablename__ = "scrape_strategy_stats"
+
+    # Samples the rates average over: a running mean up to this many,
+    # then an exponential moving average, so old behaviour fades out.
+    WINDOW = 20
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    playlist_id = db.Column(db.String(255), nullable=False, unique=True)
+    # Share of recent attempts that returned tracks, per strategy.
+    embed_success_rate = db.Column(db.Float, nullable=False, default=0.0)
+    embed_samples = db.Column(db.Integer, nullable=False, default=0)
+    public_page_success_rate = db.Column(db.Float, nullable=False, default=0.0)
+    public_page_samples = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(
+        UTCDateTime,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    def record(self, strategy: str, succeeded: bool) -> None:
+        """Fold one attempt of ``strategy`` ("embed" / "public_page") in."""
+        rate = getattr(self, f"{strategy}_success_rate") or 0.0
+        samples = (getattr(self, f"{strategy}_samples") or 0) + 1
+        rate += (float(succeeded) - rate) / min(samples, self.WINDOW)
+        setattr(self, f"{strategy}_success_rate", rate)
+        setattr(self, f"{strategy}_samples", samples)
+
+    def __repr__(self) -> str:
+        return f"<ScrapeStrategyStats playlist={self.playlist_id}>"
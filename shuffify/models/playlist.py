@@ -34,7 +34,7 @@ class Playlist:
     ) -> "Playlist":
         """Load a playlist and optionally its audio features."""
         playlist_data = api.get_playlist(playlist_id)
-        raw_tracks = api.get_playlist_tracks(playlist_id)
+        raw_tracks = api.get_playlist_tracks(playlist_id, fields="workshop_display")
 
         tracks = []
         for track in raw_tracks:
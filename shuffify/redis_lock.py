@@ -0,0 +1,95 @@
+"""
+Short-lived Redis locks for "one worker does it, the rest wait" work.
+
+Both single-flight playlist reads (``shuffify.spotify.single_flight``)
+and single-flight token refreshes (``shuffify.services.access_token_cache``)
+take a ``SET NX PX`` lock, and a caller that finds it held polls until
+the holder has published its result. The lock's TTL bounds how long a
+holder that dies can block anyone.
+
+Redis errors propagate: each caller decides how to degrade (normally by
+doing the work without the lock).
+"""
+
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import redis
+
+# Release the lock only if we still own it.
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# How often a caller waiting on another process's lock re-checks.
+LOCK_POLL_INTERVAL = 0.05
+
+
+@dataclass
+class LockAttempt:
+    """Outcome of ``acquire_or_wait``.
+
+    Exactly one of these holds: ``owner`` is set (we hold the lock),
+    ``result`` is set (the holder published while we waited), or neither
+    is (we waited ``timeout`` seconds and should go ahead without it).
+    """
+
+    owner: Optional[str] = None
+    result: Any = None
+    waited: bool = False
+
+    @property
+    def timed_out(self) -> bool:
+        return self.owner is None and self.result is None
+
+
+def acquire_or_wait(
+    client: redis.Redis,
+    lock_key: str,
+    timeout: float,
+    ready: Callable[[], Any],
+    clock: Callable[[], float],
+    sleep: Callable[[float], None],
+) -> LockAttempt:
+    """Take ``lock_key``, or wait for its holder to publish.
+
+    Args:
+        client: Redis client.
+        lock_key: Key of the lock.
+        timeout: Lock TTL, and the longest we wait on someone else's.
+        ready: Cheap check for the holder's result; returns None until
+            there is one.
+        clock: Clock used for the wait deadline.
+        sleep: Sleep function between polls.
+
+    Raises:
+        redis.RedisError: If a Redis call fails.
+    """
+    owner = uuid.uuid4().hex
+    deadline = clock() + timeout
+    attempt = LockAttempt()
+    while True:
+        if client.set(lock_key, owner, nx=True, px=int(timeout * 1000)):
+            attempt.owner = owner
+            return attempt
+        attempt.waited = True
+        if clock() >= deadline:
+            return attempt
+        sleep(LOCK_POLL_INTERVAL)
+        published = ready()
+        if published is not None:
+            attempt.result = published
+            return attempt
+
+
+def release(client: redis.Redis, lock_key: str, owner: str) -> None:
+    """Delete ``lock_key`` if ``owner`` still holds it.
+
+    Raises:
+        redis.RedisError: If the Redis call fails.
+    """
+    client.eval(RELEASE_SCRIPT, 1, lock_key, owner)
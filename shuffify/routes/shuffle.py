@@ -107,7 +107,7 @@ def shuffle(playlist_id, api=None, user=None):
         })
 
     playlist_service.update_playlist_tracks(
-        playlist_id, shuffled_uris
+        playlist_id, shuffled_uris, current_uris=current_uris
     )
 
     updated_state = StateService.record_new_state(
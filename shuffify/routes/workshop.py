@@ -296,7 +296,9 @@ def workshop_commit(
         )
 
     playlist_service.update_playlist_tracks(
-        playlist_id, commit_request.track_uris
+        playlist_id,
+        commit_request.track_uris,
+        current_uris=current_uris,
     )
 
     # Reconcile lock positions after commit
@@ -10,10 +10,14 @@ IMPORTANT:
 - In development with Werkzeug reloader, only start in main process.
 - In production with Gunicorn, use --preload for single scheduler.
 - PostgreSQL advisory lock prevents duplicate scheduler instances.
+- With SCHEDULER_SHARDING_ENABLED (PostgreSQL only), every worker runs a
+  scheduler instead, for the schedules in the shards it holds
+  (see shuffify.scheduler_shards).
 """
 
 import logging
 import os
+import pickle
 from datetime import datetime, timezone
 from typing import Dict, Optional, Tuple
 
@@ -21,12 +25,24 @@ from apscheduler.events import (
     EVENT_JOB_ERROR,
     EVENT_JOB_EXECUTED,
     EVENT_JOB_MISSED,
+    EVENT_JOB_SUBMITTED,
 )
 from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.job import Job
+from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from apscheduler.util import datetime_to_utc_timestamp
 
 from shuffify.enums import IntervalValue, ScheduleType
+from shuffify.scheduler_dispatch import FairShareDispatcher, parse_weights
+from shuffify.scheduler_smoothing import (
+    FireHistogram,
+    FirePlanner,
+    OffsetTrigger,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,10 +52,41 @@ _scheduler: Optional[BackgroundScheduler] = None
 # Flask app reference (stored at module level to avoid pickling)
 _app = None
 
+JOB_DEFAULTS = {
+    "coalesce": True,
+    "max_instances": 1,
+    "misfire_grace_time": 3600,
+}
+
+# Rows per statement when the boot reconcile rewrites the jobstore
+RECONCILE_BATCH_SIZE = 500
+
 # Advisory lock connection (kept alive for lock duration)
 _lock_connection = None
 
-# Scheduler health metrics
+# Sharded mode: this worker's shard claims, and the shard and trigger of
+# each schedule job it has registered (to spot changed or moved schedules)
+_shard_coordinator = None
+_sharded_jobs: Dict[str, Tuple[int, str, str]] = {}
+
+SHARD_REBALANCE_JOB_ID = "scheduler_shard_rebalance"
+
+# Fair-share dispatcher in front of the job executor (None when
+# SCHEDULER_FAIR_SHARE_ENABLED is off: APScheduler's pool runs jobs itself)
+_dispatcher: Optional[FairShareDispatcher] = None
+
+# Firing-time smoothing: offsets schedule triggers across a window (None
+# when SCHEDULER_JITTER_WINDOW_SECONDS is 0), and counts actual firings
+_fire_planner: Optional[FirePlanner] = None
+_fire_histogram = FireHistogram()
+
+# Returned by _execute_scheduled_job when it only queued the run on the
+# dispatcher, so the APScheduler listener doesn't count it as executed
+_DISPATCHED = object()
+
+# Scheduler health metrics. With the fair-share dispatcher on, scheduled
+# jobs are counted when a dispatcher worker finishes them, not when
+# APScheduler hands them over.
 _metrics = {
     "jobs_executed": 0,
     "jobs_failed": 0,
@@ -50,14 +97,26 @@ _metrics = {
 
 def get_scheduler_metrics() -> dict:
     """Return a copy of current scheduler health metrics."""
-    return {
+    metrics = {
         **_metrics,
         "scheduler_running": (_scheduler is not None and _scheduler.running),
+        "fires_per_minute": _fire_histogram.snapshot(),
     }
+    if _dispatcher is not None:
+        metrics["queue"] = _dispatcher.metrics()
+    if _fire_planner is not None:
+        metrics["planned_fires"] = _fire_planner.load()
+    if _shard_coordinator is not None:
+        metrics["shards_owned"] = len(_shard_coordinator.owned)
+        metrics["shard_count"] = _shard_coordinator.shard_count
+    return metrics
 
 
 def _on_job_executed(event):
     """Listener for successful job execution."""
+    if event.retval is _DISPATCHED:
+        logger.debug(f"Job {event.job_id} queued on the dispatcher")
+        return
     _metrics["jobs_executed"] += 1
     _metrics["last_execution_at"] = datetime.now(timezone.utc).isoformat()
     logger.info(f"Job {event.job_id} executed successfully")
@@ -73,6 +132,23 @@ def _on_job_error(event):
     )
 
 
+def _on_dispatched_job_done(schedule_id: int, error: Optional[Exception]):
+    """Dispatcher callback: count a queued scheduled job once it has run."""
+    _metrics["last_execution_at"] = datetime.now(timezone.utc).isoformat()
+    if error is None:
+        _metrics["jobs_executed"] += 1
+    else:
+        _metrics["jobs_failed"] += 1
+
+
+def _on_job_submitted(event):
+    """Listener for job submission: count schedule firings per minute."""
+    if not event.job_id.startswith("schedule_"):
+        return
+    for run_time in event.scheduled_run_times:
+        _fire_histogram.record(run_time)
+
+
 def _on_job_missed(event):
     """Listener for missed job execution."""
     _metrics["jobs_missed"] += 1
@@ -159,7 +235,7 @@ def init_scheduler(app) -> Optional[BackgroundScheduler]:
     Returns:
         The BackgroundScheduler instance, or None if disabled.
     """
-    global _scheduler, _app
+    global _scheduler, _app, _shard_coordinator, _fire_planner, _dispatcher
 
     if not app.config.get("SCHEDULER_ENABLED", True):
         logger.info("Scheduler disabled by configuration")
@@ -178,10 +254,22 @@ def init_scheduler(app) -> Optional[BackgroundScheduler]:
     try:
         db_url = app.config.get("SQLALCHEMY_DATABASE_URI", "sqlite:///shuffify.db")
 
+        sharded = app.config.get("SCHEDULER_SHARDING_ENABLED", False)
+        if sharded and not db_url.startswith("postgresql"):
+            logger.warning(
+                "Scheduler sharding needs PostgreSQL advisory locks; "
+                "running a single scheduler instead"
+            )
+            sharded = False
+
         # Advisory lock: prevent duplicate schedulers. Fail closed in
         # production (app.debug is False) so a transient DB blip skips init
         # rather than spawning duplicate schedulers; fail open in dev.
-        if not _try_acquire_scheduler_lock(db_url, fail_open=app.debug):
+        # Sharded workers all run a scheduler; the shard locks keep each
+        # schedule on one of them.
+        if not sharded and not _try_acquire_scheduler_lock(
+            db_url, fail_open=app.debug
+        ):
             return None
 
         # Separate jobstore engine with small pool
@@ -199,40 +287,80 @@ def init_scheduler(app) -> Optional[BackgroundScheduler]:
         # the attacker already owns the application. Tracked as
         # a known limitation; re-evaluate if upgrading to
         # APScheduler 4.x which redesigned serialization.
-        jobstores = {
-            "default": SQLAlchemyJobStore(engine=jobstore_engine),
-        }
+        #
+        # Sharded workers keep jobs in memory instead: the shared table
+        # would hand every worker every job. Each worker derives its jobs
+        # from the schedules table on every rebalance.
+        if sharded:
+            jobstores = {"default": MemoryJobStore()}
+        else:
+            jobstores = {
+                "default": SQLAlchemyJobStore(engine=jobstore_engine),
+            }
+        # With fair-share dispatch, APScheduler's threads only enqueue and
+        # the dispatcher's pool_size workers run the jobs.
+        fair_share = app.config.get("SCHEDULER_FAIR_SHARE_ENABLED", False)
         executors = {
-            "default": ThreadPoolExecutor(max_workers=pool_size),
+            "default": ThreadPoolExecutor(
+                max_workers=2 if fair_share else pool_size
+            ),
         }
-        job_defaults = {
-            "coalesce": True,
-            "max_instances": 1,
-            "misfire_grace_time": 3600,
-        }
-
+        if sharded:
+            # Own thread, so a pool full of long raids can't delay a
+            # rebalance past the point where other workers' shares shift.
+            executors["shards"] = ThreadPoolExecutor(max_workers=1)
         _scheduler = BackgroundScheduler(
             jobstores=jobstores,
             executors=executors,
-            job_defaults=job_defaults,
+            job_defaults=JOB_DEFAULTS,
         )
 
         # Add event listeners
         _scheduler.add_listener(_on_job_executed, EVENT_JOB_EXECUTED)
         _scheduler.add_listener(_on_job_error, EVENT_JOB_ERROR)
         _scheduler.add_listener(_on_job_missed, EVENT_JOB_MISSED)
+        _scheduler.add_listener(_on_job_submitted, EVENT_JOB_SUBMITTED)
+
+        jitter_window = app.config.get("SCHEDULER_JITTER_WINDOW_SECONDS", 0)
+        if jitter_window > 0:
+            _fire_planner = FirePlanner(
+                jitter_window,
+                slot_seconds=app.config.get("SCHEDULER_JITTER_SLOT_SECONDS", 60),
+                budget=app.config.get("SCHEDULER_FIRE_BUDGET") or pool_size,
+            )
 
-        _scheduler.start()
+        if fair_share:
+            _dispatcher = FairShareDispatcher(
+                _run_scheduled_job,
+                workers=pool_size,
+                weights=parse_weights(
+                    app.config.get("SCHEDULER_JOB_TYPE_WEIGHTS", "")
+                ),
+                reserved_workers=app.config.get(
+                    "SCHEDULER_RESERVED_LIGHT_WORKERS", 1
+                ),
+                on_done=_on_dispatched_job_done,
+            )
+
+        # Start paused: the job stores are up, so jobs can be registered
+        # against them, but nothing fires until registration is done.
+        _scheduler.start(paused=True)
         _app = app
+
+        if sharded:
+            _start_sharding(app, db_url)
+        else:
+            # Reconcile the jobstore with the enabled schedules
+            with app.app_context():
+                _register_existing_jobs(jobstores["default"])
+
+        _scheduler.resume()
         logger.info(
-            "APScheduler started successfully (pool_size=%d)",
+            "APScheduler started successfully (pool_size=%d, sharded=%s)",
             pool_size,
+            sharded,
         )
 
-        # Register existing enabled schedules from database
-        with app.app_context():
-            _register_existing_jobs()
-
         # Clean up stale execution records from prior crashes
         with app.app_context():
             _cleanup_stale_executions()
@@ -245,37 +373,276 @@ def init_scheduler(app) -> Optional[BackgroundScheduler]:
             exc_info=True,
         )
         _scheduler = None
+        _fire_planner = None
+        if _dispatcher is not None:
+            _dispatcher.shutdown()
+            _dispatcher = None
+        if _shard_coordinator is not None:
+            _shard_coordinator.leave()
+            _shard_coordinator = None
         return None
 
 
-def _register_existing_jobs():
+def _start_sharding(app, db_url: str) -> None:
+    """Join the shard ring and schedule periodic rebalancing.
+
+    The first rebalance runs synchronously, so this worker's jobs are
+    registered before init returns, as in unsharded mode.
     """
-    Load enabled schedules from the database and register them
-    with APScheduler.
+    global _shard_coordinator
+
+    from shuffify.scheduler_shards import PgShardLocks, ShardCoordinator
+
+    _shard_coordinator = ShardCoordinator(
+        lambda: PgShardLocks(db_url),
+        shard_count=app.config.get("SCHEDULER_SHARD_COUNT", 64),
+    )
+    _rebalance_shards()
+
+    _scheduler.add_job(
+        func=_rebalance_shards,
+        trigger="interval",
+        seconds=app.config.get("SCHEDULER_SHARD_REBALANCE_SECONDS", 30),
+        id=SHARD_REBALANCE_JOB_ID,
+        executor="shards",
+        replace_existing=True,
+    )
+
+
+def _rebalance_shards():
+    """Rebalance this worker's shards, then sync its jobs to them.
+
+    Also how schedule changes made by other processes reach this worker:
+    a create, edit or toggle handled elsewhere is picked up here within
+    one rebalance interval.
     """
+    if _shard_coordinator is None or _app is None:
+        return
+    with _app.app_context():
+        try:
+            _shard_coordinator.rebalance(
+                before_release=_remove_jobs_for_shards
+            )
+            _sync_sharded_jobs()
+        except Exception as e:
+            logger.error(f"Failed to sync sharded scheduler jobs: {e}")
+
+
+def _remove_jobs_for_shards(shards) -> None:
+    """Remove this worker's jobs for schedules in ``shards``."""
+    for job_id, (shard, _, _) in list(_sharded_jobs.items()):
+        if shard in shards:
+            _remove_sharded_job(job_id)
+
+
+def _remove_sharded_job(job_id: str) -> None:
+    _sharded_jobs.pop(job_id, None)
+    if _fire_planner is not None:
+        _fire_planner.forget(int(job_id.rsplit("_", 1)[1]))
     try:
-        from shuffify.models.db import Schedule
+        _scheduler.remove_job(job_id)
+    except Exception:
+        pass
 
-        enabled_schedules = Schedule.query.filter_by(is_enabled=True).all()
-        registered = 0
 
-        for schedule in enabled_schedules:
-            try:
-                add_job_for_schedule(schedule)
-                registered += 1
-            except Exception as e:
-                logger.error(f"Failed to register job for schedule {schedule.id}: {e}")
+def _sync_sharded_jobs():
+    """
+    Register the enabled schedules in this worker's shards, and remove
+    jobs for schedules that were disabled, deleted or moved away.
+    Unchanged jobs are left alone.
+    """
+    from shuffify.models.db import Schedule, db
+    from shuffify.scheduler_shards import shard_for
+
+    rows = (
+        db.session.query(
+            Schedule.id,
+            Schedule.target_playlist_id,
+            Schedule.schedule_type,
+            Schedule.schedule_value,
+        )
+        .filter(Schedule.is_enabled.is_(True))
+        .all()
+    )
+    owned = _shard_coordinator.owned
+    count = _shard_coordinator.shard_count
+
+    desired = {}
+    for row in rows:
+        shard = shard_for(row.target_playlist_id, count)
+        if shard in owned:
+            desired[f"schedule_{row.id}"] = (shard, row)
+
+    for job_id in list(_sharded_jobs):
+        if job_id not in desired:
+            _remove_sharded_job(job_id)
+
+    added = 0
+    for job_id, (shard, row) in desired.items():
+        if _sharded_jobs.get(job_id) == (
+            shard,
+            row.schedule_type,
+            row.schedule_value,
+        ):
+            continue
+        try:
+            add_job_for_schedule(row)
+            added += 1
+        except Exception as e:
+            logger.error(f"Failed to register job for schedule {row.id}: {e}")
 
+    if added:
         logger.info(
-            f"Registered {registered}/"
-            f"{len(enabled_schedules)} "
-            f"scheduled jobs from database"
+            "Sharded scheduler: registered %d job(s); %d job(s) across "
+            "%d owned shard(s)",
+            added,
+            len(_sharded_jobs),
+            len(owned),
+        )
+
+
+def _register_existing_jobs(jobstore=None):
+    """
+    Reconcile the jobstore with the enabled schedules in the database.
+
+    Jobs persist across restarts, so most are already registered and
+    current. The stored jobs and the enabled schedules are each read
+    once and diffed: jobs whose schedule is unchanged are left alone
+    (keeping their next run time), jobs for disabled or deleted
+    schedules are removed, and missing or changed jobs are rewritten.
+    With a SQLAlchemyJobStore all of those writes go out in batches in
+    one transaction, so startup cost tracks the number of changes, not
+    the number of schedules.
+    """
+    try:
+        from shuffify.models.db import Schedule, db
+
+        rows = (
+            db.session.query(
+                Schedule.id,
+                Schedule.schedule_type,
+                Schedule.schedule_value,
+            )
+            .filter(Schedule.is_enabled.is_(True))
+            .all()
+        )
+        desired = {f"schedule_{row.id}": row for row in rows}
+        existing = {
+            job.id: job
+            for job in _scheduler.get_jobs()
+            if job.id.startswith("schedule_")
+        }
+
+        stale = [job_id for job_id in existing if job_id not in desired]
+        changed = []
+        for job_id, row in desired.items():
+            job = existing.get(job_id)
+            if job is not None and _job_is_current(job, row):
+                if _fire_planner is not None:
+                    _fire_planner.reserve(
+                        row.id,
+                        job.trigger.trigger,
+                        job.trigger.offset_seconds,
+                    )
+            else:
+                changed.append(row)
+
+        if isinstance(jobstore, SQLAlchemyJobStore):
+            written = _write_jobs_batched(jobstore, stale, changed)
+        else:
+            for job_id in stale:
+                _scheduler.remove_job(job_id)
+            written = 0
+            for row in changed:
+                try:
+                    add_job_for_schedule(row)
+                    written += 1
+                except Exception as e:
+                    logger.error(f"Failed to register job for schedule {row.id}: {e}")
+
+        logger.info(
+            f"Reconciled {len(rows)} enabled schedules with the jobstore: "
+            f"{len(rows) - len(changed)} unchanged, {written} written, "
+            f"{len(stale)} removed"
         )
 
     except Exception as e:
         logger.error(f"Failed to load schedules from database: {e}")
 
 
+def _job_name(schedule) -> str:
+    """Job name, which doubles as the fingerprint the reconcile compares."""
+    return f"schedule_{schedule.id} {schedule.schedule_type} {schedule.schedule_value}"
+
+
+def _job_is_current(job, schedule) -> bool:
+    """Whether a stored job still matches its schedule and smoothing config."""
+    if job.name != _job_name(schedule):
+        return False
+    if _fire_planner is None:
+        return not isinstance(job.trigger, OffsetTrigger)
+    return (
+        isinstance(job.trigger, OffsetTrigger)
+        and job.trigger.offset_seconds < _fire_planner.window_seconds
+    )
+
+
+def _write_jobs_batched(jobstore, stale_ids, schedules) -> int:
+    """Delete ``stale_ids`` and (re)write jobs for ``schedules`` in batches.
+
+    Builds each job the way ``add_job`` would, then replaces the rows
+    with multi-row statements in a single transaction. The scheduler is
+    paused while this runs and picks the jobs up when it resumes.
+    """
+    now = datetime.now(_scheduler.timezone)
+    jobs = []
+    for schedule in schedules:
+        trigger = _build_trigger(
+            *_parse_schedule(schedule.schedule_type, schedule.schedule_value)
+        )
+        if _fire_planner is not None:
+            offset = _fire_planner.offset_for(schedule.id, trigger)
+            trigger = OffsetTrigger(trigger, offset)
+        jobs.append(
+            Job(
+                _scheduler,
+                id=f"schedule_{schedule.id}",
+                func=_execute_scheduled_job,
+                trigger=trigger,
+                executor="default",
+                args=(schedule.id,),
+                kwargs={},
+                name=_job_name(schedule),
+                next_run_time=trigger.get_next_fire_time(None, now),
+                **JOB_DEFAULTS,
+            )
+        )
+
+    jobs_t = jobstore.jobs_t
+    delete_ids = list(stale_ids) + [job.id for job in jobs]
+    with jobstore.engine.begin() as conn:
+        for start in range(0, len(delete_ids), RECONCILE_BATCH_SIZE):
+            chunk = delete_ids[start : start + RECONCILE_BATCH_SIZE]
+            conn.execute(jobs_t.delete().where(jobs_t.c.id.in_(chunk)))
+        for start in range(0, len(jobs), RECONCILE_BATCH_SIZE):
+            conn.execute(
+                jobs_t.insert(),
+                [
+                    {
+                        "id": job.id,
+                        "next_run_time": datetime_to_utc_timestamp(
+                            job.next_run_time
+                        ),
+                        "job_state": pickle.dumps(
+                            job.__getstate__(), jobstore.pickle_protocol
+                        ),
+                    }
+                    for job in jobs[start : start + RECONCILE_BATCH_SIZE]
+                ],
+            )
+    return len(jobs)
+
+
 def get_scheduler() -> Optional[BackgroundScheduler]:
     """Get the global scheduler instance."""
     return _scheduler
@@ -296,6 +663,22 @@ def add_job_for_schedule(schedule):
 
     job_id = f"schedule_{schedule.id}"
 
+    if _shard_coordinator is not None:
+        from shuffify.scheduler_shards import shard_for
+
+        shard = shard_for(
+            schedule.target_playlist_id, _shard_coordinator.shard_count
+        )
+        if shard not in _shard_coordinator.owned:
+            # Another worker owns it and registers it on its next
+            # rebalance. Drop any stale local copy (the schedule moved).
+            _remove_sharded_job(job_id)
+            logger.info(
+                f"Schedule {schedule.id} is in shard {shard}, not owned "
+                f"here; its owner registers it on the next rebalance"
+            )
+            return
+
     # Remove existing job if present (for updates)
     try:
         _scheduler.remove_job(job_id)
@@ -307,15 +690,28 @@ def add_job_for_schedule(schedule):
         schedule.schedule_type, schedule.schedule_value
     )
 
+    if _fire_planner is not None:
+        base = _build_trigger(trigger, trigger_kwargs)
+        offset = _fire_planner.offset_for(schedule.id, base)
+        trigger, trigger_kwargs = OffsetTrigger(base, offset), {}
+
     _scheduler.add_job(
         func=_execute_scheduled_job,
         trigger=trigger,
         id=job_id,
+        name=_job_name(schedule),
         args=[schedule.id],
         replace_existing=True,
         **trigger_kwargs,
     )
 
+    if _shard_coordinator is not None:
+        _sharded_jobs[job_id] = (
+            shard,
+            schedule.schedule_type,
+            schedule.schedule_value,
+        )
+
     logger.info(
         f"Registered job {job_id} with trigger={trigger}, kwargs={trigger_kwargs}"
     )
@@ -332,6 +728,9 @@ def remove_job_for_schedule(schedule_id: int):
         return
 
     job_id = f"schedule_{schedule_id}"
+    _sharded_jobs.pop(job_id, None)
+    if _fire_planner is not None:
+        _fire_planner.forget(schedule_id)
     try:
         _scheduler.remove_job(job_id)
         logger.info(f"Removed job {job_id}")
@@ -384,6 +783,13 @@ def _parse_schedule(schedule_type: str, schedule_value: str) -> Tuple[str, Dict]
         return "interval", {"days": 1}
 
 
+def _build_trigger(trigger: str, trigger_kwargs: Dict):
+    """Build the trigger object ``add_job`` would build from these args."""
+    if trigger == "cron":
+        return CronTrigger(timezone=_scheduler.timezone, **trigger_kwargs)
+    return IntervalTrigger(timezone=_scheduler.timezone, **trigger_kwargs)
+
+
 def _execute_scheduled_job(schedule_id: int):
     """
     Wrapper that executes a scheduled job within Flask app context.
@@ -396,7 +802,41 @@ def _execute_scheduled_job(schedule_id: int):
 
     Args:
         schedule_id: The Schedule model ID to execute.
+
+    With the fair-share dispatcher on, this only looks up the schedule's
+    user and job type and queues it; a dispatcher worker runs it later
+    through ``_run_scheduled_job``. It then returns ``_DISPATCHED`` so
+    the run is counted when it finishes, not here.
     """
+    if _dispatcher is None:
+        _run_scheduled_job(schedule_id)
+        return
+
+    with _app.app_context():
+        try:
+            from shuffify.models.db import Schedule, db
+
+            row = (
+                db.session.query(Schedule.user_id, Schedule.job_type)
+                .filter(Schedule.id == schedule_id)
+                .first()
+            )
+        except Exception as e:
+            logger.error(
+                f"Could not look up schedule {schedule_id} for dispatch: {e}"
+            )
+            row = None
+
+    if row is None:
+        # Let the executor handle (and log) a missing schedule.
+        _run_scheduled_job(schedule_id)
+        return
+    _dispatcher.submit(schedule_id, row.user_id, row.job_type)
+    return _DISPATCHED
+
+
+def _run_scheduled_job(schedule_id: int):
+    """Execute a schedule's job within Flask app context."""
     with _app.app_context():
         try:
             from shuffify.services.executors import (
@@ -458,12 +898,23 @@ def _cleanup_stale_executions(max_age_minutes: int = 30):
 
 def shutdown_scheduler():
     """Gracefully shut down the scheduler."""
-    global _scheduler, _app, _lock_connection
+    global _scheduler, _app, _lock_connection, _shard_coordinator
+    global _fire_planner, _dispatcher
     if _scheduler is not None and _scheduler.running:
         _scheduler.shutdown(wait=False)
         logger.info("Scheduler shut down")
     _scheduler = None
     _app = None
+    _fire_planner = None
+    if _dispatcher is not None:
+        _dispatcher.shutdown()
+        _dispatcher = None
+
+    # Release shard claims so other workers pick them up immediately
+    if _shard_coordinator is not None:
+        _shard_coordinator.leave()
+        _shard_coordinator = None
+    _sharded_jobs.clear()
 
     # Release advisory lock
     if _lock_connection is not None:
@@ -0,0 +1,305 @@
+"""
+Fair-share dispatch of scheduled jobs.
+
+APScheduler's thread pool runs jobs in the order they come due, so one
+user's ten-source raid, or a burst of raids at a popular cron time, can
+take every thread while quick shuffles for other users wait behind them.
+
+``FairShareDispatcher`` sits between APScheduler and the job executor.
+APScheduler's thread only enqueues the job; the dispatcher's own workers
+pick what runs next:
+
+- Queues are kept per user and, within a user, per job type.
+- Users are served by stride scheduling: each dispatch advances the
+  user's pass by ``1 / weight`` of the job type it ran, and the job that
+  would leave its user with the lowest pass goes next. Every user gets
+  turns, and users running cheap (high-weight) jobs get more of them than
+  users running raids.
+- Within a user, job types are served the same way, so a user's shuffle
+  isn't stuck behind their own raid backlog.
+- Heavy job types may hold at most ``workers - reserved_workers`` workers
+  at once, so there is always capacity for cheap jobs.
+
+A schedule that is already queued or running is not queued again, which
+keeps APScheduler's ``max_instances=1`` / ``coalesce`` behaviour now that
+APScheduler's own job returns as soon as it has enqueued.
+
+Queue-wait times (enqueue to start) are tracked per job type and exposed
+through ``metrics()``. Since APScheduler only sees the enqueue, the
+optional ``on_done`` callback reports each run's outcome instead.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, FrozenSet, Optional
+
+from shuffify.enums import JobType
+
+logger = logging.getLogger(__name__)
+
+# Relative share per job type: higher runs more often. Shuffles, drips and
+# rotations touch one or two playlists; raids resolve every upstream source.
+DEFAULT_JOB_TYPE_WEIGHTS: Dict[str, float] = {
+    JobType.SHUFFLE: 4.0,
+    JobType.ROTATE: 4.0,
+    JobType.DRIP: 4.0,
+    JobType.RAID: 1.0,
+    JobType.RAID_AND_SHUFFLE: 1.0,
+    JobType.RAID_AND_DRIP: 1.0,
+}
+
+HEAVY_JOB_TYPES: FrozenSet[str] = frozenset(
+    {JobType.RAID, JobType.RAID_AND_SHUFFLE, JobType.RAID_AND_DRIP}
+)
+
+
+def parse_weights(raw: str) -> Dict[str, float]:
+    """Parse ``"shuffle=4,raid=1"`` into job-type weights.
+
+    Types left out keep their default weight.
+    """
+    weights = dict(DEFAULT_JOB_TYPE_WEIGHTS)
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        name, _, value = item.partition("=")
+        weight = float(value)
+        if weight <= 0:
+            raise ValueError(f"Job type weight must be positive: {item!r}")
+        weights[name.strip()] = weight
+    return weights
+
+
+@dataclass
+class _QueuedJob:
+    schedule_id: int
+    user_id: int
+    job_type: str
+    enqueued_at: float
+
+
+@dataclass
+class _UserQueues:
+    pass_: float
+    types: Dict[str, Deque[_QueuedJob]] = field(default_factory=dict)
+    type_pass: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class _WaitStats:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_seconds": round(self.total / self.count, 3) if self.count else 0.0,
+            "max_seconds": round(self.max, 3),
+        }
+
+
+class FairShareDispatcher:
+    """Weighted fair-share queue with its own worker threads."""
+
+    def __init__(
+        self,
+        run: Callable[[int], None],
+        workers: int,
+        weights: Optional[Dict[str, float]] = None,
+        reserved_workers: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        start: bool = True,
+        on_done: Optional[Callable[[int, Optional[Exception]], None]] = None,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self._run = run
+        self._on_done = on_done
+        self.workers = workers
+        self.weights = dict(weights or DEFAULT_JOB_TYPE_WEIGHTS)
+        self.heavy_limit = max(1, workers - max(0, reserved_workers))
+        self._clock = clock
+
+        self._cond = threading.Condition()
+        self._users: Dict[int, _UserQueues] = {}
+        self._queued: Dict[int, _QueuedJob] = {}
+        self._running: Dict[int, _QueuedJob] = {}
+        self._heavy_running = 0
+        self._virtual_time = 0.0
+        self._waits: Dict[str, _WaitStats] = {}
+        self._stopping = False
+        self._threads = []
+        if start:
+            for i in range(workers):
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"shuffify-dispatch-{i}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, schedule_id: int, user_id: int, job_type: str) -> bool:
+        """Queue a schedule's run.
+
+        Returns:
+            False if the schedule is already queued or running (the
+            firing is coalesced into that run), True otherwise.
+        """
+        with self._cond:
+            if self._stopping:
+                return False
+            if schedule_id in self._queued or schedule_id in self._running:
+                logger.info(
+                    "Schedule %s is already queued or running; "
+                    "coalescing this firing",
+                    schedule_id,
+                )
+                return False
+
+            user = self._users.get(user_id)
+            if user is None:
+                # A user who was idle joins at the current virtual time,
+                # so they neither jump the queue nor lose turns.
+                user = _UserQueues(pass_=self._virtual_time)
+                self._users[user_id] = user
+            queue = user.types.get(job_type)
+            if queue is None:
+                # Likewise a job type the user had no backlog of rejoins
+                # at their other types' lowest pass.
+                floor = min(
+                    (user.type_pass[t] for t in user.types), default=0.0
+                )
+                user.type_pass[job_type] = max(
+                    user.type_pass.get(job_type, floor), floor
+                )
+                queue = user.types[job_type] = deque()
+
+            job = _QueuedJob(schedule_id, user_id, job_type, self._clock())
+            queue.append(job)
+            self._queued[schedule_id] = job
+            self._cond.notify()
+            return True
+
+    def metrics(self) -> dict:
+        """Queue depth, running jobs and queue-wait times per job type."""
+        with self._cond:
+            return {
+                "queued": len(self._queued),
+                "running": len(self._running),
+                "heavy_running": self._heavy_running,
+                "queued_users": len(self._users),
+                "wait_seconds": {
+                    job_type: stats.to_dict()
+                    for job_type, stats in sorted(self._waits.items())
+                },
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the workers; queued jobs are dropped."""
+        with self._cond:
+            self._stopping = True
+            self._users.clear()
+            self._queued.clear()
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    # -----------------------------------------------------------------
+    # Internals
+    # -----------------------------------------------------------------
+
+    def _weight(self, job_type: str) -> float:
+        return self.weights.get(job_type, 1.0)
+
+    def _eligible(self, job_type: str) -> bool:
+        return (
+            job_type not in HEAVY_JOB_TYPES
+            or self._heavy_running < self.heavy_limit
+        )
+
+    def _take(self) -> Optional[_QueuedJob]:
+        """Pop the next job to run, or None. Caller holds ``_cond``."""
+        best = None
+        for user_id, user in self._users.items():
+            for job_type, queue in user.types.items():
+                if not queue or not self._eligible(job_type):
+                    continue
+                # Rank by the pass the dispatch would advance to, so at
+                # equal passes the cheaper job goes first.
+                stride = 1.0 / self._weight(job_type)
+                key = (
+                    user.pass_ + stride,
+                    user.type_pass[job_type] + stride,
+                    queue[0].enqueued_at,
+                )
+                if best is None or key < best[0]:
+                    best = (key, user_id, job_type)
+        if best is None:
+            return None
+
+        _, user_id, job_type = best
+        user = self._users[user_id]
+        job = user.types[job_type].popleft()
+
+        stride = 1.0 / self._weight(job_type)
+        self._virtual_time = max(self._virtual_time, user.pass_)
+        user.pass_ += stride
+        user.type_pass[job_type] += stride
+        if not user.types[job_type]:
+            del user.types[job_type]
+        if not user.types:
+            del self._users[user_id]
+
+        del self._queued[job.schedule_id]
+        self._running[job.schedule_id] = job
+        if job.job_type in HEAVY_JOB_TYPES:
+            self._heavy_running += 1
+        self._waits.setdefault(job_type, _WaitStats()).add(
+            self._clock() - job.enqueued_at
+        )
+        return job
+
+    def _finish(self, job: _QueuedJob) -> None:
+        """Mark ``job`` done. Caller holds ``_cond``."""
+        self._running.pop(job.schedule_id, None)
+        if job.job_type in HEAVY_JOB_TYPES:
+            self._heavy_running -= 1
+        # A freed heavy slot may unblock a queued raid.
+        self._cond.notify_all()
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                job = self._take()
+                while job is None:
+                    if self._stopping:
+                        return
+                    self._cond.wait()
+                    job = self._take()
+            error = None
+            try:
+                self._run(job.schedule_id)
+            except Exception as e:
+                error = e
+                logger.exception(
+                    "Dispatched job for schedule %s failed", job.schedule_id
+                )
+            finally:
+                with self._cond:
+                    self._finish(job)
+            if self._on_done is not None:
+                try:
+                    self._on_done(job.schedule_id, error)
+                except Exception:
+                    logger.exception("on_done callback failed")
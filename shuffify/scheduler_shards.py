@@ -0,0 +1,237 @@
+"""
+Sharded scheduling: split the schedule set across scheduler workers.
+
+In the default mode one process wins the scheduler advisory lock and runs
+every user's jobs on its thread pool, so scheduled-job throughput is capped
+at one process however many workers are deployed. With sharding enabled
+every worker runs a scheduler, and each schedule is owned by exactly one of
+them.
+
+Schedules are hashed by target playlist ID into ``shard_count`` shards, so
+all schedules for one playlist land on the same worker and contend for its
+execution lock locally. A worker owns a shard while it holds that shard's
+Postgres advisory lock, taken on a dedicated connection that lives as long
+as the worker does.
+
+Membership works the same way: each worker holds one member-slot lock, and
+counting the granted member locks in ``pg_locks`` gives the number of live
+workers. On each rebalance a worker sizes its fair share as
+``ceil(shard_count / live_workers)``, releases shards beyond that share and
+claims free shards up to it. A worker that dies drops its connection, so
+Postgres releases its locks and the survivors claim its shards on their
+next rebalance; a worker that joins is handed shards as the others shed
+their surplus.
+
+If the lock connection fails the worker gives up every shard (fail closed):
+the other workers take them over rather than two workers running the same
+schedule.
+"""
+
+import hashlib
+import logging
+import math
+from typing import Callable, FrozenSet, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Advisory-lock namespaces for the two-key pg_try_advisory_lock(int, int)
+# form, so shard and member locks can't collide with the single scheduler
+# lock (88442211) or the per-playlist execution locks (one bigint key).
+SHARD_LOCK_CLASS = 88442212
+MEMBER_LOCK_CLASS = 88442213
+
+# Upper bound on concurrently live workers (member slots).
+MAX_MEMBERS = 256
+
+
+def shard_for(target_playlist_id: str, shard_count: int) -> int:
+    """Map a target playlist ID to its shard.
+
+    Blake2b rather than ``hash()``: the mapping must agree across
+    processes, and ``hash()`` of a str is salted per process.
+    """
+    digest = hashlib.blake2b(
+        target_playlist_id.encode("utf-8"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "big") % shard_count
+
+
+class PgShardLocks:
+    """Advisory-lock operations on one dedicated Postgres connection.
+
+    Session-level advisory locks are released when their connection
+    closes, which is what hands a dead worker's shards to the others.
+    """
+
+    def __init__(self, db_url: str):
+        from sqlalchemy import create_engine
+
+        self._engine = create_engine(db_url, pool_size=1, pool_pre_ping=True)
+        self._conn = self._engine.connect()
+
+    def try_lock(self, namespace: int, key: int) -> bool:
+        from sqlalchemy import text
+
+        result = self._conn.execute(
+            text("SELECT pg_try_advisory_lock(:ns, :key)"),
+            {"ns": namespace, "key": key},
+        )
+        return bool(result.scalar())
+
+    def unlock(self, namespace: int, key: int) -> None:
+        from sqlalchemy import text
+
+        self._conn.execute(
+            text("SELECT pg_advisory_unlock(:ns, :key)"),
+            {"ns": namespace, "key": key},
+        )
+
+    def count_holders(self, namespace: int) -> int:
+        """Number of granted advisory locks in ``namespace``, all sessions."""
+        from sqlalchemy import text
+
+        result = self._conn.execute(
+            text(
+                "SELECT count(*) FROM pg_locks "
+                "WHERE locktype = 'advisory' AND classid = :ns "
+                "AND objsubid = 2 AND granted"
+            ),
+            {"ns": namespace},
+        )
+        return int(result.scalar())
+
+    def close(self) -> None:
+        try:
+            self._conn.close()
+        finally:
+            self._engine.dispose()
+
+
+class ShardCoordinator:
+    """Claims and rebalances this worker's share of the schedule shards."""
+
+    def __init__(
+        self,
+        locks_factory: Callable[[], PgShardLocks],
+        shard_count: int,
+    ):
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1")
+        self._locks_factory = locks_factory
+        self._locks: Optional[PgShardLocks] = None
+        self.shard_count = shard_count
+        self.member_slot: Optional[int] = None
+        self._owned: Set[int] = set()
+
+    @property
+    def owned(self) -> FrozenSet[int]:
+        """Shards this worker currently holds."""
+        return frozenset(self._owned)
+
+    def owns(self, target_playlist_id: str) -> bool:
+        """Whether this worker schedules jobs for ``target_playlist_id``."""
+        return shard_for(target_playlist_id, self.shard_count) in self._owned
+
+    def rebalance(
+        self,
+        before_release: Optional[Callable[[Set[int]], None]] = None,
+    ) -> Tuple[Set[int], Set[int]]:
+        """Bring this worker's shards to its fair share of the live workers.
+
+        Args:
+            before_release: Called with the shards about to be given up,
+                while they are still held, so their jobs can be removed
+                before another worker can claim them.
+
+        Returns:
+            Tuple of (gained, lost) shard sets.
+        """
+        before = set(self._owned)
+        try:
+            self._ensure_member()
+            live = max(1, self._locks.count_holders(MEMBER_LOCK_CLASS))
+            fair = math.ceil(self.shard_count / live)
+
+            # Shed the shards furthest along this worker's claim order,
+            # keeping the ones it would claim first anyway.
+            held = [s for s in self._claim_order(live) if s in self._owned]
+            surplus = set(held[fair:])
+            if surplus:
+                if before_release is not None:
+                    before_release(surplus)
+                for shard in surplus:
+                    self._locks.unlock(SHARD_LOCK_CLASS, shard)
+                    self._owned.discard(shard)
+
+            for shard in self._claim_order(live):
+                if len(self._owned) >= fair:
+                    break
+                if shard in self._owned:
+                    continue
+                if self._locks.try_lock(SHARD_LOCK_CLASS, shard):
+                    self._owned.add(shard)
+        except Exception as e:
+            logger.error(
+                "Shard rebalance failed (%s); giving up all %d shards so "
+                "other workers take them over",
+                e,
+                len(self._owned),
+            )
+            lost = set(self._owned)
+            if lost and before_release is not None:
+                try:
+                    before_release(lost)
+                except Exception:
+                    logger.exception("Failed to drop jobs for released shards")
+            self._drop_connection()
+            return set(), lost
+
+        gained = self._owned - before
+        lost = before - self._owned
+        if gained or lost:
+            logger.info(
+                "Shard rebalance: live_workers=%d fair_share=%d owned=%d "
+                "gained=%d lost=%d",
+                live,
+                fair,
+                len(self._owned),
+                len(gained),
+                len(lost),
+            )
+        return gained, lost
+
+    def leave(self) -> None:
+        """Release every lock held by this worker."""
+        self._drop_connection()
+
+    def _ensure_member(self) -> None:
+        if self._locks is None:
+            self._locks = self._locks_factory()
+            self.member_slot = None
+        if self.member_slot is not None:
+            return
+        for slot in range(MAX_MEMBERS):
+            if self._locks.try_lock(MEMBER_LOCK_CLASS, slot):
+                self.member_slot = slot
+                logger.info("Joined scheduler shard ring as member %d", slot)
+                return
+        raise RuntimeError(f"All {MAX_MEMBERS} scheduler member slots are taken")
+
+    def _claim_order(self, live: int) -> List[int]:
+        """Shards in the order this worker tries them.
+
+        Starting each member at a different offset keeps workers that
+        rebalance at the same moment from racing for the same shards.
+        """
+        start = (self.member_slot * self.shard_count // live) % self.shard_count
+        return [(start + i) % self.shard_count for i in range(self.shard_count)]
+
+    def _drop_connection(self) -> None:
+        self._owned.clear()
+        self.member_slot = None
+        if self._locks is not None:
+            try:
+                self._locks.close()
+            except Exception:
+                pass
+            self._locks = None
@@ -0,0 +1,203 @@
+"""
+Firing-time smoothing for scheduled jobs.
+
+Most schedules use the ``IntervalValue`` presets or a round cron time such
+as ``0 9 * * *``, and interval jobs registered together at boot share a
+start time, so whole groups of jobs fire in the same second. Each firing
+refreshes a token and pages in playlists, so the scheduler turns a quiet
+minute into a burst against Spotify and the database.
+
+Three pieces spread that load:
+
+- ``OffsetTrigger`` shifts a trigger's every firing by a fixed offset. It
+  delegates to the wrapped trigger, so the cadence is unchanged and the
+  result pickles into the job store like any other trigger.
+- ``FirePlanner`` picks each schedule's offset within a smoothing window.
+  A schedule starts from a slot derived from its ID (so its offset is
+  deterministic) and moves to the next slot with room when its preferred
+  one already holds ``budget`` schedules due at the same minute.
+- ``FireHistogram`` counts actual firings per minute, so the flattening
+  can be watched in the scheduler metrics.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+
+from apscheduler.triggers.base import BaseTrigger
+
+# Minutes of firing history kept by FireHistogram.
+HISTOGRAM_MINUTES = 120
+
+
+def _stable_hash(schedule_id: int) -> int:
+    digest = hashlib.blake2b(
+        str(schedule_id).encode("utf-8"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "big")
+
+
+class OffsetTrigger(BaseTrigger):
+    """Fire ``offset_seconds`` after every firing of ``trigger``."""
+
+    def __init__(self, trigger: BaseTrigger, offset_seconds: int):
+        self.trigger = trigger
+        self.offset_seconds = offset_seconds
+
+    def get_next_fire_time(self, previous_fire_time, now):
+        offset = timedelta(seconds=self.offset_seconds)
+        if previous_fire_time is not None:
+            previous_fire_time = previous_fire_time - offset
+        base = self.trigger.get_next_fire_time(previous_fire_time, now - offset)
+        return base + offset if base is not None else None
+
+    def __str__(self):
+        return f"{self.trigger} +{self.offset_seconds}s"
+
+    def __repr__(self):
+        return (
+            f"<OffsetTrigger ({self.trigger!r}, "
+            f"offset_seconds={self.offset_seconds})>"
+        )
+
+
+class FirePlanner:
+    """Assigns schedules firing offsets spread across a window.
+
+    The window is split into slots of ``slot_seconds``; at most ``budget``
+    schedules whose unshifted triggers next fire in the same minute share a
+    slot. Once every slot for that minute is full, further schedules go to
+    the least loaded one.
+    """
+
+    def __init__(
+        self,
+        window_seconds: int,
+        slot_seconds: int = 60,
+        budget: int = 10,
+    ):
+        if window_seconds < 1 or slot_seconds < 1 or budget < 1:
+            raise ValueError(
+                "window_seconds, slot_seconds and budget must be positive"
+            )
+        self.window_seconds = window_seconds
+        self.slot_seconds = min(slot_seconds, window_seconds)
+        self.slots = max(1, window_seconds // self.slot_seconds)
+        self.budget = budget
+        self._lock = threading.Lock()
+        self._load: Dict[Tuple[str, int], int] = {}
+        self._assigned: Dict[int, Tuple[str, int, int]] = {}
+
+    def offset_for(self, schedule_id: int, trigger: BaseTrigger) -> int:
+        """Pick (or re-pick) ``schedule_id``'s offset, in seconds.
+
+        Re-planning a schedule first releases its previous slot, so an
+        edited schedule doesn't count against its old minute.
+        """
+        bucket = self._bucket(trigger)
+        h = _stable_hash(schedule_id)
+        preferred = h % self.slots
+
+        with self._lock:
+            self._release(schedule_id)
+            loads = [
+                self._load.get((bucket, slot), 0) for slot in range(self.slots)
+            ]
+            slot = next(
+                (
+                    (preferred + i) % self.slots
+                    for i in range(self.slots)
+                    if loads[(preferred + i) % self.slots] < self.budget
+                ),
+                None,
+            )
+            if slot is None:
+                slot = min(range(self.slots), key=lambda s: (loads[s], s))
+            self._load[(bucket, slot)] = loads[slot] + 1
+            offset = slot * self.slot_seconds + (h // self.slots) % self.slot_seconds
+            self._assigned[schedule_id] = (bucket, slot, offset)
+            return offset
+
+    def reserve(
+        self, schedule_id: int, trigger: BaseTrigger, offset_seconds: int
+    ) -> None:
+        """Count an already-registered schedule's offset against its slot.
+
+        Used for jobs restored from the job store, so schedules planned
+        after them see the load they add.
+        """
+        slot = min(offset_seconds // self.slot_seconds, self.slots - 1)
+        bucket = self._bucket(trigger)
+        with self._lock:
+            self._release(schedule_id)
+            self._load[(bucket, slot)] = self._load.get((bucket, slot), 0) + 1
+            self._assigned[schedule_id] = (bucket, slot, offset_seconds)
+
+    def forget(self, schedule_id: int) -> None:
+        """Release a removed schedule's slot."""
+        with self._lock:
+            self._release(schedule_id)
+
+    def load(self) -> Dict[str, Dict[int, int]]:
+        """Planned schedules per slot, keyed by the minute they collide on."""
+        with self._lock:
+            planned: Dict[str, Dict[int, int]] = {}
+            for (bucket, slot), count in sorted(self._load.items()):
+                planned.setdefault(bucket, {})[slot] = count
+            return planned
+
+    @staticmethod
+    def _bucket(trigger: BaseTrigger) -> str:
+        """The minute ``trigger`` next fires, unshifted (UTC)."""
+        next_fire = trigger.get_next_fire_time(None, datetime.now(timezone.utc))
+        if next_fire is None:
+            return ""
+        return next_fire.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M")
+
+    def _release(self, schedule_id: int) -> None:
+        previous = self._assigned.pop(schedule_id, None)
+        if previous is None:
+            return
+        key = previous[:2]
+        remaining = self._load.get(key, 0) - 1
+        if remaining > 0:
+            self._load[key] = remaining
+        else:
+            self._load.pop(key, None)
+
+
+class FireHistogram:
+    """Job firings per minute over the last ``HISTOGRAM_MINUTES``."""
+
+    def __init__(self, minutes: int = HISTOGRAM_MINUTES):
+        self.minutes = minutes
+        self._lock = threading.Lock()
+        self._counts: "OrderedDict[str, int]" = OrderedDict()
+
+    def record(self, fired_at: Optional[datetime] = None) -> None:
+        fired_at = fired_at or datetime.now(timezone.utc)
+        minute = fired_at.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M")
+        with self._lock:
+            # Scheduled times arrive almost in order; keep keys sorted so
+            # the oldest minute is always first to go.
+            out_of_order = (
+                minute not in self._counts
+                and bool(self._counts)
+                and minute < next(reversed(self._counts))
+            )
+            self._counts[minute] = self._counts.get(minute, 0) + 1
+            if out_of_order:
+                self._counts = OrderedDict(sorted(self._counts.items()))
+            while len(self._counts) > self.minutes:
+                self._counts.popitem(last=False)
+
+    def snapshot(self) -> Dict[str, int]:
+        """Minute (UTC, ``YYYY-MM-DDTHH:MM``) to number of firings."""
+        with self._lock:
+            return dict(self._counts)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
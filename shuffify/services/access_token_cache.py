@@ -0,0 +1,297 @@
+"""
+Encrypted, TTL-aware cache of Spotify access tokens, keyed by user.
+
+Every scheduled job used to build its SpotifyAPI from the stored refresh
+token alone, with a placeholder access token that had "expired" at epoch
+0, so every run paid a refresh round trip to accounts.spotify.com before
+its first real request -- even when the same user's previous job, or
+their browser session, had minted an access token minutes earlier that
+was still good for most of an hour.
+
+This cache holds the most recent access token per Spotify user until
+shortly before it expires (``refresh_margin``), so jobs and web requests
+reuse it. Refreshes go through ``get_or_refresh``, which is single-flight
+per user: concurrent callers for one user wait for a single refresh
+instead of each sending their own.
+
+Storage:
+
+- With Redis, entries live under ``{key_prefix}{spotify_id}`` with a TTL
+  matching the token's remaining life, so every worker shares them. The
+  cross-process refresh lock is a ``SET NX PX`` key next to the entry.
+- Without Redis (or when a Redis call fails), an in-process dict serves
+  the same role for this worker only.
+
+Entries are Fernet-encrypted with the same key chain as refresh tokens
+(``TokenService``), so a Redis dump or a heap inspection never yields a
+bearer token in the clear. Refresh tokens are never cached here; they stay
+in the database.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import redis
+
+from shuffify import redis_lock
+from shuffify.services.token_service import TokenEncryptionError, TokenService
+from shuffify.spotify.auth import TokenInfo
+
+logger = logging.getLogger(__name__)
+
+
+class AccessTokenCache:
+    """
+    Per-user access-token cache with single-flight refresh.
+
+    Example:
+        cache = AccessTokenCache(redis_client)
+        token = cache.get_or_refresh(user.spotify_id, do_refresh)
+        cache.put(user.spotify_id, refreshed_token)   # from a web refresh
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        key_prefix: str = "shuffify:access_token:",
+        refresh_margin: int = 120,
+        lock_timeout: float = 30.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_client: Optional Redis client. When None, entries are
+                kept in this process only.
+            key_prefix: Prefix for Redis keys.
+            refresh_margin: Seconds before expiry at which a token stops
+                being served, so nobody starts a job on a token that dies
+                mid-run.
+            lock_timeout: Longest a refresh may hold the per-user lock
+                before another caller is allowed to take over.
+            clock: Wall clock (``expires_at`` is epoch seconds).
+            sleep: Sleep function, injectable for tests.
+        """
+        self._redis = redis_client
+        self._key_prefix = key_prefix
+        self._refresh_margin = refresh_margin
+        self._lock_timeout = lock_timeout
+        self._clock = clock
+        self._sleep = sleep
+        self._reset_local_state()
+
+    def _reset_local_state(self) -> None:
+        """(Re)build in-process entries and locks; also run after a fork."""
+        self._pid = os.getpid()
+        self._guard = threading.Lock()
+        self._local: Dict[str, Tuple[str, float]] = {}
+        self._user_locks: Dict[str, threading.Lock] = {}
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+
+    def _check_fork(self) -> None:
+        if self._pid != os.getpid():
+            self._reset_local_state()
+
+    @property
+    def refresh_margin(self) -> int:
+        """Seconds before expiry at which a token stops being served."""
+        return self._refresh_margin
+
+    @property
+    def backend(self) -> str:
+        """``"redis"`` when entries are shared across processes."""
+        return "redis" if self._redis is not None else "local"
+
+    # -----------------------------------------------------------------
+    # Public API
+    # -----------------------------------------------------------------
+
+    def get(self, user_key: str) -> Optional[TokenInfo]:
+        """Return a cached token with more than ``refresh_margin`` left.
+
+        The returned TokenInfo has no refresh token; callers add their own.
+        """
+        self._check_fork()
+        blob = None
+        read_shared = False
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(self._key(user_key))
+                blob = raw.decode("utf-8") if raw else None
+                read_shared = True
+            except redis.RedisError as e:
+                logger.warning("Access token cache read error: %s", e)
+        # The local copy only stands in when Redis is absent or failing;
+        # otherwise another worker's invalidate() would be ignored here.
+        if not read_shared:
+            with self._guard:
+                entry = self._local.get(user_key)
+            if entry is not None and entry[1] > self._clock():
+                blob = entry[0]
+
+        token = self._decode(blob) if blob else None
+        if token is not None and not self._usable(token):
+            token = None
+        with self._guard:
+            if token is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return token
+
+    def put(self, user_key: str, token_info: TokenInfo) -> None:
+        """Store ``token_info`` until ``refresh_margin`` before it expires."""
+        self._check_fork()
+        if not token_info.access_token or not self._usable(token_info):
+            return
+        try:
+            blob = TokenService.encrypt_token(
+                json.dumps(
+                    {
+                        "access_token": token_info.access_token,
+                        "token_type": token_info.token_type,
+                        "expires_at": token_info.expires_at,
+                        "scope": token_info.scope,
+                    }
+                )
+            )
+        except TokenEncryptionError as e:
+            logger.warning("Access token not cached: %s", e)
+            return
+
+        ttl = token_info.expires_at - self._refresh_margin - self._clock()
+        with self._guard:
+            self._local[user_key] = (blob, self._clock() + ttl)
+        if self._redis is not None:
+            try:
+                self._redis.setex(self._key(user_key), max(1, int(ttl)), blob)
+            except redis.RedisError as e:
+                logger.warning("Access token cache write error: %s", e)
+
+    def invalidate(self, user_key: str) -> None:
+        """Drop the cached token, e.g. after Spotify rejected it."""
+        self._check_fork()
+        with self._guard:
+            self._local.pop(user_key, None)
+        if self._redis is not None:
+            try:
+                self._redis.delete(self._key(user_key))
+            except redis.RedisError as e:
+                logger.warning("Access token cache delete error: %s", e)
+
+    def get_or_refresh(
+        self, user_key: str, refresh: Callable[[], TokenInfo]
+    ) -> TokenInfo:
+        """Return a cached token, or call ``refresh`` -- once per user.
+
+        Threads in this process queue on a per-user lock; processes queue
+        on a Redis lock. Whoever gets through first re-checks the cache,
+        so everyone behind a successful refresh gets its token without
+        refreshing again. An exception from ``refresh`` propagates to its
+        caller only; the next caller tries again.
+        """
+        token = self.get(user_key)
+        if token is not None:
+            return token
+
+        with self._user_lock(user_key):
+            token = self.get(user_key)
+            if token is not None:
+                return token
+
+            owner = self._acquire_shared_lock(user_key)
+            try:
+                # Another process may have finished while we waited.
+                token = self.get(user_key)
+                if token is not None:
+                    return token
+                token = refresh()
+                with self._guard:
+                    self._refreshes += 1
+                self.put(user_key, token)
+                return token
+            finally:
+                self._release_shared_lock(user_key, owner)
+
+    def metrics(self) -> Dict[str, object]:
+        """Return hit/miss/refresh counters for this process."""
+        self._check_fork()
+        with self._guard:
+            return {
+                "backend": self.backend,
+                "hits": self._hits,
+                "misses": self._misses,
+                "refreshes": self._refreshes,
+                "local_entries": len(self._local),
+            }
+
+    # -----------------------------------------------------------------
+    # Internals
+    # -----------------------------------------------------------------
+
+    def _key(self, user_key: str) -> str:
+        return f"{self._key_prefix}{user_key}"
+
+    def _usable(self, token_info: TokenInfo) -> bool:
+        return token_info.expires_at - self._refresh_margin > self._clock()
+
+    @staticmethod
+    def _decode(blob: str) -> Optional[TokenInfo]:
+        try:
+            data = json.loads(TokenService.decrypt_token(blob))
+            return TokenInfo(
+                access_token=data["access_token"],
+                token_type=data.get("token_type", "Bearer"),
+                expires_at=float(data["expires_at"]),
+                scope=data.get("scope"),
+            )
+        except (TokenEncryptionError, ValueError, KeyError, TypeError) as e:
+            # A key rotation or a corrupt entry is a cache miss, not an error.
+            logger.debug("Discarding unreadable access token entry: %s", e)
+            return None
+
+    def _user_lock(self, user_key: str) -> threading.Lock:
+        with self._guard:
+            lock = self._user_locks.get(user_key)
+            if lock is None:
+                lock = self._user_locks[user_key] = threading.Lock()
+            return lock
+
+    def _acquire_shared_lock(self, user_key: str) -> Optional[str]:
+        """Take the cross-process refresh lock, or wait out its holder.
+
+        Returns the owner token when we hold the lock, or None when Redis
+        is unavailable or the holder published a token while we waited.
+        """
+        if self._redis is None:
+            return None
+        try:
+            # On a timeout the holder died mid-refresh; its lock will expire
+            # on its own, and refreshing twice is only a wasted call.
+            return redis_lock.acquire_or_wait(
+                self._redis,
+                f"{self._key(user_key)}:lock",
+                self._lock_timeout,
+                lambda: self._redis.exists(self._key(user_key)) or None,
+                self._clock,
+                self._sleep,
+            ).owner
+        except redis.RedisError as e:
+            logger.warning("Access token refresh lock unavailable: %s", e)
+            return None
+
+    def _release_shared_lock(self, user_key: str, owner: Optional[str]) -> None:
+        if owner is None or self._redis is None:
+            return
+        try:
+            redis_lock.release(self._redis, f"{self._key(user_key)}:lock", owner)
+        except redis.RedisError as e:
+            logger.warning("Access token refresh lock release error: %s", e)
@@ -5,6 +5,7 @@ Handles OAuth URL generation, token exchange, validation, and session management
 """
 
 import logging
+import time
 from typing import Any, Dict, Optional, Tuple
 
 from shuffify.spotify.api import SpotifyAPI
@@ -171,11 +172,12 @@ class AuthService:
             # TokenInfo.from_dict, and an expired one with no refresh_token
             # still fails through the refresh path.
             return SpotifyAPI(
-                TokenInfo.from_dict(token),
+                AuthService._reuse_cached_access_token(TokenInfo.from_dict(token)),
                 AuthService._auth_manager(),
                 auto_refresh=True,
                 cache=get_spotify_cache(),
                 on_token_refresh=AuthService._persist_token_to_session,
+                on_token_rejected=AuthService._drop_cached_access_token,
             )
         except SpotifyTokenError as e:
             logger.error("Token initialization failed: %s", e)
@@ -212,6 +214,84 @@ class AuthService:
         except Exception as e:
             logger.warning("Failed to persist refreshed token to session: %s", e)
 
+        # Publish to the shared access-token cache too, so this user's
+        # scheduled jobs start on the token instead of refreshing again.
+        try:
+            from shuffify import get_access_token_cache
+
+            token_cache = get_access_token_cache()
+            spotify_id = (session.get("user_data") or {}).get("id")
+            if token_cache is not None and spotify_id:
+                token_cache.put(spotify_id, token_info)
+        except Exception as e:
+            logger.warning("Failed to publish refreshed token to cache: %s", e)
+
+    @staticmethod
+    def _drop_cached_access_token(token_info: "TokenInfo") -> None:
+        """
+        Remove the session user's access token from the shared cache.
+
+        Wired as SpotifyAPI's ``on_token_rejected`` callback: Spotify has
+        answered 401 to the token, so neither this session nor the user's
+        scheduled jobs should be handed it again. Best-effort, like
+        ``_persist_token_to_session``.
+        """
+        from flask import has_request_context, session
+
+        if not has_request_context():
+            return
+        try:
+            from shuffify import get_access_token_cache
+
+            token_cache = get_access_token_cache()
+            spotify_id = (session.get("user_data") or {}).get("id")
+            if token_cache is not None and spotify_id:
+                token_cache.invalidate(spotify_id)
+        except Exception as e:
+            logger.warning("Failed to drop rejected token from cache: %s", e)
+
+    @staticmethod
+    def _reuse_cached_access_token(token_info: TokenInfo) -> TokenInfo:
+        """
+        Swap an expiring session token for this user's cached one.
+
+        A scheduled job may already have refreshed the user's access token;
+        reusing it saves the request a refresh round trip. The session's
+        refresh token is kept either way. Returns ``token_info`` unchanged
+        when there is no request context, no cache, or no usable entry.
+        """
+        from flask import has_request_context, session
+
+        if not has_request_context():
+            return token_info
+        try:
+            from shuffify import get_access_token_cache
+
+            token_cache = get_access_token_cache()
+            spotify_id = (session.get("user_data") or {}).get("id")
+            if token_cache is None or not spotify_id:
+                return token_info
+            # Only worth a lookup when the session token would be refreshed.
+            if token_info.expires_at - time.time() > token_cache.refresh_margin:
+                return token_info
+            cached = token_cache.get(spotify_id)
+        except Exception as e:
+            logger.warning("Access token cache lookup failed: %s", e)
+            return token_info
+        if cached is None:
+            return token_info
+
+        logger.debug("Reusing cached access token for session user")
+        reused = TokenInfo(
+            access_token=cached.access_token,
+            token_type=cached.token_type,
+            expires_at=cached.expires_at,
+            refresh_token=token_info.refresh_token,
+            scope=cached.scope or token_info.scope,
+        )
+        AuthService._persist_token_to_session(reused)
+        return reused
+
     @staticmethod
     def get_user_data(api: SpotifyAPI) -> Dict[str, Any]:
         """
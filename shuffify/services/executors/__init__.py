@@ -6,6 +6,7 @@ Splits the monolithic job_executor_service into focused modules:
 - raid_executor: Raid-specific operations
 - shuffle_executor: Shuffle-specific operations
 - rotate_executor: Rotation modes and pairing logic
+- working_set: Per-execution playlist reads and expected post-write state
 
 Public API (backward-compatible):
     from shuffify.services.executors import (
@@ -21,7 +21,6 @@ from shuffify.services.token_service import (
     TokenEncryptionError,
     TokenService,
 )
-from shuffify.shuffle_algorithms.utils import extract_uris
 from shuffify.spotify.api import SpotifyAPI
 from shuffify.spotify.auth import SpotifyAuthManager, TokenInfo
 from shuffify.spotify.credentials import SpotifyCredentials
@@ -116,9 +115,11 @@ def verify_playlist_state(
 ) -> List[str]:
     """Re-fetch playlist and verify it matches expected.
 
-    Belt-and-suspenders: write methods on SpotifyAPI already invalidate
-    the playlist cache, but skip_cache=True here ensures correctness
-    even if a future write path forgets to invalidate.
+    Reads the live URI sequence with ``get_playlist_uris``, which never
+    touches the cache and transfers only URIs rather than full track
+    objects -- verification runs after every write, so it used to double
+    the bytes each job read. The comparison itself is unchanged: the
+    full sequence or multiset is checked, never a sample.
 
     Args:
         api: SpotifyAPI client.
@@ -139,11 +140,7 @@ def verify_playlist_state(
         PlaylistVerificationError: If the actual state diverges from expected
             (by sequence when ordered, otherwise by multiset).
     """
-    verified = api.get_playlist_tracks(
-        playlist_id,
-        skip_cache=True,
-    )
-    actual_uris = extract_uris(verified or [])
+    actual_uris = list(api.get_playlist_uris(playlist_id) or [])
 
     if ordered:
         diverged = actual_uris != expected_uris
@@ -161,6 +158,11 @@ def verify_playlist_state(
     return actual_uris
 
 
+def _success_status(result: dict) -> str:
+    """Status to record for a job that completed without error."""
+    return "unchanged" if result.get("unchanged") else "success"
+
+
 def _rollback_trigger_phrase(error) -> str:
     """Short human description for the rollback activity log."""
     if isinstance(error, PlaylistVerificationError):
@@ -460,7 +462,7 @@ class JobExecutorService:
 
                 JobExecutorService._record_success(execution, schedule, result)
                 return {
-                    "status": "success",
+                    "status": _success_status(result),
                     "tracks_added": result.get("tracks_added", 0),
                     "tracks_total": result.get("tracks_total", 0),
                 }
@@ -620,14 +622,20 @@ class JobExecutorService:
         schedule: Schedule,
         result: dict,
     ) -> None:
-        """Record a successful job execution."""
-        execution.status = "success"
+        """Record a successful job execution.
+
+        A raid that found nothing changed upstream is recorded as
+        ``"unchanged"`` rather than ``"success"``, so history shows which
+        runs did real work.
+        """
+        status = _success_status(result)
+        execution.status = status
         execution.completed_at = datetime.now(timezone.utc)
         execution.tracks_added = result.get("tracks_added", 0)
         execution.tracks_total = result.get("tracks_total", 0)
 
         schedule.last_run_at = datetime.now(timezone.utc)
-        schedule.last_status = "success"
+        schedule.last_status = status
         schedule.last_error = None
 
         db.session.commit()
@@ -654,6 +662,7 @@ class JobExecutorService:
                     "job_type": schedule.job_type,
                     "tracks_added": result.get("tracks_added", 0),
                     "tracks_total": result.get("tracks_total", 0),
+                    "status": status,
                     "triggered_by": "scheduler",
                 },
             )
@@ -891,15 +900,45 @@ class JobExecutorService:
                 refresh_token=refresh_token,
             )
 
+            # Reuse the user's still-valid access token when one is cached
+            # (from an earlier job or their browser session), so the run
+            # skips the refresh round trip. A miss refreshes once per user
+            # however many of their jobs start together.
+            from shuffify import get_access_token_cache, get_spotify_cache
+
+            token_cache = get_access_token_cache()
+            on_token_refresh = None
+            on_token_rejected = None
+            if token_cache is not None:
+                cached = token_cache.get_or_refresh(
+                    user.spotify_id,
+                    lambda: auth_manager.refresh_token(token_info),
+                )
+                token_info = TokenInfo(
+                    access_token=cached.access_token,
+                    token_type=cached.token_type,
+                    expires_at=cached.expires_at,
+                    refresh_token=cached.refresh_token or refresh_token,
+                    scope=cached.scope,
+                )
+
+                def on_token_refresh(new_token):
+                    token_cache.put(user.spotify_id, new_token)
+
+                # A revoked token is dropped so this user's other jobs
+                # refresh too instead of failing on it until it "expires".
+                def on_token_rejected(_rejected_token):
+                    token_cache.invalidate(user.spotify_id)
+
             # Inject the Redis cache (None when Redis is unavailable) so
             # background jobs share the cached playlist/user data (SR-005).
-            from shuffify import get_spotify_cache
-
             api = SpotifyAPI(
                 token_info,
                 auth_manager,
                 auto_refresh=True,
                 cache=get_spotify_cache(),
+                on_token_refresh=on_token_refresh,
+                on_token_rejected=on_token_rejected,
             )
 
             # Update stored refresh token if it was rotated
@@ -933,19 +972,34 @@ class JobExecutorService:
         from shuffify.services.executors.shuffle_executor import (  # noqa: E501
             execute_shuffle,
         )
+        from shuffify.services.executors.working_set import (
+            PlaylistWorkingSet,
+        )
 
         if schedule.job_type == JobType.RAID:
             return execute_raid(schedule, api)
         elif schedule.job_type == JobType.SHUFFLE:
             return execute_shuffle(schedule, api)
         elif schedule.job_type == JobType.RAID_AND_SHUFFLE:
-            result = execute_raid(schedule, api)
-            shuffle_result = execute_shuffle(schedule, api)
+            # One working set for both phases: each playlist is read once,
+            # and the raid playlist write is verified along with the
+            # shuffle's. The shuffle needs more of the target than the
+            # raid's dedupe does, so the raid's read fetches that up front.
+            working_set = PlaylistWorkingSet(api, schedule.id)
+            working_set.prefer_fields(schedule.target_playlist_id, "shuffle_minimal")
+            result = execute_raid(schedule, api, working_set)
+            shuffle_result = execute_shuffle(schedule, api, working_set)
+            working_set.verify()
+            # The shuffle ran either way, so the job isn't "unchanged".
+            result.pop("unchanged", None)
             result["tracks_total"] = shuffle_result["tracks_total"]
             return result
         elif schedule.job_type == JobType.RAID_AND_DRIP:
-            result = execute_raid(schedule, api)
-            drip_result = execute_drip(schedule, api)
+            working_set = PlaylistWorkingSet(api, schedule.id)
+            result = execute_raid(schedule, api, working_set)
+            result.pop("unchanged", None)
+            drip_result = execute_drip(schedule, api, working_set)
+            working_set.verify()
             result["tracks_dripped"] = drip_result.get("tracks_added", 0)
             return result
         elif schedule.job_type == JobType.ROTATE:
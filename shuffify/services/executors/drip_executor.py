@@ -9,17 +9,19 @@ PendingRaidTrack records are updated to PROMOTED status.
 import logging
 import random
 from datetime import datetime, timezone
+from typing import Optional
 
 from shuffify.enums import PendingRaidStatus, SnapshotType
 from shuffify.models.db import Schedule
 from shuffify.services.executors.base_executor import (
     JobExecutionError,
-    verify_playlist_state,
+)
+from shuffify.services.executors.working_set import (
+    PlaylistWorkingSet,
 )
 from shuffify.services.playlist_snapshot_service import (
     PlaylistSnapshotService,
 )
-from shuffify.shuffle_algorithms.utils import extract_uris
 from shuffify.spotify.api import SpotifyAPI
 from shuffify.spotify.exceptions import (
     SpotifyAPIError,
@@ -30,11 +32,17 @@ logger = logging.getLogger(__name__)
 
 
 def execute_drip(
-    schedule: Schedule, api: SpotifyAPI
+    schedule: Schedule,
+    api: SpotifyAPI,
+    working_set: Optional[PlaylistWorkingSet] = None,
 ) -> dict:
     """
     Move tracks from raid playlist to the top of the
     target playlist.
+
+    Both playlists are read once, through ``working_set``
+    when a combined job passes its own (so the raid phase's
+    reads and expected raid playlist state carry over).
     """
     from shuffify.services.raid_link_service import (
         RaidLinkService,
@@ -42,6 +50,7 @@ def execute_drip(
 
     target_id = schedule.target_playlist_id
     user_id = schedule.user_id
+    ws = working_set or PlaylistWorkingSet(api, schedule.id)
 
     link = RaidLinkService.get_link_for_playlist(
         user_id, target_id
@@ -62,10 +71,9 @@ def execute_drip(
             "skipping",
             schedule.id, target_id,
         )
-        target_tracks = api.get_playlist_tracks(target_id)
         return {
             "tracks_added": 0,
-            "tracks_total": len(target_tracks),
+            "tracks_total": len(ws.get_playlist_uris(target_id)),
             "skipped_reason": "drip_disabled",
         }
 
@@ -77,8 +85,7 @@ def execute_drip(
     try:
         raid_id = link.raid_playlist_id
 
-        raid_tracks = api.get_playlist_tracks(raid_id)
-        raid_uris = extract_uris(raid_tracks or [])
+        raid_uris = ws.get_playlist_uris(raid_id)
 
         if not raid_uris:
             logger.info(
@@ -86,28 +93,23 @@ def execute_drip(
                 "empty, nothing to drip",
                 schedule.id, raid_id,
             )
-            target_tracks = api.get_playlist_tracks(
-                target_id
-            )
             return {
                 "tracks_added": 0,
-                "tracks_total": len(target_tracks),
+                "tracks_total": len(
+                    ws.get_playlist_uris(target_id)
+                ),
             }
 
         _auto_snapshot_before_drip(
-            schedule, api, target_id, raid_id
+            schedule, ws, target_id, raid_id
         )
 
         drip_uris = _select_drip_tracks(
             raid_uris, drip_count
         )
 
-        target_tracks = api.get_playlist_tracks(target_id)
-        target_uri_set = {
-            t.get("uri")
-            for t in target_tracks
-            if t.get("uri")
-        }
+        prev_target_uris = ws.get_playlist_uris(target_id)
+        target_uri_set = set(prev_target_uris)
         drip_uris = [
             u for u in drip_uris
             if u not in target_uri_set
@@ -121,7 +123,7 @@ def execute_drip(
             )
             return {
                 "tracks_added": 0,
-                "tracks_total": len(target_tracks),
+                "tracks_total": len(prev_target_uris),
             }
 
         api.playlist_add_items(
@@ -133,15 +135,13 @@ def execute_drip(
         # otherwise tracks can be flagged as promoted while
         # absent from the target (failed add) or still
         # living in the raid playlist (failed remove).
-        prev_target_uris = extract_uris(target_tracks)
         # drip adds at position=0, so expected order is
         # drip_uris first, then existing target tracks.
         expected_target = list(drip_uris) + prev_target_uris
         # Order-sensitive: a drip that appended to the end instead of
         # prepending has the same multiset but the wrong sequence (SR-007).
-        verify_playlist_state(
-            api, target_id, expected_target,
-            schedule.id, "drip target",
+        ws.record_write(
+            target_id, expected_target, "drip target",
             ordered=True,
         )
 
@@ -149,10 +149,8 @@ def execute_drip(
         expected_raid = [
             u for u in raid_uris if u not in drip_set
         ]
-        verify_playlist_state(
-            api, raid_id, expected_raid,
-            schedule.id, "drip raid",
-        )
+        ws.record_write(raid_id, expected_raid, "drip raid")
+        ws.verify()
 
         _mark_dripped_as_promoted(
             user_id, target_id, drip_uris
@@ -180,7 +178,7 @@ def execute_drip(
         return {
             "tracks_added": len(drip_uris),
             "tracks_total": (
-                len(target_tracks) + len(drip_uris)
+                len(prev_target_uris) + len(drip_uris)
             ),
         }
 
@@ -208,12 +206,12 @@ def _select_drip_tracks(raid_uris, drip_count):
 
 
 def _auto_snapshot_before_drip(
-    schedule, api, target_id, raid_id,
+    schedule, ws, target_id, raid_id,
 ):
     """Create auto-snapshots before drip if enabled."""
     try:
-        target_tracks = api.get_playlist_tracks(target_id)
-        raid_tracks = api.get_playlist_tracks(raid_id)
+        target_uris = ws.get_playlist_uris(target_id)
+        raid_uris = ws.get_playlist_uris(raid_id)
     except Exception as snap_err:
         logger.warning(
             "Auto-snapshot before drip "
@@ -225,7 +223,7 @@ def _auto_snapshot_before_drip(
         user_id=schedule.user_id,
         playlist_id=target_id,
         playlist_name=schedule.target_playlist_name or target_id,
-        track_uris=extract_uris(target_tracks or []),
+        track_uris=target_uris,
         snapshot_type=SnapshotType.AUTO_PRE_DRIP,
         trigger_description="Before scheduled drip (target)",
     )
@@ -233,7 +231,7 @@ def _auto_snapshot_before_drip(
         user_id=schedule.user_id,
         playlist_id=raid_id,
         playlist_name="Raid playlist",
-        track_uris=extract_uris(raid_tracks or []),
+        track_uris=raid_uris,
         snapshot_type=SnapshotType.AUTO_PRE_DRIP,
         trigger_description="Before scheduled drip (raid)",
     )
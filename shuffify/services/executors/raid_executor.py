@@ -10,13 +10,15 @@ many tracks each source contributes.
 import logging
 import random
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from shuffify.enums import ActivityType, SnapshotType
 from shuffify.models.db import Schedule, UpstreamSource, db
 from shuffify.services.executors.base_executor import (
     JobExecutionError,
-    verify_playlist_state,
+)
+from shuffify.services.executors.working_set import (
+    PlaylistWorkingSet,
 )
 from shuffify.services.pending_raid_service import (
     PendingRaidService,
@@ -28,23 +30,37 @@ from shuffify.services.raid_dedupe import (
     build_full_exclusion_set,
 )
 from shuffify.services.source_resolver import SourceResolver
-from shuffify.shuffle_algorithms.utils import extract_uris
+from shuffify.services.source_resolver.base import content_hash
+from shuffify.services.source_resolver.public_scraper_pathway import (
+    PublicScraperPathway,
+)
 from shuffify.spotify.api import SpotifyAPI
 from shuffify.spotify.exceptions import (
     SpotifyAPIError,
     SpotifyNotFoundError,
+    SpotifyTokenExpiredError,
 )
 
 logger = logging.getLogger(__name__)
 
+# Scraped sources have no snapshot_id of their own to record.
+_SCRAPER_PATHWAY = PublicScraperPathway().name
+
 
 def execute_raid(
-    schedule: Schedule, api: SpotifyAPI
+    schedule: Schedule,
+    api: SpotifyAPI,
+    working_set: Optional[PlaylistWorkingSet] = None,
 ) -> dict:
     """
     Pull new tracks from source playlists, add to the raid
     playlist (if linked), and stage in PendingRaidTrack.
+
+    A combined job passes its ``working_set`` so later phases
+    reuse the raid's reads; the raid playlist write is then
+    verified by the caller, with the later phases' writes.
     """
+    ws = working_set or PlaylistWorkingSet(api, schedule.id)
     target_id = schedule.target_playlist_id
     source_ids = schedule.source_playlist_ids or []
 
@@ -64,22 +80,39 @@ def execute_raid(
             "skipping raid",
             schedule.id,
         )
-        target_tracks = api.get_playlist_tracks(target_id)
         return {
             "tracks_added": 0,
-            "tracks_total": len(target_tracks),
+            "tracks_total": len(ws.get_playlist_uris(target_id)),
+        }
+
+    # --- Change check: only re-resolve sources that changed upstream ---
+    versions = _probe_source_versions(api, sources)
+    changed = [
+        source for source in sources
+        if not _is_unchanged(source, versions)
+    ]
+    if not changed:
+        logger.info(
+            "Schedule %s: no source changed upstream since "
+            "the last raid, skipping resolve",
+            schedule.id,
+        )
+        return {
+            "tracks_added": 0,
+            "tracks_total": len(ws.get_playlist_uris(target_id)),
+            "unchanged": True,
         }
 
     # --- Target-specific operations (can raise NotFound) ---
     try:
         exclusion_set, target_count = (
             build_full_exclusion_set(
-                api, target_id, schedule.user_id
+                ws, target_id, schedule.user_id
             )
         )
 
         _auto_snapshot_before_raid(
-            schedule, api, target_id
+            schedule, ws, target_id
         )
     except SpotifyNotFoundError:
         raise JobExecutionError(
@@ -96,8 +129,9 @@ def execute_raid(
 
     # --- Source resolution (graceful — returns 0 on failure) ---
     new_uris, provenance = _fetch_raid_sources_with_limits(
-        api, sources, exclusion_set,
+        api, changed, exclusion_set,
         user_id=schedule.user_id,
+        versions=versions,
     )
 
     if not new_uris:
@@ -122,8 +156,8 @@ def execute_raid(
                 td["source_name"], td["source_playlist_id"] = src
 
         _add_to_raid_playlist(
-            api, schedule.user_id, target_id, new_uris,
-            schedule.id,
+            ws, schedule.user_id, target_id, new_uris,
+            verify=working_set is None,
         )
 
         staged = PendingRaidService.stage_tracks(
@@ -157,14 +191,91 @@ def execute_raid(
         )
 
 
+def _probe_source_versions(
+    api: SpotifyAPI, sources: list
+) -> Dict[int, str]:
+    """Current upstream version of each persisted playlist source.
+
+    The version is the playlist's snapshot_id, fetched on its own (a few
+    bytes). When Spotify won't give one and the source was last read by
+    scraping, the content hash of an unexpired scrape-cache row stands in.
+    Sources with no answer are left out, which means "resolve it".
+
+    Returns an empty dict when ``RAID_SKIP_UNCHANGED_SOURCES`` is off.
+    """
+    if not _skip_unchanged_enabled():
+        return {}
+
+    versions = {}
+    for source in sources:
+        playlist_id = source.source_playlist_id
+        if (
+            not source.id
+            or not playlist_id
+            or source.source_type == "search_query"
+        ):
+            continue
+
+        version = None
+        try:
+            version = api.get_playlist_snapshot_id(playlist_id)
+        except SpotifyTokenExpiredError:
+            raise
+        except SpotifyAPIError as e:
+            logger.debug(
+                "Snapshot probe failed for source %s: %s",
+                playlist_id, e,
+            )
+        if (
+            not isinstance(version, str)
+            and source.last_resolve_pathway == _SCRAPER_PATHWAY
+        ):
+            version = PublicScraperPathway.cached_content_hash(
+                playlist_id
+            )
+        if isinstance(version, str) and version:
+            versions[source.id] = version
+    return versions
+
+
+def _is_unchanged(source, versions: Dict[int, str]) -> bool:
+    """True when resolving ``source`` again can't offer anything new.
+
+    That takes the same upstream version as the last resolve, a
+    successful last resolve, and no fresh tracks left over from it (had
+    raid_count capped it, the rest would still be waiting).
+    """
+    version = versions.get(source.id) if source.id else None
+    return (
+        version is not None
+        and version == source.last_content_version
+        and source.last_resolve_status == "success"
+        and source.last_fresh_count == 0
+    )
+
+
+def _skip_unchanged_enabled() -> bool:
+    """Read ``RAID_SKIP_UNCHANGED_SOURCES`` (on outside an app context)."""
+    try:
+        from flask import current_app
+
+        return bool(
+            current_app.config.get(
+                "RAID_SKIP_UNCHANGED_SOURCES", True
+            )
+        )
+    except Exception:
+        return True
+
+
 def _auto_snapshot_before_raid(
     schedule: Schedule,
-    api: SpotifyAPI,
+    ws: PlaylistWorkingSet,
     target_id: str,
 ) -> None:
     """Create auto-snapshots before a scheduled raid."""
     try:
-        target_tracks = api.get_playlist_tracks(target_id)
+        target_uris = ws.get_playlist_uris(target_id)
     except Exception as snap_err:
         logger.warning(
             "Auto-snapshot before scheduled "
@@ -178,7 +289,7 @@ def _auto_snapshot_before_raid(
         playlist_name=(
             schedule.target_playlist_name or target_id
         ),
-        track_uris=extract_uris(target_tracks or []),
+        track_uris=target_uris,
         snapshot_type=SnapshotType.AUTO_PRE_RAID,
         trigger_description="Before scheduled raid",
     )
@@ -199,12 +310,13 @@ def _auto_snapshot_raid_playlist(user_id, raid_playlist_id, uris):
 
 
 def _add_to_raid_playlist(
-    api, user_id, target_id, uris, schedule_id,
+    ws, user_id, target_id, uris, verify=True,
 ):
     """Add raided tracks to the raid Spotify playlist
-    if a RaidPlaylistLink exists, and verify the resulting
-    state. Any HTTP failure or post-write divergence
-    propagates so the orchestrator can fail/rollback.
+    if a RaidPlaylistLink exists, and record (and, with
+    ``verify``, check) the resulting state. Any HTTP failure
+    or post-write divergence propagates so the orchestrator
+    can fail/rollback.
     """
     from shuffify.services.raid_link_service import (
         RaidLinkService,
@@ -216,13 +328,14 @@ def _add_to_raid_playlist(
     if not link:
         return
 
-    # The raid playlist is distinct from `target_id`, so its
-    # contents aren't fetched anywhere upstream. Read here
-    # to build the post-write expected URI set.
-    prev_raid_tracks = api.get_playlist_tracks(
-        link.raid_playlist_id
-    )
-    prev_raid_uris = extract_uris(prev_raid_tracks or [])
+    # The raid playlist's current order is the base of the
+    # post-write expected state. When the dedupe pass read the
+    # chain's playlists, it is memoized in the working set and
+    # this costs nothing. When the dedupe came from the URI index
+    # (which holds a set, not an order), this is the raid
+    # playlist's first read in the run, and it is answered from
+    # the cache or Spotify.
+    prev_raid_uris = ws.get_playlist_uris(link.raid_playlist_id)
 
     # Snapshot the raid playlist before writing, so a post-write verification
     # failure can be rolled back — the raid playlist is distinct from the
@@ -232,7 +345,7 @@ def _add_to_raid_playlist(
         user_id, link.raid_playlist_id, prev_raid_uris
     )
 
-    api.playlist_add_items(
+    ws.api.playlist_add_items(
         link.raid_playlist_id, uris
     )
     logger.info(
@@ -240,11 +353,13 @@ def _add_to_raid_playlist(
         len(uris), link.raid_playlist_id,
     )
 
-    expected_raid = prev_raid_uris + list(uris)
-    verify_playlist_state(
-        api, link.raid_playlist_id, expected_raid,
-        schedule_id, "raid pull",
+    ws.record_write(
+        link.raid_playlist_id,
+        prev_raid_uris + list(uris),
+        "raid pull",
     )
+    if verify:
+        ws.verify()
 
 
 def _fetch_raid_sources_with_limits(
@@ -252,6 +367,7 @@ def _fetch_raid_sources_with_limits(
     sources: list,
     exclusion_set: set,
     user_id: Optional[int] = None,
+    versions: Optional[Dict[int, str]] = None,
 ) -> List[str]:
     """
     Resolve the given UpstreamSource records and apply per-source
@@ -260,6 +376,8 @@ def _fetch_raid_sources_with_limits(
     ``sources`` is the already-loaded list of UpstreamSource records for the
     target (see ``_load_sources``). The caller owns loading so the skip
     decision and the resolution operate on the same authoritative set.
+    ``versions`` are the upstream versions probed before resolving (see
+    ``_probe_source_versions``), recorded on each source for the next run.
     """
     resolver = SourceResolver()
 
@@ -273,6 +391,7 @@ def _fetch_raid_sources_with_limits(
     # staged tracks record correct provenance -- the source, not the target
     # (SR-036).
     provenance = {}
+    fresh_counts = []
 
     for source, result in results.source_results:
         if result and not result.success:
@@ -312,6 +431,9 @@ def _fetch_raid_sources_with_limits(
         fresh_uris = [
             uri for uri in source_uris if uri not in exclusion_set
         ]
+        # What sampling leaves behind: a source that still has fresh
+        # tracks at the same version must be resolved again next run.
+        fresh_counts.append(max(0, len(fresh_uris) - raid_count))
 
         if len(fresh_uris) > raid_count:
             fresh_uris = random.sample(fresh_uris, raid_count)
@@ -327,7 +449,7 @@ def _fetch_raid_sources_with_limits(
             )
 
     # Update tracking fields on resolved sources
-    _update_source_tracking(results)
+    _update_source_tracking(results, fresh_counts, versions)
 
     # Deduplicate across sources
     seen = set()
@@ -442,11 +564,26 @@ def _log_failed_source_activity(user_id, source, result):
         )
 
 
-def _update_source_tracking(results):
-    """Update tracking fields on resolved sources."""
+def _update_source_tracking(results, fresh_counts=None, versions=None):
+    """Update tracking fields on resolved sources.
+
+    Along with the resolve outcome, records what the change check needs
+    next run: the upstream version (the probed snapshot_id, else a hash
+    of what the scraper read) and how many fresh tracks raid_count left
+    unsampled.
+    """
     now = datetime.now(timezone.utc)
-    for source, result in results.source_results:
+    versions = versions or {}
+    if fresh_counts is None:
+        fresh_counts = [None] * len(results.source_results)
+    for (source, result), fresh_count in zip(
+        results.source_results, fresh_counts
+    ):
         if source.id:
+            source.last_content_version = _resolved_version(
+                source, result, versions
+            )
+            source.last_fresh_count = fresh_count
             source.last_resolved_at = now
             source.last_resolve_pathway = (
                 result.pathway_name
@@ -465,6 +602,16 @@ def _update_source_tracking(results):
         )
 
 
+def _resolved_version(source, result, versions):
+    """The version to record for a source that was just resolved."""
+    if not result.success:
+        return None
+    version = versions.get(source.id)
+    if version is None and result.pathway_name == _SCRAPER_PATHWAY:
+        version = content_hash(result.track_uris)
+    return version
+
+
 def _build_track_dicts(
     api: SpotifyAPI,
     uris: List[str],
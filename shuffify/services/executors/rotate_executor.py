@@ -54,7 +54,7 @@ def execute_rotate(schedule: Schedule, api: SpotifyAPI) -> dict:
     archive_id = pair.archive_playlist_id
 
     try:
-        prod_tracks = api.get_playlist_tracks(target_id)
+        prod_tracks = api.get_playlist_tracks(target_id, fields="uris_only")
         if not prod_tracks:
             return {
                 "tracks_added": 0,
@@ -283,7 +283,7 @@ def _rotate_swap(
     swap rotation_count tracks between production and
     archive.
     """
-    archive_tracks = api.get_playlist_tracks(archive_id)
+    archive_tracks = api.get_playlist_tracks(archive_id, fields="uris_only")
     archive_uris = extract_uris(archive_tracks or [])
 
     prod_set = set(prod_uris)
@@ -3,12 +3,15 @@ Shuffle executor: run shuffle algorithms on target playlists.
 """
 
 import logging
+from typing import Optional
 
 from shuffify.enums import SnapshotType
 from shuffify.models.db import Schedule
 from shuffify.services.executors.base_executor import (
     JobExecutionError,
-    verify_playlist_state,
+)
+from shuffify.services.executors.working_set import (
+    PlaylistWorkingSet,
 )
 from shuffify.services.playlist_snapshot_service import (
     PlaylistSnapshotService,
@@ -25,9 +28,15 @@ logger = logging.getLogger(__name__)
 
 
 def execute_shuffle(
-    schedule: Schedule, api: SpotifyAPI
+    schedule: Schedule,
+    api: SpotifyAPI,
+    working_set: Optional[PlaylistWorkingSet] = None,
 ) -> dict:
-    """Run a shuffle algorithm on the target playlist."""
+    """Run a shuffle algorithm on the target playlist.
+
+    With a combined job's ``working_set``, the target is read from it
+    and the verification also covers the earlier phases' writes.
+    """
     target_id = schedule.target_playlist_id
     algorithm_name = schedule.algorithm_name
 
@@ -38,7 +47,10 @@ def execute_shuffle(
         )
 
     try:
-        raw_tracks = api.get_playlist_tracks(target_id)
+        ws = working_set or PlaylistWorkingSet(api, schedule.id)
+        raw_tracks = ws.get_playlist_tracks(
+            target_id, fields="shuffle_minimal"
+        )
 
         logger.info(
             "Schedule %d: fetched %d raw tracks from %s",
@@ -155,19 +167,22 @@ def execute_shuffle(
             target_id,
         )
 
+        # Locked tracks stay put, so the write planner only has to move
+        # the unlocked ones (and falls back to a full replace when that
+        # is as cheap).
         api.update_playlist_tracks(
-            target_id, shuffled_uris
+            target_id, shuffled_uris,
+            current_uris=extract_uris(tracks),
         )
 
         # Catches silent multi-batch truncation (update_playlist_tracks
         # returns True even if a POST batch after the initial PUT fails)
         # and, via ordered=True, a write that kept the original order —
         # a shuffle that silently didn't reorder (SR-007).
-        verify_playlist_state(
-            api, target_id, shuffled_uris,
-            schedule.id, "shuffle",
-            ordered=True,
+        ws.record_write(
+            target_id, shuffled_uris, "shuffle", ordered=True
         )
+        ws.verify()
 
         # Reconcile lock positions after reorder
         TrackLockService.safe_reconcile_positions(
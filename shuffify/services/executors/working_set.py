@@ -0,0 +1,190 @@
+"""
+Per-execution playlist working set.
+
+A combined job (raid-and-shuffle, raid-and-drip) used to run its phases
+as if they were separate jobs: the raid read the target and raid
+playlist, then the shuffle or drip read them again, and each phase
+re-read every playlist it wrote to verify it before the next phase began.
+
+``PlaylistWorkingSet`` is the unit of work the phases share instead. It
+memoizes playlist reads for the duration of one execution, records the
+state each write is expected to leave behind, and verifies all of those
+writes together with one live read per playlist. Phases read through it
+with the same calls they would make on ``SpotifyAPI``, and keep writing
+through the API itself.
+"""
+
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+
+from shuffify.services.executors.base_executor import (
+    verify_playlist_state,
+)
+from shuffify.shuffle_algorithms.utils import extract_uris
+from shuffify.spotify.api import SpotifyAPI
+
+logger = logging.getLogger(__name__)
+
+
+def _covers(have: Optional[str], want: Optional[str]) -> bool:
+    """Whether a read with the ``have`` preset answers a ``want`` read.
+
+    A full read (None) answers anything, and every preset carries URIs.
+    """
+    return have is None or have == want or want == "uris_only"
+
+
+class PlaylistWorkingSet:
+    """Playlist reads and expected post-write state for one execution."""
+
+    def __init__(self, api: SpotifyAPI, schedule_id: int):
+        self.api = api
+        self.schedule_id = schedule_id
+        self._reads: Dict[str, Tuple[Optional[str], List[dict]]] = {}
+        self._preferred: Dict[str, str] = {}
+        self._written: Dict[str, List[str]] = {}
+        self._pending: Dict[str, Tuple[str, bool]] = {}
+
+    # -----------------------------------------------------------------
+    # Reads
+    # -----------------------------------------------------------------
+
+    def prefer_fields(self, playlist_id: str, fields: Optional[str]) -> None:
+        """Read ``playlist_id`` with ``fields`` whenever it is first fetched.
+
+        Lets the orchestrator widen the first phase's read to what a later
+        phase needs, so both are answered by a single fetch.
+        """
+        self._preferred[playlist_id] = fields
+
+    def get_playlist_tracks(
+        self, playlist_id: str, fields: Optional[str] = None
+    ) -> List[dict]:
+        """Tracks of ``playlist_id``, fetched at most once per preset."""
+        cached = self._reads.get(playlist_id)
+        if cached is not None and _covers(cached[0], fields):
+            return list(cached[1])
+
+        fetch_fields = self._fetch_fields(playlist_id, fields)
+        if fetch_fields is None:
+            tracks = self.api.get_playlist_tracks(playlist_id)
+        else:
+            tracks = self.api.get_playlist_tracks(
+                playlist_id, fields=fetch_fields
+            )
+        tracks = tracks or []
+        self._store(playlist_id, fetch_fields, tracks)
+        return list(tracks)
+
+    def get_many_playlist_tracks(
+        self, playlist_ids: List[str], fields: Optional[str] = None
+    ) -> Dict[str, List[dict]]:
+        """Like ``SpotifyAPI.get_many_playlist_tracks``, from the working set.
+
+        Playlists already held are answered locally; the rest are fetched
+        with one batch call. A playlist with a preferred preset is fetched
+        on its own with that preset.
+        """
+        result = {}
+        batch = []
+        for playlist_id in playlist_ids:
+            cached = self._reads.get(playlist_id)
+            if cached is not None and _covers(cached[0], fields):
+                result[playlist_id] = list(cached[1])
+            elif self._fetch_fields(playlist_id, fields) != fields:
+                result[playlist_id] = self.get_playlist_tracks(
+                    playlist_id, fields
+                )
+            else:
+                batch.append(playlist_id)
+
+        if batch:
+            fetched = self.api.get_many_playlist_tracks(batch, fields=fields)
+            for playlist_id, tracks in fetched.items():
+                self._store(playlist_id, fields, tracks or [])
+                result[playlist_id] = list(tracks or [])
+
+        return {pid: result[pid] for pid in playlist_ids if pid in result}
+
+    def get_indexed_playlist_uris(
+        self, playlist_ids: List[str]
+    ) -> Optional[Tuple[Set[str], Dict[str, int]]]:
+        """``SpotifyAPI.get_indexed_playlist_uris``, passed straight through.
+
+        The index lives in the shared cache and tracks our writes itself,
+        so there is nothing for the working set to memoize.
+        """
+        return self.api.get_indexed_playlist_uris(playlist_ids)
+
+    def get_playlist_uris(self, playlist_id: str) -> List[str]:
+        """URIs of ``playlist_id`` as this execution left them.
+
+        After a recorded write this is the write's expected state, which
+        verification later checks against the live playlist.
+        """
+        if playlist_id in self._written:
+            return list(self._written[playlist_id])
+        return extract_uris(
+            self.get_playlist_tracks(playlist_id, fields="uris_only")
+        )
+
+    # -----------------------------------------------------------------
+    # Writes and verification
+    # -----------------------------------------------------------------
+
+    def record_write(
+        self,
+        playlist_id: str,
+        expected_uris: List[str],
+        phase: str,
+        ordered: bool = False,
+    ) -> None:
+        """Record the state a write to ``playlist_id`` should produce.
+
+        Replaces any earlier expectation for the playlist: only its final
+        state is verified. Memoized tracks for it are dropped, since they
+        describe the playlist before the write.
+        """
+        self._reads.pop(playlist_id, None)
+        self._written[playlist_id] = list(expected_uris)
+        self._pending[playlist_id] = (phase, ordered)
+
+    @property
+    def pending(self) -> List[str]:
+        """Playlists written since the last ``verify``."""
+        return list(self._pending)
+
+    def verify(self) -> None:
+        """Verify every recorded write with one live read per playlist.
+
+        Raises:
+            PlaylistVerificationError: On the first playlist whose live
+                state differs from what was recorded for it.
+        """
+        while self._pending:
+            playlist_id = next(iter(self._pending))
+            phase, ordered = self._pending[playlist_id]
+            verify_playlist_state(
+                self.api,
+                playlist_id,
+                self._written[playlist_id],
+                self.schedule_id,
+                phase,
+                ordered=ordered,
+            )
+            del self._pending[playlist_id]
+
+    # -----------------------------------------------------------------
+    # Internals
+    # -----------------------------------------------------------------
+
+    def _fetch_fields(
+        self, playlist_id: str, fields: Optional[str]
+    ) -> Optional[str]:
+        preferred = self._preferred.get(playlist_id, fields)
+        return preferred if _covers(preferred, fields) else fields
+
+    def _store(
+        self, playlist_id: str, fields: Optional[str], tracks: List[dict]
+    ) -> None:
+        self._reads[playlist_id] = (fields, list(tracks))
@@ -376,13 +376,20 @@ class PlaylistService:
         logger.debug(f"Computed stats for playlist {playlist_id}")
         return stats
 
-    def update_playlist_tracks(self, playlist_id: str, track_uris: List[str]) -> bool:
+    def update_playlist_tracks(
+        self,
+        playlist_id: str,
+        track_uris: List[str],
+        current_uris: Optional[List[str]] = None,
+    ) -> bool:
         """
         Update a playlist with a new track order.
 
         Args:
             playlist_id: The Spotify playlist ID.
             track_uris: List of track URIs in the desired order.
+            current_uris: The playlist's live URIs, if the caller has
+                them. Lets the API write only the difference.
 
         Returns:
             True if update succeeded.
@@ -399,7 +406,9 @@ class PlaylistService:
             )
 
         try:
-            success = self._api.update_playlist_tracks(playlist_id, track_uris)
+            success = self._api.update_playlist_tracks(
+                playlist_id, track_uris, current_uris=current_uris
+            )
             if success:
                 logger.info(
                     f"Updated playlist {playlist_id} with {len(track_uris)} tracks"
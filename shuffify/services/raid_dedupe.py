@@ -23,8 +23,17 @@ def build_full_exclusion_set(api, target_id, user_id):
 
     Checks: target + raid playlist + archive + dismissed.
 
+    The chain's URIs come from the cache's per-playlist URI index when it
+    is enabled: each playlist costs a snapshot_id check, and only one
+    that changed outside Shuffify is read again. Otherwise the chain's
+    playlists are read (URIs only) with one ``get_many_playlist_tracks``
+    call, so a warm cache answers all three in a single round trip. If
+    that call fails, each playlist is fetched on its own so one bad
+    playlist only drops its own tracks from the set.
+
     Args:
-        api: SpotifyAPI instance.
+        api: SpotifyAPI instance, or the PlaylistWorkingSet of a running
+            job, whose memoized reads later phases then reuse.
         target_id: Target playlist Spotify ID.
         user_id: Internal database user ID.
 
@@ -36,12 +45,7 @@ def build_full_exclusion_set(api, target_id, user_id):
     exclusion = set()
     target_track_count = 0
 
-    try:
-        target_tracks = api.get_playlist_tracks(target_id)
-        target_track_count = len(target_tracks)
-        exclusion |= {t.get("uri") for t in target_tracks if t.get("uri")}
-    except Exception as e:
-        logger.warning("Could not fetch target tracks for dedupe: %s", e)
+    chain = [("target", target_id)]
 
     try:
         link = RaidPlaylistLink.query.filter_by(
@@ -49,11 +53,10 @@ def build_full_exclusion_set(api, target_id, user_id):
             target_playlist_id=target_id,
         ).first()
         if link:
-            raid_tracks = api.get_playlist_tracks(link.raid_playlist_id)
-            exclusion |= {t.get("uri") for t in raid_tracks if t.get("uri")}
+            chain.append(("raid playlist", link.raid_playlist_id))
     except Exception as e:
         db.session.rollback()
-        logger.warning("Could not fetch raid playlist tracks for dedupe: %s", e)
+        logger.warning("Could not look up raid playlist for dedupe: %s", e)
 
     try:
         pair = PlaylistPair.query.filter_by(
@@ -61,11 +64,23 @@ def build_full_exclusion_set(api, target_id, user_id):
             production_playlist_id=target_id,
         ).first()
         if pair:
-            archive_tracks = api.get_playlist_tracks(pair.archive_playlist_id)
-            exclusion |= {t.get("uri") for t in archive_tracks if t.get("uri")}
+            chain.append(("archive", pair.archive_playlist_id))
     except Exception as e:
         db.session.rollback()
-        logger.warning("Could not fetch archive tracks for dedupe: %s", e)
+        logger.warning("Could not look up archive playlist for dedupe: %s", e)
+
+    indexed = _indexed_chain_uris(api, chain)
+    if indexed is not None:
+        exclusion, counts = indexed
+        target_track_count = counts.get(target_id, 0)
+    else:
+        tracks_by_playlist = _fetch_chain_tracks(api, chain)
+
+        target_tracks = tracks_by_playlist.get(target_id)
+        if target_tracks is not None:
+            target_track_count = len(target_tracks)
+        for tracks in tracks_by_playlist.values():
+            exclusion |= {t.get("uri") for t in tracks if t.get("uri")}
 
     try:
         dismissed = PendingRaidTrack.query.filter_by(
@@ -79,3 +94,45 @@ def build_full_exclusion_set(api, target_id, user_id):
         logger.warning("Could not fetch dismissed tracks for dedupe: %s", e)
 
     return exclusion, target_track_count
+
+
+def _indexed_chain_uris(api, chain):
+    """Union of the chain's URIs from the URI index, or None.
+
+    Any failure falls back to reading the playlists, which reports
+    problems per playlist.
+    """
+    try:
+        indexed = api.get_indexed_playlist_uris(
+            [playlist_id for _, playlist_id in chain]
+        )
+        if indexed is None:
+            return None
+        uris, counts = indexed
+        return set(uris), dict(counts)
+    except Exception as e:
+        logger.debug("URI index unavailable for dedupe, reading playlists: %s", e)
+        return None
+
+
+def _fetch_chain_tracks(api, chain):
+    """Fetch tracks for each ``(label, playlist_id)`` in the chain.
+
+    Returns a dict of playlist ID to tracks, omitting playlists that
+    could not be fetched.
+    """
+    playlist_ids = [playlist_id for _, playlist_id in chain]
+    try:
+        return api.get_many_playlist_tracks(playlist_ids, fields="uris_only")
+    except Exception as e:
+        logger.debug("Batch fetch for dedupe failed, fetching one by one: %s", e)
+
+    tracks_by_playlist = {}
+    for label, playlist_id in chain:
+        try:
+            tracks_by_playlist[playlist_id] = api.get_playlist_tracks(
+                playlist_id, fields="uris_only"
+            )
+        except Exception as e:
+            logger.warning("Could not fetch %s tracks for dedupe: %s", label, e)
+    return tracks_by_playlist
@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, List, Optional, Protocol, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+)
 
 if TYPE_CHECKING:
     from shuffify.models.db import UpstreamSource
@@ -48,6 +57,19 @@ class ResolveAllResult:
     )
 
 
+def content_hash(uris: Iterable[str]) -> str:
+    """Hash a source's track set, ignoring order and duplicates.
+
+    Stands in for a snapshot_id where a source can only be scraped: the
+    same tracks always hash the same, however the page listed them.
+    """
+    digest = hashlib.sha256()
+    for uri in sorted(set(uris)):
+        digest.update(uri.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
 def find_nested_key(data: Any, key: str) -> Any:
     """Find the first occurrence of a key in a nested structure.
 
@@ -1,22 +1,27 @@
 """Public scraper pathway — extracts tracks from Spotify's public web pages.
 
 Uses structured JSON extraction from embed/public pages rather than
-naive regex matching. Parses __NEXT_DATA__ script tags and trackList
-arrays that Spotify embeds in server-rendered HTML.
+naive regex matching. Finds the __NEXT_DATA__ script tag and trackList
+arrays that Spotify embeds in server-rendered HTML by searching for those
+landmarks, and decodes only the track arrays rather than whole scripts.
 """
 
 import json
 import logging
+import os
 import random
 import re
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from .base import ResolveResult, find_nested_key
+from .base import ResolveResult, content_hash
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +51,15 @@ REQUEST_HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+# Connection pool for open.spotify.com. Every scrape targets that one host;
+# the pool only needs a socket per concurrent resolver worker.
+POOL_CONNECTIONS = 1
+POOL_MAXSIZE = 10
+
+_session_lock = threading.Lock()
+_shared_session: Optional[requests.Session] = None
+_shared_session_pid: Optional[int] = None
+
 # ---------------------------------------------------------------------------
 # Retry / backoff configuration
 # ---------------------------------------------------------------------------
@@ -65,28 +79,32 @@ MAX_BACKOFF = 30  # seconds — ceiling for any single sleep
 CACHE_TTL = 3600  # 1 hour
 
 # ---------------------------------------------------------------------------
-# Extraction patterns (ordered by reliability)
+# Hedging configuration
 # ---------------------------------------------------------------------------
+# Fallbacks for the SCRAPER_HEDGE_* settings when no Flask app context is
+# active; see ``_get_hedge_settings()`` and ``config.Config``. Hedging
+# decisions come from ScrapeStrategyStats, so without a database the
+# strategies always run in turn.
+DEFAULT_HEDGE_ENABLED = True
+DEFAULT_HEDGE_DELAY = 1.0  # seconds
+DEFAULT_HEDGE_EMBED_SUCCESS_BELOW = 0.8
+DEFAULT_HEDGE_MIN_SAMPLES = 5
 
-# Pattern to locate the __NEXT_DATA__ script tag on Spotify pages.
-# This contains a JSON blob with full playlist/track metadata.
-NEXT_DATA_PATTERN = re.compile(
-    r'<script\s+id="__NEXT_DATA__"\s+type="application/json"'
-    r"[^>]*>(.*?)</script>",
-    re.DOTALL,
-)
-
-# Pattern to locate any <script> tag containing a "trackList" key.
-# The embed player stores a simplified track list in these blocks.
-TRACK_LIST_SCRIPT_PATTERN = re.compile(
-    r"<script[^>]*>(.*?)</script>",
-    re.DOTALL,
-)
+# ---------------------------------------------------------------------------
+# Extraction patterns
+# ---------------------------------------------------------------------------
+
+# A "trackList" / "items" key whose value is an array: the candidates for
+# track data inside script blocks. Only the array itself is decoded.
+TRACK_ARRAY_PATTERN = re.compile(r'"(?P<key>trackList|items)"\s*:\s*(?=\[)')
+TRACK_LIST_ARRAY_PATTERN = re.compile(r'"trackList"\s*:\s*(?=\[)')
 
 # Fallback regex patterns for raw URI/URL extraction (last resort).
 URI_PATTERN = re.compile(r'"(spotify:track:[a-zA-Z0-9]{22})"')
 URL_PATTERN = re.compile(r"/track/([a-zA-Z0-9]{22})")
 
+_JSON_DECODER = json.JSONDecoder()
+
 
 @dataclass
 class ScrapeOutcome:
@@ -111,6 +129,53 @@ class ScrapeOutcome:
     uris: List[str]
     confirmed: bool
     error: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False
+
+
+@dataclass
+class CachedScrape:
+    """A scrape-cache row as read for revalidation (expired or not).
+
+    ``etag`` / ``last_modified`` are the validators of the page the URIs
+    were extracted from (``scrape_pathway``); a 304 for that page means
+    ``uris`` still hold.
+    """
+
+    uris: List[str]
+    scrape_pathway: Optional[str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+def get_scrape_session() -> requests.Session:
+    """Return this process's shared session for scraping Spotify's pages.
+
+    Scrapes carry no credentials, so one ``Session`` (and its keep-alive
+    connections to open.spotify.com) serves every raid in the process
+    instead of a new TCP + TLS handshake per page.
+
+    Rebuilt whenever the owning PID changes, like
+    ``shuffify.spotify.http_client.get_shared_adapter``: sockets inherited
+    across ``fork()`` under a preloading Gunicorn must not be reused.
+    """
+    global _shared_session, _shared_session_pid
+
+    pid = os.getpid()
+    with _session_lock:
+        if _shared_session is None or _shared_session_pid != pid:
+            session = requests.Session()
+            session.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=POOL_MAXSIZE,
+                ),
+            )
+            _shared_session = session
+            _shared_session_pid = pid
+        return _shared_session
 
 
 class PublicScraperPathway:
@@ -125,7 +190,10 @@ class PublicScraperPathway:
     3. Public page → parse __NEXT_DATA__ JSON
     4. Any page → fallback regex extraction of track URIs/URLs
 
-    Results are cached in the database to avoid repeated scraping.
+    Results are cached in the database to avoid repeated scraping. Once
+    a cached scrape expires, the page it came from is fetched with its
+    stored ``ETag`` / ``Last-Modified``; a 304 reuses the cached tracks
+    without downloading or parsing the page.
     """
 
     @property
@@ -168,25 +236,28 @@ class PublicScraperPathway:
                 success=False,
             )
 
-        # Strategy 1: Embed endpoint (lighter, more structured)
-        embed = self._scrape_embed(playlist_id)
-        if embed.uris:
-            self._set_cached(playlist_id, embed.uris, "embed")
-            return ResolveResult(
-                track_uris=embed.uris,
-                pathway_name=self.name,
-                success=True,
-            )
+        # An expired row can still be revalidated against the page it
+        # was scraped from.
+        previous = self._get_revalidation_state(playlist_id)
 
-        # Strategy 2: Public page (heavier, but may have more data)
-        public = self._scrape_public_page(playlist_id)
-        if public.uris:
-            self._set_cached(playlist_id, public.uris, "public_page")
-            return ResolveResult(
-                track_uris=public.uris,
-                pathway_name=self.name,
-                success=True,
+        hedging = _get_hedge_settings()
+        if hedging["enabled"] and self._should_hedge(playlist_id, hedging):
+            outcomes = self._scrape_hedged(
+                playlist_id, previous, hedging["delay"]
             )
+        else:
+            outcomes = self._scrape_in_turn(playlist_id, previous)
+        if hedging["enabled"]:
+            self._record_strategy_outcomes(playlist_id, outcomes)
+
+        for scrape_pathway, outcome in outcomes.items():
+            if outcome.uris:
+                self._cache_outcome(playlist_id, outcome, scrape_pathway)
+                return ResolveResult(
+                    track_uris=outcome.uris,
+                    pathway_name=self.name,
+                    success=True,
+                )
 
         # Neither strategy returned tracks. Two cases:
         #
@@ -199,7 +270,7 @@ class PublicScraperPathway:
         #     error) — the playlist's state is unknown. Do NOT cache; let
         #     the next call retry. This avoids the cache-poisoning bug
         #     where one transient failure blocks an hour of raids.
-        if embed.confirmed or public.confirmed:
+        if any(outcome.confirmed for outcome in outcomes.values()):
             self._set_cached(playlist_id, [], "none")
             return ResolveResult(
                 track_uris=[],
@@ -209,7 +280,10 @@ class PublicScraperPathway:
             )
 
         # Both unconfirmed — surface the failure without caching.
-        failure_reason = embed.error or public.error or "scrape failed"
+        failure_reason = next(
+            (outcome.error for outcome in outcomes.values() if outcome.error),
+            "scrape failed",
+        )
         return ResolveResult(
             track_uris=[],
             pathway_name=self.name,
@@ -217,11 +291,115 @@ class PublicScraperPathway:
             error_message=f"Scrape unconfirmed: {failure_reason}",
         )
 
+    def _scrape_in_turn(
+        self,
+        playlist_id: str,
+        previous: Optional[CachedScrape],
+    ) -> Dict[str, ScrapeOutcome]:
+        """Run the strategies one after another until one returns tracks.
+
+        Returns the outcome of each strategy that ran, keyed by its
+        ``scrape_pathway`` name, in the order they ran.
+        """
+        # Strategy 1: Embed endpoint (lighter, more structured)
+        outcomes = {
+            "embed": self._scrape_embed(
+                playlist_id, _validated_by(previous, "embed")
+            )
+        }
+        if not outcomes["embed"].uris:
+            # Strategy 2: Public page (heavier, but may have more data)
+            outcomes["public_page"] = self._scrape_public_page(
+                playlist_id, _validated_by(previous, "public_page")
+            )
+        return outcomes
+
+    def _scrape_hedged(
+        self,
+        playlist_id: str,
+        previous: Optional[CachedScrape],
+        delay: float,
+    ) -> Dict[str, ScrapeOutcome]:
+        """Race the public page against an embed that is slow to answer.
+
+        The embed request starts first. The public page starts once the
+        embed comes back without tracks or ``delay`` seconds pass,
+        whichever is sooner, so an embed stuck in timeouts and backoff
+        no longer holds the public page back. The first outcome with
+        tracks wins and the other request is cancelled: it stops before
+        its next attempt or backoff sleep, and whatever it is still
+        waiting on is discarded.
+
+        Returns the outcome of each strategy that finished, keyed by its
+        ``scrape_pathway`` name, in strategy order; a cancelled strategy
+        is left out.
+        """
+        timeout = _get_request_timeout()
+        cancel = threading.Event()
+        outcomes: Dict[str, ScrapeOutcome] = {}
+        pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="scrape-hedge"
+        )
+        try:
+            pending: Dict[Future, str] = {
+                pool.submit(
+                    self._scrape_embed,
+                    playlist_id,
+                    _validated_by(previous, "embed"),
+                    timeout=timeout,
+                    cancel=cancel,
+                ): "embed"
+            }
+            public_started = False
+            done, _ = wait(pending, timeout=delay)
+            while True:
+                for future in done:
+                    outcomes[pending.pop(future)] = _outcome_or_failure(future)
+                if any(outcome.uris for outcome in outcomes.values()):
+                    break
+                if not public_started:
+                    public_started = True
+                    if pending:
+                        logger.info(
+                            "Embed scrape for %s still running after "
+                            "%ss; hedging with the public page",
+                            playlist_id,
+                            delay,
+                        )
+                    pending[
+                        pool.submit(
+                            self._scrape_public_page,
+                            playlist_id,
+                            _validated_by(previous, "public_page"),
+                            timeout=timeout,
+                            cancel=cancel,
+                        )
+                    ] = "public_page"
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        finally:
+            cancel.set()
+            # Never block the resolve on the losing request.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return {
+            name: outcomes[name]
+            for name in ("embed", "public_page")
+            if name in outcomes
+        }
+
     # ------------------------------------------------------------------
     # Scrape strategies
     # ------------------------------------------------------------------
 
-    def _scrape_embed(self, playlist_id: str) -> ScrapeOutcome:
+    def _scrape_embed(
+        self,
+        playlist_id: str,
+        previous: Optional[CachedScrape] = None,
+        timeout: Optional[float] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> ScrapeOutcome:
         """Extract URIs from the embed endpoint.
 
         Returns a ScrapeOutcome whose ``confirmed`` field signals whether
@@ -231,17 +409,37 @@ class PublicScraperPathway:
             EMBED_URL.format(playlist_id=playlist_id),
             playlist_id,
             label="Embed",
+            previous=previous,
+            timeout=timeout,
+            cancel=cancel,
         )
 
-    def _scrape_public_page(self, playlist_id: str) -> ScrapeOutcome:
+    def _scrape_public_page(
+        self,
+        playlist_id: str,
+        previous: Optional[CachedScrape] = None,
+        timeout: Optional[float] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> ScrapeOutcome:
         """Extract URIs from the public playlist page."""
         return self._do_scrape(
             PUBLIC_URL.format(playlist_id=playlist_id),
             playlist_id,
             label="Public page",
+            previous=previous,
+            timeout=timeout,
+            cancel=cancel,
         )
 
-    def _do_scrape(self, url: str, playlist_id: str, label: str) -> ScrapeOutcome:
+    def _do_scrape(
+        self,
+        url: str,
+        playlist_id: str,
+        label: str,
+        previous: Optional[CachedScrape] = None,
+        timeout: Optional[float] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> ScrapeOutcome:
         """Fetch ``url`` and extract track URIs, classifying the outcome.
 
         Retries transient failures (429/5xx, network errors, timeouts) up
@@ -251,18 +449,36 @@ class PublicScraperPathway:
         attempts on a known-bad source.
 
         ``confirmed`` is True only when an HTTP 200 was received and the
-        body was parsed. All other cases return ``confirmed=False`` so the
-        caller can skip the cache write.
+        body was parsed, or when ``previous`` (the cached scrape of this
+        same page) was revalidated with a 304. All other cases return
+        ``confirmed=False`` so the caller can skip the cache write.
+
+        ``timeout`` overrides ``_get_request_timeout()`` for callers off
+        the app context's thread. Once ``cancel`` is set, no further
+        attempt is made and a pending backoff sleep ends early.
         """
         last_error: Optional[str] = None
-        timeout = _get_request_timeout()
+        if timeout is None:
+            timeout = _get_request_timeout()
+        headers = dict(REQUEST_HEADERS)
+        if previous is not None:
+            if previous.etag:
+                headers["If-None-Match"] = previous.etag
+            if previous.last_modified:
+                headers["If-Modified-Since"] = previous.last_modified
 
         for attempt in range(MAX_ATTEMPTS):
+            if cancel is not None and cancel.is_set():
+                return ScrapeOutcome(
+                    uris=[],
+                    confirmed=False,
+                    error=last_error or "cancelled",
+                )
             try:
-                resp = requests.get(
+                resp = get_scrape_session().get(
                     url,
                     timeout=timeout,
-                    headers=REQUEST_HEADERS,
+                    headers=headers,
                 )
             except (
                 requests.Timeout,
@@ -278,7 +494,7 @@ class PublicScraperPathway:
                     e,
                 )
                 if attempt < MAX_ATTEMPTS - 1:
-                    _sleep_with_backoff(attempt)
+                    _sleep_with_backoff(attempt, cancel=cancel)
                     continue
                 return ScrapeOutcome(
                     uris=[],
@@ -306,6 +522,25 @@ class PublicScraperPathway:
                 return ScrapeOutcome(
                     uris=_extract_uris(resp.text),
                     confirmed=True,
+                    etag=_header(resp, "ETag"),
+                    last_modified=_header(resp, "Last-Modified"),
+                )
+
+            if status == 304 and previous is not None:
+                logger.debug(
+                    "%s for %s not modified, reusing %d cached tracks",
+                    label,
+                    playlist_id,
+                    len(previous.uris),
+                )
+                return ScrapeOutcome(
+                    uris=list(previous.uris),
+                    confirmed=True,
+                    etag=_header(resp, "ETag") or previous.etag,
+                    last_modified=(
+                        _header(resp, "Last-Modified") or previous.last_modified
+                    ),
+                    not_modified=True,
                 )
 
             if status in PERMANENT_STATUS_CODES:
@@ -335,6 +570,7 @@ class PublicScraperPathway:
                     _sleep_with_backoff(
                         attempt,
                         retry_after=resp.headers.get("Retry-After"),
+                        cancel=cancel,
                     )
                     continue
                 return ScrapeOutcome(
@@ -395,13 +631,89 @@ class PublicScraperPathway:
             logger.warning("Scraper cache read error: %s", e)
             return None
 
+    @staticmethod
+    def _get_revalidation_state(
+        playlist_id: str,
+    ) -> Optional[CachedScrape]:
+        """The latest cached scrape, expired or not, if it has validators."""
+        try:
+            from shuffify.models.db import (
+                ScrapedPlaylistCache,
+            )
+
+            row = (
+                ScrapedPlaylistCache.query.filter(
+                    ScrapedPlaylistCache.playlist_id == playlist_id,
+                )
+                .order_by(ScrapedPlaylistCache.scraped_at.desc())
+                .first()
+            )
+            if row is None or not (row.etag or row.last_modified):
+                return None
+            return CachedScrape(
+                uris=row.track_uris,
+                scrape_pathway=row.scrape_pathway,
+                etag=row.etag,
+                last_modified=row.last_modified,
+            )
+        except Exception as e:
+            logger.warning("Scraper cache read error: %s", e)
+            return None
+
+    def _cache_outcome(
+        self, playlist_id: str, outcome: ScrapeOutcome, pathway: str
+    ) -> None:
+        """Cache a confirmed scrape with the validators of its page."""
+        self._set_cached(
+            playlist_id,
+            outcome.uris,
+            pathway,
+            etag=outcome.etag,
+            last_modified=outcome.last_modified,
+        )
+
+    @staticmethod
+    def cached_content_hash(playlist_id: str) -> Optional[str]:
+        """Content hash of the unexpired cached scrape, if there is one.
+
+        Lets a caller check whether a scraped source changed without
+        scraping it: a miss (or a read error) returns None, meaning
+        "unknown", never "unchanged".
+        """
+        try:
+            from shuffify.models.db import (
+                ScrapedPlaylistCache,
+            )
+
+            now = datetime.now(timezone.utc)
+            row = (
+                ScrapedPlaylistCache.query.filter(
+                    ScrapedPlaylistCache.playlist_id == playlist_id,
+                    ScrapedPlaylistCache.expires_at > now,
+                )
+                .order_by(ScrapedPlaylistCache.scraped_at.desc())
+                .first()
+            )
+            if row is None:
+                return None
+            return row.content_hash or content_hash(row.track_uris)
+        except Exception as e:
+            logger.warning("Scraper cache read error: %s", e)
+            return None
+
     @staticmethod
     def _set_cached(
         playlist_id: str,
         uris: List[str],
         pathway: str = "unknown",
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
     ) -> None:
-        """Cache scrape results in database."""
+        """Cache scrape results in database.
+
+        ``etag`` / ``last_modified`` are the validators of the page named
+        by ``pathway``, kept for conditional requests after expiry.
+        """
         try:
             from shuffify.models.db import (
                 ScrapedPlaylistCache,
@@ -411,27 +723,42 @@ class PublicScraperPathway:
             now = datetime.now(timezone.utc)
             expires = now + timedelta(seconds=CACHE_TTL)
 
-            # Delete expired rows for this playlist
-            ScrapedPlaylistCache.query.filter(
-                ScrapedPlaylistCache.playlist_id == playlist_id,
-                ScrapedPlaylistCache.expires_at <= now,
-            ).delete()
+            # Upsert into the newest row, expired or not. A revalidation
+            # has just loaded it into the session, so deleting it and
+            # inserting a replacement would collide in the identity map.
+            existing = (
+                ScrapedPlaylistCache.query.filter(
+                    ScrapedPlaylistCache.playlist_id == playlist_id,
+                )
+                .order_by(ScrapedPlaylistCache.scraped_at.desc())
+                .first()
+            )
 
-            # Upsert: update existing or create new
-            existing = ScrapedPlaylistCache.query.filter(
+            # Delete any other expired rows for this playlist
+            stale = ScrapedPlaylistCache.query.filter(
                 ScrapedPlaylistCache.playlist_id == playlist_id,
-            ).first()
+                ScrapedPlaylistCache.expires_at <= now,
+            )
+            if existing is not None:
+                stale = stale.filter(ScrapedPlaylistCache.id != existing.id)
+            stale.delete(synchronize_session="fetch")
 
             if existing:
                 existing.track_uris = uris
                 existing.scraped_at = now
                 existing.scrape_pathway = pathway
+                existing.content_hash = content_hash(uris)
+                existing.etag = etag
+                existing.last_modified = last_modified
                 existing.expires_at = expires
             else:
                 row = ScrapedPlaylistCache(
                     playlist_id=playlist_id,
                     scraped_at=now,
                     scrape_pathway=pathway,
+                    content_hash=content_hash(uris),
+                    etag=etag,
+                    last_modified=last_modified,
                     expires_at=expires,
                 )
                 row.track_uris = uris
@@ -454,6 +781,85 @@ class PublicScraperPathway:
                     rollback_err,
                 )
 
+    # ------------------------------------------------------------------
+    # Strategy history helpers (database-backed)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _should_hedge(playlist_id: str, settings: Dict[str, Any]) -> bool:
+        """Whether this playlist's history says to hedge the embed.
+
+        True when the embed has returned tracks less than
+        ``embed_success_below`` of the time over at least
+        ``min_samples`` recent scrapes, and the public page has done
+        better. A playlist without history is scraped in turn.
+        """
+        try:
+            from shuffify.models.db import ScrapeStrategyStats
+
+            stats = ScrapeStrategyStats.query.filter_by(
+                playlist_id=playlist_id
+            ).first()
+        except Exception as e:
+            logger.warning("Scraper stats read error: %s", e)
+            return False
+        return (
+            stats is not None
+            and stats.embed_samples >= settings["min_samples"]
+            and stats.embed_success_rate < settings["embed_success_below"]
+            and stats.public_page_samples > 0
+            and stats.public_page_success_rate > stats.embed_success_rate
+        )
+
+    @staticmethod
+    def _record_strategy_outcomes(
+        playlist_id: str, outcomes: Dict[str, ScrapeOutcome]
+    ) -> None:
+        """Fold each finished strategy's result into its success rate."""
+        if not outcomes:
+            return
+        try:
+            from shuffify.models.db import ScrapeStrategyStats, db
+
+            stats = ScrapeStrategyStats.query.filter_by(
+                playlist_id=playlist_id
+            ).first()
+            if stats is None:
+                stats = ScrapeStrategyStats(playlist_id=playlist_id)
+                db.session.add(stats)
+            for strategy, outcome in outcomes.items():
+                stats.record(strategy, bool(outcome.uris))
+            db.session.commit()
+        except Exception as e:
+            logger.warning("Scraper stats write error: %s", e)
+            try:
+                db.session.rollback()
+            except Exception as rollback_err:
+                logger.warning(
+                    "Scraper stats rollback failed: %s",
+                    rollback_err,
+                )
+
+
+# ======================================================================
+# Conditional request helpers
+# ======================================================================
+
+
+def _validated_by(
+    previous: Optional[CachedScrape], pathway: str
+) -> Optional[CachedScrape]:
+    """``previous`` if its validators belong to the ``pathway`` page."""
+    if previous is not None and previous.scrape_pathway == pathway:
+        return previous
+    return None
+
+
+def _header(resp: Any, name: str) -> Optional[str]:
+    """A response header's value, or None when absent or not a string."""
+    value = resp.headers.get(name)
+    return value if isinstance(value, str) and value else None
+
 
 # ======================================================================
 # Configuration helpers
@@ -479,12 +885,68 @@ def _get_request_timeout() -> int:
         return DEFAULT_REQUEST_TIMEOUT
 
 
+def _get_hedge_settings() -> Dict[str, Any]:
+    """Resolve the SCRAPER_HEDGE_* settings from Flask config when available.
+
+    Looked up on every resolve, like ``SOURCE_RESOLVER_TIMEOUT``, so a
+    config change applies without a restart.
+    """
+    settings = {
+        "enabled": DEFAULT_HEDGE_ENABLED,
+        "delay": DEFAULT_HEDGE_DELAY,
+        "embed_success_below": DEFAULT_HEDGE_EMBED_SUCCESS_BELOW,
+        "min_samples": DEFAULT_HEDGE_MIN_SAMPLES,
+    }
+    try:
+        from flask import current_app
+
+        config = current_app.config
+        settings["enabled"] = config.get(
+            "SCRAPER_HEDGE_ENABLED", DEFAULT_HEDGE_ENABLED
+        )
+        settings["delay"] = config.get(
+            "SCRAPER_HEDGE_DELAY", DEFAULT_HEDGE_DELAY
+        )
+        settings["embed_success_below"] = config.get(
+            "SCRAPER_HEDGE_EMBED_SUCCESS_BELOW",
+            DEFAULT_HEDGE_EMBED_SUCCESS_BELOW,
+        )
+        settings["min_samples"] = config.get(
+            "SCRAPER_HEDGE_MIN_SAMPLES", DEFAULT_HEDGE_MIN_SAMPLES
+        )
+    except Exception:
+        pass
+    return settings
+
+
+# ======================================================================
+# Hedging helpers
+# ======================================================================
+
+
+def _outcome_or_failure(future: Future) -> ScrapeOutcome:
+    """Unwrap a finished scrape; an exception becomes an unconfirmed one."""
+    try:
+        return future.result()
+    except Exception as e:
+        logger.warning("Hedged scrape raised: %s", e, exc_info=True)
+        return ScrapeOutcome(
+            uris=[],
+            confirmed=False,
+            error=f"{type(e).__name__}: {e}",
+        )
+
+
 # ======================================================================
 # Retry helpers
 # ======================================================================
 
 
-def _sleep_with_backoff(attempt: int, retry_after: Optional[str] = None) -> None:
+def _sleep_with_backoff(
+    attempt: int,
+    retry_after: Optional[str] = None,
+    cancel: Optional[threading.Event] = None,
+) -> None:
     """Sleep before the next retry attempt.
 
     Honors a server-provided ``Retry-After`` value (seconds) when present
@@ -492,6 +954,7 @@ def _sleep_with_backoff(attempt: int, retry_after: Optional[str] = None) -> None
     doubled per attempt). Adds 0–0.5s of jitter so a burst of concurrent
     raids doesn't thunder against Spotify in lockstep, and caps any
     single sleep at ``MAX_BACKOFF`` to keep worst-case latency bounded.
+    Setting ``cancel`` cuts the sleep short.
     """
     base = BACKOFF_BASE * (2**attempt)
     if retry_after:
@@ -500,7 +963,10 @@ def _sleep_with_backoff(attempt: int, retry_after: Optional[str] = None) -> None
         except (TypeError, ValueError):
             pass
     delay = min(base, MAX_BACKOFF) + random.uniform(0, 0.5)
-    time.sleep(delay)
+    if cancel is not None:
+        cancel.wait(delay)
+    else:
+        time.sleep(delay)
 
 
 # ======================================================================
@@ -508,29 +974,30 @@ def _sleep_with_backoff(attempt: int, retry_after: Optional[str] = None) -> None
 # ======================================================================
 
 
+@dataclass
+class _ScriptScan:
+    """Track URIs the structured strategies found in a page's scripts."""
+
+    next_data: List[str] = field(default_factory=list)
+    track_list: List[str] = field(default_factory=list)
+
+
 def _extract_uris(html: str) -> List[str]:
     """Extract unique track URIs from HTML using multiple strategies.
 
     Tries structured JSON extraction first (most reliable), then
-    falls back to regex pattern matching.
+    falls back to regex pattern matching. Both structured strategies
+    come from landmark searches that decode only the track arrays
+    (see ``_scan_scripts``); the regex pass only runs when they find
+    nothing.
 
     Strategies (in order):
-    1. __NEXT_DATA__ JSON → tracks.items[].track.uri
+    1. __NEXT_DATA__ JSON → tracks.items[].track.uri / trackList[].uri
     2. Script blocks → trackList[].uri
     3. Regex fallback → spotify:track: patterns + /track/ URLs
     """
-    # Strategy 1: __NEXT_DATA__ (full metadata)
-    uris = _extract_from_next_data(html)
-    if uris:
-        return uris
-
-    # Strategy 2: trackList in script blocks (embed format)
-    uris = _extract_from_track_list(html)
-    if uris:
-        return uris
-
-    # Strategy 3: Regex fallback (least reliable)
-    return _extract_with_regex(html)
+    scan = _scan_scripts(html)
+    return scan.next_data or scan.track_list or _extract_with_regex(html)
 
 
 def _extract_from_next_data(html: str) -> List[str]:
@@ -543,20 +1010,10 @@ def _extract_from_next_data(html: str) -> List[str]:
             }}}}}
         </script>
 
-    The exact nesting varies, so we recursively search for track
-    data in known key patterns.
+    The exact nesting varies, so the first "trackList" or "items"
+    array in the blob that holds tracks is used.
     """
-    match = NEXT_DATA_PATTERN.search(html)
-    if not match:
-        return []
-
-    try:
-        data = json.loads(match.group(1))
-    except (json.JSONDecodeError, ValueError):
-        logger.debug("Failed to parse __NEXT_DATA__ JSON")
-        return []
-
-    return _walk_json_for_tracks(data)
+    return _scan_scripts(html).next_data
 
 
 def _extract_from_track_list(html: str) -> List[str]:
@@ -566,30 +1023,7 @@ def _extract_from_track_list(html: str) -> List[str]:
     script tags as JSON objects containing a "trackList" key:
         {"trackList":[{"uri":"spotify:track:...","uid":"..."},...]}
     """
-    seen = set()
-    uris = []
-
-    for script_match in TRACK_LIST_SCRIPT_PATTERN.finditer(html):
-        content = script_match.group(1).strip()
-        if "trackList" not in content:
-            continue
-
-        # Try to parse the entire script content as JSON
-        parsed = _try_parse_json(content)
-        if parsed is None:
-            continue
-
-        track_list = find_nested_key(parsed, "trackList")
-        if not isinstance(track_list, list):
-            continue
-
-        for item in track_list:
-            uri = _get_track_uri_from_item(item)
-            if uri and uri not in seen:
-                seen.add(uri)
-                uris.append(uri)
-
-    return uris
+    return _scan_scripts(html, stop_at_next_data=False).track_list
 
 
 def _extract_with_regex(html: str) -> List[str]:
@@ -618,73 +1052,80 @@ def _extract_with_regex(html: str) -> List[str]:
     return uris
 
 
-# ======================================================================
-# JSON traversal helpers
-# ======================================================================
-
+def _scan_scripts(html: str, stop_at_next_data: bool = True) -> _ScriptScan:
+    """Run both structured strategies without parsing any script whole.
 
-def _walk_json_for_tracks(data: Any) -> List[str]:
-    """Recursively walk a JSON structure to find track URIs.
+    The page is searched for its landmarks (the __NEXT_DATA__ tag,
+    then "trackList" keys) instead of being split into script blocks,
+    and each candidate array (see ``TRACK_ARRAY_PATTERN``) is decoded
+    on its own with ``raw_decode`` starting at its ``[``. A
+    multi-megabyte __NEXT_DATA__ blob is never materialized, and a blob
+    that isn't valid JSON as a whole still yields any track array
+    inside it that decodes.
 
-    Searches for known Spotify data patterns:
-    - tracks.items[].track.uri (playlist API format)
-    - tracks.items[].uri (simplified format)
-    - trackList[].uri (embed format)
-    - entity.trackList[].uri (NEXT_DATA wrapper)
+    - In __NEXT_DATA__, the first "trackList" / "items" array (in
+      document order) that holds tracks wins. With
+      ``stop_at_next_data`` the scan ends there, since
+      ``_extract_uris`` needs nothing else.
+    - In every script, the first "trackList" array feeds strategy 2.
     """
-    seen = set()
-    uris: List[str] = []
+    scan = _ScriptScan()
+
+    body = _find_next_data(html)
+    if body is not None:
+        for match in TRACK_ARRAY_PATTERN.finditer(html, *body):
+            uris = _decode_track_array(html, match.end())
+            if uris:
+                scan.next_data = uris
+                if stop_at_next_data:
+                    return scan
+                break
+
+    track_list: List[str] = []
+    counted_script = -1
+    for match in TRACK_LIST_ARRAY_PATTERN.finditer(html):
+        script_start = _enclosing_script(html, match.start())
+        if script_start < 0 or script_start == counted_script:
+            continue
+        counted_script = script_start
+        track_list.extend(_decode_track_array(html, match.end()))
 
-    def _collect(uri: str) -> None:
-        if uri and uri.startswith("spotify:track:") and uri not in seen:
-            seen.add(uri)
-            uris.append(uri)
+    scan.track_list = list(dict.fromkeys(track_list))
+    return scan
 
-    def _walk(node: Any, depth: int = 0) -> None:
-        if depth > 20:  # Guard against pathological nesting
-            return
 
-        if isinstance(node, dict):
-            # Check for tracks.items pattern (API-style)
-            if "tracks" in node and isinstance(node["tracks"], dict):
-                items = node["tracks"].get("items", [])
-                if isinstance(items, list):
-                    for item in items:
-                        uri = _get_track_uri_from_item(item)
-                        _collect(uri)
-                    if uris:
-                        return  # Found tracks, stop walking
-
-            # Check for trackList pattern (embed-style)
-            if "trackList" in node and isinstance(node["trackList"], list):
-                for item in node["trackList"]:
-                    uri = _get_track_uri_from_item(item)
-                    _collect(uri)
-                if uris:
-                    return
-
-            # Check for items at current level
-            if "items" in node and isinstance(node["items"], list):
-                for item in node["items"]:
-                    uri = _get_track_uri_from_item(item)
-                    _collect(uri)
-                if uris:
-                    return
-
-            # Recurse into dict values
-            for value in node.values():
-                _walk(value, depth + 1)
-                if uris:
-                    return
-
-        elif isinstance(node, list):
-            for item in node:
-                _walk(item, depth + 1)
-                if uris:
-                    return
-
-    _walk(data)
-    return uris
+def _find_next_data(html: str) -> Optional[Tuple[int, int]]:
+    """``(start, end)`` of the __NEXT_DATA__ script's body, if any."""
+    pos = 0
+    while True:
+        at = html.find('id="__NEXT_DATA__"', pos)
+        if at < 0:
+            return None
+        if html.startswith("<script", html.rfind("<", 0, at)):
+            start = html.find(">", at) + 1
+            if not start:
+                return None
+            end = html.find("</script>", start)
+            return start, end if end >= 0 else len(html)
+        pos = at + 1
+
+
+def _enclosing_script(html: str, pos: int) -> int:
+    """Start of the <script> tag ``pos`` is inside, or -1 outside scripts."""
+    open_at = html.rfind("<script", 0, pos)
+    if open_at < 0 or html.find("</script>", open_at, pos) >= 0:
+        return -1
+    return open_at
+
+
+def _decode_track_array(html: str, start: int) -> List[str]:
+    """Decode the JSON array at ``html[start]`` into unique track URIs."""
+    try:
+        items, _ = _JSON_DECODER.raw_decode(html, start)
+    except (ValueError, RecursionError):
+        return []
+    uris = (_get_track_uri_from_item(item) for item in items)
+    return list(dict.fromkeys(uri for uri in uris if uri))
 
 
 def _get_track_uri_from_item(item: Any) -> Optional[str]:
@@ -716,14 +1157,3 @@ def _get_track_uri_from_item(item: Any) -> Optional[str]:
         return f"spotify:track:{track_id}"
 
     return None
-
-
-def _try_parse_json(text: str) -> Optional[Dict]:
-    """Attempt to parse text as JSON, returning None on failure."""
-    try:
-        result = json.loads(text)
-        if isinstance(result, dict):
-            return result
-        return None
-    except (json.JSONDecodeError, ValueError):
-        return None
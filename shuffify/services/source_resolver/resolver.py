@@ -1,7 +1,9 @@
 """Source resolver — orchestrates pathways in priority order."""
 
 import logging
-from typing import Any, List, Optional, Set
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Set
 
 from .base import ResolveAllResult, ResolvePathway, ResolveResult
 from .direct_api_pathway import DirectAPIPathway
@@ -10,6 +12,15 @@ from .search_pathway import SearchPathway
 
 logger = logging.getLogger(__name__)
 
+# Fallbacks used when no Flask app context is active (e.g. unit tests that
+# exercise the resolver directly). The canonical values are the
+# ``SOURCE_RESOLVER_*`` keys in ``config.Config``. Outside an app the
+# resolver stays sequential: concurrency is a deployment decision, and a
+# caller without config gets the behaviour it always had.
+DEFAULT_MAX_WORKERS = 1
+DEFAULT_SOURCE_DEADLINE = 60.0
+DEFAULT_JOB_DEADLINE = 180.0
+
 
 class SourceResolver:
     """Resolves upstream sources to track URIs using multiple pathways.
@@ -110,17 +121,63 @@ class SourceResolver:
         sources: List[Any],
         api: Any = None,
         exclude_uris: Optional[Set[str]] = None,
+        max_workers: Optional[int] = None,
+        source_deadline: Optional[float] = None,
+        job_deadline: Optional[float] = None,
     ) -> ResolveAllResult:
-        """Resolve all sources, deduplicating against exclude_uris."""
+        """Resolve all sources, deduplicating against exclude_uris.
+
+        With more than one worker, sources are resolved concurrently on a
+        bounded pool. A raid with ten sources whose scraper fallback is
+        sleeping on backoff would otherwise hold its scheduler thread for
+        the sum of every source's worst case.
+
+        Two deadlines bound the wait. ``source_deadline`` runs from the
+        moment a source starts resolving; ``job_deadline`` from the call.
+        A source that misses either is reported as a failed
+        ``ResolveResult`` (pathway ``"timeout"``) and the call returns
+        without it. Python threads cannot be killed, so the abandoned
+        resolve finishes in the background and its result is discarded.
+
+        Results are merged in ``sources`` order whatever order they finish
+        in, so dedupe and ``source_results`` are exactly what the
+        sequential loop produced -- the first-source-wins provenance in
+        ``_fetch_raid_sources_with_limits`` depends on it.
+
+        Args:
+            sources: UpstreamSource-like records, in priority order.
+            api: Optional Spotify API client passed to each pathway.
+            exclude_uris: URIs to leave out of ``new_uris``.
+            max_workers: Pool size; 1 resolves sequentially. Defaults to
+                ``SOURCE_RESOLVER_MAX_WORKERS``.
+            source_deadline: Seconds one source may take. Defaults to
+                ``SOURCE_RESOLVER_SOURCE_DEADLINE``.
+            job_deadline: Seconds the whole call may take. Defaults to
+                ``SOURCE_RESOLVER_JOB_DEADLINE``.
+        """
         if exclude_uris is None:
             exclude_uris = set()
 
+        settings = _get_concurrency_settings()
+        if max_workers is None:
+            max_workers = settings["max_workers"]
+        if source_deadline is None:
+            source_deadline = settings["source_deadline"]
+        if job_deadline is None:
+            job_deadline = settings["job_deadline"]
+
+        if max_workers > 1 and len(sources) > 1:
+            results = self._resolve_concurrently(
+                sources, api, max_workers, source_deadline, job_deadline
+            )
+        else:
+            results = [self.resolve(source, api=api) for source in sources]
+
         seen: Set[str] = set(exclude_uris)
         new_uris: List[str] = []
         source_results = []
 
-        for source in sources:
-            result = self.resolve(source, api=api)
+        for source, result in zip(sources, results):
             source_results.append((source, result))
 
             for uri in result.track_uris:
@@ -132,3 +189,150 @@ class SourceResolver:
             new_uris=new_uris,
             source_results=source_results,
         )
+
+    def _resolve_concurrently(
+        self,
+        sources: List[Any],
+        api: Any,
+        max_workers: int,
+        source_deadline: float,
+        job_deadline: float,
+    ) -> List[ResolveResult]:
+        """Resolve ``sources`` on a pool; one result per source, in order."""
+        app = _current_app_or_none()
+        started: Dict[int, float] = {}
+
+        def _run(index: int, source: Any) -> ResolveResult:
+            started[index] = time.monotonic()
+            # Pathways read config and the scrape cache through Flask; a
+            # fresh app context per worker also gives each thread its own
+            # DB session, so one worker's commit can't expire another's.
+            if app is None:
+                return self.resolve(source, api=api)
+            with app.app_context():
+                return self.resolve(source, api=api)
+
+        results: List[Optional[ResolveResult]] = [None] * len(sources)
+        job_ends = time.monotonic() + job_deadline
+        pool = ThreadPoolExecutor(
+            max_workers=min(max_workers, len(sources)),
+            thread_name_prefix="source-resolve",
+        )
+        try:
+            pending: Dict[Future, int] = {
+                pool.submit(_run, i, source): i
+                for i, source in enumerate(sources)
+            }
+            while pending:
+                now = time.monotonic()
+                expiries = [job_ends] + [
+                    started[i] + source_deadline
+                    for i in pending.values()
+                    if i in started
+                ]
+                done, _ = wait(
+                    pending,
+                    timeout=max(0.0, min(expiries) - now),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    index = pending.pop(future)
+                    results[index] = _result_or_failure(
+                        future, sources[index]
+                    )
+
+                now = time.monotonic()
+                for future, index in list(pending.items()):
+                    job_expired = now >= job_ends
+                    source_expired = (
+                        index in started
+                        and now >= started[index] + source_deadline
+                    )
+                    if not (job_expired or source_expired):
+                        continue
+                    del pending[future]
+                    future.cancel()
+                    limit = "job" if job_expired and not source_expired else "source"
+                    seconds = job_deadline if limit == "job" else source_deadline
+                    logger.warning(
+                        "Resolve of source %s abandoned: %s deadline "
+                        "of %ss exceeded",
+                        getattr(sources[index], "source_playlist_id", "?"),
+                        limit,
+                        seconds,
+                    )
+                    results[index] = ResolveResult(
+                        track_uris=[],
+                        pathway_name="timeout",
+                        success=False,
+                        error_message=(
+                            f"Exceeded {limit} deadline of {seconds}s"
+                        ),
+                    )
+        finally:
+            # Never block the caller on an abandoned resolve.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
+
+def _result_or_failure(future: Future, source: Any) -> ResolveResult:
+    """Unwrap a finished resolve; an exception becomes a failed result.
+
+    The sequential loop let a pathway exception propagate and abort the
+    whole call. Concurrently that would discard every sibling's result,
+    so the error is confined to its own source instead.
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        logger.warning(
+            "Resolve of source %s raised: %s",
+            getattr(source, "source_playlist_id", "?"),
+            e,
+            exc_info=True,
+        )
+        return ResolveResult(
+            track_uris=[],
+            pathway_name="error",
+            success=False,
+            error_message=str(e) or type(e).__name__,
+        )
+
+
+def _current_app_or_none() -> Any:
+    """Return the real Flask app object when an app context is active."""
+    try:
+        from flask import current_app, has_app_context
+
+        if has_app_context():
+            return current_app._get_current_object()
+    except Exception:
+        pass
+    return None
+
+
+def _get_concurrency_settings() -> Dict[str, Any]:
+    """Resolve pool size and deadlines from Flask config when available.
+
+    Looked up on every call, like ``SOURCE_RESOLVER_TIMEOUT``, so a config
+    change applies to the next raid without a restart.
+    """
+    settings = {
+        "max_workers": DEFAULT_MAX_WORKERS,
+        "source_deadline": DEFAULT_SOURCE_DEADLINE,
+        "job_deadline": DEFAULT_JOB_DEADLINE,
+    }
+    app = _current_app_or_none()
+    if app is not None:
+        config = app.config
+        settings["max_workers"] = config.get(
+            "SOURCE_RESOLVER_MAX_WORKERS", DEFAULT_MAX_WORKERS
+        )
+        settings["source_deadline"] = config.get(
+            "SOURCE_RESOLVER_SOURCE_DEADLINE", DEFAULT_SOURCE_DEADLINE
+        )
+        settings["job_deadline"] = config.get(
+            "SOURCE_RESOLVER_JOB_DEADLINE", DEFAULT_JOB_DEADLINE
+        )
+    return settings
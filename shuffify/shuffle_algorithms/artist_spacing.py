@@ -1,6 +1,6 @@
 import heapq
 import random
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import Any, Dict, List, Optional
 
 from . import ShuffleAlgorithm
@@ -97,33 +97,53 @@ class ArtistSpacingShuffle(ShuffleAlgorithm):
         for group in artist_tracks.values():
             random.shuffle(group)
 
-        # Use a max-heap approach: always pick from the artist with the
-        # most remaining tracks (that isn't blocked by spacing). This
-        # prevents the algorithm from painting itself into a corner.
+        return self._schedule(artist_tracks, min_spacing)
+
+    @staticmethod
+    def _schedule(
+        artist_tracks: Dict[str, List[str]], min_spacing: int
+    ) -> List[str]:
+        """
+        Interleave per-artist track lists, honouring ``min_spacing``.
+
+        Always picks from the artist with the most remaining tracks that
+        isn't blocked by spacing; this prevents the algorithm from painting
+        itself into a corner.
+
+        An artist placed at position ``p`` is released at ``p + min_spacing``.
+        Positions only grow, so release times are handed out in increasing
+        order and the cooldown is a FIFO: the artists to release are always
+        a prefix of the deque, and the one released soonest is at its head.
+        Each placement is therefore one heap push/pop -- O(log k) for k
+        artists -- instead of rescanning (and, when everyone is blocked,
+        sorting) the whole cooldown list per track.
+
+        Args:
+            artist_tracks: Artist name -> that artist's URIs (pre-shuffled;
+                consumed from the end).
+            min_spacing: Minimum tracks between same artist.
+
+        Returns:
+            List of URIs.
+        """
         # Heap entries: (-count, random_tiebreaker, artist_name)
         heap = []
         for artist, tracks_list in artist_tracks.items():
             heapq.heappush(heap, (-len(tracks_list), random.random(), artist))
 
         result = []
-        recent_artists = []  # Sliding window of recent artist names
-        cooldown = []  # Artists waiting out their spacing cooldown
+        cooldown = deque()  # (release_at, heap entry), release_at increasing
 
         while heap or cooldown:
             # Move artists off cooldown if enough tracks have been placed
-            still_waiting = []
-            for wait_until, entry in cooldown:
-                if len(result) >= wait_until:
-                    heapq.heappush(heap, entry)
-                else:
-                    still_waiting.append((wait_until, entry))
-            cooldown = still_waiting
+            placed = len(result)
+            while cooldown and cooldown[0][0] <= placed:
+                heapq.heappush(heap, cooldown.popleft()[1])
 
             if not heap:
                 # All artists are on cooldown — impossible to satisfy
                 # spacing. Pick the one that comes off cooldown soonest.
-                cooldown.sort(key=lambda x: x[0])
-                _, entry = cooldown.pop(0)
+                _, entry = cooldown.popleft()
                 neg_count, _, artist = entry
             else:
                 neg_count, _, artist = heapq.heappop(heap)
@@ -131,7 +151,6 @@ class ArtistSpacingShuffle(ShuffleAlgorithm):
             # Take one track from this artist
             chosen = artist_tracks[artist].pop()
             result.append(chosen)
-            recent_artists.append(artist)
 
             # Put artist back on cooldown if they have remaining tracks
             remaining_count = -neg_count - 1
@@ -3,7 +3,12 @@ import random
 from typing import Any, Dict, List, Optional
 
 from . import ShuffleAlgorithm
-from .utils import extract_uris, split_into_sections, split_keep_first
+from .utils import (
+    extract_uris,
+    interleave_sections,
+    split_into_sections,
+    split_keep_first,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -87,10 +92,4 @@ class BalancedShuffle(ShuffleAlgorithm):
             random.shuffle(section)
 
         # Build final sequence using round-robin selection
-        result = kept_tracks.copy()
-        while any(sections):
-            for section in sections:
-                if section:
-                    result.append(section.pop(0))
-
-        return result
+        return kept_tracks + interleave_sections(sections)
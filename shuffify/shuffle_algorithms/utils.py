@@ -153,3 +153,49 @@ def split_into_sections(items: List[str], section_count: int) -> List[List[str]]
         start += size
 
     return sections
+
+
+def interleave_sections(sections: List[List[str]]) -> List[str]:
+    """
+    Round-robin merge: one item from each section in turn.
+
+    Equivalent to repeatedly taking the head of every non-empty section,
+    in section order, until all are empty -- but without ``pop(0)``, which
+    shifts the whole section per item and made the merge quadratic.
+
+    Sections from ``split_into_sections`` differ in length by at most one,
+    longest first. Then section ``s`` fills every ``k``-th slot starting at
+    ``s`` for the full rounds, which is one strided slice assignment per
+    section, and the longer sections each add one item to a final partial
+    round. Other shapes take the general row-by-row walk.
+
+    Args:
+        sections: Lists to interleave. Not modified.
+
+    Returns:
+        The interleaved items.
+    """
+    if not sections:
+        return []
+
+    sizes = [len(section) for section in sections]
+    shortest = min(sizes)
+    if max(sizes) - shortest <= 1 and sizes == sorted(sizes, reverse=True):
+        count = len(sections)
+        full_rounds = shortest * count
+        result = [""] * sum(sizes)
+        for s, section in enumerate(sections):
+            result[s:full_rounds:count] = section[:shortest]
+        tail = full_rounds
+        for section in sections:
+            if len(section) > shortest:
+                result[tail] = section[shortest]
+                tail += 1
+        return result
+
+    result = []
+    for i in range(max(sizes)):
+        for section in sections:
+            if i < len(section):
+                result.append(section[i])
+    return result
@@ -8,8 +8,14 @@ Architecture:
     - credentials.py: SpotifyCredentials for config/DI
     - auth.py: SpotifyAuthManager for OAuth and token management
     - api.py: SpotifyAPI for data operations
+    - async_api.py, async_http_client.py: asyncio/httpx variants of SpotifyAPI
+      and SpotifyHTTPClient (imported from their modules, not re-exported)
     - error_handling.py: Retry logic, backoff, error classification
     - cache.py: SpotifyCache for Redis-based response caching
+    - cache_codec.py: Cache value codecs (json/msgpack, zlib) and track projection
+    - fields.py: Field-projection presets for playlist-item reads
+    - rate_governor.py: RateGovernor, the process-wide request token bucket
+    - write_planner.py: Diff planner for playlist writes (remove/reorder/insert)
     - exceptions.py: Exception hierarchy
 
 Usage:
@@ -69,6 +75,9 @@ from .exceptions import (
     SpotifyTokenExpiredError,
 )
 
+# Rate governor (process-wide request budget)
+from .rate_governor import RateGovernor
+
 # URL parser utility
 from .url_parser import parse_spotify_playlist_url
 
@@ -85,6 +94,8 @@ __all__ = [
     "parse_spotify_playlist_url",
     # Cache
     "SpotifyCache",
+    # Rate governor
+    "RateGovernor",
     # Client (facade)
     # Exceptions
     "SpotifyError",
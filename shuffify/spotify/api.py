@@ -9,7 +9,18 @@ Supports optional Redis caching for improved performance.
 """
 
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from .auth import SpotifyAuthManager, TokenInfo
 from .error_handling import api_error_handler
@@ -18,7 +29,22 @@ from .exceptions import (
     SpotifyPartialBatchError,
     SpotifyTokenExpiredError,
 )
+from .fields import (
+    PLAYLIST_ITEM_PRESETS,
+    page_fields,
+    playlist_item_fields,
+    tracks_namespace,
+)
 from .http_client import SpotifyHTTPClient
+from .single_flight import get_single_flight
+from .write_planner import (
+    OP_INSERT,
+    OP_REMOVE,
+    OP_REORDER,
+    PlaylistWriteOp,
+    PlaylistWritePlan,
+    plan_playlist_write,
+)
 
 if TYPE_CHECKING:
     from .cache import SpotifyCache
@@ -26,6 +52,110 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def tracks_from_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Unwrap playlist items into track dicts, as ``get_playlist_tracks`` returns.
+
+    Items without a track (removed from the catalog) or without a URI are
+    dropped, and each track carries its item's ``added_at``.
+    """
+    tracks = []
+    for item in items:
+        # The playlist-items resource names the nested object "track" on
+        # the legacy shape and "item" on the current one. Both are read
+        # because a single playlist can return either -- the rename rolled
+        # out per-response, not per-account -- so neither key can be
+        # dropped on a date.
+        track = item.get("track") or item.get("item")
+        # Only include valid tracks (not None, not local-only)
+        if track and track.get("uri"):
+            # Preserve added_at from the playlist item wrapper
+            if "added_at" in item:
+                track["added_at"] = item["added_at"]
+            tracks.append(track)
+    return tracks
+
+
+def item_uris(items: List[Dict[str, Any]]) -> Optional[List[str]]:
+    """
+    The URI at every position of a raw playlist item list.
+
+    Positional edits (``range_start``, ``insert_before``, ``position``)
+    count every item Spotify holds, including the ones
+    ``tracks_from_items`` drops. An item without a track or URI can be
+    neither planned around nor removed by URI, so None is returned and the
+    caller falls back to a full replace, which drops it as it always has.
+    """
+    uris = []
+    for item in items:
+        track = item.get("track") or item.get("item")
+        uri = track.get("uri") if isinstance(track, dict) else None
+        if not uri:
+            return None
+        uris.append(uri)
+    return uris
+
+
+def _tracks_flight_key(playlist_id: str, fields: Optional[str]) -> str:
+    """Single-flight key for one playlist's tracks under a preset."""
+    return f"{tracks_namespace(fields)}:{playlist_id}"
+
+
+def write_result_snapshot(result: Any) -> Optional[str]:
+    """The snapshot_id a playlist write returned, if any."""
+    snapshot_id = result.get("snapshot_id") if isinstance(result, dict) else None
+    return snapshot_id if isinstance(snapshot_id, str) and snapshot_id else None
+
+
+def record_uri_index_write(
+    cache: Optional["SpotifyCache"],
+    playlist_id: str,
+    snapshot_id: Optional[str],
+    added: Sequence[str] = (),
+    removed: Sequence[str] = (),
+    replace: bool = False,
+    base_snapshot_id: Optional[str] = None,
+) -> None:
+    """Carry one of our own writes into the playlist's URI index.
+
+    Without the snapshot the write returned there is nothing to tag the
+    update with; the index is left at its old snapshot, which no longer
+    matches, so the next reader rebuilds it. An add or remove is only
+    applied if the index was at ``base_snapshot_id``, the snapshot read
+    just before the write (see ``SpotifyCache.update_uri_index``).
+    """
+    if cache and cache.uri_index_enabled and snapshot_id:
+        cache.update_uri_index(
+            playlist_id,
+            snapshot_id,
+            added=added,
+            removed=removed,
+            replace=replace,
+            base_snapshot_id=base_snapshot_id,
+        )
+
+
+def write_op_payload(op: PlaylistWriteOp, snapshot_id: Optional[str]) -> Dict[str, Any]:
+    """Request body for one call of a ``PlaylistWritePlan``."""
+    if op.kind == OP_REMOVE:
+        payload: Dict[str, Any] = {"items": [{"uri": u} for u in op.uris]}
+    elif op.kind == OP_REORDER:
+        payload = {
+            "range_start": op.range_start,
+            "range_length": op.range_length,
+            "insert_before": op.insert_before,
+        }
+    else:
+        payload = {"uris": op.uris, "position": op.position}
+    # Spotify applies a snapshot-tagged edit against that version, so a
+    # remove or reorder can't land on a list that moved under it. The
+    # add-items call accepts no snapshot_id: an insert's position is only
+    # as fresh as the base read (``SpotifyAPI._write_base``) before it.
+    if snapshot_id and op.kind != OP_INSERT:
+        payload["snapshot_id"] = snapshot_id
+    return payload
+
+
 class SpotifyAPI:
     """
     Spotify Web API client for data operations.
@@ -56,6 +186,9 @@ class SpotifyAPI:
 
     # Batch size for API operations
     BATCH_SIZE = 100
+    # Spotify's maximum page size for playlist items. The endpoint defaults
+    # to 20, which would quintuple the page count for every large playlist.
+    PLAYLIST_ITEMS_PAGE_SIZE = 100
     AUDIO_FEATURES_BATCH_SIZE = 50
 
     def __init__(
@@ -65,6 +198,7 @@ class SpotifyAPI:
         auto_refresh: bool = True,
         cache: Optional["SpotifyCache"] = None,
         on_token_refresh: Optional[Callable[[TokenInfo], None]] = None,
+        on_token_rejected: Optional[Callable[[TokenInfo], None]] = None,
     ):
         """
         Initialize the API client.
@@ -79,6 +213,10 @@ class SpotifyAPI:
                 whenever the access token is refreshed (at construction or on a
                 401 retry). Used to persist the refreshed token, e.g. back to
                 the Flask session. Background jobs pass None.
+            on_token_rejected: Optional callback invoked with the access
+                token Spotify answered 401 to, before it is refreshed. Used
+                to drop it from a shared token cache, which would otherwise
+                keep handing it out until its stated expiry.
 
         Raises:
             SpotifyTokenExpiredError: If token is expired and cannot be refreshed.
@@ -87,6 +225,7 @@ class SpotifyAPI:
         self._auto_refresh = auto_refresh and auth_manager is not None
         self._cache = cache
         self._on_token_refresh = on_token_refresh
+        self._on_token_rejected = on_token_rejected
 
         # Ensure token is valid, refreshing if needed.
         refreshed_at_init = False
@@ -130,8 +269,17 @@ class SpotifyAPI:
             logger.warning("on_token_refresh callback failed: %s", e)
 
     def _handle_token_refresh(self) -> str:
-        """Callback for SpotifyHTTPClient on 401 responses."""
-        self._token_info = self._auth_manager.ensure_valid_token(self._token_info)
+        """Callback for SpotifyHTTPClient on 401 responses.
+
+        The token is refreshed whatever its expiry says: Spotify has just
+        rejected it, so it was revoked or rotated before it ran out.
+        """
+        if self._on_token_rejected is not None:
+            try:
+                self._on_token_rejected(self._token_info)
+            except Exception as e:  # pragma: no cover - defensive
+                logger.warning("on_token_rejected callback failed: %s", e)
+        self._token_info = self._auth_manager.refresh_token(self._token_info)
         self._notify_token_refresh()
         return self._token_info.access_token
 
@@ -283,14 +431,28 @@ class SpotifyAPI:
 
     @api_error_handler
     def get_playlist_tracks(
-        self, playlist_id: str, skip_cache: bool = False
+        self,
+        playlist_id: str,
+        skip_cache: bool = False,
+        fields: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get all tracks from a playlist.
 
+        A recent cached copy is returned as-is. An older one is reused if
+        the playlist's snapshot_id has not changed, which costs one small
+        request instead of every page. On a miss, concurrent callers for
+        the same playlist share one fetch when a ``SingleFlight`` is
+        installed (see ``single_flight``).
+
         Args:
             playlist_id: The Spotify playlist ID.
             skip_cache: If True, bypass cache and fetch fresh data.
+            fields: Optional preset from ``fields.PLAYLIST_ITEM_PRESETS``
+                (``"uris_only"``, ``"shuffle_minimal"``,
+                ``"workshop_display"``). Only that preset's fields are
+                transferred, and the result is cached apart from full
+                track lists.
 
         Returns:
             List of track dictionaries.
@@ -303,43 +465,323 @@ class SpotifyAPI:
 
         # Check cache first
         if self._cache and not skip_cache:
-            cached = self._cache.get_playlist_tracks(playlist_id)
+            cached = self._cache.get_playlist_tracks(playlist_id, fields=fields)
             if cached is not None:
                 return cached
 
-        tracks = []
+        def read() -> List[Dict[str, Any]]:
+            if self._cache and not skip_cache:
+                tracks = self._load_playlist_tracks(playlist_id, fields)
+            else:
+                tracks = self._fetch_playlist_tracks(playlist_id, fields)
+            # Cache the result
+            if self._cache:
+                self._cache.set_playlist_tracks(playlist_id, tracks, fields=fields)
+            return tracks
+
+        # A skip_cache caller wants a read that starts after it asked, so it
+        # never joins a fetch already in flight.
+        flight = get_single_flight()
+        if flight is None or skip_cache:
+            return read()
+        # Another worker's leader publishes through the cache, so without
+        # one there is nothing to peek at and coalescing stays in-process.
+        peek = None
+        if self._cache:
+            peek = partial(self._cache.get_playlist_tracks, playlist_id, fields=fields)
+        return flight.do(_tracks_flight_key(playlist_id, fields), read, peek=peek)
+
+    @api_error_handler
+    def get_many_playlist_tracks(
+        self,
+        playlist_ids: List[str],
+        skip_cache: bool = False,
+        fields: Optional[str] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get all tracks from several playlists.
 
-        all_items = self._http.get_all_pages(f"/playlists/{playlist_id}/items")
-        for item in all_items:
-            # The playlist-items resource names the nested object "track" on
-            # the legacy shape and "item" on the current one. Both are read
-            # because a single playlist can return either -- the rename rolled
-            # out per-response, not per-account -- so neither key can be
-            # dropped on a date.
-            track = item.get("track") or item.get("item")
-            # Only include valid tracks (not None, not local-only)
-            if track and track.get("uri"):
-                # Preserve added_at from the playlist item wrapper
-                if "added_at" in item:
-                    track["added_at"] = item["added_at"]
-                tracks.append(track)
+        The cache is read with one MGET and the fetched playlists are
+        written back with one pipeline, so a cold or warm read of N
+        playlists costs two Redis round trips instead of 2N.
 
-        logger.debug(f"Retrieved {len(tracks)} tracks from playlist {playlist_id}")
+        Args:
+            playlist_ids: Spotify playlist IDs. Duplicates are fetched once.
+            skip_cache: If True, bypass cache and fetch fresh data.
+            fields: Optional field preset, as for ``get_playlist_tracks``.
 
-        # Cache the result
-        if self._cache:
-            self._cache.set_playlist_tracks(playlist_id, tracks)
+        Returns:
+            Dictionary mapping each playlist ID to its track list.
+
+        Raises:
+            SpotifyNotFoundError: If a playlist doesn't exist.
+            SpotifyAPIError: If a request fails. Playlists fetched before
+                the failure are still cached.
+        """
+        self._ensure_valid_token()
+        playlist_ids = list(dict.fromkeys(playlist_ids))
+
+        tracks_by_playlist: Dict[str, List[Dict[str, Any]]] = {}
+        if self._cache and not skip_cache:
+            tracks_by_playlist.update(
+                self._cache.get_many_playlist_tracks(playlist_ids, fields=fields)
+            )
+
+        fetched: Dict[str, List[Dict[str, Any]]] = {}
+        try:
+            for playlist_id in playlist_ids:
+                if playlist_id in tracks_by_playlist:
+                    continue
+                if self._cache and not skip_cache:
+                    fetched[playlist_id] = self._coalesced_load(playlist_id, fields)
+                else:
+                    fetched[playlist_id] = self._fetch_playlist_tracks(playlist_id, fields)
+        finally:
+            if self._cache and fetched:
+                self._cache.set_many_playlist_tracks(fetched, fields=fields)
+
+        tracks_by_playlist.update(fetched)
+        return {pid: tracks_by_playlist[pid] for pid in playlist_ids}
+
+    @api_error_handler
+    def get_playlist_uris(self, playlist_id: str) -> List[str]:
+        """
+        Get a playlist's track URIs, in order, straight from Spotify.
 
+        Same items, same order and same filtering as
+        ``get_playlist_tracks``, fetched with the ``uris_only`` preset, and
+        the cache is never read or written. Meant for post-write
+        verification, which needs the live sequence and nothing else.
+
+        Args:
+            playlist_id: The Spotify playlist ID.
+
+        Returns:
+            List of track URIs.
+
+        Raises:
+            SpotifyNotFoundError: If playlist doesn't exist.
+            SpotifyAPIError: If the request fails.
+        """
+        self._ensure_valid_token()
+
+        tracks = self._fetch_playlist_tracks(playlist_id, "uris_only")
+        return [track["uri"] for track in tracks]
+
+    @api_error_handler
+    def get_playlist_snapshot_id(self, playlist_id: str) -> Optional[str]:
+        """
+        Get a playlist's current snapshot_id without reading its tracks.
+
+        Never served from cache: the answer is only useful as a change
+        check, so it is always asked of Spotify (a few bytes).
+
+        Args:
+            playlist_id: The Spotify playlist ID.
+
+        Returns:
+            The snapshot_id, or None if Spotify didn't send one.
+
+        Raises:
+            SpotifyNotFoundError: If playlist doesn't exist.
+            SpotifyAPIError: If the request fails.
+        """
+        self._ensure_valid_token()
+        return self._get_snapshot_id(playlist_id)
+
+    @api_error_handler
+    def get_indexed_playlist_uris(
+        self, playlist_ids: List[str]
+    ) -> Optional[Tuple[Set[str], Dict[str, int]]]:
+        """
+        Get the union of several playlists' URIs from the cache's URI index.
+
+        Each playlist's snapshot_id is checked (one small request); an
+        index at that snapshot is trusted as-is, and only a playlist that
+        changed outside our own writes (or was never indexed) is read in
+        full and re-indexed. The union is then one Redis round trip.
+
+        Args:
+            playlist_ids: Spotify playlist IDs.
+
+        Returns:
+            Tuple of (uris, track count per playlist), or None when there
+            is no index to use (no cache, indexing disabled, Redis errors
+            or a playlist without a snapshot_id). Callers then read the
+            playlists themselves.
+
+        Raises:
+            SpotifyNotFoundError: If a playlist doesn't exist.
+            SpotifyAPIError: If a request fails.
+        """
+        if not (self._cache and self._cache.uri_index_enabled):
+            return None
+        self._ensure_valid_token()
+        playlist_ids = list(dict.fromkeys(playlist_ids))
+
+        indexed = self._cache.get_uri_index_meta(playlist_ids)
+        counts: Dict[str, int] = {}
+        for playlist_id in playlist_ids:
+            snapshot_id = self._get_snapshot_id(playlist_id)
+            if not snapshot_id:
+                return None
+            held = indexed.get(playlist_id)
+            if held is not None and held[0] == snapshot_id:
+                counts[playlist_id] = held[1]
+                continue
+            uris = [
+                t["uri"]
+                for t in self._tracks_at_snapshot(playlist_id, snapshot_id, "uris_only")
+                if t.get("uri")
+            ]
+            if not self._cache.set_uri_index(playlist_id, uris, snapshot_id):
+                return None
+            counts[playlist_id] = len(uris)
+            logger.debug(f"Re-indexed playlist {playlist_id} at a new snapshot")
+
+        uris = self._cache.union_uri_index(playlist_ids)
+        if uris is None:
+            return None
+        return uris, counts
+
+    def _load_playlist_tracks(
+        self, playlist_id: str, fields: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a playlist's tracks, revalidating a snapshot-keyed cached copy.
+
+        The short-lived ``tracks`` entry has expired by the time this runs.
+        Rather than paging the whole playlist in again, ask Spotify for
+        just its ``snapshot_id`` and reuse the copy cached at that snapshot
+        if there is one. Only a changed (or never-seen) playlist is paged.
+
+        The snapshot is read before the pages. If the playlist changes in
+        between, the newer tracks are stored under the older snapshot and
+        the next read simply misses; the reverse cannot happen.
+        """
+        return self._tracks_at_snapshot(
+            playlist_id, self._get_snapshot_id(playlist_id), fields
+        )
+
+    def _tracks_at_snapshot(
+        self,
+        playlist_id: str,
+        snapshot_id: Optional[str],
+        fields: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Tracks cached at ``snapshot_id``, else paged in and cached there."""
+        if snapshot_id:
+            cached = self._cache.get_playlist_tracks_at(
+                playlist_id, snapshot_id, fields=fields
+            )
+            if cached is not None:
+                logger.debug(f"Playlist {playlist_id} unchanged since it was cached")
+                return cached
+
+        tracks = self._fetch_playlist_tracks(playlist_id, fields)
+        if snapshot_id:
+            self._cache.set_playlist_tracks_at(
+                playlist_id, snapshot_id, tracks, fields=fields
+            )
+        return tracks
+
+    def _coalesced_load(
+        self, playlist_id: str, fields: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """``_load_playlist_tracks``, joining an identical read in flight.
+
+        Coalesced in-process only: this result is cached by the caller's
+        batched write, after the flight ends, so there is nothing for
+        another process to peek at while it is running.
+        """
+        flight = get_single_flight()
+        if flight is None:
+            return self._load_playlist_tracks(playlist_id, fields)
+        return flight.do(
+            _tracks_flight_key(playlist_id, fields),
+            lambda: self._load_playlist_tracks(playlist_id, fields),
+        )
+
+    def _indexed_snapshot(self, playlist_id: str) -> Optional[str]:
+        """
+        The live snapshot_id ahead of an add or remove, if the playlist is indexed.
+
+        The write's index update is only applied on top of an index at
+        this snapshot; an edit made elsewhere since the index was built
+        drops it instead (see ``record_uri_index_write``). Playlists
+        without an index skip the request.
+        """
+        if not (self._cache and self._cache.uri_index_enabled):
+            return None
+        if not self._cache.get_uri_index_meta([playlist_id]):
+            return None
+        return self._get_snapshot_id(playlist_id)
+
+    def _get_snapshot_id(self, playlist_id: str) -> Optional[str]:
+        """Fetch only a playlist's current snapshot_id (a few bytes)."""
+        playlist = self._http.get(
+            f"/playlists/{playlist_id}", params={"fields": "snapshot_id"}
+        )
+        snapshot_id = playlist.get("snapshot_id") if isinstance(playlist, dict) else None
+        return snapshot_id if isinstance(snapshot_id, str) else None
+
+    def _fetch_playlist_tracks(
+        self, playlist_id: str, fields: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Page in a playlist's tracks from Spotify, bypassing the cache."""
+        item_fields = playlist_item_fields(fields) if fields else None
+
+        # Pages are fetched concurrently: a 2,000-track playlist is one
+        # round trip for the first page plus one wave for the other 19,
+        # rather than 20 sequential requests.
+        all_items = self._http.get_all_pages(
+            f"/playlists/{playlist_id}/items",
+            params={"limit": self.PLAYLIST_ITEMS_PAGE_SIZE},
+            parallel=True,
+            fields=item_fields,
+        )
+        tracks = tracks_from_items(all_items)
+
+        logger.debug(f"Retrieved {len(tracks)} tracks from playlist {playlist_id}")
         return tracks
 
     @api_error_handler
-    def update_playlist_tracks(self, playlist_id: str, track_uris: List[str]) -> bool:
+    def update_playlist_tracks(
+        self,
+        playlist_id: str,
+        track_uris: List[str],
+        current_uris: Optional[List[str]] = None,
+        snapshot_id: Optional[str] = None,
+    ) -> bool:
         """
         Replace all tracks in a playlist with a new list.
 
+        When ``current_uris`` is given, the write is planned as a diff
+        (remove / reorder / insert calls, see ``write_planner``) and the
+        full replace only runs when it is cheaper. A drip of three tracks
+        into a 2,000-track playlist is then one POST instead of 20 calls,
+        and a failure leaves at most a few edits applied rather than a
+        truncated playlist.
+
+        The plan is first costed against ``current_uris``, which costs
+        nothing. Only when the diff beats a full replace are the live item
+        positions read at a known snapshot (see ``_write_base``) and the
+        plan rebuilt against them, since the caller's list may be
+        filtered or cached. The snapshot goes out with the first remove or
+        reorder; Spotify's add-items call takes no snapshot_id, so an
+        insert relies on positions checked just before it. When no base
+        can be read, the full replace runs.
+
         Args:
             playlist_id: The Spotify playlist ID.
             track_uris: List of track URIs in the desired order.
+            current_uris: The playlist's URIs as the caller read them.
+                Used as the write base directly only when ``snapshot_id``
+                is still the live snapshot and no item was filtered out
+                of them; otherwise the live positions are read again.
+            snapshot_id: Snapshot the ``current_uris`` were read at, if
+                the caller knows it. Each edit after the first carries
+                the snapshot returned by the previous one.
 
         Returns:
             True if every batch was confirmed by Spotify.
@@ -354,15 +796,43 @@ class SpotifyAPI:
         """
         self._ensure_valid_token()
 
+        if current_uris is not None:
+            # Cost the diff on the caller's list first: a fresh shuffle
+            # falls back to the full replace and never pays for the read.
+            plan = plan_playlist_write(current_uris, track_uris, self.BATCH_SIZE)
+            base = None
+            if not plan.full_replace:
+                base = self._write_base(playlist_id, current_uris, snapshot_id)
+            if base is not None:
+                live_uris, live_snapshot = base
+                if live_uris != current_uris:
+                    plan = plan_playlist_write(live_uris, track_uris, self.BATCH_SIZE)
+                if not plan.full_replace:
+                    return self._apply_write_plan(
+                        playlist_id, plan, live_snapshot, track_uris
+                    )
+            logger.debug(
+                "Replacing playlist %s in full (diff: %d calls%s)",
+                playlist_id,
+                plan.call_count,
+                "" if plan.full_replace else ", no pinned positions",
+            )
+
         # Handle empty playlist
         if not track_uris:
-            self._http.put(
+            result = self._http.put(
                 f"/playlists/{playlist_id}/items",
                 json={"uris": []},
             )
             logger.info(f"Cleared playlist {playlist_id}")
             if self._cache:
                 self._cache.invalidate_playlist(playlist_id)
+                record_uri_index_write(
+                    self._cache,
+                    playlist_id,
+                    write_result_snapshot(result),
+                    replace=True,
+                )
             return True
 
         total_batches = (len(track_uris) + self.BATCH_SIZE - 1) // self.BATCH_SIZE
@@ -371,7 +841,7 @@ class SpotifyAPI:
         # Batch 1: PUT (replaces playlist contents)
         first = track_uris[: self.BATCH_SIZE]
         try:
-            self._http.put(
+            result = self._http.put(
                 f"/playlists/{playlist_id}/items",
                 json={"uris": first},
             )
@@ -396,7 +866,7 @@ class SpotifyAPI:
         ):
             batch = track_uris[i : i + self.BATCH_SIZE]
             try:
-                self._http.post(
+                result = self._http.post(
                     f"/playlists/{playlist_id}/items",
                     json={"uris": batch},
                 )
@@ -421,6 +891,117 @@ class SpotifyAPI:
 
         if self._cache:
             self._cache.invalidate_playlist(playlist_id)
+            record_uri_index_write(
+                self._cache,
+                playlist_id,
+                write_result_snapshot(result),
+                added=track_uris,
+                replace=True,
+            )
+            if self._user_id:
+                self._cache.invalidate_user_playlists(self._user_id)
+
+        return True
+
+    def _write_base(
+        self,
+        playlist_id: str,
+        current_uris: List[str],
+        snapshot_id: Optional[str],
+    ) -> Optional[Tuple[List[str], str]]:
+        """
+        The item positions a diff write is planned against, and their snapshot.
+
+        ``current_uris`` are used as-is only when ``snapshot_id`` is the
+        live snapshot and Spotify's item ``total`` equals their length, so
+        no unplayable item was filtered out of them. Otherwise the raw
+        items are paged in (``uris_only``) between two snapshot reads.
+
+        Returns None -- replace in full -- when the playlist has no
+        snapshot_id, changed during the read, or holds an item that
+        ``item_uris`` can't address.
+        """
+        live_snapshot = self._get_snapshot_id(playlist_id)
+        if not live_snapshot:
+            return None
+        path = f"/playlists/{playlist_id}/items"
+
+        if snapshot_id == live_snapshot:
+            page = self._http.get(path, params={"limit": 1, "fields": "total"})
+            total = page.get("total") if isinstance(page, dict) else None
+            if total != len(current_uris):
+                return None
+            return list(current_uris), live_snapshot
+
+        items = self._http.get_all_pages(
+            path,
+            params={"limit": self.PLAYLIST_ITEMS_PAGE_SIZE},
+            parallel=True,
+            fields=playlist_item_fields("uris_only"),
+        )
+        uris = item_uris(items)
+        if uris is None or self._get_snapshot_id(playlist_id) != live_snapshot:
+            return None
+        return uris, live_snapshot
+
+    def _apply_write_plan(
+        self,
+        playlist_id: str,
+        plan: PlaylistWritePlan,
+        snapshot_id: Optional[str],
+        track_uris: List[str],
+    ) -> bool:
+        """Send a diff plan's calls in order, chaining ``snapshot_id``."""
+        if not plan.ops:
+            logger.info(f"Playlist {playlist_id} already matches; nothing to write")
+            return True
+
+        path = f"/playlists/{playlist_id}/items"
+        completed: List[str] = []
+        written_snapshot = None
+
+        for op_idx, op in enumerate(plan.ops):
+            payload = write_op_payload(op, snapshot_id)
+            try:
+                if op.kind == OP_REMOVE:
+                    result = self._http.delete(path, json=payload)
+                elif op.kind == OP_REORDER:
+                    result = self._http.put(path, json=payload)
+                else:
+                    result = self._http.post(path, json=payload)
+            except SpotifyAPIError as e:
+                if self._cache and op_idx > 0:
+                    self._cache.invalidate_playlist(playlist_id)
+                raise SpotifyPartialBatchError(
+                    playlist_id=playlist_id,
+                    method="update",
+                    completed_batches=op_idx,
+                    total_batches=len(plan.ops),
+                    completed_uris=list(completed),
+                    remaining_uris=[u for rest in plan.ops[op_idx:] for u in rest.uris],
+                    cause=e,
+                )
+            completed.extend(op.uris)
+            written_snapshot = write_result_snapshot(result)
+            if written_snapshot:
+                snapshot_id = written_snapshot
+
+        logger.info(
+            "Updated playlist %s with %d diff calls (%s)",
+            playlist_id,
+            len(plan.ops),
+            ", ".join(op.kind for op in plan.ops),
+        )
+
+        if self._cache:
+            self._cache.invalidate_playlist(playlist_id)
+            record_uri_index_write(
+                self._cache,
+                playlist_id,
+                written_snapshot,
+                added=track_uris,
+                replace=True,
+            )
             if self._user_id:
                 self._cache.invalidate_user_playlists(self._user_id)
 
@@ -495,6 +1076,7 @@ class SpotifyAPI:
         if not track_uris:
             return True
 
+        base_snapshot = self._indexed_snapshot(playlist_id)
         total_batches = (len(track_uris) + self.BATCH_SIZE - 1) // self.BATCH_SIZE
         completed: List[str] = []
 
@@ -504,7 +1086,7 @@ class SpotifyAPI:
             if position is not None:
                 payload["position"] = position + i
             try:
-                self._http.post(
+                result = self._http.post(
                     f"/playlists/{playlist_id}/items",
                     json=payload,
                 )
@@ -526,6 +1108,13 @@ class SpotifyAPI:
 
         if self._cache:
             self._cache.invalidate_playlist(playlist_id)
+            record_uri_index_write(
+                self._cache,
+                playlist_id,
+                write_result_snapshot(result),
+                added=track_uris,
+                base_snapshot_id=base_snapshot,
+            )
 
         return True
 
@@ -557,13 +1146,14 @@ class SpotifyAPI:
         if not track_uris:
             return True
 
+        base_snapshot = self._indexed_snapshot(playlist_id)
         total_batches = (len(track_uris) + self.BATCH_SIZE - 1) // self.BATCH_SIZE
         completed: List[str] = []
 
         for batch_idx, i in enumerate(range(0, len(track_uris), self.BATCH_SIZE)):
             batch = track_uris[i : i + self.BATCH_SIZE]
             try:
-                self._http.delete(
+                result = self._http.delete(
                     f"/playlists/{playlist_id}/items",
                     json={"items": [{"uri": u} for u in batch]},
                 )
@@ -589,6 +1179,13 @@ class SpotifyAPI:
 
         if self._cache:
             self._cache.invalidate_playlist(playlist_id)
+            record_uri_index_write(
+                self._cache,
+                playlist_id,
+                write_result_snapshot(result),
+                removed=track_uris,
+                base_snapshot_id=base_snapshot,
+            )
             if self._user_id:
                 self._cache.invalidate_user_playlists(self._user_id)
 
@@ -673,7 +1270,9 @@ class SpotifyAPI:
 
         Args:
             playlist_id: The Spotify playlist ID.
-            fields: Spotify field filter string.
+            fields: Spotify field filter string, or the name of a preset
+                from ``fields.PLAYLIST_ITEM_PRESETS`` (expanded to that
+                preset's items plus the paging fields).
             limit: Max items per page.
             offset: Index of the first item to return.
 
@@ -683,6 +1282,8 @@ class SpotifyAPI:
         self._ensure_valid_token()
 
         params = {"limit": limit, "offset": offset}
+        if fields in PLAYLIST_ITEM_PRESETS:
+            fields = page_fields(PLAYLIST_ITEM_PRESETS[fields])
         if fields:
             params["fields"] = fields
 
@@ -0,0 +1,962 @@
+"""
+asyncio variant of SpotifyAPI.
+
+``AsyncSpotifyAPI`` mirrors ``SpotifyAPI`` method for method -- same
+arguments, same caching, same ``SpotifyPartialBatchError`` reporting on
+batched writes -- with every method a coroutine running on an
+``AsyncSpotifyHTTPClient``. Reads of several playlists
+(``get_many_playlist_tracks``) are fetched concurrently rather than one
+after another.
+
+The cache is the same Redis-backed ``SpotifyCache``, whose calls block
+on a Redis round trip. They run in worker threads (``_cache_io``), as
+token refresh through the blocking ``SpotifyAuthManager`` does, so a slow
+Redis delays only the coroutine waiting on it, not the whole loop.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+
+import httpx
+
+from .api import (
+    SpotifyAPI,
+    item_uris,
+    record_uri_index_write,
+    tracks_from_items,
+    write_op_payload,
+    write_result_snapshot,
+)
+from .async_http_client import AsyncSpotifyHTTPClient
+from .auth import SpotifyAuthManager, TokenInfo
+from .error_handling import async_api_error_handler
+from .exceptions import (
+    SpotifyAPIError,
+    SpotifyPartialBatchError,
+    SpotifyTokenExpiredError,
+)
+from .fields import PLAYLIST_ITEM_PRESETS, page_fields, playlist_item_fields
+from .write_planner import (
+    OP_REMOVE,
+    OP_REORDER,
+    PlaylistWritePlan,
+    plan_playlist_write,
+)
+
+if TYPE_CHECKING:
+    from .cache import SpotifyCache
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSpotifyAPI:
+    """
+    Async Spotify Web API client for data operations.
+
+    Example:
+        async with AsyncSpotifyAPI(token_info, auth_manager, cache=cache) as api:
+            by_playlist = await api.get_many_playlist_tracks(source_ids)
+    """
+
+    BATCH_SIZE = SpotifyAPI.BATCH_SIZE
+    PLAYLIST_ITEMS_PAGE_SIZE = SpotifyAPI.PLAYLIST_ITEMS_PAGE_SIZE
+    AUDIO_FEATURES_BATCH_SIZE = SpotifyAPI.AUDIO_FEATURES_BATCH_SIZE
+
+    def __init__(
+        self,
+        token_info: TokenInfo,
+        auth_manager: Optional[SpotifyAuthManager] = None,
+        auto_refresh: bool = True,
+        cache: Optional["SpotifyCache"] = None,
+        on_token_refresh: Optional[Callable[[TokenInfo], None]] = None,
+        on_token_rejected: Optional[Callable[[TokenInfo], None]] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        """
+        Initialize the API client.
+
+        Arguments are those of ``SpotifyAPI``, plus ``client``, an
+        optional ``httpx.AsyncClient`` to share between instances on one
+        loop (see ``AsyncSpotifyHTTPClient``).
+
+        An expired token is refreshed before the first request rather
+        than here, since a constructor cannot await.
+
+        Raises:
+            SpotifyTokenExpiredError: If token is expired and cannot be refreshed.
+        """
+        self._auth_manager = auth_manager
+        self._auto_refresh = auto_refresh and auth_manager is not None
+        self._cache = cache
+        self._on_token_refresh = on_token_refresh
+        self._on_token_rejected = on_token_rejected
+
+        if token_info.is_expired and not self._auto_refresh:
+            raise SpotifyTokenExpiredError("Token is expired")
+
+        self._token_info = token_info
+        self._http = AsyncSpotifyHTTPClient(
+            token_info.access_token,
+            on_token_refresh=(
+                self._handle_token_refresh if self._auto_refresh else None
+            ),
+            client=client,
+        )
+        self._user_id: Optional[str] = None
+
+    async def __aenter__(self) -> "AsyncSpotifyAPI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        await self._http.aclose()
+
+    def _notify_token_refresh(self) -> None:
+        """Invoke the on_token_refresh callback; failures are logged."""
+        if self._on_token_refresh is None:
+            return
+        try:
+            self._on_token_refresh(self._token_info)
+        except Exception as e:  # pragma: no cover - defensive
+            logger.warning("on_token_refresh callback failed: %s", e)
+
+    async def _refresh(self) -> None:
+        self._token_info = await asyncio.to_thread(
+            self._auth_manager.ensure_valid_token, self._token_info
+        )
+        self._notify_token_refresh()
+
+    async def _handle_token_refresh(self) -> str:
+        """Callback for AsyncSpotifyHTTPClient on 401 responses.
+
+        Refreshes whatever the token's expiry says, as ``SpotifyAPI`` does.
+        """
+        if self._on_token_rejected is not None:
+            try:
+                # Normally a token-cache delete: a Redis round trip.
+                await asyncio.to_thread(self._on_token_rejected, self._token_info)
+            except Exception as e:  # pragma: no cover - defensive
+                logger.warning("on_token_rejected callback failed: %s", e)
+        self._token_info = await asyncio.to_thread(
+            self._auth_manager.refresh_token, self._token_info
+        )
+        self._notify_token_refresh()
+        return self._token_info.access_token
+
+    @staticmethod
+    async def _cache_io(call: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking cache call (a Redis round trip) off the loop."""
+        return await asyncio.to_thread(call, *args, **kwargs)
+
+    @property
+    def token_info(self) -> TokenInfo:
+        """Get the current token info (may have been refreshed)."""
+        return self._token_info
+
+    @property
+    def cache(self) -> Optional["SpotifyCache"]:
+        """Get the cache instance (if configured)."""
+        return self._cache
+
+    async def _ensure_valid_token(self) -> None:
+        """
+        Ensure the token is valid, refreshing if necessary.
+
+        Raises:
+            SpotifyTokenExpiredError: If token cannot be made valid.
+        """
+        if not self._token_info.is_expired:
+            return
+
+        if not self._auto_refresh:
+            raise SpotifyTokenExpiredError("Token expired and auto-refresh disabled")
+
+        logger.info("Token expired, refreshing...")
+        await self._refresh()
+        self._http.update_token(self._token_info.access_token)
+
+    async def _get_user_id(self) -> str:
+        """Get the current user's ID, caching the result."""
+        if self._user_id is None:
+            user = await self.get_current_user()
+            self._user_id = user["id"]
+        return self._user_id
+
+    # =========================================================================
+    # User Operations
+    # =========================================================================
+
+    @async_api_error_handler
+    async def get_current_user(self) -> Dict[str, Any]:
+        """Get the current user's profile."""
+        await self._ensure_valid_token()
+
+        if self._cache and self._user_id:
+            cached = await self._cache_io(self._cache.get_user, self._user_id)
+            if cached:
+                return cached
+
+        user = await self._http.get("/me")
+
+        if self._cache and user:
+            self._user_id = user["id"]
+            await self._cache_io(self._cache.set_user, user["id"], user)
+
+        return user
+
+    # =========================================================================
+    # Playlist Operations
+    # =========================================================================
+
+    @async_api_error_handler
+    async def get_user_playlists(self, skip_cache: bool = False) -> List[Dict[str, Any]]:
+        """Get all playlists the user can edit (owned or collaborative)."""
+        await self._ensure_valid_token()
+        user_id = await self._get_user_id()
+
+        if self._cache and not skip_cache:
+            cached = await self._cache_io(self._cache.get_playlists, user_id)
+            if cached is not None:
+                return cached
+
+        all_items = await self._http.get_all_pages("/me/playlists")
+        playlists = [
+            playlist
+            for playlist in all_items
+            if playlist["owner"]["id"] == user_id or playlist.get("collaborative")
+        ]
+
+        if self._cache:
+            await self._cache_io(self._cache.set_playlists, user_id, playlists)
+
+        return playlists
+
+    @async_api_error_handler
+    async def get_playlist(
+        self, playlist_id: str, skip_cache: bool = False
+    ) -> Dict[str, Any]:
+        """Get a single playlist by ID."""
+        await self._ensure_valid_token()
+
+        if self._cache and not skip_cache:
+            cached = await self._cache_io(self._cache.get_playlist, playlist_id)
+            if cached is not None:
+                return cached
+
+        playlist = await self._http.get(f"/playlists/{playlist_id}")
+
+        if self._cache:
+            await self._cache_io(self._cache.set_playlist, playlist_id, playlist)
+
+        return playlist
+
+    @async_api_error_handler
+    async def get_playlist_tracks(
+        self,
+        playlist_id: str,
+        skip_cache: bool = False,
+        fields: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all tracks from a playlist.
+
+        See ``SpotifyAPI.get_playlist_tracks``: recent cached copies are
+        returned as-is, older ones are revalidated by snapshot_id.
+        """
+        await self._ensure_valid_token()
+
+        if self._cache and not skip_cache:
+            cached = await self._cache_io(self._cache.get_playlist_tracks, playlist_id, fields=fields)
+            if cached is not None:
+                return cached
+            tracks = await self._load_playlist_tracks(playlist_id, fields)
+        else:
+            tracks = await self._fetch_playlist_tracks(playlist_id, fields)
+
+        if self._cache:
+            await self._cache_io(self._cache.set_playlist_tracks, playlist_id, tracks, fields=fields)
+
+        return tracks
+
+    @async_api_error_handler
+    async def get_many_playlist_tracks(
+        self,
+        playlist_ids: List[str],
+        skip_cache: bool = False,
+        fields: Optional[str] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get all tracks from several playlists, fetching misses concurrently.
+
+        Cache reads and writes are batched as in
+        ``SpotifyAPI.get_many_playlist_tracks``. The first failing
+        playlist raises once the others have settled; every playlist that
+        was fetched is still cached.
+        """
+        await self._ensure_valid_token()
+        playlist_ids = list(dict.fromkeys(playlist_ids))
+
+        tracks_by_playlist: Dict[str, List[Dict[str, Any]]] = {}
+        if self._cache and not skip_cache:
+            tracks_by_playlist.update(
+                await self._cache_io(self._cache.get_many_playlist_tracks, playlist_ids, fields=fields)
+            )
+
+        misses = [pid for pid in playlist_ids if pid not in tracks_by_playlist]
+        load = (
+            self._load_playlist_tracks
+            if self._cache and not skip_cache
+            else self._fetch_playlist_tracks
+        )
+        results = await asyncio.gather(
+            *(load(pid, fields) for pid in misses), return_exceptions=True
+        )
+
+        fetched: Dict[str, List[Dict[str, Any]]] = {}
+        error: Optional[BaseException] = None
+        for playlist_id, result in zip(misses, results):
+            if isinstance(result, BaseException):
+                error = error or result
+            else:
+                fetched[playlist_id] = result
+
+        if self._cache and fetched:
+            await self._cache_io(self._cache.set_many_playlist_tracks, fetched, fields=fields)
+        if error is not None:
+            raise error
+
+        tracks_by_playlist.update(fetched)
+        return {pid: tracks_by_playlist[pid] for pid in playlist_ids}
+
+    @async_api_error_handler
+    async def get_playlist_uris(self, playlist_id: str) -> List[str]:
+        """Get a playlist's track URIs, in order, straight from Spotify."""
+        await self._ensure_valid_token()
+
+        tracks = await self._fetch_playlist_tracks(playlist_id, "uris_only")
+        return [track["uri"] for track in tracks]
+
+    @async_api_error_handler
+    async def get_playlist_snapshot_id(self, playlist_id: str) -> Optional[str]:
+        """Get a playlist's current snapshot_id without reading its tracks."""
+        await self._ensure_valid_token()
+        return await self._get_snapshot_id(playlist_id)
+
+    @async_api_error_handler
+    async def get_indexed_playlist_uris(
+        self, playlist_ids: List[str]
+    ) -> Optional[Tuple[Set[str], Dict[str, int]]]:
+        """Get the union of several playlists' URIs from the cache's URI index.
+
+        Snapshots are checked concurrently; see
+        ``SpotifyAPI.get_indexed_playlist_uris``.
+        """
+        if not (self._cache and self._cache.uri_index_enabled):
+            return None
+        await self._ensure_valid_token()
+        playlist_ids = list(dict.fromkeys(playlist_ids))
+
+        indexed = await self._cache_io(self._cache.get_uri_index_meta, playlist_ids)
+        snapshots = await asyncio.gather(
+            *(self._get_snapshot_id(pid) for pid in playlist_ids)
+        )
+        counts: Dict[str, int] = {}
+        for playlist_id, snapshot_id in zip(playlist_ids, snapshots):
+            if not snapshot_id:
+                return None
+            held = indexed.get(playlist_id)
+            if held is not None and held[0] == snapshot_id:
+                counts[playlist_id] = held[1]
+                continue
+            uris = [
+                t["uri"]
+                for t in await self._tracks_at_snapshot(playlist_id, snapshot_id, "uris_only")
+                if t.get("uri")
+            ]
+            if not await self._cache_io(self._cache.set_uri_index, playlist_id, uris, snapshot_id):
+                return None
+            counts[playlist_id] = len(uris)
+
+        uris = await self._cache_io(self._cache.union_uri_index, playlist_ids)
+        if uris is None:
+            return None
+        return uris, counts
+
+    async def _load_playlist_tracks(
+        self, playlist_id: str, fields: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get a playlist's tracks, revalidating a snapshot-keyed cached copy."""
+        return await self._tracks_at_snapshot(
+            playlist_id, await self._get_snapshot_id(playlist_id), fields
+        )
+
+    async def _tracks_at_snapshot(
+        self,
+        playlist_id: str,
+        snapshot_id: Optional[str],
+        fields: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Tracks cached at ``snapshot_id``, else paged in and cached there."""
+        if snapshot_id:
+            cached = await self._cache_io(
+                self._cache.get_playlist_tracks_at,
+                playlist_id, snapshot_id, fields=fields
+            )
+            if cached is not None:
+                return cached
+
+        tracks = await self._fetch_playlist_tracks(playlist_id, fields)
+        if snapshot_id:
+            await self._cache_io(
+                self._cache.set_playlist_tracks_at,
+                playlist_id, snapshot_id, tracks, fields=fields
+            )
+        return tracks
+
+    async def _indexed_snapshot(self, playlist_id: str) -> Optional[str]:
+        """See ``SpotifyAPI._indexed_snapshot``."""
+        if not (self._cache and self._cache.uri_index_enabled):
+            return None
+        if not await self._cache_io(self._cache.get_uri_index_meta, [playlist_id]):
+            return None
+        return await self._get_snapshot_id(playlist_id)
+
+    async def _get_snapshot_id(self, playlist_id: str) -> Optional[str]:
+        """Fetch only a playlist's current snapshot_id."""
+        playlist = await self._http.get(
+            f"/playlists/{playlist_id}", params={"fields": "snapshot_id"}
+        )
+        snapshot_id = playlist.get("snapshot_id") if isinstance(playlist, dict) else None
+        return snapshot_id if isinstance(snapshot_id, str) else None
+
+    async def _fetch_playlist_tracks(
+        self, playlist_id: str, fields: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Page in a playlist's tracks from Spotify, bypassing the cache."""
+        item_fields = playlist_item_fields(fields) if fields else None
+        all_items = await self._http.get_all_pages(
+            f"/playlists/{playlist_id}/items",
+            params={"limit": self.PLAYLIST_ITEMS_PAGE_SIZE},
+            parallel=True,
+            fields=item_fields,
+        )
+        tracks = tracks_from_items(all_items)
+        logger.debug(f"Retrieved {len(tracks)} tracks from playlist {playlist_id}")
+        return tracks
+
+    @async_api_error_handler
+    async def update_playlist_tracks(
+        self,
+        playlist_id: str,
+        track_uris: List[str],
+        current_uris: Optional[List[str]] = None,
+        snapshot_id: Optional[str] = None,
+    ) -> bool:
+        """
+        Replace all tracks in a playlist with a new list.
+
+        Batches are sent in order, as in ``SpotifyAPI.update_playlist_tracks``
+        -- each one depends on the playlist state the previous one left.
+
+        Raises:
+            SpotifyNotFoundError: If playlist doesn't exist.
+            SpotifyPartialBatchError: If a batch fails mid-flight.
+            SpotifyAPIError: If the update fails for non-batch reasons.
+        """
+        await self._ensure_valid_token()
+
+        if current_uris is not None:
+            plan = plan_playlist_write(current_uris, track_uris, self.BATCH_SIZE)
+            base = None
+            if not plan.full_replace:
+                base = await self._write_base(playlist_id, current_uris, snapshot_id)
+            if base is not None:
+                live_uris, live_snapshot = base
+                if live_uris != current_uris:
+                    plan = plan_playlist_write(live_uris, track_uris, self.BATCH_SIZE)
+                if not plan.full_replace:
+                    return await self._apply_write_plan(
+                        playlist_id, plan, live_snapshot, track_uris
+                    )
+
+        path = f"/playlists/{playlist_id}/items"
+
+        if not track_uris:
+            result = await self._http.put(path, json={"uris": []})
+            logger.info(f"Cleared playlist {playlist_id}")
+            if self._cache:
+                await self._cache_io(self._cache.invalidate_playlist, playlist_id)
+                await self._cache_io(
+                    record_uri_index_write,
+                    self._cache,
+                    playlist_id,
+                    write_result_snapshot(result),
+                    replace=True,
+                )
+            return True
+
+        total_batches = (len(track_uris) + self.BATCH_SIZE - 1) // self.BATCH_SIZE
+        completed: List[str] = []
+
+        first = track_uris[: self.BATCH_SIZE]
+        try:
+            result = await self._http.put(path, json={"uris": first})
+        except SpotifyAPIError as e:
+            raise SpotifyPartialBatchError(
+                playlist_id=playlist_id,
+                method="update",
+                completed_batches=0,
+                total_batches=total_batches,
+                completed_uris=[],
+                remaining_uris=list(track_uris),
+                cause=e,
+            )
+        completed.extend(first)
+
+        for batch_idx, i in enumerate(
+            range(self.BATCH_SIZE, len(track_uris), self.BATCH_SIZE),
+            start=1,
+        ):
+            batch = track_uris[i : i + self.BATCH_SIZE]
+            try:
+                result = await self._http.post(path, json={"uris": batch})
+            except SpotifyAPIError as e:
+                if self._cache:
+                    await self._cache_io(self._cache.invalidate_playlist, playlist_id)
+                raise SpotifyPartialBatchError(
+                    playlist_id=playlist_id,
+                    method="update",
+                    completed_batches=batch_idx,
+                    total_batches=total_batches,
+                    completed_uris=list(completed),
+                    remaining_uris=list(track_uris[i:]),
+                    cause=e,
+                )
+            completed.extend(batch)
+
+        logger.info(f"Updated playlist {playlist_id} with {len(track_uris)} tracks")
+
+        if self._cache:
+            await self._cache_io(self._cache.invalidate_playlist, playlist_id)
+            await self._cache_io(
+                record_uri_index_write,
+                self._cache,
+                playlist_id,
+                write_result_snapshot(result),
+                added=track_uris,
+                replace=True,
+            )
+            if self._user_id:
+                await self._cache_io(self._cache.invalidate_user_playlists, self._user_id)
+
+        return True
+
+    async def _write_base(
+        self,
+        playlist_id: str,
+        current_uris: List[str],
+        snapshot_id: Optional[str],
+    ) -> Optional[Tuple[List[str], str]]:
+        """See ``SpotifyAPI._write_base``."""
+        live_snapshot = await self._get_snapshot_id(playlist_id)
+        if not live_snapshot:
+            return None
+        path = f"/playlists/{playlist_id}/items"
+
+        if snapshot_id == live_snapshot:
+            page = await self._http.get(path, params={"limit": 1, "fields": "total"})
+            total = page.get("total") if isinstance(page, dict) else None
+            if total != len(current_uris):
+                return None
+            return list(current_uris), live_snapshot
+
+        items = await self._http.get_all_pages(
+            path,
+            params={"limit": self.PLAYLIST_ITEMS_PAGE_SIZE},
+            parallel=True,
+            fields=playlist_item_fields("uris_only"),
+        )
+        uris = item_uris(items)
+        if uris is None or await self._get_snapshot_id(playlist_id) != live_snapshot:
+            return None
+        return uris, live_snapshot
+
+    async def _apply_write_plan(
+        self,
+        playlist_id: str,
+        plan: PlaylistWritePlan,
+        snapshot_id: Optional[str],
+        track_uris: List[str],
+    ) -> bool:
+        """Send a diff plan's calls in order, chaining ``snapshot_id``."""
+        if not plan.ops:
+            return True
+
+        path = f"/playlists/{playlist_id}/items"
+        completed: List[str] = []
+        written_snapshot = None
+
+        for op_idx, op in enumerate(plan.ops):
+            payload = write_op_payload(op, snapshot_id)
+            try:
+                if op.kind == OP_REMOVE:
+                    result = await self._http.delete(path, json=payload)
+                elif op.kind == OP_REORDER:
+                    result = await self._http.put(path, json=payload)
+                else:
+                    result = await self._http.post(path, json=payload)
+            except SpotifyAPIError as e:
+                if self._cache and op_idx > 0:
+                    await self._cache_io(self._cache.invalidate_playlist, playlist_id)
+                raise SpotifyPartialBatchError(
+                    playlist_id=playlist_id,
+                    method="update",
+                    completed_batches=op_idx,
+                    total_batches=len(plan.ops),
+                    completed_uris=list(completed),
+                    remaining_uris=[u for rest in plan.ops[op_idx:] for u in rest.uris],
+                    cause=e,
+                )
+            completed.extend(op.uris)
+            written_snapshot = write_result_snapshot(result)
+            if written_snapshot:
+                snapshot_id = written_snapshot
+
+        if self._cache:
+            await self._cache_io(self._cache.invalidate_playlist, playlist_id)
+            await self._cache_io(
+                record_uri_index_write,
+                self._cache,
+                playlist_id,
+                written_snapshot,
+                added=track_uris,
+                replace=True,
+            )
+            if self._user_id:
+                await self._cache_io(self._cache.invalidate_user_playlists, self._user_id)
+
+        return True
+
+    @async_api_error_handler
+    async def get_tracks(self, track_uris: List[str]) -> List[Dict[str, Any]]:
+        """Fetch full track metadata for a list of track URIs."""
+        await self._ensure_valid_token()
+
+        ids = []
+        for uri in track_uris:
+            parts = uri.split(":")
+            if len(parts) == 3 and parts[1] == "track":
+                ids.append(parts[2])
+
+        batch_size = 50  # Spotify limit for /tracks
+        results = await asyncio.gather(
+            *(
+                self._http.get("/tracks", params={"ids": ",".join(ids[i : i + batch_size])})
+                for i in range(0, len(ids), batch_size)
+            )
+        )
+
+        tracks = []
+        for result in results:
+            if result and "tracks" in result:
+                for t in result["tracks"]:
+                    if t and t.get("uri"):
+                        tracks.append(t)
+        return tracks
+
+    @async_api_error_handler
+    async def playlist_add_items(
+        self,
+        playlist_id: str,
+        track_uris: List[str],
+        position: Optional[int] = None,
+    ) -> bool:
+        """
+        Add tracks to a playlist in batches, in order.
+
+        Raises:
+            SpotifyPartialBatchError: If a batch fails mid-flight.
+            SpotifyAPIError: For non-batch HTTP failures.
+        """
+        await self._ensure_valid_token()
+
+        if not track_uris:
+            return True
+
+        base_snapshot = await self._indexed_snapshot(playlist_id)
+        total_batches = (len(track_uris) + self.BATCH_SIZE - 1) // self.BATCH_SIZE
+        completed: List[str] = []
+
+        for batch_idx, i in enumerate(range(0, len(track_uris), self.BATCH_SIZE)):
+            batch = track_uris[i : i + self.BATCH_SIZE]
+            payload: Dict[str, Any] = {"uris": batch}
+            if position is not None:
+                payload["position"] = position + i
+            try:
+                result = await self._http.post(f"/playlists/{playlist_id}/items", json=payload)
+            except SpotifyAPIError as e:
+                if self._cache and batch_idx > 0:
+                    await self._cache_io(self._cache.invalidate_playlist, playlist_id)
+                raise SpotifyPartialBatchError(
+                    playlist_id=playlist_id,
+                    method="add",
+                    completed_batches=batch_idx,
+                    total_batches=total_batches,
+                    completed_uris=list(completed),
+                    remaining_uris=list(track_uris[i:]),
+                    cause=e,
+                )
+            completed.extend(batch)
+
+        if self._cache:
+            await self._cache_io(self._cache.invalidate_playlist, playlist_id)
+            await self._cache_io(
+                record_uri_index_write,
+                self._cache,
+                playlist_id,
+                write_result_snapshot(result),
+                added=track_uris,
+                base_snapshot_id=base_snapshot,
+            )
+
+        return True
+
+    @async_api_error_handler
+    async def playlist_remove_items(self, playlist_id: str, track_uris: List[str]) -> bool:
+        """
+        Remove specific tracks from a playlist, in batches.
+
+        Raises:
+            SpotifyNotFoundError: If playlist doesn't exist.
+            SpotifyPartialBatchError: If a batch fails mid-flight.
+            SpotifyAPIError: For non-batch HTTP failures.
+        """
+        await self._ensure_valid_token()
+
+        if not track_uris:
+            return True
+
+        base_snapshot = await self._indexed_snapshot(playlist_id)
+        total_batches = (len(track_uris) + self.BATCH_SIZE - 1) // self.BATCH_SIZE
+        completed: List[str] = []
+
+        for batch_idx, i in enumerate(range(0, len(track_uris), self.BATCH_SIZE)):
+            batch = track_uris[i : i + self.BATCH_SIZE]
+            try:
+                result = await self._http.delete(
+                    f"/playlists/{playlist_id}/items",
+                    json={"items": [{"uri": u} for u in batch]},
+                )
+            except SpotifyAPIError as e:
+                if self._cache and batch_idx > 0:
+                    await self._cache_io(self._cache.invalidate_playlist, playlist_id)
+                raise SpotifyPartialBatchError(
+                    playlist_id=playlist_id,
+                    method="remove",
+                    completed_batches=batch_idx,
+                    total_batches=total_batches,
+                    completed_uris=list(completed),
+                    remaining_uris=list(track_uris[i:]),
+                    cause=e,
+                )
+            completed.extend(batch)
+
+        if self._cache:
+            await self._cache_io(self._cache.invalidate_playlist, playlist_id)
+            await self._cache_io(
+                record_uri_index_write,
+                self._cache,
+                playlist_id,
+                write_result_snapshot(result),
+                removed=track_uris,
+                base_snapshot_id=base_snapshot,
+            )
+            if self._user_id:
+                await self._cache_io(self._cache.invalidate_user_playlists, self._user_id)
+
+        return True
+
+    @async_api_error_handler
+    async def create_user_playlist(
+        self,
+        user_id: str,
+        name: str,
+        public: bool = False,
+        description: str = "",
+    ) -> Dict[str, Any]:
+        """Create a new playlist for a user."""
+        await self._ensure_valid_token()
+
+        result = await self._http.post(
+            f"/users/{user_id}/playlists",
+            json={"name": name, "public": public, "description": description},
+        )
+
+        if self._cache and self._user_id:
+            await self._cache_io(self._cache.invalidate_user_playlists, self._user_id)
+
+        return result
+
+    @async_api_error_handler
+    async def update_playlist_details(self, playlist_id: str, **kwargs) -> None:
+        """Update a playlist's details (name, public, description)."""
+        await self._ensure_valid_token()
+
+        allowed = {"name", "public", "description"}
+        body = {k: v for k, v in kwargs.items() if k in allowed}
+        if not body:
+            return
+
+        await self._http.put(f"/playlists/{playlist_id}", json=body)
+
+    @async_api_error_handler
+    async def get_playlist_items_raw(
+        self,
+        playlist_id: str,
+        fields: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """Get one page of playlist items with optional field filtering."""
+        await self._ensure_valid_token()
+
+        params = {"limit": limit, "offset": offset}
+        if fields in PLAYLIST_ITEM_PRESETS:
+            fields = page_fields(PLAYLIST_ITEM_PRESETS[fields])
+        if fields:
+            params["fields"] = fields
+
+        return await self._http.get(f"/playlists/{playlist_id}/items", params=params)
+
+    # =========================================================================
+    # Audio Features Operations
+    # =========================================================================
+
+    @async_api_error_handler
+    async def get_audio_features(
+        self, track_ids: List[str], skip_cache: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get audio features for multiple tracks, keyed by track ID."""
+        await self._ensure_valid_token()
+        features: Dict[str, Dict[str, Any]] = {}
+
+        valid_ids = [tid.split(":")[-1] for tid in track_ids if tid]
+        if not valid_ids:
+            return features
+
+        ids_to_fetch = valid_ids
+        if self._cache and not skip_cache:
+            cached_features = await self._cache_io(self._cache.get_audio_features, valid_ids)
+            features.update(cached_features)
+            ids_to_fetch = [tid for tid in valid_ids if tid not in cached_features]
+            if not ids_to_fetch:
+                return features
+
+        batches = [
+            ids_to_fetch[i : i + self.AUDIO_FEATURES_BATCH_SIZE]
+            for i in range(0, len(ids_to_fetch), self.AUDIO_FEATURES_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(
+                self._http.get("/audio-features", params={"ids": ",".join(batch)})
+                for batch in batches
+            )
+        )
+
+        new_features = {}
+        for batch, result in zip(batches, results):
+            for track_id, feature in zip(batch, (result or {}).get("audio_features") or []):
+                if feature:
+                    features[track_id] = feature
+                    new_features[track_id] = feature
+
+        if self._cache and new_features:
+            await self._cache_io(self._cache.set_audio_features, new_features)
+
+        return features
+
+    # =========================================================================
+    # Search Operations
+    # =========================================================================
+
+    @async_api_error_handler
+    async def search_playlists(
+        self,
+        query: str,
+        limit: int = 10,
+        skip_cache: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Search for playlists by name (see ``SpotifyAPI.search_playlists``)."""
+        await self._ensure_valid_token()
+        limit = max(1, min(limit, 50))
+
+        if self._cache and not skip_cache:
+            cached = await self._cache_io(self._cache.get_search_playlists, query, limit)
+            if cached is not None:
+                return cached
+
+        results = await self._http.get(
+            "/search",
+            params={"q": query, "type": "playlist", "limit": limit},
+        )
+
+        playlists = []
+        for item in ((results or {}).get("playlists") or {}).get("items") or []:
+            if item is None:
+                continue
+            owner = item.get("owner", {})
+            playlists.append(
+                {
+                    "id": item["id"],
+                    "name": item["name"],
+                    "owner_display_name": owner.get("display_name", "Unknown"),
+                    "owner_id": owner.get("id", ""),
+                    "image_url": item["images"][0]["url"] if item.get("images") else None,
+                    "total_tracks": item.get("tracks", {}).get("total", 0),
+                }
+            )
+
+        if self._cache and playlists:
+            await self._cache_io(self._cache.set_search_playlists, query, limit, playlists)
+
+        return playlists
+
+    @async_api_error_handler
+    async def search_tracks(
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        market: Optional[str] = None,
+        skip_cache: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Search Spotify's catalog for tracks (see ``SpotifyAPI.search_tracks``)."""
+        await self._ensure_valid_token()
+        limit = max(1, min(limit, 50))
+        offset = max(0, offset)
+
+        if self._cache and not skip_cache:
+            cached = await self._cache_io(self._cache.get_search_results, query, offset)
+            if cached is not None:
+                return cached
+
+        params = {"q": query, "type": "track", "limit": limit, "offset": offset}
+        if market:
+            params["market"] = market
+
+        results = await self._http.get("/search", params=params)
+
+        tracks = [
+            item
+            for item in ((results or {}).get("tracks") or {}).get("items") or []
+            if item and item.get("uri")
+        ]
+
+        if self._cache and tracks:
+            await self._cache_io(self._cache.set_search_results, query, offset, tracks)
+
+        return tracks
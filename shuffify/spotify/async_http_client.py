@@ -0,0 +1,362 @@
+"""
+asyncio HTTP client for the Spotify Web API, on httpx.
+
+``SpotifyHTTPClient`` blocks its thread for every request and every
+backoff sleep, so a scheduler thread paging in a large playlist (or
+waiting out a 429) can do nothing else. ``AsyncSpotifyHTTPClient`` has
+the same public surface and the same retry, 401-refresh and pagination
+behaviour, but awaits instead of blocking, so many playlists and users
+can overlap their I/O on one event loop.
+
+Retry limits and backoff are shared with ``http_client`` rather than
+copied, and requests pass through the same process-wide rate governor.
+"""
+
+import asyncio
+import inspect
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+import httpx
+
+from .exceptions import (
+    SpotifyAPIError,
+    SpotifyNotFoundError,
+    SpotifyRateLimitError,
+    SpotifyTokenExpiredError,
+)
+from .fields import page_fields
+from .http_client import (
+    BASE_URL,
+    MAX_PAGE_WORKERS,
+    MAX_RETRIES,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    _calculate_backoff_delay,
+    get_rate_governor,
+)
+
+logger = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT = 30  # seconds, as for SpotifyHTTPClient
+
+TokenRefresher = Callable[[], Union[str, Awaitable[str]]]
+
+
+def build_async_client() -> httpx.AsyncClient:
+    """Build an ``httpx.AsyncClient`` sized like the shared sync pool.
+
+    The bearer token is sent per request, not set on the client, so one
+    client can be shared by every ``AsyncSpotifyHTTPClient`` on a loop
+    without leaking one user's token onto another's request. A client is
+    bound to the loop it first runs on; do not share one across loops.
+    """
+    return httpx.AsyncClient(
+        timeout=REQUEST_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=POOL_MAXSIZE,
+            max_keepalive_connections=POOL_CONNECTIONS,
+        ),
+    )
+
+
+class AsyncSpotifyHTTPClient:
+    """
+    Async HTTP client for Spotify Web API requests.
+
+    Handles authorization headers, token refresh on 401, rate limit
+    backoff on 429, and retries on transient errors (5xx, network).
+
+    Example:
+        async with AsyncSpotifyHTTPClient(token) as http:
+            items = await http.get_all_pages("/me/playlists", parallel=True)
+    """
+
+    def __init__(
+        self,
+        access_token: str,
+        on_token_refresh: Optional[TokenRefresher] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        """
+        Initialize the HTTP client.
+
+        Args:
+            access_token: Bearer token for API requests.
+            on_token_refresh: Optional callback that returns a fresh
+                access token. Called on 401 responses. May be a plain
+                function or a coroutine function.
+            client: Optional ``httpx.AsyncClient`` to send requests on,
+                e.g. one shared by every client on the loop. It is left
+                open by ``aclose``. When omitted, this client builds and
+                owns its own.
+        """
+        self._access_token = access_token
+        self._on_token_refresh = on_token_refresh
+        # Serialises 401 handling when parallel pagination has several
+        # requests in flight, as SpotifyHTTPClient's _refresh_lock does.
+        self._refresh_lock = asyncio.Lock()
+        self._owns_client = client is None
+        self._client = client if client is not None else build_async_client()
+
+    async def __aenter__(self) -> "AsyncSpotifyHTTPClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def update_token(self, access_token: str) -> None:
+        """Update the bearer token for future requests."""
+        self._access_token = access_token
+
+    async def aclose(self) -> None:
+        """Close the underlying client, unless it was passed in."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    # -----------------------------------------------------------------
+    # Public HTTP methods
+    # -----------------------------------------------------------------
+
+    async def get(self, path: str, params: Optional[Dict] = None) -> Any:
+        """Send a GET request."""
+        return await self._request("GET", path, params=params)
+
+    async def post(self, path: str, json: Any = None) -> Any:
+        """Send a POST request."""
+        return await self._request("POST", path, json=json)
+
+    async def put(self, path: str, json: Any = None) -> Any:
+        """Send a PUT request."""
+        return await self._request("PUT", path, json=json)
+
+    async def delete(self, path: str, json: Any = None) -> Any:
+        """Send a DELETE request."""
+        return await self._request("DELETE", path, json=json)
+
+    async def get_all_pages(
+        self,
+        path: str,
+        params: Optional[Dict] = None,
+        items_key: str = "items",
+        parallel: bool = False,
+        fields: Optional[str] = None,
+    ) -> List[Dict]:
+        """
+        Fetch all pages of a paginated endpoint.
+
+        Same contract as ``SpotifyHTTPClient.get_all_pages``. With
+        ``parallel=True`` the pages after the first are fetched as
+        concurrent tasks, at most ``MAX_PAGE_WORKERS`` in flight.
+
+        Args:
+            path: Initial API path (e.g. ``/me/playlists``).
+            params: Optional query parameters for the first request.
+            items_key: Key containing the list items (default ``items``).
+            parallel: Fetch pages after the first concurrently instead of
+                following ``next`` links one at a time.
+            fields: Item-level field filter, wrapped as in the sync client.
+
+        Returns:
+            Concatenated list of all items across pages, in page order.
+        """
+        if fields:
+            params = {**(params or {}), "fields": page_fields(fields, items_key)}
+
+        first = await self._request("GET", path, params=params)
+        if not first:
+            return []
+
+        all_items: List[Dict] = list(first.get(items_key) or [])
+        if not first.get("next"):
+            return all_items
+
+        total = first.get("total")
+        limit = first.get("limit") or len(all_items)
+        if not parallel or not isinstance(total, int) or not limit:
+            url: Optional[str] = first["next"]
+            while url:
+                data = await self._request_url("GET", url)
+                if data and items_key in data:
+                    all_items.extend(data[items_key])
+                url = data.get("next") if data else None
+            return all_items
+
+        start = (first.get("offset") or 0) + limit
+        offsets = list(range(start, total, limit))
+        base_params = dict(params or {})
+        slots = asyncio.Semaphore(MAX_PAGE_WORKERS)
+
+        async def fetch(offset: int) -> List[Dict]:
+            page_params = {**base_params, "offset": offset, "limit": limit}
+            async with slots:
+                data = await self._request("GET", path, params=page_params)
+            return (data or {}).get(items_key) or []
+
+        # gather() returns pages in offset order regardless of which
+        # finished first. The first page error propagates here, and the
+        # pages still in flight are cancelled rather than left running.
+        tasks = [asyncio.ensure_future(fetch(offset)) for offset in offsets]
+        try:
+            pages = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        for page in pages:
+            all_items.extend(page)
+
+        return all_items
+
+    # -----------------------------------------------------------------
+    # Internal request handling
+    # -----------------------------------------------------------------
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict] = None,
+        json: Any = None,
+    ) -> Any:
+        """Make a request to a relative API path."""
+        url = f"{BASE_URL}{path}"
+        return await self._request_url(method, url, params=params, json=json)
+
+    async def _refresh_token(self) -> str:
+        new_token = self._on_token_refresh()
+        if inspect.isawaitable(new_token):
+            new_token = await new_token
+        return new_token
+
+    async def _request_url(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        json: Any = None,
+    ) -> Any:
+        """
+        Execute an HTTP request with retry and error handling.
+
+        Retries on 429 (rate limit), 5xx, and network errors.
+        On 401, attempts a single token refresh before failing.
+        """
+        token_refreshed = False
+        attempt = 0
+
+        while attempt <= MAX_RETRIES:
+            sent_token = self._access_token
+            governor = get_rate_governor()
+            try:
+                if governor is not None:
+                    await governor.acquire_async()
+                response = await self._client.request(
+                    method,
+                    url,
+                    params=params,
+                    json=json,
+                    headers={
+                        "Authorization": f"Bearer {sent_token}",
+                        "Content-Type": "application/json",
+                    },
+                )
+            except httpx.TransportError as e:
+                if attempt >= MAX_RETRIES:
+                    raise SpotifyAPIError(
+                        f"Network error after {MAX_RETRIES + 1} attempts: {e}"
+                    )
+                delay = _calculate_backoff_delay(attempt)
+                logger.warning(
+                    "Network error, retry %d/%d in %ss: %s",
+                    attempt + 1,
+                    MAX_RETRIES + 1,
+                    delay,
+                    e,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            # --- Success ---
+            if response.status_code == 204:
+                return None
+            if response.is_success:
+                return response.json()
+
+            # --- 401 Unauthorized: try token refresh once ---
+            if response.status_code == 401:
+                if not token_refreshed and self._on_token_refresh:
+                    async with self._refresh_lock:
+                        if self._access_token != sent_token:
+                            # A concurrent request already refreshed while
+                            # this one was in flight; retry with its token.
+                            token_refreshed = True
+                            attempt = 0
+                            continue
+                        logger.info("401 received, attempting token refresh")
+                        try:
+                            self.update_token(await self._refresh_token())
+                            token_refreshed = True
+                            attempt = 0  # reset retry budget after refresh
+                            continue
+                        except Exception as e:
+                            logger.error("Token refresh failed: %s", e)
+                raise SpotifyTokenExpiredError("Token expired or invalid")
+
+            # --- 404 Not Found ---
+            if response.status_code == 404:
+                raise SpotifyNotFoundError(f"Resource not found: {url}")
+
+            # --- 429 Rate Limited ---
+            if response.status_code == 429:
+                if attempt >= MAX_RETRIES:
+                    retry_after = int(response.headers.get("Retry-After", 60))
+                    if governor is not None and "Retry-After" in response.headers:
+                        await governor.cool_down_async(retry_after)
+                    raise SpotifyRateLimitError(
+                        f"Rate limited after {MAX_RETRIES + 1} attempts",
+                        retry_after=retry_after,
+                    )
+                retry_after = int(response.headers.get("Retry-After", 1))
+                if governor is not None:
+                    await governor.cool_down_async(retry_after)
+                delay = max(retry_after, _calculate_backoff_delay(attempt))
+                logger.warning(
+                    "Rate limited (429), retry %d/%d in %ss",
+                    attempt + 1,
+                    MAX_RETRIES + 1,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            # --- 5xx Server Error ---
+            if response.status_code >= 500:
+                if attempt >= MAX_RETRIES:
+                    raise SpotifyAPIError(
+                        f"Server error {response.status_code} "
+                        f"after {MAX_RETRIES + 1} attempts"
+                    )
+                delay = _calculate_backoff_delay(attempt)
+                logger.warning(
+                    "Server error %d, retry %d/%d in %ss",
+                    response.status_code,
+                    attempt + 1,
+                    MAX_RETRIES + 1,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            # --- Other client errors (400, 403, etc.) ---
+            try:
+                body = response.json()
+                msg = body.get("error", {}).get("message", response.text)
+            except Exception:
+                msg = response.text
+            raise SpotifyAPIError(f"API error {response.status_code}: {msg}")
+
+        # Should not reach here
+        raise SpotifyAPIError(f"Request failed after {MAX_RETRIES + 1} attempts")
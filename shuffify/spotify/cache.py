@@ -3,18 +3,87 @@ Redis caching layer for Spotify API responses.
 
 Provides caching functionality to reduce API calls and improve response times.
 Cache keys are prefixed and organized by data type with appropriate TTLs.
+Values are encoded by a pluggable codec (see ``cache_codec``), and cached
+track lists can be projected down to the fields the app reads. An optional
+in-process tier (see ``local_cache``) answers repeat reads without Redis.
 """
 
-import json
 import logging
-from typing import Any, Dict, List, Optional, TypeVar
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 import redis
 
+from shuffify.spotify.cache_codec import (
+    CacheCodec,
+    JsonCodec,
+    cache_format_tag,
+    project_tracks,
+)
+from shuffify.spotify.fields import PLAYLIST_ITEM_PRESETS, tracks_namespace
+from shuffify.spotify.local_cache import LocalCacheTier
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# (namespace, id) -- the address of one entry for the batch methods.
+CacheEntryKey = Tuple[str, str]
+
+# Members per SADD when a URI index is rebuilt.
+_URI_INDEX_CHUNK = 1000
+
+# Apply one of our own writes to a playlist's URI index, if it has one.
+# KEYS: uri set, meta hash. ARGV: snapshot_id, replace ("1"/"0"), the
+# snapshot the playlist was at before the write, number of added URIs,
+# the added URIs, then the removed URIs. An incremental (non-replace)
+# update is only valid on top of the playlist the index describes, so an
+# index at any other snapshot is dropped instead. The set takes the meta
+# hash's remaining TTL, so incremental updates never extend an index past
+# the rebuild that created it.
+_URI_INDEX_UPDATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    return 0
+end
+if ARGV[2] ~= '1' and redis.call('HGET', KEYS[2], 'snapshot_id') ~= ARGV[3] then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    return 0
+end
+local n_add = tonumber(ARGV[4])
+local count = tonumber(redis.call('HGET', KEYS[2], 'count') or '0')
+if ARGV[2] == '1' then
+    redis.call('DEL', KEYS[1])
+    count = 0
+end
+for i = 5 + n_add, #ARGV do
+    count = count - redis.call('SREM', KEYS[1], ARGV[i])
+end
+for i = 5, 4 + n_add do
+    redis.call('SADD', KEYS[1], ARGV[i])
+end
+count = math.max(count + n_add, 0)
+redis.call('HSET', KEYS[2], 'snapshot_id', ARGV[1], 'count', count)
+local ttl = redis.call('PTTL', KEYS[2])
+if ttl > 0 then
+    redis.call('PEXPIRE', KEYS[1], ttl)
+end
+return 1
+"""
+
+
+def _text(value: Any) -> Any:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
 
 class SpotifyCache:
     """
@@ -41,6 +110,12 @@ class SpotifyCache:
         playlist_ttl: int = 60,
         user_ttl: int = 600,
         audio_features_ttl: int = 86400,
+        snapshot_ttl: int = 86400,
+        codec: Optional[CacheCodec] = None,
+        project_tracks: bool = False,
+        local_tier: Optional[LocalCacheTier] = None,
+        uri_index: bool = False,
+        uri_index_ttl: int = 86400,
     ):
         """
         Initialize the cache.
@@ -52,6 +127,18 @@ class SpotifyCache:
             playlist_ttl: TTL for playlist data.
             user_ttl: TTL for user profile data.
             audio_features_ttl: TTL for audio features data.
+            snapshot_ttl: TTL for track lists keyed by snapshot_id. These
+                never go stale (a changed playlist has a new snapshot_id),
+                so the TTL only bounds how long unused ones occupy Redis.
+            codec: Value codec (default: plain JSON, the original format).
+            project_tracks: Strip cached track lists down to the fields
+                the app reads (see ``cache_codec.project_track``).
+            local_tier: Optional in-process tier consulted before Redis
+                and shared by every SpotifyCache in the process.
+            uri_index: Keep per-playlist URI sets (see "Playlist URI
+                Index") for raid dedupe.
+            uri_index_ttl: TTL for a URI index, counted from its last
+                full rebuild; updates from our own writes do not extend it.
         """
         self._redis = redis_client
         self._prefix = key_prefix
@@ -59,6 +146,16 @@ class SpotifyCache:
         self._playlist_ttl = playlist_ttl
         self._user_ttl = user_ttl
         self._audio_features_ttl = audio_features_ttl
+        self._snapshot_ttl = snapshot_ttl
+        self._codec = codec or JsonCodec()
+        self._project_tracks = project_tracks
+        self._local = local_tier
+        self._uri_index = uri_index
+        self._uri_index_ttl = uri_index_ttl
+        # Entries written under another codec or projection live under a
+        # different tag, so they are never misread and age out on their TTL.
+        tag = cache_format_tag(self._codec, project_tracks)
+        self._key_root = f"{key_prefix}{tag}:" if tag else key_prefix
 
     def _make_key(self, namespace: str, *parts: str) -> str:
         """
@@ -71,17 +168,73 @@ class SpotifyCache:
         Returns:
             Formatted cache key.
         """
-        return f"{self._prefix}{namespace}:{':'.join(parts)}"
+        return f"{self._key_root}{namespace}:{':'.join(parts)}"
 
     def _serialize(self, data: Any) -> bytes:
         """Serialize data to bytes for storage."""
-        return json.dumps(data).encode("utf-8")
+        return self._codec.encode(data)
 
     def _deserialize(self, data: bytes) -> Any:
         """Deserialize bytes to Python object."""
         if data is None:
             return None
-        return json.loads(data.decode("utf-8"))
+        return self._codec.decode(data)
+
+    # =========================================================================
+    # Storage (local tier, then Redis)
+    # =========================================================================
+
+    def _get_raw(self, key: str) -> Optional[bytes]:
+        """Read one encoded value, from the local tier when it has it."""
+        if self._local is not None:
+            payload = self._local.get(key)
+            if payload is not None:
+                return payload
+        payload = self._redis.get(key)
+        if self._local is not None:
+            self._local.record_redis(hits=int(bool(payload)), misses=int(not payload))
+            if payload:
+                self._local.set(key, payload)
+        return payload
+
+    def _mget_raw(self, keys: List[str]) -> List[Optional[bytes]]:
+        """Read several encoded values; only local misses go to Redis."""
+        if self._local is None:
+            return self._redis.mget(keys)
+
+        values: List[Optional[bytes]] = [self._local.get(key) for key in keys]
+        missing = [i for i, value in enumerate(values) if value is None]
+        if missing:
+            fetched = self._redis.mget([keys[i] for i in missing])
+            hits = 0
+            for i, payload in zip(missing, fetched):
+                if payload:
+                    hits += 1
+                    values[i] = payload
+                    self._local.set(keys[i], payload)
+            self._local.record_redis(hits=hits, misses=len(missing) - hits)
+        return values
+
+    def _set_raw(self, key: str, ttl: int, payload: bytes) -> None:
+        """Write one encoded value to Redis, then to the local tier."""
+        self._redis.setex(key, ttl, payload)
+        if self._local is not None:
+            self._local.set(key, payload, ttl)
+
+    def _remember(self, written: List[Tuple[str, int, bytes]]) -> None:
+        """Copy values just written through a pipeline into the local tier."""
+        if self._local is not None:
+            for key, ttl, payload in written:
+                self._local.set(key, payload, ttl)
+
+    def _invalidate_local(self, keys: List[str]) -> None:
+        """Evict keys from this worker's tier and tell the other workers."""
+        if self._local is not None:
+            self._local.invalidate(keys)
+
+    def _slim_tracks(self, tracks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Project a track list when projection is enabled."""
+        return project_tracks(tracks) if self._project_tracks else tracks
 
     # =========================================================================
     # User Data
@@ -99,7 +252,7 @@ class SpotifyCache:
         """
         try:
             key = self._make_key("user", user_id)
-            data = self._redis.get(key)
+            data = self._get_raw(key)
             if data:
                 logger.debug(f"Cache hit for user: {user_id}")
                 return self._deserialize(data)
@@ -126,7 +279,7 @@ class SpotifyCache:
         try:
             key = self._make_key("user", user_id)
             ttl = ttl or self._user_ttl
-            self._redis.setex(key, ttl, self._serialize(user_data))
+            self._set_raw(key, ttl, self._serialize(user_data))
             logger.debug(f"Cached user: {user_id} (TTL: {ttl}s)")
             return True
         except redis.RedisError as e:
@@ -149,7 +302,7 @@ class SpotifyCache:
         """
         try:
             key = self._make_key("playlists", user_id)
-            data = self._redis.get(key)
+            data = self._get_raw(key)
             if data:
                 logger.debug(f"Cache hit for playlists: {user_id}")
                 return self._deserialize(data)
@@ -176,7 +329,7 @@ class SpotifyCache:
         try:
             key = self._make_key("playlists", user_id)
             ttl = ttl or self._playlist_ttl
-            self._redis.setex(key, ttl, self._serialize(playlists))
+            self._set_raw(key, ttl, self._serialize(playlists))
             logger.debug(
                 f"Cached {len(playlists)} playlists for user: {user_id} (TTL: {ttl}s)"
             )
@@ -197,7 +350,7 @@ class SpotifyCache:
         """
         try:
             key = self._make_key("playlist", playlist_id)
-            data = self._redis.get(key)
+            data = self._get_raw(key)
             if data:
                 logger.debug(f"Cache hit for playlist: {playlist_id}")
                 return self._deserialize(data)
@@ -224,7 +377,7 @@ class SpotifyCache:
         try:
             key = self._make_key("playlist", playlist_id)
             ttl = ttl or self._playlist_ttl
-            self._redis.setex(key, ttl, self._serialize(playlist))
+            self._set_raw(key, ttl, self._serialize(playlist))
             logger.debug(f"Cached playlist: {playlist_id} (TTL: {ttl}s)")
             return True
         except redis.RedisError as e:
@@ -235,19 +388,23 @@ class SpotifyCache:
     # Playlist Tracks
     # =========================================================================
 
-    def get_playlist_tracks(self, playlist_id: str) -> Optional[List[Dict[str, Any]]]:
+    def get_playlist_tracks(
+        self, playlist_id: str, fields: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
         """
         Get cached playlist tracks.
 
         Args:
             playlist_id: Spotify playlist ID.
+            fields: Field preset the tracks were fetched with (see
+                ``fields.PLAYLIST_ITEM_PRESETS``); None for full tracks.
 
         Returns:
             List of track dicts or None if not cached.
         """
         try:
-            key = self._make_key("tracks", playlist_id)
-            data = self._redis.get(key)
+            key = self._make_key(tracks_namespace(fields), playlist_id)
+            data = self._get_raw(key)
             if data:
                 logger.debug(f"Cache hit for tracks: {playlist_id}")
                 return self._deserialize(data)
@@ -258,7 +415,11 @@ class SpotifyCache:
             return None
 
     def set_playlist_tracks(
-        self, playlist_id: str, tracks: List[Dict[str, Any]], ttl: Optional[int] = None
+        self,
+        playlist_id: str,
+        tracks: List[Dict[str, Any]],
+        ttl: Optional[int] = None,
+        fields: Optional[str] = None,
     ) -> bool:
         """
         Cache playlist tracks.
@@ -267,14 +428,15 @@ class SpotifyCache:
             playlist_id: Spotify playlist ID.
             tracks: List of track data.
             ttl: Time-to-live in seconds (default: playlist_ttl).
+            fields: Field preset the tracks were fetched with.
 
         Returns:
             True if cached successfully.
         """
         try:
-            key = self._make_key("tracks", playlist_id)
+            key = self._make_key(tracks_namespace(fields), playlist_id)
             ttl = ttl or self._playlist_ttl
-            self._redis.setex(key, ttl, self._serialize(tracks))
+            self._set_raw(key, ttl, self._serialize(self._slim_tracks(tracks)))
             logger.debug(
                 f"Cached {len(tracks)} tracks for playlist: {playlist_id} (TTL: {ttl}s)"
             )
@@ -283,6 +445,231 @@ class SpotifyCache:
             logger.warning(f"Redis error setting tracks cache: {e}")
             return False
 
+    def get_playlist_tracks_at(
+        self, playlist_id: str, snapshot_id: str, fields: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get cached playlist tracks as of a specific snapshot.
+
+        Args:
+            playlist_id: Spotify playlist ID.
+            snapshot_id: Spotify snapshot_id the tracks were read at.
+            fields: Field preset the tracks were fetched with.
+
+        Returns:
+            List of track dicts or None if not cached.
+        """
+        try:
+            key = self._make_key(
+                tracks_namespace(fields, snapshot=True), playlist_id, snapshot_id
+            )
+            data = self._get_raw(key)
+            if data:
+                logger.debug(f"Cache hit for tracks at snapshot: {playlist_id}")
+                return self._deserialize(data)
+            logger.debug(f"Cache miss for tracks at snapshot: {playlist_id}")
+            return None
+        except redis.RedisError as e:
+            logger.warning(f"Redis error getting snapshot tracks cache: {e}")
+            return None
+
+    def set_playlist_tracks_at(
+        self,
+        playlist_id: str,
+        snapshot_id: str,
+        tracks: List[Dict[str, Any]],
+        ttl: Optional[int] = None,
+        fields: Optional[str] = None,
+    ) -> bool:
+        """
+        Cache playlist tracks under the snapshot they were read at.
+
+        Args:
+            playlist_id: Spotify playlist ID.
+            snapshot_id: Spotify snapshot_id read before the tracks.
+            tracks: List of track data.
+            ttl: Time-to-live in seconds (default: snapshot_ttl).
+            fields: Field preset the tracks were fetched with.
+
+        Returns:
+            True if cached successfully.
+        """
+        try:
+            key = self._make_key(
+                tracks_namespace(fields, snapshot=True), playlist_id, snapshot_id
+            )
+            ttl = ttl or self._snapshot_ttl
+            self._set_raw(key, ttl, self._serialize(self._slim_tracks(tracks)))
+            logger.debug(
+                f"Cached {len(tracks)} tracks for playlist: {playlist_id} "
+                f"at snapshot (TTL: {ttl}s)"
+            )
+            return True
+        except redis.RedisError as e:
+            logger.warning(f"Redis error setting snapshot tracks cache: {e}")
+            return False
+
+    # =========================================================================
+    # Playlist URI Index
+    # =========================================================================
+    #
+    # A Redis set of each indexed playlist's URIs, plus a small hash with the
+    # snapshot_id the set matches and the playlist's track count. Our own
+    # writes update an existing index in place -- an add or remove only if
+    # the index matched the playlist just before it, since re-tagging a
+    # stale set with the write's snapshot would hide the outside change.
+    # Anything else that changes the playlist gives it a new snapshot_id,
+    # so a reader that compares snapshots first never trusts a stale set.
+    # Indexes are only created by ``set_uri_index``, so playlists nobody
+    # dedupes against cost nothing.
+
+    @property
+    def uri_index_enabled(self) -> bool:
+        """Whether per-playlist URI indexes are kept."""
+        return self._uri_index
+
+    def _uri_index_keys(self, playlist_id: str) -> Tuple[str, str]:
+        return (
+            self._make_key("uri_index", playlist_id),
+            self._make_key("uri_index_meta", playlist_id),
+        )
+
+    def get_uri_index_meta(
+        self, playlist_ids: Sequence[str]
+    ) -> Dict[str, Tuple[str, int]]:
+        """
+        Get the snapshot_id and track count each playlist's index matches.
+
+        Args:
+            playlist_ids: Spotify playlist IDs.
+
+        Returns:
+            Dictionary of playlist ID to (snapshot_id, track_count), for
+            the playlists that have an index.
+        """
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for playlist_id in playlist_ids:
+                pipe.hmget(self._uri_index_keys(playlist_id)[1], "snapshot_id", "count")
+            rows = pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Redis error getting URI index metadata: {e}")
+            return {}
+
+        meta = {}
+        for playlist_id, (snapshot_id, count) in zip(playlist_ids, rows):
+            if snapshot_id is not None:
+                meta[playlist_id] = (_text(snapshot_id), int(count or 0))
+        return meta
+
+    def set_uri_index(
+        self,
+        playlist_id: str,
+        uris: Sequence[str],
+        snapshot_id: str,
+        track_count: Optional[int] = None,
+    ) -> bool:
+        """
+        Rebuild a playlist's URI index from a full read.
+
+        Args:
+            playlist_id: Spotify playlist ID.
+            uris: Every track URI in the playlist.
+            snapshot_id: Spotify snapshot_id read before the tracks.
+            track_count: Number of tracks (default: ``len(uris)``).
+
+        Returns:
+            True if the index was written.
+        """
+        set_key, meta_key = self._uri_index_keys(playlist_id)
+        try:
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.delete(set_key)
+            members = list(dict.fromkeys(uris))
+            for i in range(0, len(members), _URI_INDEX_CHUNK):
+                pipe.sadd(set_key, *members[i : i + _URI_INDEX_CHUNK])
+            pipe.hset(
+                meta_key,
+                mapping={
+                    "snapshot_id": snapshot_id,
+                    "count": len(uris) if track_count is None else track_count,
+                },
+            )
+            pipe.expire(set_key, self._uri_index_ttl)
+            pipe.expire(meta_key, self._uri_index_ttl)
+            pipe.execute()
+            logger.debug(f"Rebuilt URI index for playlist: {playlist_id}")
+            return True
+        except redis.RedisError as e:
+            logger.warning(f"Redis error rebuilding URI index: {e}")
+            return False
+
+    def update_uri_index(
+        self,
+        playlist_id: str,
+        snapshot_id: str,
+        added: Sequence[str] = (),
+        removed: Sequence[str] = (),
+        replace: bool = False,
+        base_snapshot_id: Optional[str] = None,
+    ) -> bool:
+        """
+        Apply one of our own writes to a playlist's index, if it has one.
+
+        Args:
+            playlist_id: Spotify playlist ID.
+            snapshot_id: Snapshot the write returned.
+            added: URIs the write added (every URI when ``replace``).
+            removed: URIs the write removed.
+            replace: The write set the playlist to exactly ``added``.
+            base_snapshot_id: Snapshot the playlist was at before the
+                write. Unless ``replace``, an index at any other snapshot
+                (or with no base given) is dropped, not updated.
+
+        Returns:
+            True if an index existed and was updated.
+        """
+        set_key, meta_key = self._uri_index_keys(playlist_id)
+        try:
+            updated = self._redis.eval(
+                _URI_INDEX_UPDATE_SCRIPT,
+                2,
+                set_key,
+                meta_key,
+                snapshot_id,
+                "1" if replace else "0",
+                base_snapshot_id or "",
+                len(added),
+                *added,
+                *removed,
+            )
+            return bool(updated)
+        except redis.RedisError as e:
+            logger.warning(f"Redis error updating URI index: {e}")
+            return False
+
+    def union_uri_index(self, playlist_ids: Sequence[str]) -> Optional[Set[str]]:
+        """
+        Get the union of several playlists' indexed URIs in one round trip.
+
+        Returns:
+            The URIs, or None if any playlist has no index (for example it
+            expired since its snapshot was checked).
+        """
+        keys = [self._uri_index_keys(pid) for pid in playlist_ids]
+        try:
+            pipe = self._redis.pipeline(transaction=True)
+            for _, meta_key in keys:
+                pipe.exists(meta_key)
+            pipe.sunion([set_key for set_key, _ in keys])
+            *present, members = pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Redis error reading URI index: {e}")
+            return None
+        if not all(present):
+            return None
+        return {_text(uri) for uri in members}
+
     # =========================================================================
     # Audio Features
     # =========================================================================
@@ -302,7 +689,7 @@ class SpotifyCache:
 
         try:
             keys = [self._make_key("audio", tid) for tid in track_ids]
-            values = self._redis.mget(keys)
+            values = self._mget_raw(keys)
 
             result = {}
             for track_id, value in zip(track_ids, values):
@@ -334,12 +721,16 @@ class SpotifyCache:
         try:
             ttl = ttl or self._audio_features_ttl
             pipe = self._redis.pipeline()
+            written = []
 
             for track_id, feature_data in features.items():
                 key = self._make_key("audio", track_id)
-                pipe.setex(key, ttl, self._serialize(feature_data))
+                payload = self._serialize(feature_data)
+                pipe.setex(key, ttl, payload)
+                written.append((key, ttl, payload))
 
             pipe.execute()
+            self._remember(written)
             logger.debug(
                 f"Cached audio features for {len(features)} tracks (TTL: {ttl}s)"
             )
@@ -368,7 +759,7 @@ class SpotifyCache:
         try:
             normalized_query = query.strip().lower()
             key = self._make_key("search", normalized_query, str(offset))
-            data = self._redis.get(key)
+            data = self._get_raw(key)
             if data:
                 logger.debug(
                     f"Cache hit for search: {normalized_query} offset={offset}"
@@ -405,7 +796,7 @@ class SpotifyCache:
             normalized_query = query.strip().lower()
             key = self._make_key("search", normalized_query, str(offset))
             ttl = ttl or 120
-            self._redis.setex(key, ttl, self._serialize(results))
+            self._set_raw(key, ttl, self._serialize(results))
             logger.debug(
                 f"Cached {len(results)} search results for: "
                 f"{normalized_query} offset={offset} (TTL: {ttl}s)"
@@ -436,7 +827,7 @@ class SpotifyCache:
             key = self._make_key(
                 "search_playlists", f"{query.lower()}:{limit}"
             )
-            data = self._redis.get(key)
+            data = self._get_raw(key)
             if data:
                 logger.debug(f"Cache hit for playlist search: {query!r}")
                 return self._deserialize(data)
@@ -470,7 +861,7 @@ class SpotifyCache:
                 "search_playlists", f"{query.lower()}:{limit}"
             )
             ttl = ttl or self._default_ttl
-            self._redis.setex(key, ttl, self._serialize(results))
+            self._set_raw(key, ttl, self._serialize(results))
             logger.debug(
                 f"Cached {len(results)} playlist search results for "
                 f"{query!r} (TTL: {ttl}s)"
@@ -480,6 +871,134 @@ class SpotifyCache:
             logger.warning(f"Redis error setting search cache: {e}")
             return False
 
+    # =========================================================================
+    # Batch Access
+    # =========================================================================
+
+    def _ttl_for(self, namespace: str) -> int:
+        """Default TTL for a namespace, matching the single-entry setters."""
+        if namespace == "user":
+            return self._user_ttl
+        if namespace.startswith("tracks_at"):
+            return self._snapshot_ttl
+        if namespace in ("playlists", "playlist") or namespace.startswith("tracks"):
+            return self._playlist_ttl
+        if namespace == "audio":
+            return self._audio_features_ttl
+        return self._default_ttl
+
+    def get_many(self, entries: Iterable[CacheEntryKey]) -> Dict[CacheEntryKey, Any]:
+        """
+        Get several cached entries, across namespaces, in one round trip.
+
+        Each single-entry getter is its own GET; a caller that needs the
+        user, their playlists and a few playlists' tracks paid one round
+        trip per item. This reads them all with a single MGET.
+
+        Args:
+            entries: ``(namespace, id)`` pairs, e.g. ``("tracks", pid)``.
+
+        Returns:
+            Dictionary mapping each cached ``(namespace, id)`` to its data.
+            Misses are absent; a Redis error returns an empty dict.
+        """
+        entries = list(dict.fromkeys(entries))
+        if not entries:
+            return {}
+
+        try:
+            keys = [self._make_key(namespace, key) for namespace, key in entries]
+            values = self._mget_raw(keys)
+
+            result = {}
+            for entry, value in zip(entries, values):
+                if value:
+                    result[entry] = self._deserialize(value)
+
+            logger.debug(f"Batch cache read: {len(result)}/{len(entries)} hits")
+            return result
+        except redis.RedisError as e:
+            logger.warning(f"Redis error getting batch cache: {e}")
+            return {}
+
+    def set_many(
+        self, entries: Mapping[CacheEntryKey, Any], ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Cache several entries, across namespaces, in one round trip.
+
+        Args:
+            entries: Dictionary mapping ``(namespace, id)`` to data.
+            ttl: Time-to-live in seconds for every entry (default: each
+                namespace's own TTL, as the single-entry setters use).
+
+        Returns:
+            True if cached successfully.
+        """
+        if not entries:
+            return True
+
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            written = []
+            for (namespace, key), data in entries.items():
+                if namespace.startswith("tracks"):
+                    data = self._slim_tracks(data)
+                entry = (
+                    self._make_key(namespace, key),
+                    ttl or self._ttl_for(namespace),
+                    self._serialize(data),
+                )
+                pipe.setex(*entry)
+                written.append(entry)
+            pipe.execute()
+            self._remember(written)
+            logger.debug(f"Batch cached {len(entries)} entries")
+            return True
+        except redis.RedisError as e:
+            logger.warning(f"Redis error setting batch cache: {e}")
+            return False
+
+    def get_many_playlist_tracks(
+        self, playlist_ids: Iterable[str], fields: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get cached tracks for several playlists in one round trip.
+
+        Args:
+            playlist_ids: Spotify playlist IDs.
+            fields: Field preset the tracks were fetched with.
+
+        Returns:
+            Dictionary mapping playlist ID to tracks (only cached ones).
+        """
+        namespace = tracks_namespace(fields)
+        cached = self.get_many((namespace, pid) for pid in playlist_ids)
+        return {pid: tracks for (_, pid), tracks in cached.items()}
+
+    def set_many_playlist_tracks(
+        self,
+        tracks_by_playlist: Mapping[str, List[Dict[str, Any]]],
+        ttl: Optional[int] = None,
+        fields: Optional[str] = None,
+    ) -> bool:
+        """
+        Cache tracks for several playlists in one round trip.
+
+        Args:
+            tracks_by_playlist: Dictionary mapping playlist ID to tracks.
+            ttl: Time-to-live in seconds (default: playlist_ttl).
+            fields: Field preset the tracks were fetched with.
+
+        Returns:
+            True if cached successfully.
+        """
+        namespace = tracks_namespace(fields)
+        return self.set_many(
+            {(namespace, pid): tracks for pid, tracks in tracks_by_playlist.items()},
+            ttl=ttl,
+        )
+
     # =========================================================================
     # Cache Management
     # =========================================================================
@@ -496,17 +1015,28 @@ class SpotifyCache:
         Returns:
             True if invalidation succeeded.
         """
+        # Snapshot-keyed track lists are left alone: a write gives the
+        # playlist a new snapshot_id, so they can never be served stale.
+        keys = [
+            self._make_key("playlist", playlist_id),
+            self._make_key(tracks_namespace(), playlist_id),
+        ] + [
+            self._make_key(tracks_namespace(preset), playlist_id)
+            for preset in PLAYLIST_ITEM_PRESETS
+        ]
+        # Redis first, then the local tiers: evicting first would let a
+        # worker re-read the old Redis value into its tier in between and
+        # serve it for CACHE_LOCAL_TTL. The local eviction runs even if
+        # Redis is down, so this worker stops serving the pre-write version.
         try:
-            keys = [
-                self._make_key("playlist", playlist_id),
-                self._make_key("tracks", playlist_id),
-            ]
             self._redis.delete(*keys)
             logger.debug(f"Invalidated cache for playlist: {playlist_id}")
             return True
         except redis.RedisError as e:
             logger.warning(f"Redis error invalidating playlist cache: {e}")
             return False
+        finally:
+            self._invalidate_local(keys)
 
     def invalidate_user_playlists(self, user_id: str) -> bool:
         """
@@ -520,14 +1050,17 @@ class SpotifyCache:
         Returns:
             True if invalidation succeeded.
         """
+        key = self._make_key("playlists", user_id)
+        # Redis first, then the local tiers (see invalidate_playlist).
         try:
-            key = self._make_key("playlists", user_id)
             self._redis.delete(key)
             logger.debug(f"Invalidated playlists cache for user: {user_id}")
             return True
         except redis.RedisError as e:
             logger.warning(f"Redis error invalidating user playlists cache: {e}")
             return False
+        finally:
+            self._invalidate_local([key])
 
     def clear_all(self) -> bool:
         """
@@ -536,6 +1069,8 @@ class SpotifyCache:
         Returns:
             True if cleared successfully.
         """
+        if self._local is not None:
+            self._local.invalidate_all()
         try:
             pattern = f"{self._prefix}*"
             cursor = 0
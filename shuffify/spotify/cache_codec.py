@@ -0,0 +1,249 @@
+"""
+Serialization codecs and track projection for SpotifyCache.
+
+``SpotifyCache`` stored every value as plain JSON. For playlist tracks
+that meant full Spotify track objects -- album images for every size,
+``available_markets`` on both the track and its album (about 180 country
+codes each), ``external_ids``, ``href``s, preview URLs -- almost none of
+which the shuffle algorithms, executors or templates ever read. A
+1,000-track playlist was megabytes per key, and encoding it cost more
+than the Redis round trip.
+
+Two independent levers bring that down:
+
+- A codec decides the wire format: ``json`` (the original), ``msgpack``
+  (binary, faster to encode and decode), either of which can be wrapped
+  with ``+zlib`` compression.
+- ``project_track`` keeps only the track fields the app reads before a
+  track list is cached.
+
+Entries written with different settings are not interchangeable, so
+``SpotifyCache`` puts a format tag (``cache_format_tag``) into every key
+it writes under a non-legacy setting. Changing the codec or projection
+therefore starts a fresh keyspace; the old entries are never misread and
+simply expire on their TTL.
+"""
+
+import json
+import logging
+import zlib
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the projected track shape changes, so entries cached under the
+# old shape are abandoned instead of read back with fields missing.
+CACHE_FORMAT_VERSION = 2
+
+DEFAULT_CODEC = "msgpack+zlib"
+
+# Values smaller than this are stored uncompressed: zlib's header and the
+# CPU time are not worth it for a user profile or a short search page.
+COMPRESSION_THRESHOLD = 1024
+
+# One-byte header on compressed-codec values.
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+
+
+class CacheCodec:
+    """Base codec: turns cacheable Python data into bytes and back."""
+
+    name = ""
+
+    def encode(self, data: Any) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, payload: bytes) -> Any:
+        raise NotImplementedError
+
+
+class JsonCodec(CacheCodec):
+    """UTF-8 JSON, the format SpotifyCache has always written."""
+
+    name = "json"
+
+    def encode(self, data: Any) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+    def decode(self, payload: bytes) -> Any:
+        return json.loads(payload.decode("utf-8"))
+
+
+class MsgpackCodec(CacheCodec):
+    """MessagePack. Requires the ``msgpack`` package."""
+
+    name = "msgpack"
+
+    def __init__(self):
+        import msgpack
+
+        self._msgpack = msgpack
+
+    def encode(self, data: Any) -> bytes:
+        return self._msgpack.packb(data, use_bin_type=True)
+
+    def decode(self, payload: bytes) -> Any:
+        return self._msgpack.unpackb(payload, raw=False)
+
+
+class ZlibCodec(CacheCodec):
+    """Wrap another codec with zlib compression above a size threshold."""
+
+    def __init__(
+        self,
+        inner: CacheCodec,
+        level: int = 1,
+        threshold: int = COMPRESSION_THRESHOLD,
+    ):
+        self._inner = inner
+        self._level = level
+        self._threshold = threshold
+        self.name = f"{inner.name}+zlib"
+
+    def encode(self, data: Any) -> bytes:
+        payload = self._inner.encode(data)
+        if len(payload) < self._threshold:
+            return _RAW + payload
+        return _ZLIB + zlib.compress(payload, self._level)
+
+    def decode(self, payload: bytes) -> Any:
+        header, body = payload[:1], payload[1:]
+        if header == _ZLIB:
+            body = zlib.decompress(body)
+        elif header != _RAW:
+            raise ValueError("Unknown cache compression header")
+        return self._inner.decode(body)
+
+
+_BASE_CODECS = {
+    "json": JsonCodec,
+    "msgpack": MsgpackCodec,
+}
+
+
+def build_codec(spec: str) -> CacheCodec:
+    """
+    Build a codec from a spec such as ``"json"`` or ``"msgpack+zlib"``.
+
+    Args:
+        spec: Base codec name, optionally followed by ``+zlib``.
+
+    Returns:
+        The codec.
+
+    Raises:
+        ValueError: If the spec names an unknown codec.
+        ImportError: If the codec's library is not installed.
+    """
+    base, _, wrapper = (spec or "").strip().lower().partition("+")
+    if base not in _BASE_CODECS or wrapper not in ("", "zlib"):
+        raise ValueError(f"Unknown cache codec: {spec!r}")
+    codec = _BASE_CODECS[base]()
+    if wrapper == "zlib":
+        codec = ZlibCodec(codec)
+    return codec
+
+
+def resolve_codec(spec: str) -> CacheCodec:
+    """
+    Build the configured codec, falling back to ``json+zlib``.
+
+    A deployment where ``msgpack`` cannot be imported keeps compression
+    and projection rather than failing to start.
+    """
+    try:
+        return build_codec(spec)
+    except ImportError as e:
+        logger.warning(
+            "Cache codec %r unavailable (%s); using json+zlib", spec, e
+        )
+        return build_codec("json+zlib")
+
+
+def cache_format_tag(codec: CacheCodec, project_tracks: bool) -> str:
+    """
+    Key segment identifying how entries are encoded, e.g. ``v2.msgpack+zlib.slim``.
+
+    Plain JSON without projection is the original format and has no tag,
+    so its keys stay exactly as they always were.
+    """
+    if codec.name == JsonCodec.name and not project_tracks:
+        return ""
+    tag = f"v{CACHE_FORMAT_VERSION}.{codec.name}"
+    if project_tracks:
+        tag += ".slim"
+    return tag
+
+
+# =========================================================================
+# Track projection
+# =========================================================================
+
+# Everything read from a cached track: shuffle algorithms (uri, artists,
+# album name), executors and raid staging (id, name, artists, album
+# images), Playlist.from_spotify and the workshop templates (duration,
+# is_local, added_at, artist and track URLs).
+_TRACK_FIELDS = ("id", "uri", "name", "duration_ms", "is_local", "added_at")
+_ARTIST_FIELDS = ("id", "name", "uri")
+_ALBUM_FIELDS = ("id", "name", "uri")
+_IMAGE_FIELDS = ("url", "height", "width")
+
+
+def _spotify_url(obj: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    urls = obj.get("external_urls")
+    if isinstance(urls, dict) and urls.get("spotify"):
+        return {"spotify": urls["spotify"]}
+    return None
+
+
+def _pick(obj: Dict[str, Any], fields) -> Dict[str, Any]:
+    return {f: obj[f] for f in fields if f in obj}
+
+
+def project_track(track: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce a Spotify track object to the fields the app reads.
+
+    Args:
+        track: A track dict as returned by ``SpotifyAPI.get_playlist_tracks``.
+
+    Returns:
+        A new dict with the same shape, minus everything unused.
+    """
+    if not isinstance(track, dict):
+        return track
+    slim = _pick(track, _TRACK_FIELDS)
+
+    url = _spotify_url(track)
+    if url:
+        slim["external_urls"] = url
+
+    artists = track.get("artists")
+    if isinstance(artists, list):
+        slim["artists"] = []
+        for artist in artists:
+            if not isinstance(artist, dict):
+                continue
+            slim_artist = _pick(artist, _ARTIST_FIELDS)
+            artist_url = _spotify_url(artist)
+            if artist_url:
+                slim_artist["external_urls"] = artist_url
+            slim["artists"].append(slim_artist)
+
+    album = track.get("album")
+    if isinstance(album, dict):
+        slim_album = _pick(album, _ALBUM_FIELDS)
+        images = album.get("images")
+        if isinstance(images, list):
+            slim_album["images"] = [
+                _pick(image, _IMAGE_FIELDS) for image in images if isinstance(image, dict)
+            ]
+        slim["album"] = slim_album
+
+    return slim
+
+
+def project_tracks(tracks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Apply ``project_track`` to every track in a list."""
+    return [project_track(track) for track in tracks]
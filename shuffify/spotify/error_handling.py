@@ -2,7 +2,8 @@
 Spotify API error handling.
 
 Provides the api_error_handler decorator used by SpotifyAPI methods
-to catch and convert unexpected exceptions.
+(and async_api_error_handler for AsyncSpotifyAPI) to catch and convert
+unexpected exceptions.
 
 Note: HTTP-level error handling (retries, rate limits, token refresh)
 is handled by SpotifyHTTPClient. This module provides a thin wrapper
@@ -53,3 +54,29 @@ def api_error_handler(func: Callable) -> Callable:
             )
 
     return wrapper
+
+
+def async_api_error_handler(func: Callable) -> Callable:
+    """``api_error_handler`` for the coroutine methods of AsyncSpotifyAPI."""
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except (
+            SpotifyAPIError,
+            SpotifyNotFoundError,
+            SpotifyRateLimitError,
+            SpotifyTokenExpiredError,
+        ):
+            raise
+        except Exception as e:
+            logger.error(
+                "Unexpected error in %s: %s",
+                func.__name__, e, exc_info=True,
+            )
+            raise SpotifyAPIError(
+                f"Unexpected error: {e}"
+            )
+
+    return wrapper
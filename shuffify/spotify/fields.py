@@ -0,0 +1,84 @@
+"""
+Field-projection presets for playlist-item reads.
+
+Spotify's items endpoint returns a full track object per item -- album
+images, ``available_markets`` on both the track and its album,
+``external_ids`` and more -- and most callers read three or four of
+those fields. The endpoint accepts a ``fields`` filter, so a caller that
+names a preset here gets only what it reads, which shrinks both the
+response and the JSON parse.
+
+Each preset is an item-level filter (the part inside ``items(...)``).
+``SpotifyHTTPClient.get_all_pages`` wraps it and adds the paging fields
+it needs. The nested object is named ``track`` on the legacy response
+shape and ``item`` on the current one, and a filter that names only one
+strips the other, so every preset names both.
+
+Projected results are cached apart from full ones (see
+``tracks_namespace``), so a caller never receives a projection it did
+not ask for.
+"""
+
+from typing import Dict, Optional
+
+_DISPLAY_TRACK = (
+    "id,uri,name,duration_ms,is_local,external_urls(spotify),"
+    "artists(id,name,uri,external_urls(spotify)),"
+    "album(id,name,uri,images)"
+)
+_SHUFFLE_TRACK = "id,uri,name,artists(name),album(name)"
+
+
+def _both_shapes(track_fields: str) -> str:
+    return f"track({track_fields}),item({track_fields})"
+
+
+# Preset name -> item-level field filter.
+PLAYLIST_ITEM_PRESETS: Dict[str, str] = {
+    # Verification and dedupe: the sequence of URIs and nothing else.
+    "uris_only": _both_shapes("uri"),
+    # What the shuffle algorithms and scheduled shuffles read.
+    "shuffle_minimal": "added_at," + _both_shapes(_SHUFFLE_TRACK),
+    # What Playlist.from_spotify and the workshop templates read.
+    "workshop_display": "added_at," + _both_shapes(_DISPLAY_TRACK),
+}
+
+# Fields get_all_pages needs on every page to find the next one.
+PAGING_FIELDS = "total,limit,offset,next"
+
+
+def playlist_item_fields(preset: str) -> str:
+    """
+    Return the item-level field filter for a preset.
+
+    Args:
+        preset: One of ``PLAYLIST_ITEM_PRESETS``.
+
+    Returns:
+        The filter, e.g. ``"track(uri),item(uri)"``.
+
+    Raises:
+        ValueError: If the preset is unknown.
+    """
+    try:
+        return PLAYLIST_ITEM_PRESETS[preset]
+    except KeyError:
+        raise ValueError(f"Unknown fields preset: {preset!r}") from None
+
+
+def page_fields(items_fields: str, items_key: str = "items") -> str:
+    """Wrap an item-level filter into a page-level one with paging fields."""
+    return f"{items_key}({items_fields}),{PAGING_FIELDS}"
+
+
+def tracks_namespace(preset: Optional[str] = None, snapshot: bool = False) -> str:
+    """
+    Cache namespace for a playlist's tracks under a preset (or in full).
+
+    Args:
+        preset: Preset name, or None for full track objects.
+        snapshot: The snapshot_id-keyed namespace rather than the
+            short-lived one.
+    """
+    base = "tracks_at" if snapshot else "tracks"
+    return f"{base}.{preset}" if preset else base
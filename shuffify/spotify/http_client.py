@@ -9,6 +9,7 @@ import logging
 import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Dict, List, Optional
 
 import requests
@@ -21,6 +22,8 @@ from .exceptions import (
     SpotifyRateLimitError,
     SpotifyTokenExpiredError,
 )
+from .fields import page_fields
+from .rate_governor import RateGovernor
 
 logger = logging.getLogger(__name__)
 
@@ -35,10 +38,19 @@ MAX_DELAY = 16  # seconds
 POOL_CONNECTIONS = 10
 POOL_MAXSIZE = 20
 
+# Upper bound on in-flight page requests for one parallel pagination call.
+# Kept well under POOL_MAXSIZE so a single large playlist cannot monopolise
+# the shared pool while scheduler threads and web requests also need sockets.
+MAX_PAGE_WORKERS = 4
+
 _adapter_lock = threading.Lock()
 _shared_adapter: Optional[HTTPAdapter] = None
 _shared_adapter_pid: Optional[int] = None
 
+# Process-wide rate governor. None (the default, and in tests) means requests
+# are sent as soon as they are made and rate limits are learned from 429s.
+_rate_governor: Optional[RateGovernor] = None
+
 
 def _calculate_backoff_delay(attempt: int) -> float:
     """Calculate exponential backoff delay, capped at MAX_DELAY."""
@@ -73,6 +85,17 @@ def get_shared_adapter() -> HTTPAdapter:
         return _shared_adapter
 
 
+def set_rate_governor(governor: Optional[RateGovernor]) -> None:
+    """Install (or, with None, remove) the process-wide rate governor."""
+    global _rate_governor
+    _rate_governor = governor
+
+
+def get_rate_governor() -> Optional[RateGovernor]:
+    """Return the process-wide rate governor, if one is installed."""
+    return _rate_governor
+
+
 class SpotifyHTTPClient:
     """
     HTTP client for Spotify Web API requests.
@@ -96,6 +119,10 @@ class SpotifyHTTPClient:
         """
         self._access_token = access_token
         self._on_token_refresh = on_token_refresh
+        # Serialises 401 handling when parallel pagination has several
+        # requests in flight: the first to see the 401 refreshes, the rest
+        # retry with the token it installed.
+        self._refresh_lock = threading.Lock()
         self._session = requests.Session()
         self._session.headers.update(
             {
@@ -148,20 +175,39 @@ class SpotifyHTTPClient:
         path: str,
         params: Optional[Dict] = None,
         items_key: str = "items",
+        parallel: bool = False,
+        fields: Optional[str] = None,
     ) -> List[Dict]:
         """
         Fetch all pages of a paginated endpoint.
 
-        Follows the ``next`` URL in each response until exhausted.
+        Follows the ``next`` URL in each response until exhausted. With
+        ``parallel=True``, the first page's ``total`` and ``limit`` are used
+        to compute every remaining offset window up front, and those pages
+        are fetched concurrently (at most ``MAX_PAGE_WORKERS`` at a time)
+        over the shared connection pool. Each page goes through the same
+        ``_request_url`` retry loop, so 429/5xx/401 handling is unchanged.
 
         Args:
             path: Initial API path (e.g. ``/me/playlists``).
             params: Optional query parameters for the first request.
             items_key: Key containing the list items (default ``items``).
+            parallel: Fetch pages after the first concurrently instead of
+                following ``next`` links one at a time.
+            fields: Item-level field filter (e.g. ``"track(uri)"``, see
+                ``fields.PLAYLIST_ITEM_PRESETS``). It is wrapped in
+                ``items_key(...)`` and the paging fields are added, so a
+                projection never strips what pagination needs.
 
         Returns:
-            Concatenated list of all items across pages.
+            Concatenated list of all items across pages, in page order.
         """
+        if fields:
+            params = {**(params or {}), "fields": page_fields(fields, items_key)}
+
+        if parallel:
+            return self._get_all_pages_parallel(path, params, items_key)
+
         all_items: List[Dict] = []
         url: Optional[str] = f"{BASE_URL}{path}"
 
@@ -183,6 +229,61 @@ class SpotifyHTTPClient:
 
         return all_items
 
+    def _get_all_pages_parallel(
+        self,
+        path: str,
+        params: Optional[Dict],
+        items_key: str,
+    ) -> List[Dict]:
+        """Fetch page one, then every remaining offset window concurrently.
+
+        Falls back to following ``next`` links when the first page does not
+        describe its own window (no ``total``/``limit``) -- a paging object
+        that cannot be addressed by offset has to be walked.
+        """
+        first = self._request("GET", path, params=params)
+        if not first:
+            return []
+
+        all_items: List[Dict] = list(first.get(items_key) or [])
+        if not first.get("next"):
+            return all_items
+
+        total = first.get("total")
+        limit = first.get("limit") or len(all_items)
+        if not isinstance(total, int) or not limit:
+            url: Optional[str] = first["next"]
+            while url:
+                data = self._request_url("GET", url)
+                if data and items_key in data:
+                    all_items.extend(data[items_key])
+                url = data.get("next") if data else None
+            return all_items
+
+        start = (first.get("offset") or 0) + limit
+        offsets = list(range(start, total, limit))
+        base_params = dict(params or {})
+
+        def fetch(offset: int) -> List[Dict]:
+            page_params = {**base_params, "offset": offset, "limit": limit}
+            data = self._request("GET", path, params=page_params)
+            return (data or {}).get(items_key) or []
+
+        workers = min(MAX_PAGE_WORKERS, len(offsets))
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="spotify-page",
+        ) as pool:
+            # map() yields in submission order, so items come back in
+            # playlist order regardless of which page finished first. On
+            # the first page error, map() cancels the pages not yet
+            # started, and leaving the block waits for those already in
+            # flight (at most MAX_PAGE_WORKERS) before the error propagates.
+            for page in pool.map(fetch, offsets):
+                all_items.extend(page)
+
+        return all_items
+
     # -----------------------------------------------------------------
     # Internal request handling
     # -----------------------------------------------------------------
@@ -215,7 +316,11 @@ class SpotifyHTTPClient:
         attempt = 0
 
         while attempt <= MAX_RETRIES:
+            sent_token = self._access_token
+            governor = _rate_governor
             try:
+                if governor is not None:
+                    governor.acquire()
                 response = self._session.request(
                     method,
                     url,
@@ -233,15 +338,23 @@ class SpotifyHTTPClient:
                 # --- 401 Unauthorized: try token refresh once ---
                 if response.status_code == 401:
                     if not token_refreshed and self._on_token_refresh:
-                        logger.info("401 received, attempting token refresh")
-                        try:
-                            new_token = self._on_token_refresh()
-                            self.update_token(new_token)
-                            token_refreshed = True
-                            attempt = 0  # reset retry budget after refresh
-                            continue
-                        except Exception as e:
-                            logger.error("Token refresh failed: %s", e)
+                        with self._refresh_lock:
+                            if self._access_token != sent_token:
+                                # A concurrent request already refreshed
+                                # while this one was in flight; retry with
+                                # its token instead of refreshing again.
+                                token_refreshed = True
+                                attempt = 0
+                                continue
+                            logger.info("401 received, attempting token refresh")
+                            try:
+                                new_token = self._on_token_refresh()
+                                self.update_token(new_token)
+                                token_refreshed = True
+                                attempt = 0  # reset retry budget after refresh
+                                continue
+                            except Exception as e:
+                                logger.error("Token refresh failed: %s", e)
                     raise SpotifyTokenExpiredError("Token expired or invalid")
 
                 # --- 404 Not Found ---
@@ -252,11 +365,17 @@ class SpotifyHTTPClient:
                 if response.status_code == 429:
                     if attempt >= MAX_RETRIES:
                         retry_after = int(response.headers.get("Retry-After", 60))
+                        if governor is not None and "Retry-After" in response.headers:
+                            governor.cool_down(retry_after)
                         raise SpotifyRateLimitError(
                             f"Rate limited after {MAX_RETRIES + 1} attempts",
                             retry_after=retry_after,
                         )
                     retry_after = int(response.headers.get("Retry-After", 1))
+                    if governor is not None:
+                        # Park every other thread too, rather than letting
+                        # each discover the limit with its own 429.
+                        governor.cool_down(retry_after)
                     delay = max(
                         retry_after,
                         _calculate_backoff_delay(attempt),
@@ -0,0 +1,248 @@
+"""
+In-process LRU tier in front of the Redis-backed SpotifyCache.
+
+Every ``SpotifyCache`` hit cost a Redis round trip, even when the same
+worker had served the identical playlist a second earlier. A
+``LocalCacheTier`` keeps recently used entries in this process, bounded
+by total bytes and by a short TTL, and ``SpotifyCache`` consults it
+before Redis.
+
+Entries are stored as the encoded bytes Redis holds, not as decoded
+objects: callers are free to mutate what the cache returns (shuffles
+sort lists in place), so handing two requests the same list would let
+one corrupt the other. Decoding is cheap next to the network hop it
+replaces.
+
+Invalidations (``invalidate_playlist``, ``invalidate_user_playlists``,
+``clear_all``) are published on a Redis channel, and every worker's tier
+subscribes and evicts the named keys. Pub/sub is fire-and-forget, so a
+worker that is briefly disconnected can miss a message; the local TTL
+(seconds, not minutes) bounds how long such a stale entry can live.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHANNEL = "shuffify:cache:invalidate"
+
+# Published in place of key names to drop every local entry.
+_CLEAR_ALL = "*"
+
+# Seconds the listener waits before resubscribing after a Redis error.
+_RECONNECT_DELAY = 5.0
+
+
+class LocalCacheTier:
+    """
+    Byte-bounded LRU of encoded cache values, with TTLs.
+
+    One instance is shared by every SpotifyCache in the process.
+
+    Example:
+        tier = LocalCacheTier(max_bytes=32 * 1024 * 1024, ttl=15)
+        cache = SpotifyCache(redis_client, local_tier=tier)
+        tier.metrics()   # per-tier hits and misses
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl: float = 15.0,
+        redis_client: Optional[redis.Redis] = None,
+        channel: str = DEFAULT_CHANNEL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the tier.
+
+        Args:
+            max_bytes: Upper bound on the summed size of stored values.
+                A single value larger than this is never stored.
+            ttl: Longest a value is served locally, in seconds. The
+                Redis TTL still applies when it is shorter.
+            redis_client: Client used to publish and receive
+                invalidations. None keeps invalidation process-local.
+            channel: Pub/sub channel for invalidation messages.
+            clock: Monotonic clock, injectable for tests.
+        """
+        if max_bytes <= 0 or ttl <= 0:
+            raise ValueError("max_bytes and ttl must be positive")
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._redis = redis_client
+        self._channel = channel
+        self._clock = clock
+        self._reset_local_state()
+
+    def _reset_local_state(self) -> None:
+        """(Re)build entries, counters and lock; also run after a fork."""
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._bytes = 0
+        self._listener: Optional[threading.Thread] = None
+        self._stats = {
+            "local_hits": 0,
+            "local_misses": 0,
+            "redis_hits": 0,
+            "redis_misses": 0,
+            "evictions": 0,
+            "invalidations_received": 0,
+        }
+
+    def _check_fork(self) -> None:
+        # A listener thread started before a pre-fork (gunicorn --preload)
+        # does not exist in the child; rebuild so the child starts its own.
+        if self._pid != os.getpid():
+            self._reset_local_state()
+
+    # -----------------------------------------------------------------
+    # Entries
+    # -----------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored bytes for ``key``, or None."""
+        self._check_fork()
+        self._ensure_listener()
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= now:
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self._stats["local_misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["local_hits"] += 1
+            return entry[0]
+
+    def set(self, key: str, payload: bytes, ttl: Optional[float] = None) -> None:
+        """Store ``payload`` for ``min(ttl, tier ttl)`` seconds."""
+        self._check_fork()
+        size = len(payload)
+        if size > self._max_bytes:
+            return
+        lifetime = min(ttl, self._ttl) if ttl else self._ttl
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (payload, self._clock() + lifetime)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._stats["evictions"] += 1
+
+    def evict(self, keys: Iterable[str]) -> None:
+        """Drop ``keys`` here only (see ``invalidate`` to tell every worker)."""
+        self._check_fork()
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._drop(key)
+
+    def clear(self) -> None:
+        """Drop every local entry in this process."""
+        self._check_fork()
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        """Evict ``keys`` here and publish them to every other worker."""
+        keys = list(keys)
+        self.evict(keys)
+        self._publish(keys)
+
+    def invalidate_all(self) -> None:
+        """Clear this tier and every other worker's."""
+        self.clear()
+        self._publish([_CLEAR_ALL])
+
+    def _drop(self, key: str) -> None:
+        payload, _ = self._entries.pop(key)
+        self._bytes -= len(payload)
+
+    # -----------------------------------------------------------------
+    # Metrics
+    # -----------------------------------------------------------------
+
+    def record_redis(self, hits: int = 0, misses: int = 0) -> None:
+        """Count lookups that fell through to Redis."""
+        with self._lock:
+            self._stats["redis_hits"] += hits
+            self._stats["redis_misses"] += misses
+
+    def metrics(self) -> Dict[str, object]:
+        """Return per-tier hit/miss counters and current size."""
+        self._check_fork()
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "listening": self._listener is not None and self._listener.is_alive(),
+            }
+
+    # -----------------------------------------------------------------
+    # Pub/sub
+    # -----------------------------------------------------------------
+
+    def _publish(self, keys) -> None:
+        if self._redis is None or not keys:
+            return
+        try:
+            self._redis.publish(self._channel, "\n".join(keys))
+        except redis.RedisError as e:
+            logger.warning("Cache invalidation publish failed: %s", e)
+
+    def _ensure_listener(self) -> None:
+        """Start the invalidation listener the first time it is needed."""
+        if self._redis is None or self._listener is not None:
+            return
+        with self._lock:
+            if self._listener is not None:
+                return
+            self._listener = threading.Thread(
+                target=self._listen, name="cache-invalidation", daemon=True
+            )
+            self._listener.start()
+
+    def _listen(self) -> None:
+        pid = self._pid
+        while pid == os.getpid():
+            try:
+                pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self._channel)
+                # Anything cached while we were not subscribed may have
+                # been invalidated without us hearing about it.
+                self.clear()
+                for message in pubsub.listen():
+                    self._handle_message(message)
+            except redis.RedisError as e:
+                logger.warning("Cache invalidation listener error: %s", e)
+                time.sleep(_RECONNECT_DELAY)
+
+    def _handle_message(self, message) -> None:
+        data = message.get("data")
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        if not isinstance(data, str):
+            return
+        with self._lock:
+            self._stats["invalidations_received"] += 1
+        keys = data.split("\n")
+        if _CLEAR_ALL in keys:
+            self.clear()
+        else:
+            self.evict(keys)
@@ -0,0 +1,320 @@
+"""
+Process-wide rate governor for Spotify Web API requests.
+
+Spotify enforces one rate limit per application, not per user or per thread,
+so the budget is shared by every web request and scheduler thread in every
+worker. Without a governor each ``SpotifyHTTPClient`` only learns about the
+limit from a 429, and every thread that hits it backs off on its own
+schedule: under a burst of scheduled jobs the whole pool trips the limit
+together and retries in lockstep.
+
+The governor is a token bucket that every request passes through before it
+is sent. A ``Retry-After`` seen by any thread sets a cool-down that every
+other thread honours, so one 429 parks the whole process (or, with Redis, the
+whole deployment) instead of each thread rediscovering it.
+
+With a Redis client the bucket and the cool-down live in Redis and are
+updated atomically by a Lua script, so all workers draw from one budget. A
+Redis error falls back to the in-process bucket for that call: a cache
+outage must never stop Spotify traffic outright.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+# Longest single sleep while waiting for a token. Waiting in short slices
+# lets a cool-down set by another thread (or process) take effect promptly,
+# and keeps a long Retry-After from pinning a thread past a config change.
+MAX_WAIT_SLICE = 1.0
+
+# KEYS[1] bucket hash, KEYS[2] cool-down key.
+# ARGV[1] rate (tokens/s), ARGV[2] burst (capacity).
+# Returns the milliseconds to wait, or 0 when a token was taken.
+_ACQUIRE_SCRIPT = """
+local cooldown = redis.call('PTTL', KEYS[2])
+if cooldown > 0 then
+    return cooldown
+end
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = burst
+    ts = now
+end
+tokens = math.min(burst, tokens + (now - ts) * rate / 1000)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) * 1000 / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst * 1000 / rate) + 1000)
+return wait
+"""
+
+# KEYS[1] cool-down key. ARGV[1] milliseconds. Only ever extends.
+_COOL_DOWN_SCRIPT = """
+local current = redis.call('PTTL', KEYS[1])
+if current < tonumber(ARGV[1]) then
+    redis.call('SET', KEYS[1], '1', 'PX', ARGV[1])
+end
+return 1
+"""
+
+
+class RateGovernor:
+    """
+    Token-bucket gate shared by every Spotify request in the process.
+
+    Example:
+        governor = RateGovernor(rate=6, burst=30, redis_client=client)
+        governor.acquire()          # blocks until a request may be sent
+        governor.cool_down(5)       # a 429 said Retry-After: 5
+        governor.metrics()          # queue depth, wait times, backend
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        redis_client: Optional[redis.Redis] = None,
+        key_prefix: str = "shuffify:ratelimit:",
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the governor.
+
+        Args:
+            rate: Sustained requests per second.
+            burst: Bucket capacity -- requests that may be sent back to
+                back after an idle period.
+            redis_client: Optional Redis client. When given, the bucket
+                and cool-down are shared across processes.
+            key_prefix: Prefix for the Redis keys.
+            clock: Monotonic clock, injectable for tests.
+            sleep: Sleep function, injectable for tests.
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be >= 1, got {burst}")
+
+        self._rate = float(rate)
+        self._burst = int(burst)
+        self._redis = redis_client
+        self._bucket_key = f"{key_prefix}bucket"
+        self._cool_down_key = f"{key_prefix}cooldown"
+        self._clock = clock
+        self._sleep = sleep
+        self._reset_local_state()
+
+    def _reset_local_state(self) -> None:
+        """(Re)build the in-process bucket, lock and counters.
+
+        Also run after a fork: a lock inherited mid-acquire would be held
+        forever in the child, which no thread there can release.
+        """
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._tokens = float(self._burst)
+        self._updated_at = self._clock()
+        self._cool_down_until = 0.0
+        self._waiting = 0
+        self._max_waiting = 0
+        self._acquired = 0
+        self._delayed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._cool_downs = 0
+        self._redis_errors = 0
+
+    def _check_fork(self) -> None:
+        if self._pid != os.getpid():
+            self._reset_local_state()
+
+    @property
+    def backend(self) -> str:
+        """``"redis"`` when the budget is shared across processes."""
+        return "redis" if self._redis is not None else "local"
+
+    # -----------------------------------------------------------------
+    # Public API
+    # -----------------------------------------------------------------
+
+    def acquire(self) -> float:
+        """Block until one request may be sent.
+
+        Returns:
+            Seconds spent waiting (0.0 when a token was immediately free).
+        """
+        start = self._begin_wait()
+        try:
+            while True:
+                wait = self._reserve()
+                if wait <= 0:
+                    break
+                self._sleep(min(wait, MAX_WAIT_SLICE))
+        finally:
+            waited = self._end_wait(start)
+        return waited
+
+    async def acquire_async(self) -> float:
+        """``acquire`` for coroutines: waits with ``asyncio.sleep``.
+
+        The wait yields to the event loop instead of blocking it, so other
+        requests on the same loop keep moving while this one is held back.
+        With the Redis backend each reservation is a blocking ``EVAL`` and
+        runs in a worker thread for the same reason.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        start = self._begin_wait()
+        try:
+            while True:
+                if self._redis is not None:
+                    wait = await asyncio.to_thread(self._reserve)
+                else:
+                    wait = self._reserve()
+                if wait <= 0:
+                    break
+                await asyncio.sleep(min(wait, MAX_WAIT_SLICE))
+        finally:
+            waited = self._end_wait(start)
+        return waited
+
+    def cool_down(self, seconds: float) -> None:
+        """Hold every request back for ``seconds``.
+
+        Called with the ``Retry-After`` of a 429. A shorter cool-down never
+        shortens one already in force.
+        """
+        if seconds <= 0:
+            return
+        self._check_fork()
+        with self._lock:
+            self._cool_downs += 1
+            self._cool_down_until = max(
+                self._cool_down_until, self._clock() + seconds
+            )
+        if self._redis is not None:
+            try:
+                self._redis.eval(
+                    _COOL_DOWN_SCRIPT,
+                    1,
+                    self._cool_down_key,
+                    int(seconds * 1000),
+                )
+            except redis.RedisError as e:
+                self._note_redis_error(e)
+        logger.warning("Spotify rate limit cool-down for %ss", seconds)
+
+    async def cool_down_async(self, seconds: float) -> None:
+        """``cool_down`` for coroutines; the Redis write runs in a thread."""
+        if self._redis is None:
+            self.cool_down(seconds)
+        else:
+            await asyncio.to_thread(self.cool_down, seconds)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return a snapshot of queue depth and wait-time counters."""
+        self._check_fork()
+        with self._lock:
+            return {
+                "backend": self.backend,
+                "rate_per_second": self._rate,
+                "burst": self._burst,
+                "queue_depth": self._waiting,
+                "max_queue_depth": self._max_waiting,
+                "requests_acquired": self._acquired,
+                "requests_delayed": self._delayed,
+                "total_wait_seconds": round(self._total_wait, 3),
+                "max_wait_seconds": round(self._max_wait, 3),
+                "cool_downs": self._cool_downs,
+                "cool_down_remaining_seconds": round(
+                    max(0.0, self._cool_down_until - self._clock()), 3
+                ),
+                "redis_errors": self._redis_errors,
+            }
+
+    # -----------------------------------------------------------------
+    # Internals
+    # -----------------------------------------------------------------
+
+    def _begin_wait(self) -> float:
+        self._check_fork()
+        with self._lock:
+            self._waiting += 1
+            self._max_waiting = max(self._max_waiting, self._waiting)
+        return self._clock()
+
+    def _end_wait(self, start: float) -> float:
+        waited = self._clock() - start
+        with self._lock:
+            self._waiting -= 1
+            self._acquired += 1
+            if waited > 0:
+                self._delayed += 1
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+        return waited
+
+    def _reserve(self) -> float:
+        """Take a token if one is free; otherwise return seconds to wait."""
+        if self._redis is not None:
+            try:
+                wait_ms = self._redis.eval(
+                    _ACQUIRE_SCRIPT,
+                    2,
+                    self._bucket_key,
+                    self._cool_down_key,
+                    self._rate,
+                    self._burst,
+                )
+                return int(wait_ms) / 1000.0
+            except redis.RedisError as e:
+                self._note_redis_error(e)
+        return self._reserve_local()
+
+    def _reserve_local(self) -> float:
+        with self._lock:
+            now = self._clock()
+            if now < self._cool_down_until:
+                return self._cool_down_until - now
+
+            elapsed = now - self._updated_at
+            self._tokens = min(
+                float(self._burst), self._tokens + elapsed * self._rate
+            )
+            self._updated_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self._rate
+
+    def _note_redis_error(self, error: Exception) -> None:
+        with self._lock:
+            self._redis_errors += 1
+            first = self._redis_errors == 1
+        # Once per process is enough to diagnose; every request would flood.
+        if first:
+            logger.warning(
+                "Redis error in Spotify rate governor, using the "
+                "in-process bucket: %s",
+                error,
+            )
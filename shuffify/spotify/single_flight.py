@@ -0,0 +1,263 @@
+"""
+Single-flight coalescing for identical Spotify reads.
+
+When a playlist's cached tracks expire, every reader that arrives before
+someone repopulates the cache misses and pages the API on its own: a few
+workshop tabs, the dashboard and a scheduled job reading one playlist in
+the same second cost the whole playlist several times over, and a busy
+playlist does this once per TTL.
+
+``SingleFlight.do`` runs the fetch once per key. Within a process the
+first caller (the leader) fetches, and callers arriving while it is in
+flight wait and receive a copy of its result. Only successes are shared:
+keys carry no caller identity, so when the leader fails (an expired
+token, a playlist only it cannot see) each follower fetches for itself
+rather than inheriting an error that may not be its own.
+
+With a Redis client, leaders in different workers also coordinate: the
+leader takes a ``SET NX PX`` lock for the key, and a leader that finds
+the lock held polls ``peek`` (normally a cache read) until the holder has
+populated the cache, then returns that. If the holder dies, or Redis is
+unavailable, the waiter stops waiting and fetches itself; coalescing is
+an optimisation and must never turn into an outage.
+"""
+
+import copy
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import redis
+
+from shuffify import redis_lock
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Process-wide instance. None (the default, and in tests) means every
+# caller fetches for itself, as before.
+_single_flight: Optional["SingleFlight"] = None
+
+
+def set_single_flight(flight: Optional["SingleFlight"]) -> None:
+    """Install (or, with None, remove) the process-wide SingleFlight."""
+    global _single_flight
+    _single_flight = flight
+
+
+def get_single_flight() -> Optional["SingleFlight"]:
+    """Return the process-wide SingleFlight, if one is installed."""
+    return _single_flight
+
+
+class _Call:
+    """One in-flight fetch, shared by its leader and followers."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Runs at most one fetch per key at a time; everyone else waits for it.
+
+    Example:
+        flight = SingleFlight(redis_client)
+        tracks = flight.do(
+            "tracks:pl1",
+            lambda: api_fetch("pl1"),
+            peek=lambda: cache.get_playlist_tracks("pl1"),
+        )
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        key_prefix: str = "shuffify:flight:",
+        wait_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the coalescer.
+
+        Args:
+            redis_client: Optional Redis client for cross-process locks.
+                None coalesces within this process only.
+            key_prefix: Prefix for the Redis lock keys.
+            wait_timeout: Longest a caller waits on someone else's fetch
+                before fetching itself. Also the Redis lock's TTL, so a
+                leader that dies holding it cannot block anyone longer.
+            clock: Monotonic clock, injectable for tests.
+            sleep: Sleep function, injectable for tests.
+        """
+        if wait_timeout <= 0:
+            raise ValueError(f"wait_timeout must be > 0, got {wait_timeout}")
+        self._redis = redis_client
+        self._key_prefix = key_prefix
+        self._wait_timeout = wait_timeout
+        self._clock = clock
+        self._sleep = sleep
+        self._reset_local_state()
+
+    def _reset_local_state(self) -> None:
+        """(Re)build the in-flight table, lock and counters; also after a fork."""
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._stats = {
+            "fetches": 0,
+            "coalesced": 0,
+            "remote_waits": 0,
+            "remote_hits": 0,
+            "wait_timeouts": 0,
+            "redis_errors": 0,
+        }
+
+    def _check_fork(self) -> None:
+        # A leader thread that was mid-fetch at fork time does not exist in
+        # the child, so its followers there would wait for nothing.
+        if self._pid != os.getpid():
+            self._reset_local_state()
+
+    @property
+    def backend(self) -> str:
+        """``"redis"`` when leaders coordinate across processes."""
+        return "redis" if self._redis is not None else "local"
+
+    # -----------------------------------------------------------------
+    # Public API
+    # -----------------------------------------------------------------
+
+    def do(
+        self,
+        key: str,
+        fetch: Callable[[], T],
+        peek: Optional[Callable[[], Optional[T]]] = None,
+    ) -> T:
+        """
+        Return ``fetch()``, sharing one call among concurrent callers.
+
+        Args:
+            key: Identifies what is fetched; equal keys must mean equal
+                results.
+            fetch: Does the real work. Its exception propagates to the
+                leader only; callers waiting on it fetch for themselves.
+            peek: Optional cheap read of a result another process has
+                published (e.g. a cache get), returning None until there
+                is one. Required for cross-process coalescing.
+
+        Returns:
+            The leader gets ``fetch``'s own result; followers get deep
+            copies, since callers are free to mutate what they receive.
+        """
+        self._check_fork()
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            return self._follow(key, call, fetch)
+
+        try:
+            call.result = self._lead(key, fetch, peek)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def metrics(self) -> Dict[str, object]:
+        """Return fetch and coalescing counters for this process."""
+        self._check_fork()
+        with self._lock:
+            return {**self._stats, "backend": self.backend, "in_flight": len(self._calls)}
+
+    # -----------------------------------------------------------------
+    # Internals
+    # -----------------------------------------------------------------
+
+    def _follow(self, key: str, call: _Call, fetch: Callable[[], T]) -> T:
+        if not call.done.wait(timeout=self._wait_timeout):
+            self._count("wait_timeouts")
+            logger.warning("Single-flight wait for %s timed out; fetching directly", key)
+            self._count("fetches")
+            return fetch()
+        if call.error is not None:
+            # The failure may be the leader's own (its token, its access),
+            # so it is not handed on; this caller tries with its own fetch.
+            self._count("fetches")
+            return fetch()
+        return copy.deepcopy(call.result)
+
+    def _lead(
+        self,
+        key: str,
+        fetch: Callable[[], T],
+        peek: Optional[Callable[[], Optional[T]]],
+    ) -> T:
+        owner = None
+        if peek is not None and self._redis is not None:
+            owner, published = self._acquire_shared_lock(key, peek)
+            if published is not None:
+                return published
+        try:
+            self._count("fetches")
+            return fetch()
+        finally:
+            self._release_shared_lock(key, owner)
+
+    def _acquire_shared_lock(self, key: str, peek: Callable[[], Optional[T]]):
+        """Take the cross-process lock, or wait for its holder's result.
+
+        Returns ``(owner, None)`` when we hold the lock, ``(None, result)``
+        when the holder published one while we waited, and ``(None, None)``
+        when we should fetch without the lock (timeout or Redis error).
+        """
+        try:
+            attempt = redis_lock.acquire_or_wait(
+                self._redis,
+                f"{self._key_prefix}{key}",
+                self._wait_timeout,
+                peek,
+                self._clock,
+                self._sleep,
+            )
+        except redis.RedisError as e:
+            self._count("redis_errors")
+            logger.warning("Single-flight lock unavailable for %s: %s", key, e)
+            return None, None
+        if attempt.waited:
+            self._count("remote_waits")
+        if attempt.result is not None:
+            self._count("remote_hits")
+        elif attempt.timed_out:
+            self._count("wait_timeouts")
+        return attempt.owner, attempt.result
+
+    def _release_shared_lock(self, key: str, owner: Optional[str]) -> None:
+        if owner is None:
+            return
+        try:
+            redis_lock.release(self._redis, f"{self._key_prefix}{key}", owner)
+        except redis.RedisError as e:
+            self._count("redis_errors")
+            logger.warning("Single-flight lock release error for %s: %s", key, e)
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
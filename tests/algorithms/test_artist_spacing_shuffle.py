@@ -264,3 +264,49 @@ class TestArtistSpacingShuffleEdgeCases:
         results = [tuple(algorithm.shuffle(tracks)) for _ in range(10)]
         unique_results = set(results)
         assert len(unique_results) > 1
+
+
+class TestArtistSpacingShuffleLargePlaylists:
+    """The deque cooldown keeps large playlists cheap and correct."""
+
+    @pytest.fixture
+    def algorithm(self):
+        """ArtistSpacingShuffle instance."""
+        return ArtistSpacingShuffle()
+
+    def test_spacing_holds_across_a_large_playlist(self, algorithm):
+        """20,000 tracks over 2,000 artists keep every artist 10 apart."""
+        tracks = [
+            {
+                "uri": f"spotify:track:{i}",
+                "artists": [{"name": f"Artist {i % 2000}"}],
+            }
+            for i in range(20_000)
+        ]
+        artist_of = {t["uri"]: t["artists"][0]["name"] for t in tracks}
+
+        result = algorithm.shuffle(tracks, min_spacing=10)
+
+        assert len(result) == 20_000
+        last_seen = {}
+        for pos, uri in enumerate(result):
+            artist = artist_of[uri]
+            if artist in last_seen:
+                assert pos - last_seen[artist] > 10
+            last_seen[artist] = pos
+
+    def test_blocked_fallback_releases_soonest_artist_first(self, algorithm):
+        """With every artist blocked, the earliest-placed one goes next."""
+        tracks = [
+            {"uri": f"spotify:track:a{i}", "artists": [{"name": "A"}]}
+            for i in range(3)
+        ] + [
+            {"uri": f"spotify:track:b{i}", "artists": [{"name": "B"}]}
+            for i in range(3)
+        ]
+        artist_of = {t["uri"]: t["artists"][0]["name"] for t in tracks}
+
+        for _ in range(20):
+            order = [artist_of[u] for u in algorithm.shuffle(tracks, min_spacing=5)]
+            # Two artists can only alternate; neither ever repeats early.
+            assert order in (list("ABABAB"), list("BABABA"))
@@ -5,6 +5,7 @@ Tests cover sectioned shuffling with round-robin selection.
 """
 
 import random
+from collections import Counter
 
 import pytest
 
@@ -247,3 +248,55 @@ class TestBalancedShuffleEdgeCases:
 
         assert len(result) == 2
         assert set(result) == {'a', 'b'}
+
+
+class TestBalancedShuffleDistribution:
+    """The stride interleave must not change which orders come out, or how often."""
+
+    @pytest.fixture
+    def algorithm(self):
+        """BalancedShuffle instance."""
+        return BalancedShuffle()
+
+    def test_every_permutation_within_constraints_is_equally_likely(
+        self, algorithm
+    ):
+        """Chi-squared over all reachable orders of a small playlist.
+
+        7 tracks in 3 sections (3/2/2) give 3!*2!*2! = 24 reachable orders,
+        each with probability 1/24 if sections are shuffled uniformly and
+        interleaved deterministically.
+        """
+        tracks = [{"uri": f"spotify:track:t{i}"} for i in range(7)]
+        trials = 24_000
+        rng_state = random.getstate()
+        random.seed(20260101)
+        try:
+            counts = Counter(
+                tuple(algorithm.shuffle(tracks, section_count=3))
+                for _ in range(trials)
+            )
+        finally:
+            random.setstate(rng_state)
+
+        assert len(counts) == 24
+        expected = trials / 24
+        chi_squared = sum((n - expected) ** 2 / expected for n in counts.values())
+        # 23 degrees of freedom; p = 0.001 critical value is 49.73.
+        assert chi_squared < 49.73
+
+    def test_positions_keep_section_slots(self, algorithm):
+        """Section s always fills slots s, s+k, s+2k, ... of the result."""
+        tracks = [{"uri": f"spotify:track:t{i:03d}"} for i in range(103)]
+        sections = [
+            {f"spotify:track:t{i:03d}" for i in range(start, start + size)}
+            for start, size in ((0, 26), (26, 26), (52, 26), (78, 25))
+        ]
+
+        result = algorithm.shuffle(tracks, section_count=4)
+
+        for pos, uri in enumerate(result[:100]):
+            assert uri in sections[pos % 4]
+        assert result[100] in sections[0]
+        assert result[101] in sections[1]
+        assert result[102] in sections[2]
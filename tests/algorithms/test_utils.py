@@ -1,12 +1,13 @@
 """
 Tests for shuffle algorithm utility functions.
 
-Tests extract_uris, split_keep_first, and split_into_sections
-pure functions used across multiple shuffle algorithms.
+Tests extract_uris, split_keep_first, split_into_sections and
+interleave_sections pure functions used across multiple shuffle algorithms.
 """
 
 from shuffify.shuffle_algorithms.utils import (
     extract_uris,
+    interleave_sections,
     split_into_sections,
     split_keep_first,
 )
@@ -141,3 +142,51 @@ class TestSplitIntoSections:
     def test_items_equal_sections(self):
         result = split_into_sections(["a", "b", "c"], 3)
         assert result == [["a"], ["b"], ["c"]]
+
+
+# =============================================================================
+# interleave_sections
+# =============================================================================
+
+
+def _pop_head_interleave(sections):
+    """The original merge: take each non-empty section's head in turn."""
+    sections = [list(s) for s in sections]
+    result = []
+    while any(sections):
+        for section in sections:
+            if section:
+                result.append(section.pop(0))
+    return result
+
+
+class TestInterleaveSections:
+    """Tests for interleave_sections()."""
+
+    def test_empty(self):
+        assert interleave_sections([]) == []
+
+    def test_even_sections(self):
+        result = interleave_sections([["a", "b"], ["c", "d"]])
+        assert result == ["a", "c", "b", "d"]
+
+    def test_longer_sections_finish_the_last_round(self):
+        result = interleave_sections([["a", "b", "c"], ["d", "e"], ["f", "g"]])
+        assert result == ["a", "d", "f", "b", "e", "g", "c"]
+
+    def test_irregular_shapes_use_general_walk(self):
+        sections = [["a"], ["b", "c", "d"], [], ["e", "f"]]
+        assert interleave_sections(sections) == _pop_head_interleave(sections)
+
+    def test_does_not_modify_sections(self):
+        sections = [["a", "b"], ["c"]]
+        interleave_sections(sections)
+        assert sections == [["a", "b"], ["c"]]
+
+    def test_matches_pop_head_merge_for_every_split(self):
+        for total in range(0, 40):
+            for count in range(1, 11):
+                sections = split_into_sections(list(range(total)), count)
+                assert interleave_sections(sections) == _pop_head_interleave(
+                    sections
+                ), (total, count)
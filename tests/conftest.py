@@ -10,6 +10,52 @@ from unittest.mock import Mock
 
 import pytest
 
+# =============================================================================
+# Process-global State
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def _reset_rate_governor():
+    """Remove any Spotify rate governor a test installed.
+
+    create_app() with a development or production config installs one
+    process-wide; left behind, its bucket and any 429 cool-down would
+    throttle every HTTP client test that runs after it.
+    """
+    yield
+    from shuffify.spotify.http_client import set_rate_governor
+
+    set_rate_governor(None)
+
+
+@pytest.fixture(autouse=True)
+def _reset_single_flight():
+    """Remove any single-flight table a test's create_app() installed."""
+    yield
+    from shuffify.spotify.single_flight import set_single_flight
+
+    set_single_flight(None)
+
+
+@pytest.fixture(autouse=True)
+def _reset_access_token_cache():
+    """Remove any access-token cache a test's create_app() installed."""
+    yield
+    import shuffify
+
+    shuffify._access_token_cache = None
+
+
+@pytest.fixture(autouse=True)
+def _reset_local_cache_tier():
+    """Remove any local cache tier a test's create_app() installed."""
+    yield
+    import shuffify
+
+    shuffify._local_cache_tier = None
+
+
 # =============================================================================
 # Sample Data Fixtures
 # =============================================================================
@@ -391,8 +391,11 @@ class TestWorkshopCommit:
         assert response.status_code == 200
         data = response.get_json()
         assert data["success"] is True
+        # The live order goes along so only the difference is written.
         mock_ps_instance.update_playlist_tracks.assert_called_once_with(
-            "playlist123", new_uris
+            "playlist123",
+            new_uris,
+            current_uris=[t["uri"] for t in mock_playlist.tracks],
         )
 
     @patch("shuffify.routes.workshop.PlaylistSnapshotService")
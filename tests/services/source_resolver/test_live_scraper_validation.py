@@ -31,10 +31,8 @@ from shuffify.services.source_resolver.public_scraper_pathway import (
 )
 from shuffify.services.source_resolver.public_scraper_pathway import (
     EMBED_URL,
-    NEXT_DATA_PATTERN,
     PUBLIC_URL,
     REQUEST_HEADERS,
-    TRACK_LIST_SCRIPT_PATTERN,
     PublicScraperPathway,
     _extract_from_next_data,
     _extract_from_track_list,
@@ -55,6 +53,19 @@ RAPCAVIAR_ID = "37i9dQZF1DX0XUsuxWHRQd"
 # Spotify track URI format: spotify:track:<22 alphanumeric chars>
 TRACK_URI_PATTERN = re.compile(r"^spotify:track:[a-zA-Z0-9]{22}$")
 
+# Page-structure probes for the diagnostics below. Extraction itself
+# searches for landmarks and decodes only the track arrays, so it
+# doesn't cut these blocks out.
+NEXT_DATA_PATTERN = re.compile(
+    r'<script\s+id="__NEXT_DATA__"\s+type="application/json"'
+    r"[^>]*>(.*?)</script>",
+    re.DOTALL,
+)
+TRACK_LIST_SCRIPT_PATTERN = re.compile(
+    r"<script[^>]*>(.*?)</script>",
+    re.DOTALL,
+)
+
 # Minimum number of tracks we expect from a major editorial playlist.
 # These playlists typically have 50+ tracks; if we get fewer than this
 # threshold, something is likely wrong with our extraction.
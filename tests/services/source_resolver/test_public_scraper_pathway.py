@@ -7,6 +7,10 @@ Tests cover all extraction strategies:
 Plus caching, error handling, and integration with resolve().
 """
 
+import json
+import pathlib
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -16,13 +20,12 @@ from shuffify.services.source_resolver.base import (
 )
 from shuffify.services.source_resolver.public_scraper_pathway import (
     PublicScraperPathway,
+    ScrapeOutcome,
     _extract_from_next_data,
     _extract_from_track_list,
     _extract_uris,
     _extract_with_regex,
     _get_track_uri_from_item,
-    _try_parse_json,
-    _walk_json_for_tracks,
 )
 
 # ======================================================================
@@ -537,51 +540,88 @@ class TestGetTrackUriFromItem:
         assert result == "spotify:track:aaaaaaaaaaaaaaaaaaaaaa"
 
 
-class TestWalkJsonForTracks:
-    """Tests for _walk_json_for_tracks."""
+def _next_data_page(blob: str) -> str:
+    return (
+        '<script id="__NEXT_DATA__" type="application/json">'
+        f"{blob}</script>"
+    )
+
+
+class TestLandmarkScan:
+    """Edge cases of the landmark scan behind the structured strategies."""
 
     def test_deeply_nested_tracks(self):
-        data = {
-            "a": {
-                "b": {
-                    "c": {
-                        "tracks": {
-                            "items": [
-                                {
-                                    "track": {
-                                        "uri": "spotify:track:aaaaaaaaaaaaaaaaaaaaaa"
-                                    }
-                                }
-                            ]
-                        }
-                    }
-                }
-            }
-        }
-        result = _walk_json_for_tracks(data)
-        assert len(result) == 1
+        blob = (
+            '{"a":{"b":{"c":{"tracks":{"items":['
+            '{"track":{"uri":"spotify:track:aaaaaaaaaaaaaaaaaaaaaa"}}'
+            "]}}}}}"
+        )
+        assert _extract_from_next_data(_next_data_page(blob)) == [
+            "spotify:track:aaaaaaaaaaaaaaaaaaaaaa"
+        ]
 
-    def test_empty_structure(self):
-        assert _walk_json_for_tracks({}) == []
-        assert _walk_json_for_tracks({"data": {}}) == []
+    def test_skips_arrays_without_tracks(self):
+        """An earlier non-track "items" array doesn't end the search."""
+        blob = (
+            '{"images":{"items":[{"sources":[{"url":"x"}]}]},'
+            '"tracks":{"items":[{"uri":"spotify:track:aaaaaaaaaaaaaaaaaaaaaa"}]}}'
+        )
+        assert _extract_from_next_data(_next_data_page(blob)) == [
+            "spotify:track:aaaaaaaaaaaaaaaaaaaaaa"
+        ]
 
-    def test_handles_lists(self):
-        data = [
-            {"tracks": {"items": [{"uri": "spotify:track:aaaaaaaaaaaaaaaaaaaaaa"}]}}
+    def test_track_array_in_truncated_blob(self):
+        """A blob cut off after its track list still yields the tracks."""
+        blob = (
+            '{"entity":{"trackList":['
+            '{"uri":"spotify:track:aaaaaaaaaaaaaaaaaaaaaa"}],"name":'
+        )
+        assert _extract_from_next_data(_next_data_page(blob)) == [
+            "spotify:track:aaaaaaaaaaaaaaaaaaaaaa"
         ]
-        result = _walk_json_for_tracks(data)
-        assert len(result) == 1
+
+    def test_malformed_array_is_skipped(self):
+        html = '<script>{"trackList":[{"uri":"spotify:track:</script>'
+        assert _extract_from_track_list(html) == []
 
     def test_depth_guard(self):
         """Does not crash on deeply nested structures."""
-        data = {"a": None}
-        node = data
-        for _ in range(50):
-            node["a"] = {"a": None}
-            node = node["a"]
-        # Should not raise, just return empty
-        result = _walk_json_for_tracks(data)
-        assert result == []
+        blob = '{"items":' + "[" * 100_000 + "]" * 100_000 + "}"
+        assert _extract_uris(_next_data_page(blob)) == []
+
+    def test_track_list_outside_scripts_ignored(self):
+        html = (
+            "<script>var a = 1;</script>"
+            '<div data-x=\'{"trackList":[{"id":"aaaaaaaaaaaaaaaaaaaaaa"}]}\'></div>'
+        )
+        assert _extract_from_track_list(html) == []
+
+    def test_first_track_list_per_script(self):
+        html = (
+            '<script>{"a":{"trackList":[{"uri":"spotify:track:aaaaaaaaaaaaaaaaaaaaaa"}]},'
+            '"trackList":[{"uri":"spotify:track:bbbbbbbbbbbbbbbbbbbbbb"}]}</script>'
+            '<script>{"trackList":[{"uri":"spotify:track:cccccccccccccccccccccc"}]}</script>'
+        )
+        assert _extract_from_track_list(html) == [
+            "spotify:track:aaaaaaaaaaaaaaaaaaaaaa",
+            "spotify:track:cccccccccccccccccccccc",
+        ]
+
+
+SCRAPER_PAGES = pathlib.Path(__file__).parent / "scraper_pages"
+EXPECTED_PAGE_URIS = json.loads((SCRAPER_PAGES / "expected.json").read_text())
+
+
+class TestSavedPageCorpus:
+    """Extraction accuracy on the saved embed/public page corpus.
+
+    The same pages drive scripts/benchmarks/scrape_extraction.py.
+    """
+
+    @pytest.mark.parametrize("page", sorted(EXPECTED_PAGE_URIS))
+    def test_extracts_expected_uris(self, page):
+        html = (SCRAPER_PAGES / page).read_text()
+        assert _extract_uris(html) == EXPECTED_PAGE_URIS[page]
 
 
 class TestFindKey:
@@ -605,23 +645,6 @@ class TestFindKey:
         assert _find_key({"x": None}, "x") is None
 
 
-class TestTryParseJson:
-    """Tests for _try_parse_json."""
-
-    def test_valid_dict(self):
-        assert _try_parse_json('{"a": 1}') == {"a": 1}
-
-    def test_valid_non_dict(self):
-        """Lists and other types return None."""
-        assert _try_parse_json("[1, 2, 3]") is None
-
-    def test_invalid_json(self):
-        assert _try_parse_json("not json") is None
-
-    def test_empty_string(self):
-        assert _try_parse_json("") is None
-
-
 # ======================================================================
 # Tests: can_handle
 # ======================================================================
@@ -651,7 +674,7 @@ class TestCanHandle:
 class TestResolve:
     """Tests for PublicScraperPathway.resolve()."""
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_embed_success_with_next_data(self, mock_get, pathway, mock_source):
         resp = Mock(status_code=200, text=NEXT_DATA_TRACKS_ITEMS_HTML)
         mock_get.return_value = resp
@@ -662,7 +685,7 @@ class TestResolve:
         assert len(result.track_uris) == 3
         assert mock_get.call_count == 1
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_embed_success_with_track_list(self, mock_get, pathway, mock_source):
         resp = Mock(status_code=200, text=SCRIPT_TRACK_LIST_HTML)
         mock_get.return_value = resp
@@ -672,7 +695,7 @@ class TestResolve:
         assert len(result.track_uris) == 2
         assert mock_get.call_count == 1
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_embed_success_with_regex_fallback(self, mock_get, pathway, mock_source):
         resp = Mock(status_code=200, text=LEGACY_URI_HTML)
         mock_get.return_value = resp
@@ -681,7 +704,7 @@ class TestResolve:
         assert result.success is True
         assert len(result.track_uris) == 2
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_embed_fails_falls_to_public_page(self, mock_get, pathway, mock_source):
         embed_resp = Mock(status_code=404, text="")
         page_resp = Mock(status_code=200, text=LEGACY_URL_HTML)
@@ -691,7 +714,7 @@ class TestResolve:
         assert result.success is True
         assert mock_get.call_count == 2
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_both_strategies_fail(self, mock_get, pathway, mock_source):
         mock_get.return_value = Mock(status_code=200, text="<html></html>")
 
@@ -699,7 +722,7 @@ class TestResolve:
         assert result.success is False
         assert "no tracks" in result.error_message.lower()
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_http_error(self, mock_get, pathway, mock_source):
         mock_get.side_effect = Exception("Connection refused")
         result = pathway.resolve(mock_source)
@@ -716,7 +739,7 @@ class TestResolve:
     def test_name_property(self, pathway):
         assert pathway.name == "public_scraper"
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_browser_headers_sent(self, mock_get, pathway, mock_source):
         """Verify browser-like headers are used for requests."""
         mock_get.return_value = Mock(status_code=200, text=NEXT_DATA_TRACKS_ITEMS_HTML)
@@ -791,7 +814,7 @@ class TestCaching:
             result = pathway.resolve(mock_source)
             assert result.success is False
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_cache_miss_fetches_and_stores(self, mock_get, mock_source, db_app):
         """Cache miss triggers scraping and stores result."""
         from shuffify.models.db import (
@@ -821,7 +844,7 @@ class TestCaching:
                 result = PublicScraperPathway._get_cached("pl_test123")
                 assert result is None
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_expired_cache_triggers_rescrape(self, mock_get, mock_source, db_app):
         """Expired cache row is ignored; fresh scrape runs."""
         from datetime import datetime, timedelta, timezone
@@ -855,8 +878,12 @@ class TestCaching:
             assert result.success is True
             # Should have new tracks, not the old cached one
             assert "spotify:track:oldoldoldoldoldoldoldold" not in result.track_uris
+            # The expired row is refreshed in place, not replaced
+            rows = ScrapedPlaylistCache.query.filter_by(playlist_id="pl_test123").all()
+            assert [r.id for r in rows] == [row.id]
+            assert rows[0].track_uris == result.track_uris
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_failed_scrape_caches_empty(self, mock_get, mock_source, db_app):
         """Both strategies failing still caches empty."""
         from shuffify.models.db import (
@@ -875,6 +902,177 @@ class TestCaching:
             assert row is not None
             assert len(row.track_uris) == 0
 
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
+    def test_stores_content_hash(self, mock_get, mock_source, db_app):
+        """Each scrape records a hash of its track set for change checks."""
+        from shuffify.services.source_resolver.base import content_hash
+
+        with db_app.app_context():
+            mock_get.return_value = Mock(
+                status_code=200,
+                text=NEXT_DATA_TRACKS_ITEMS_HTML,
+            )
+
+            result = PublicScraperPathway().resolve(mock_source)
+
+            assert PublicScraperPathway.cached_content_hash(
+                "pl_test123"
+            ) == content_hash(result.track_uris)
+
+    def test_content_hash_ignores_order_and_duplicates(self):
+        from shuffify.services.source_resolver.base import content_hash
+
+        a = "spotify:track:aaaaaaaaaaaaaaaaaaaaaa"
+        b = "spotify:track:bbbbbbbbbbbbbbbbbbbbbb"
+        assert content_hash([a, b]) == content_hash([b, a, a])
+        assert content_hash([a]) != content_hash([a, b])
+
+    def test_expired_row_has_no_content_hash(self, db_app):
+        """An expired scrape can't vouch for the source being unchanged."""
+        from datetime import datetime, timedelta, timezone
+
+        from shuffify.models.db import (
+            ScrapedPlaylistCache,
+            db,
+        )
+
+        with db_app.app_context():
+            now = datetime.now(timezone.utc)
+            row = ScrapedPlaylistCache(
+                playlist_id="pl_test123",
+                scraped_at=now - timedelta(hours=2),
+                scrape_pathway="embed",
+                content_hash="abc",
+                expires_at=now - timedelta(hours=1),
+            )
+            row.track_uris = []
+            db.session.add(row)
+            db.session.commit()
+
+            assert PublicScraperPathway.cached_content_hash("pl_test123") is None
+
+
+# ======================================================================
+# Tests: Pooled session and conditional revalidation
+# ======================================================================
+
+
+class TestScrapeSession:
+    def test_session_is_shared_within_a_process(self):
+        from shuffify.services.source_resolver.public_scraper_pathway import (
+            get_scrape_session,
+        )
+
+        assert get_scrape_session() is get_scrape_session()
+
+    def test_session_is_rebuilt_after_fork(self):
+        from shuffify.services.source_resolver import public_scraper_pathway as mod
+
+        parent = mod.get_scrape_session()
+        with patch.object(mod.os, "getpid", return_value=-1):
+            child = mod.get_scrape_session()
+
+        assert child is not parent
+
+
+class TestConditionalRevalidation:
+    """An expired scrape is revalidated with its page's validators; a 304
+    reuses the cached tracks without parsing anything."""
+
+    URIS = ["spotify:track:aaaaaaaaaaaaaaaaaaaaaa"]
+
+    def _expired_row(self, pathway="embed"):
+        from datetime import datetime, timedelta, timezone
+
+        from shuffify.models.db import ScrapedPlaylistCache, db
+
+        now = datetime.now(timezone.utc)
+        row = ScrapedPlaylistCache(
+            playlist_id="pl_test123",
+            scraped_at=now - timedelta(hours=2),
+            scrape_pathway=pathway,
+            etag='"v1"',
+            last_modified="Wed, 14 Oct 2026 10:00:00 GMT",
+            expires_at=now - timedelta(hours=1),
+        )
+        row.track_uris = self.URIS
+        db.session.add(row)
+        db.session.commit()
+
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
+    def test_200_stores_validators(self, mock_get, mock_source, db_app):
+        from shuffify.models.db import ScrapedPlaylistCache
+
+        with db_app.app_context():
+            mock_get.return_value = Mock(
+                status_code=200,
+                text=NEXT_DATA_TRACKS_ITEMS_HTML,
+                headers={"ETag": '"v2"', "Last-Modified": "Thu"},
+            )
+
+            PublicScraperPathway().resolve(mock_source)
+
+            row = ScrapedPlaylistCache.query.filter_by(playlist_id="pl_test123").one()
+            assert row.etag == '"v2"'
+            assert row.last_modified == "Thu"
+
+    @patch("shuffify.services.source_resolver.public_scraper_pathway._extract_uris")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
+    def test_304_reuses_cached_tracks(
+        self, mock_get, mock_extract, mock_source, db_app
+    ):
+        from shuffify.models.db import ScrapedPlaylistCache
+
+        with db_app.app_context():
+            self._expired_row()
+            mock_get.return_value = Mock(status_code=304, text="", headers={})
+
+            result = PublicScraperPathway().resolve(mock_source)
+
+            assert result.success is True
+            assert result.track_uris == self.URIS
+            headers = mock_get.call_args.kwargs["headers"]
+            assert headers["If-None-Match"] == '"v1"'
+            assert headers["If-Modified-Since"] == "Wed, 14 Oct 2026 10:00:00 GMT"
+            mock_extract.assert_not_called()
+
+            # The row is fresh again and keeps its validators.
+            assert PublicScraperPathway._get_cached("pl_test123") == self.URIS
+            row = ScrapedPlaylistCache.query.filter_by(playlist_id="pl_test123").one()
+            assert row.etag == '"v1"'
+
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
+    def test_validators_only_sent_to_their_page(
+        self, mock_get, mock_source, db_app
+    ):
+        """Validators from the public page mean nothing to the embed."""
+        with db_app.app_context():
+            self._expired_row(pathway="public_page")
+            mock_get.side_effect = [
+                Mock(status_code=200, text="<html></html>", headers={}),
+                Mock(status_code=304, text="", headers={}),
+            ]
+
+            result = PublicScraperPathway().resolve(mock_source)
+
+            embed_headers = mock_get.call_args_list[0].kwargs["headers"]
+            public_headers = mock_get.call_args_list[1].kwargs["headers"]
+            assert "If-None-Match" not in embed_headers
+            assert public_headers["If-None-Match"] == '"v1"'
+            assert result.track_uris == self.URIS
+
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
+    def test_unsolicited_304_is_not_trusted(
+        self, mock_get, mock_source, db_app
+    ):
+        with db_app.app_context():
+            mock_get.return_value = Mock(status_code=304, text="", headers={})
+
+            result = PublicScraperPathway().resolve(mock_source)
+
+            assert result.success is False
+            assert PublicScraperPathway._get_cached("pl_test123") is None
+
 
 # ======================================================================
 # Tests: Cache-poisoning regression (issue #314)
@@ -892,7 +1090,7 @@ class TestCachePoisoningRegression:
     the cache.
     """
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_403_response_does_not_cache(self, mock_get, mock_source, db_app):
         from shuffify.models.db import ScrapedPlaylistCache
 
@@ -911,7 +1109,7 @@ class TestCachePoisoningRegression:
     @patch(
         "shuffify.services.source_resolver.public_scraper_pathway._sleep_with_backoff"
     )
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_429_response_does_not_cache(
         self, mock_get, mock_sleep, mock_source, db_app
     ):
@@ -926,7 +1124,7 @@ class TestCachePoisoningRegression:
             row = ScrapedPlaylistCache.query.filter_by(playlist_id="pl_test123").first()
             assert row is None
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_network_exception_does_not_cache(self, mock_get, mock_source, db_app):
         from shuffify.models.db import ScrapedPlaylistCache
 
@@ -939,7 +1137,7 @@ class TestCachePoisoningRegression:
             row = ScrapedPlaylistCache.query.filter_by(playlist_id="pl_test123").first()
             assert row is None
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_mixed_embed_403_then_public_200_with_tracks_caches(
         self, mock_get, mock_source, db_app
     ):
@@ -961,7 +1159,7 @@ class TestCachePoisoningRegression:
             assert row is not None
             assert len(row.track_uris) == len(result.track_uris)
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_mixed_embed_403_then_public_403_does_not_cache(
         self, mock_get, mock_source, db_app
     ):
@@ -981,7 +1179,7 @@ class TestCachePoisoningRegression:
             row = ScrapedPlaylistCache.query.filter_by(playlist_id="pl_test123").first()
             assert row is None
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_confirmed_empty_still_caches(self, mock_get, mock_source, db_app):
         """A 200 response with no extractable tracks IS a confirmed
         empty playlist — cache it so we don't re-scrape repeatedly.
@@ -1021,7 +1219,7 @@ class TestRetryBackoff:
     Sleep is patched out class-wide so the suite stays fast.
     """
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_429_then_200_succeeds(
         self,
         mock_get,
@@ -1045,7 +1243,7 @@ class TestRetryBackoff:
             assert mock_get.call_count == 2
             assert mock_sleep.call_count == 1
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_all_429s_exhaust_attempts_no_cache(
         self,
         mock_get,
@@ -1068,7 +1266,7 @@ class TestRetryBackoff:
             row = ScrapedPlaylistCache.query.filter_by(playlist_id="pl_test123").first()
             assert row is None
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_403_short_circuits_no_retry(
         self,
         mock_get,
@@ -1094,7 +1292,7 @@ class TestRetryBackoff:
             row = ScrapedPlaylistCache.query.filter_by(playlist_id="pl_test123").first()
             assert row is None
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_timeout_then_200_succeeds(
         self,
         mock_get,
@@ -1119,7 +1317,7 @@ class TestRetryBackoff:
             assert mock_get.call_count == 2
             assert mock_sleep.call_count == 1
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_200_zero_retries(
         self,
         mock_get,
@@ -1127,7 +1325,7 @@ class TestRetryBackoff:
         mock_source,
         db_app,
     ):
-        """Happy path: 200 first try => exactly one call to requests.get
+        """Happy path: 200 first try => exactly one request
         and zero sleeps. Retry logic must not add overhead to the
         common case."""
         with db_app.app_context():
@@ -1139,7 +1337,7 @@ class TestRetryBackoff:
             assert mock_get.call_count == 1
             assert mock_sleep.call_count == 0
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_retry_after_header_honored(
         self,
         mock_get,
@@ -1198,9 +1396,9 @@ class TestRequestTimeoutConfig:
             db_app.config["SOURCE_RESOLVER_TIMEOUT"] = 25
             assert _get_request_timeout() == 25
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_scrape_passes_configured_timeout(self, mock_get, mock_source, db_app):
-        """The configured timeout flows through to ``requests.get``."""
+        """The configured timeout flows through to the scrape request."""
         with db_app.app_context():
             db_app.config["SOURCE_RESOLVER_TIMEOUT"] = 7
             mock_get.return_value = Mock(status_code=200, text="<html></html>")
@@ -1371,7 +1569,7 @@ class TestScraperFailureModes:
             db.session.commit()
 
             with patch(
-                "shuffify.services.source_resolver.public_scraper_pathway.requests.get"
+                "shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get"
             ) as mock_get:
                 pathway = PublicScraperPathway()
                 result = pathway.resolve(mock_source)
@@ -1385,7 +1583,7 @@ class TestScraperFailureModes:
 
     # -- Concurrent cache write idempotency ----------------------------
 
-    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.get")
+    @patch("shuffify.services.source_resolver.public_scraper_pathway.requests.Session.get")
     def test_set_cached_is_idempotent_for_same_playlist(
         self, mock_get, mock_source, db_app
     ):
@@ -1463,3 +1661,261 @@ class TestScraperFailureModes:
                 pathway="embed",
             )
             assert ScrapedPlaylistCache.query.count() == count_before + 1
+
+
+# ======================================================================
+# Tests: Hedged scraping
+# ======================================================================
+
+SCRAPER_MODULE = "shuffify.services.source_resolver.public_scraper_pathway"
+
+HEDGE_SETTINGS = {
+    "enabled": True,
+    "delay": 0.05,
+    "embed_success_below": 0.8,
+    "min_samples": 5,
+}
+
+
+def _tracks(*chars):
+    return [f"spotify:track:{c * 22}" for c in chars]
+
+
+@pytest.fixture
+def hedged(pathway):
+    """The pathway with hedging forced on and the database patched out."""
+    with (
+        patch(
+            f"{SCRAPER_MODULE}._get_hedge_settings",
+            return_value=dict(HEDGE_SETTINGS),
+        ) as settings,
+        patch.object(PublicScraperPathway, "_should_hedge", return_value=True),
+        patch.object(PublicScraperPathway, "_get_cached", return_value=None),
+        patch.object(
+            PublicScraperPathway, "_get_revalidation_state", return_value=None
+        ),
+        patch.object(PublicScraperPathway, "_set_cached") as set_cached,
+        patch.object(
+            PublicScraperPathway, "_record_strategy_outcomes"
+        ) as record,
+    ):
+        yield Mock(
+            pathway=pathway,
+            settings=settings,
+            set_cached=set_cached,
+            record=record,
+        )
+
+
+class TestHedgedScrape:
+    def test_public_page_wins_while_embed_is_slow(self, hedged, mock_source):
+        release = threading.Event()
+        cancels = []
+
+        def slow_embed(playlist_id, previous, timeout=None, cancel=None):
+            cancels.append(cancel)
+            release.wait(5)
+            return ScrapeOutcome(uris=_tracks("a"), confirmed=True)
+
+        public = Mock(return_value=ScrapeOutcome(uris=_tracks("b"), confirmed=True))
+        with (
+            patch.object(hedged.pathway, "_scrape_embed", side_effect=slow_embed),
+            patch.object(hedged.pathway, "_scrape_public_page", public),
+        ):
+            result = hedged.pathway.resolve(mock_source)
+        release.set()
+
+        assert result.success is True
+        assert result.track_uris == _tracks("b")
+        assert cancels[0].is_set()
+        hedged.set_cached.assert_called_once_with(
+            "pl_test123",
+            _tracks("b"),
+            "public_page",
+            etag=None,
+            last_modified=None,
+        )
+        # The cancelled embed has no result to learn from.
+        outcomes = hedged.record.call_args.args[1]
+        assert list(outcomes) == ["public_page"]
+
+    def test_fast_embed_never_starts_public_page(self, hedged, mock_source):
+        embed = Mock(return_value=ScrapeOutcome(uris=_tracks("a"), confirmed=True))
+        public = Mock()
+        with (
+            patch.object(hedged.pathway, "_scrape_embed", embed),
+            patch.object(hedged.pathway, "_scrape_public_page", public),
+        ):
+            result = hedged.pathway.resolve(mock_source)
+
+        assert result.track_uris == _tracks("a")
+        public.assert_not_called()
+
+    def test_failed_embed_starts_public_page_at_once(self, hedged, mock_source):
+        hedged.settings.return_value["delay"] = 30
+        embed = Mock(
+            return_value=ScrapeOutcome(uris=[], confirmed=False, error="HTTP 404")
+        )
+        public = Mock(return_value=ScrapeOutcome(uris=_tracks("b"), confirmed=True))
+        with (
+            patch.object(hedged.pathway, "_scrape_embed", embed),
+            patch.object(hedged.pathway, "_scrape_public_page", public),
+        ):
+            started = time.monotonic()
+            result = hedged.pathway.resolve(mock_source)
+
+        assert time.monotonic() - started < 5
+        assert result.track_uris == _tracks("b")
+        outcomes = hedged.record.call_args.args[1]
+        assert list(outcomes) == ["embed", "public_page"]
+
+    def test_both_fail_is_unconfirmed(self, hedged, mock_source):
+        embed = Mock(side_effect=RuntimeError("boom"))
+        public = Mock(
+            return_value=ScrapeOutcome(uris=[], confirmed=False, error="HTTP 503")
+        )
+        with (
+            patch.object(hedged.pathway, "_scrape_embed", embed),
+            patch.object(hedged.pathway, "_scrape_public_page", public),
+        ):
+            result = hedged.pathway.resolve(mock_source)
+
+        assert result.success is False
+        assert "RuntimeError: boom" in result.error_message
+        hedged.set_cached.assert_not_called()
+
+    def test_disabled_scrapes_in_turn_without_history(self, hedged, mock_source):
+        hedged.settings.return_value["enabled"] = False
+        embed = Mock(return_value=ScrapeOutcome(uris=_tracks("a"), confirmed=True))
+        with patch.object(hedged.pathway, "_scrape_embed", embed):
+            hedged.pathway.resolve(mock_source)
+
+        embed.assert_called_once_with("pl_test123", None)
+        PublicScraperPathway._should_hedge.assert_not_called()
+        hedged.record.assert_not_called()
+
+
+class TestHedgeCancellation:
+    @patch(f"{SCRAPER_MODULE}.requests.Session.get")
+    def test_cancelled_scrape_sends_nothing(self, mock_get, pathway):
+        cancel = threading.Event()
+        cancel.set()
+
+        outcome = pathway._scrape_public_page("pl_test123", cancel=cancel)
+
+        assert outcome.confirmed is False
+        assert outcome.error == "cancelled"
+        mock_get.assert_not_called()
+
+    def test_cancel_cuts_backoff_short(self):
+        from shuffify.services.source_resolver.public_scraper_pathway import (
+            _sleep_with_backoff,
+        )
+
+        cancel = threading.Event()
+        cancel.set()
+        started = time.monotonic()
+        _sleep_with_backoff(4, cancel=cancel)
+
+        assert time.monotonic() - started < 1
+
+
+class TestHedgePolicy:
+    """Per-playlist strategy history and the hedging decision."""
+
+    def _record(self, embed_ok, public_ok=None):
+        outcomes = {
+            "embed": ScrapeOutcome(
+                uris=_tracks("a") if embed_ok else [], confirmed=True
+            )
+        }
+        if public_ok is not None:
+            outcomes["public_page"] = ScrapeOutcome(
+                uris=_tracks("b") if public_ok else [], confirmed=True
+            )
+        PublicScraperPathway._record_strategy_outcomes("pl_test123", outcomes)
+
+    def test_no_history_scrapes_in_turn(self, db_app):
+        with db_app.app_context():
+            assert not PublicScraperPathway._should_hedge(
+                "pl_test123", HEDGE_SETTINGS
+            )
+
+    def test_unreliable_embed_is_hedged(self, db_app):
+        with db_app.app_context():
+            for _ in range(5):
+                self._record(embed_ok=False, public_ok=True)
+
+            assert PublicScraperPathway._should_hedge(
+                "pl_test123", HEDGE_SETTINGS
+            )
+
+    def test_needs_enough_samples(self, db_app):
+        with db_app.app_context():
+            for _ in range(4):
+                self._record(embed_ok=False, public_ok=True)
+
+            assert not PublicScraperPathway._should_hedge(
+                "pl_test123", HEDGE_SETTINGS
+            )
+
+    def test_public_page_must_do_better(self, db_app):
+        with db_app.app_context():
+            for _ in range(5):
+                self._record(embed_ok=False, public_ok=False)
+
+            assert not PublicScraperPathway._should_hedge(
+                "pl_test123", HEDGE_SETTINGS
+            )
+
+    def test_recovered_embed_stops_hedging(self, db_app):
+        with db_app.app_context():
+            for _ in range(5):
+                self._record(embed_ok=False, public_ok=True)
+            for _ in range(20):
+                self._record(embed_ok=True)
+
+            assert not PublicScraperPathway._should_hedge(
+                "pl_test123", HEDGE_SETTINGS
+            )
+
+    def test_rates_average_over_recent_window(self):
+        from shuffify.models.db import ScrapeStrategyStats
+
+        stats = ScrapeStrategyStats(playlist_id="pl")
+        for succeeded in (True, False, True, True):
+            stats.record("embed", succeeded)
+        assert stats.embed_samples == 4
+        assert stats.embed_success_rate == pytest.approx(0.75)
+
+        # Past the window, old results fade: one success after a long
+        # run of failures counts for about 1/WINDOW.
+        for _ in range(100):
+            stats.record("embed", False)
+        stats.record("embed", True)
+        assert stats.embed_success_rate == pytest.approx(1 / 20, abs=0.005)
+        assert not stats.public_page_samples
+
+    def test_resolve_records_history(self, db_app, mock_source):
+        from shuffify.models.db import ScrapeStrategyStats
+
+        with (
+            db_app.app_context(),
+            patch(
+                f"{SCRAPER_MODULE}.requests.Session.get",
+                side_effect=[
+                    Mock(status_code=404, text=""),
+                    Mock(status_code=200, text=LEGACY_URI_HTML),
+                ],
+            ),
+        ):
+            PublicScraperPathway().resolve(mock_source)
+
+            stats = ScrapeStrategyStats.query.filter_by(
+                playlist_id="pl_test123"
+            ).one()
+            assert (stats.embed_samples, stats.embed_success_rate) == (1, 0.0)
+            assert (
+                stats.public_page_samples,
+                stats.public_page_success_rate,
+            ) == (1, 1.0)
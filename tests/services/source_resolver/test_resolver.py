@@ -1,6 +1,7 @@
 """Tests for SourceResolver."""
 
-from unittest.mock import Mock
+import time
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -269,3 +270,167 @@ class TestDefaultPathways:
         resolver = SourceResolver()
         names = [p.name for p in resolver._pathways]
         assert "direct_api" in names
+
+
+class TestResolveAllConcurrent:
+    """Tests for the pooled mode of SourceResolver.resolve_all()."""
+
+    @staticmethod
+    def _pathway_by_source(delays, uris):
+        """A pathway whose latency and result depend on the source."""
+
+        class _Pathway:
+            name = "p1"
+
+            def can_handle(self, source):
+                return True
+
+            def resolve(self, source, api=None):
+                pid = source.source_playlist_id
+                time.sleep(delays.get(pid, 0))
+                return ResolveResult(
+                    track_uris=uris[pid], pathway_name="p1", success=True
+                )
+
+        return _Pathway()
+
+    def test_merges_in_source_order_not_finish_order(self, mock_api):
+        """The first source still wins a shared URI even if it finishes last."""
+        pathway = self._pathway_by_source(
+            delays={"slow": 0.2},
+            uris={
+                "slow": ["spotify:track:shared", "spotify:track:a"],
+                "fast": ["spotify:track:shared", "spotify:track:b"],
+            },
+        )
+        resolver = SourceResolver(pathways=[pathway])
+        sources = [_make_source(playlist_id="slow"),
+                   _make_source(playlist_id="fast")]
+
+        result = resolver.resolve_all(sources, api=mock_api, max_workers=2)
+
+        assert result.new_uris == [
+            "spotify:track:shared",
+            "spotify:track:a",
+            "spotify:track:b",
+        ]
+        assert [s.source_playlist_id for s, _ in result.source_results] == [
+            "slow", "fast",
+        ]
+
+    def test_sources_run_in_parallel(self, mock_api):
+        pathway = self._pathway_by_source(
+            delays={f"p{i}": 0.2 for i in range(4)},
+            uris={f"p{i}": [f"spotify:track:{i}"] for i in range(4)},
+        )
+        resolver = SourceResolver(pathways=[pathway])
+        sources = [_make_source(playlist_id=f"p{i}") for i in range(4)]
+
+        start = time.monotonic()
+        result = resolver.resolve_all(sources, api=mock_api, max_workers=4)
+
+        assert time.monotonic() - start < 0.6
+        assert len(result.new_uris) == 4
+
+    def test_source_deadline_fails_only_the_slow_source(self, mock_api):
+        pathway = self._pathway_by_source(
+            delays={"stuck": 2.0},
+            uris={"stuck": ["spotify:track:x"], "ok": ["spotify:track:y"]},
+        )
+        resolver = SourceResolver(pathways=[pathway])
+        sources = [_make_source(playlist_id="stuck"),
+                   _make_source(playlist_id="ok")]
+
+        start = time.monotonic()
+        result = resolver.resolve_all(
+            sources, api=mock_api, max_workers=2, source_deadline=0.2
+        )
+
+        assert time.monotonic() - start < 1.5
+        stuck, ok = (r for _, r in result.source_results)
+        assert stuck.success is False
+        assert stuck.pathway_name == "timeout"
+        assert "source deadline" in stuck.error_message
+        assert ok.success is True
+        assert result.new_uris == ["spotify:track:y"]
+
+    def test_job_deadline_abandons_queued_sources(self, mock_api):
+        pathway = self._pathway_by_source(
+            delays={"a": 2.0, "b": 2.0},
+            uris={"a": ["spotify:track:a"], "b": ["spotify:track:b"]},
+        )
+        resolver = SourceResolver(pathways=[pathway])
+        sources = [_make_source(playlist_id="a"),
+                   _make_source(playlist_id="b")]
+
+        start = time.monotonic()
+        result = resolver.resolve_all(
+            sources, api=mock_api, max_workers=2,
+            source_deadline=30, job_deadline=0.2,
+        )
+
+        assert time.monotonic() - start < 1.5
+        assert all(
+            r.pathway_name == "timeout" and "job deadline" in r.error_message
+            for _, r in result.source_results
+        )
+        assert result.new_uris == []
+
+    def test_pathway_exception_is_confined_to_its_source(self, mock_api):
+        good = ResolveResult(
+            track_uris=["spotify:track:a"], pathway_name="p1", success=True
+        )
+
+        def _resolve(source, api=None):
+            if source.source_playlist_id == "bad":
+                raise RuntimeError("boom")
+            return good
+
+        pathway = _make_pathway(name="p1")
+        pathway.resolve.side_effect = _resolve
+        resolver = SourceResolver(pathways=[pathway])
+        sources = [_make_source(playlist_id="bad"),
+                   _make_source(playlist_id="good")]
+
+        result = resolver.resolve_all(sources, api=mock_api, max_workers=2)
+
+        bad, ok = (r for _, r in result.source_results)
+        assert bad.success is False
+        assert bad.error_message == "boom"
+        assert ok.success is True
+
+    def test_single_worker_stays_sequential(self, mock_api):
+        pathway = _make_pathway(name="p1")
+        resolver = SourceResolver(pathways=[pathway])
+        sources = [_make_source(playlist_id="p1"),
+                   _make_source(playlist_id="p2")]
+
+        with patch(
+            "shuffify.services.source_resolver.resolver.ThreadPoolExecutor"
+        ) as pool_cls:
+            resolver.resolve_all(sources, api=mock_api, max_workers=1)
+
+        pool_cls.assert_not_called()
+
+    def test_workers_run_inside_the_app_context(self, app, mock_api):
+        seen = []
+
+        def _resolve(source, api=None):
+            from flask import current_app
+
+            seen.append(current_app.config["SOURCE_RESOLVER_MAX_WORKERS"])
+            return ResolveResult(
+                track_uris=[], pathway_name="p1", success=False
+            )
+
+        pathway = _make_pathway(name="p1")
+        pathway.resolve.side_effect = _resolve
+        resolver = SourceResolver(pathways=[pathway])
+        sources = [_make_source(playlist_id="p1"),
+                   _make_source(playlist_id="p2")]
+
+        with app.app_context():
+            app.config["SOURCE_RESOLVER_MAX_WORKERS"] = 3
+            resolver.resolve_all(sources, api=mock_api)
+
+        assert seen == [3, 3]
@@ -0,0 +1,282 @@
+"""Tests for the per-user AccessTokenCache."""
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+
+from shuffify.services.access_token_cache import AccessTokenCache
+from shuffify.services.token_service import TokenService
+from shuffify.spotify.auth import SpotifyAuthManager, TokenInfo
+
+# =========================================================================
+# Helpers
+# =========================================================================
+
+
+@pytest.fixture(autouse=True)
+def _token_service():
+    TokenService.reset()
+    TokenService.initialize("test-secret-key-for-unit-tests")
+    yield
+    TokenService.reset()
+
+
+def _token(access="access-1", lifetime=3600, refresh=None):
+    return TokenInfo(
+        access_token=access,
+        token_type="Bearer",
+        expires_at=time.time() + lifetime,
+        refresh_token=refresh,
+        scope="playlist-modify-public",
+    )
+
+
+# =========================================================================
+# Local backend
+# =========================================================================
+
+
+class TestLocalBackend:
+    """Entries kept in-process when Redis is absent."""
+
+    def test_round_trip_drops_refresh_token(self):
+        cache = AccessTokenCache()
+        cache.put("user-1", _token(refresh="secret-refresh"))
+
+        cached = cache.get("user-1")
+        assert cached.access_token == "access-1"
+        assert cached.scope == "playlist-modify-public"
+        assert cached.refresh_token is None
+        assert cache.backend == "local"
+
+    def test_miss_for_unknown_user(self):
+        assert AccessTokenCache().get("nobody") is None
+
+    def test_token_inside_refresh_margin_is_not_stored(self):
+        cache = AccessTokenCache(refresh_margin=120)
+        cache.put("user-1", _token(lifetime=60))
+        assert cache.get("user-1") is None
+
+    def test_entry_expires_at_refresh_margin(self):
+        now = [1_000_000.0]
+        cache = AccessTokenCache(refresh_margin=120, clock=lambda: now[0])
+        cache.put(
+            "user-1",
+            TokenInfo("a", "Bearer", now[0] + 600),
+        )
+        now[0] += 479
+        assert cache.get("user-1") is not None
+        now[0] += 2
+        assert cache.get("user-1") is None
+
+    def test_invalidate(self):
+        cache = AccessTokenCache()
+        cache.put("user-1", _token())
+        cache.invalidate("user-1")
+        assert cache.get("user-1") is None
+
+    def test_entries_are_encrypted(self):
+        cache = AccessTokenCache()
+        cache.put("user-1", _token(access="bearer-in-the-clear"))
+        blob, _ = cache._local["user-1"]
+        assert "bearer-in-the-clear" not in blob
+
+    def test_unreadable_entry_is_a_miss(self):
+        cache = AccessTokenCache()
+        cache.put("user-1", _token())
+        TokenService.reset()
+        TokenService.initialize("a-different-secret-key")
+        assert cache.get("user-1") is None
+
+    def test_state_is_rebuilt_after_fork(self, monkeypatch):
+        cache = AccessTokenCache()
+        cache.put("user-1", _token())
+        child_pid = os.getpid() + 1
+        monkeypatch.setattr(
+            "shuffify.services.access_token_cache.os.getpid", lambda: child_pid
+        )
+        assert cache.get("user-1") is None
+
+
+# =========================================================================
+# Single-flight refresh
+# =========================================================================
+
+
+class TestGetOrRefresh:
+    """One refresh per user, however many callers arrive together."""
+
+    def test_hit_skips_refresh(self):
+        cache = AccessTokenCache()
+        cache.put("user-1", _token())
+        refresh = MagicMock()
+
+        assert cache.get_or_refresh("user-1", refresh).access_token == "access-1"
+        refresh.assert_not_called()
+
+    def test_miss_refreshes_and_stores(self):
+        cache = AccessTokenCache()
+        refreshed = _token(access="fresh", refresh="rotated")
+
+        result = cache.get_or_refresh("user-1", lambda: refreshed)
+
+        assert result is refreshed
+        assert cache.get("user-1").access_token == "fresh"
+        assert cache.metrics()["refreshes"] == 1
+
+    def test_concurrent_callers_refresh_once(self):
+        cache = AccessTokenCache()
+        calls = []
+        start = threading.Barrier(8)
+
+        def slow_refresh():
+            calls.append(1)
+            time.sleep(0.05)
+            return _token(access="fresh")
+
+        results = []
+
+        def worker():
+            start.wait()
+            results.append(cache.get_or_refresh("user-1", slow_refresh))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert len(calls) == 1
+        assert [r.access_token for r in results] == ["fresh"] * 8
+
+    def test_failed_refresh_propagates_and_next_caller_retries(self):
+        cache = AccessTokenCache()
+        failing = MagicMock(side_effect=RuntimeError("accounts down"))
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_refresh("user-1", failing)
+
+        assert cache.get_or_refresh("user-1", _token).access_token == "access-1"
+
+
+class TestRejectedToken:
+    """A cached token Spotify answers 401 to is dropped and replaced."""
+
+    def _api(self, cache, auth_manager):
+        from shuffify.spotify.api import SpotifyAPI
+
+        with patch("shuffify.spotify.api.SpotifyHTTPClient", autospec=True):
+            return SpotifyAPI(
+                cache.get_or_refresh("user-1", _token),
+                auth_manager,
+                on_token_refresh=lambda t: cache.put("user-1", t),
+                on_token_rejected=lambda _t: cache.invalidate("user-1"),
+            )
+
+    def test_401_replaces_the_cached_token(self):
+        cache = AccessTokenCache()
+        auth_manager = MagicMock(spec=SpotifyAuthManager)
+        auth_manager.refresh_token.return_value = _token("access-2")
+        api = self._api(cache, auth_manager)
+
+        assert api._handle_token_refresh() == "access-2"
+
+        # The token was still inside its lifetime: only the 401 refreshed it.
+        auth_manager.refresh_token.assert_called_once()
+        assert cache.get("user-1").access_token == "access-2"
+
+    def test_failed_refresh_still_drops_the_rejected_token(self):
+        cache = AccessTokenCache()
+        auth_manager = MagicMock(spec=SpotifyAuthManager)
+        auth_manager.refresh_token.side_effect = RuntimeError("revoked")
+        api = self._api(cache, auth_manager)
+
+        with pytest.raises(RuntimeError):
+            api._handle_token_refresh()
+
+        assert cache.get("user-1") is None
+
+
+# =========================================================================
+# Redis backend
+# =========================================================================
+
+
+class TestRedisBackend:
+    """Entries are shared through Redis; errors fall back to local."""
+
+    def test_put_sets_ttl_to_margin(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        now = [1_000_000.0]
+        cache = AccessTokenCache(
+            fake_redis, refresh_margin=120, clock=lambda: now[0]
+        )
+        cache.put(
+            "user-1",
+            TokenInfo("bearer-in-the-clear", "Bearer", now[0] + 3600),
+        )
+
+        key, ttl, blob = fake_redis.setex.call_args.args
+        assert key == "shuffify:access_token:user-1"
+        assert ttl == 3480
+        assert "bearer-in-the-clear" not in blob
+
+    def test_get_reads_shared_entry(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        writer = AccessTokenCache(fake_redis)
+        writer.put("user-1", _token(access="from-other-worker"))
+        blob = fake_redis.setex.call_args.args[2]
+        fake_redis.get.return_value = blob.encode("utf-8")
+
+        reader = AccessTokenCache(fake_redis)
+        assert reader.get("user-1").access_token == "from-other-worker"
+
+    def test_shared_delete_wins_over_local_copy(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        fake_redis.get.return_value = None
+        cache = AccessTokenCache(fake_redis)
+        cache.put("user-1", _token())
+        assert cache.get("user-1") is None
+
+    def test_redis_error_falls_back_to_local(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        fake_redis.get.side_effect = redis.ConnectionError("down")
+        cache = AccessTokenCache(fake_redis)
+        cache.put("user-1", _token())
+        assert cache.get("user-1").access_token == "access-1"
+
+    def test_refresh_takes_and_releases_shared_lock(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        fake_redis.get.return_value = None
+        fake_redis.set.return_value = True
+        cache = AccessTokenCache(fake_redis)
+
+        cache.get_or_refresh("user-1", _token)
+
+        lock_key = fake_redis.set.call_args.args[0]
+        assert lock_key == "shuffify:access_token:user-1:lock"
+        assert fake_redis.set.call_args.kwargs["nx"] is True
+        assert fake_redis.eval.call_args.args[2] == lock_key
+
+    def test_waiter_uses_token_published_by_lock_holder(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        publisher = AccessTokenCache(fake_redis)
+        publisher.put("user-1", _token(access="from-holder"))
+        blob = fake_redis.setex.call_args.args[2].encode("utf-8")
+
+        # Missing until the other process finishes, then present.
+        fake_redis.get.side_effect = [None, None, blob]
+        fake_redis.set.return_value = False
+        fake_redis.exists.return_value = 1
+        cache = AccessTokenCache(fake_redis, sleep=lambda _s: None)
+        refresh = MagicMock()
+
+        result = cache.get_or_refresh("user-1", refresh)
+
+        assert result.access_token == "from-holder"
+        refresh.assert_not_called()
+        fake_redis.eval.assert_not_called()
@@ -403,3 +403,63 @@ class TestAuthServiceTokenRefreshPersistence:
         # Construction succeeded and carries the refreshed token: the callback
         # no-opped outside the request context instead of raising.
         assert api.token_info.access_token == "refreshed_access"
+
+    def test_expired_session_token_reuses_cached_access_token(self, app):
+        """A token a scheduled job already refreshed is reused instead of
+        refreshing again; the session keeps its refresh token."""
+        import time
+
+        from flask import session
+
+        from shuffify.services.access_token_cache import AccessTokenCache
+        from shuffify.spotify.auth import SpotifyAuthManager, TokenInfo
+        from shuffify.spotify.credentials import SpotifyCredentials
+
+        token_cache = Mock(spec=AccessTokenCache)
+        token_cache.refresh_margin = 120
+        token_cache.get.return_value = TokenInfo(
+            access_token="cached_access",
+            token_type="Bearer",
+            expires_at=time.time() + 3000,
+        )
+
+        with app.test_request_context():
+            session["spotify_token"] = self._expired_token()
+            session["user_data"] = {"id": "user123"}
+
+            with patch(
+                "shuffify.spotify.api.SpotifyHTTPClient", autospec=True
+            ), patch.object(
+                SpotifyCredentials,
+                "from_flask_config",
+                return_value=self._test_credentials(),
+            ), patch(
+                "shuffify.get_access_token_cache", return_value=token_cache
+            ), patch.object(
+                SpotifyAuthManager, "refresh_token"
+            ) as mock_refresh:
+                api = AuthService.get_authenticated_api(session["spotify_token"])
+
+            token_cache.get.assert_called_once_with("user123")
+            mock_refresh.assert_not_called()
+            assert api.token_info.access_token == "cached_access"
+            assert session["spotify_token"]["access_token"] == "cached_access"
+            assert session["spotify_token"]["refresh_token"] == "test_refresh_token"
+
+    def test_refreshed_session_token_is_published_to_cache(self, app):
+        """A refresh during a web request is shared with the user's jobs."""
+        from flask import session
+
+        from shuffify.services.access_token_cache import AccessTokenCache
+
+        token_cache = Mock(spec=AccessTokenCache)
+        refreshed = self._refreshed_token_info()
+
+        with app.test_request_context():
+            session["user_data"] = {"id": "user123"}
+            with patch(
+                "shuffify.get_access_token_cache", return_value=token_cache
+            ):
+                AuthService._persist_token_to_session(refreshed)
+
+        token_cache.put.assert_called_once_with("user123", refreshed)
@@ -78,6 +78,11 @@ def schedule(user):
 def mock_api():
     """Mock SpotifyAPI."""
     api = MagicMock(spec=SpotifyAPI)
+    # Post-write verification reads URIs only; it sees whatever
+    # get_playlist_tracks is stubbed to return.
+    api.get_playlist_uris.side_effect = lambda pid: [
+        t["uri"] for t in api.get_playlist_tracks(pid, skip_cache=True) if t.get("uri")
+    ]
     return api
 
 
@@ -147,7 +152,7 @@ class TestExecuteDrip:
             "target_drip": ["spotify:track:existing"],
         }
 
-        def get_tracks_side_effect(pid, skip_cache=False):
+        def get_tracks_side_effect(pid, skip_cache=False, fields=None):
             return [
                 {"uri": u} for u in state.get(pid, [])
             ]
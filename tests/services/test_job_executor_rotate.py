@@ -95,7 +95,7 @@ def _make_api(
     target_fetch_count = {"n": 0}
     forced_post = post_removal_prod  # may be None
 
-    def get_tracks(playlist_id, skip_cache=False):
+    def get_tracks(playlist_id, skip_cache=False, fields=None):
         if playlist_id == "target1":
             target_fetch_count["n"] += 1
             if forced_post is not None and target_fetch_count["n"] >= 2:
@@ -126,6 +126,11 @@ def _make_api(
         return True
 
     api.get_playlist_tracks = MagicMock(side_effect=get_tracks)
+    # Verification reads URIs only; route it through get_tracks so the
+    # forced post-write state and the fetch count apply to it too.
+    api.get_playlist_uris = MagicMock(
+        side_effect=lambda pid: [t["uri"] for t in get_tracks(pid, skip_cache=True)]
+    )
     api.playlist_remove_items = MagicMock(side_effect=remove_items)
     api.playlist_add_items = MagicMock(side_effect=add_items)
     api._state = state
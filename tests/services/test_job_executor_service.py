@@ -4,6 +4,7 @@ Tests for JobExecutorService.
 Tests the job execution logic with mocked Spotify API calls.
 """
 
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -69,6 +70,15 @@ def mock_api():
         }
         for i in range(1, 6)
     ]
+    # The batch read (raid dedupe) follows whatever get_playlist_tracks
+    # is stubbed to return, so tests only stub the single-playlist read.
+    api.get_many_playlist_tracks.side_effect = lambda ids, fields=None: {
+        pid: api.get_playlist_tracks(pid) for pid in ids
+    }
+    # Likewise post-write verification, which reads URIs only.
+    api.get_playlist_uris.side_effect = lambda pid: [
+        t["uri"] for t in api.get_playlist_tracks(pid, skip_cache=True) if t.get("uri")
+    ]
     api.update_playlist_tracks.return_value = True
     api.playlist_add_items.return_value = None
     api.get_tracks.return_value = []
@@ -457,6 +467,38 @@ class TestExecuteRaidForUser:
 
         assert Schedule.query.count() == 0
 
+    def test_unchanged_raid_is_recorded_as_unchanged(self):
+        """A raid that found nothing changed upstream is its own status in
+        execution history, not a success."""
+        from shuffify.models.db import JobExecution, User, db
+
+        user = User(spotify_id="idle_raider", display_name="I")
+        db.session.add(user)
+        db.session.commit()
+
+        with patch(
+            "shuffify.services.executors.base_executor."
+            "JobExecutorService._get_spotify_api",
+            return_value=Mock(),
+        ), patch(
+            "shuffify.services.executors.base_executor."
+            "JobExecutorService._execute_job_type",
+            return_value={
+                "tracks_added": 0,
+                "tracks_total": 10,
+                "unchanged": True,
+            },
+        ):
+            result = JobExecutorService.execute_raid_for_user(
+                user_id=user.id,
+                target_playlist_id="tgt_idle",
+            )
+
+        assert result["status"] == "unchanged"
+        exec_row = JobExecution.query.filter_by(schedule_id=None).one()
+        assert exec_row.status == "unchanged"
+        assert exec_row.tracks_total == 10
+
 
 class TestExecuteDripForUser:
     """Inline (schedule-less) drips run through the executor rails instead of
@@ -568,11 +610,11 @@ class TestExecuteShuffle:
         original = mock_api.get_playlist_tracks.return_value
         written = {}
 
-        def _update(pid, uris):
+        def _update(pid, uris, **kwargs):
             written["uris"] = list(uris)
             return True
 
-        def _get(pid, skip_cache=False):
+        def _get(pid, skip_cache=False, fields=None):
             # Real Spotify returns tracks in the order they were written;
             # echo the write on the verification re-fetch (SR-007).
             if skip_cache and written.get("uris"):
@@ -631,11 +673,11 @@ class TestExecuteShuffle:
         original = mock_api.get_playlist_tracks.return_value
         written = {}
 
-        def _update(pid, uris):
+        def _update(pid, uris, **kwargs):
             written["uris"] = list(uris)
             return True
 
-        def _get(pid, skip_cache=False):
+        def _get(pid, skip_cache=False, fields=None):
             # Verification re-fetch: simulate a write that landed reversed
             # (same multiset, wrong order).
             if skip_cache and written.get("uris"):
@@ -736,6 +778,66 @@ class TestGetSpotifyApi:
 
         assert mock_api_class.call_args.kwargs["cache"] is sentinel
 
+    @patch("shuffify.get_access_token_cache")
+    @patch(
+        "shuffify.services.executors.base_executor.TokenService"
+    )
+    @patch(
+        "shuffify.services.executors.base_executor.SpotifyAPI",
+        autospec=True,
+    )
+    @patch(
+        "shuffify.services.executors.base_executor"
+        ".SpotifyAuthManager"
+    )
+    @patch(
+        "shuffify.services.executors.base_executor"
+        ".SpotifyCredentials"
+    )
+    def test_reuses_cached_access_token(
+        self,
+        mock_creds,
+        mock_auth,
+        mock_api_class,
+        mock_token_svc,
+        mock_get_token_cache,
+        mock_user,
+        app_context,
+    ):
+        """A cached access token is handed to SpotifyAPI with the stored
+        refresh token, and later refreshes are published back."""
+        from shuffify.services.access_token_cache import AccessTokenCache
+        from shuffify.spotify.auth import TokenInfo
+
+        mock_token_svc.decrypt_token.return_value = "decrypted_refresh"
+        mock_api_instance = Mock()
+        mock_api_instance.token_info.refresh_token = "decrypted_refresh"
+        mock_api_class.return_value = mock_api_instance
+        token_cache = Mock(spec=AccessTokenCache)
+        token_cache.get_or_refresh.return_value = TokenInfo(
+            access_token="cached_access",
+            token_type="Bearer",
+            expires_at=time.time() + 3000,
+        )
+        mock_get_token_cache.return_value = token_cache
+
+        JobExecutorService._get_spotify_api(mock_user)
+
+        assert token_cache.get_or_refresh.call_args.args[0] == "test_user"
+        token_info = mock_api_class.call_args.args[0]
+        assert token_info.access_token == "cached_access"
+        assert token_info.refresh_token == "decrypted_refresh"
+        mock_auth.return_value.refresh_token.assert_not_called()
+
+        on_refresh = mock_api_class.call_args.kwargs["on_token_refresh"]
+        refreshed = Mock()
+        on_refresh(refreshed)
+        token_cache.put.assert_called_once_with("test_user", refreshed)
+
+        on_rejected = mock_api_class.call_args.kwargs["on_token_rejected"]
+        on_rejected(Mock())
+        token_cache.invalidate.assert_called_once_with("test_user")
+
     def test_no_refresh_token_raises(self, mock_user):
         """Should raise when user has no stored token."""
         mock_user.encrypted_refresh_token = None
@@ -251,7 +251,7 @@ class TestPlaylistServiceUpdatePlaylistTracks:
 
         assert result is True
         mock_spotify_api.update_playlist_tracks.assert_called_once_with(
-            'playlist123', sample_track_uris
+            'playlist123', sample_track_uris, current_uris=None
         )
 
     def test_update_playlist_tracks_empty_list(self, mock_spotify_api):
@@ -261,7 +261,9 @@ class TestPlaylistServiceUpdatePlaylistTracks:
         result = service.update_playlist_tracks('playlist123', [])
 
         assert result is True
-        mock_spotify_api.update_playlist_tracks.assert_called_once_with('playlist123', [])
+        mock_spotify_api.update_playlist_tracks.assert_called_once_with(
+            'playlist123', [], current_uris=None
+        )
 
     def test_update_playlist_tracks_empty_id(self, mock_spotify_api, sample_track_uris):
         """Should raise PlaylistUpdateError for empty ID."""
@@ -36,8 +36,17 @@ def user(db_app):
 
 @pytest.fixture
 def mock_api():
-    """Mock SpotifyAPI."""
+    """Mock SpotifyAPI.
+
+    The batch read delegates to ``get_playlist_tracks`` so each test can
+    stub one method and cover both paths. The URI index is off unless a
+    test turns it on.
+    """
     api = MagicMock(spec=SpotifyAPI)
+    api.get_indexed_playlist_uris.return_value = None
+    api.get_many_playlist_tracks.side_effect = lambda ids, fields=None: {
+        pid: api.get_playlist_tracks(pid, fields=fields) for pid in ids
+    }
     return api
 
 
@@ -64,7 +73,7 @@ class TestBuildFullExclusionSet:
         db.session.add(link)
         db.session.commit()
 
-        def get_tracks(pid):
+        def get_tracks(pid, fields=None):
             if pid == "target2":
                 return [{"uri": "spotify:track:t1"}]
             if pid == "raid2":
@@ -86,7 +95,7 @@ class TestBuildFullExclusionSet:
         db.session.add(pair)
         db.session.commit()
 
-        def get_tracks(pid):
+        def get_tracks(pid, fields=None):
             if pid == "target3":
                 return [{"uri": "spotify:track:t1"}]
             if pid == "archive3":
@@ -143,7 +152,7 @@ class TestBuildFullExclusionSet:
         db.session.add(dismissed)
         db.session.commit()
 
-        def get_tracks(pid):
+        def get_tracks(pid, fields=None):
             if pid == "target5":
                 return [{"uri": "spotify:track:t1"}]
             if pid == "raid5":
@@ -161,6 +170,67 @@ class TestBuildFullExclusionSet:
         assert "spotify:track:d1" in result
         assert len(result) == 4
 
+    def test_reads_chain_in_one_batch(self, user, mock_api):
+        """Target, raid and archive tracks come from one batch call."""
+        db.session.add(
+            RaidPlaylistLink(
+                user_id=user.id,
+                target_playlist_id="target6",
+                raid_playlist_id="raid6",
+            )
+        )
+        db.session.add(
+            PlaylistPair(
+                user_id=user.id,
+                production_playlist_id="target6",
+                archive_playlist_id="archive6",
+            )
+        )
+        db.session.commit()
+        mock_api.get_many_playlist_tracks.side_effect = None
+        mock_api.get_many_playlist_tracks.return_value = {
+            "target6": [{"uri": "spotify:track:t1"}, {"uri": "spotify:track:t2"}],
+            "raid6": [{"uri": "spotify:track:r1"}],
+            "archive6": [{"uri": "spotify:track:a1"}],
+        }
+
+        result, count = build_full_exclusion_set(mock_api, "target6", user.id)
+
+        mock_api.get_many_playlist_tracks.assert_called_once_with(
+            ["target6", "raid6", "archive6"], fields="uris_only"
+        )
+        mock_api.get_playlist_tracks.assert_not_called()
+        assert result == {
+            "spotify:track:t1",
+            "spotify:track:t2",
+            "spotify:track:r1",
+            "spotify:track:a1",
+        }
+        assert count == 2
+
+    def test_batch_failure_falls_back_per_playlist(self, user, mock_api):
+        """One unreadable playlist only drops its own tracks."""
+        db.session.add(
+            RaidPlaylistLink(
+                user_id=user.id,
+                target_playlist_id="target7",
+                raid_playlist_id="raid7",
+            )
+        )
+        db.session.commit()
+
+        def get_tracks(pid, fields=None):
+            if pid == "raid7":
+                raise Exception("raid playlist deleted")
+            return [{"uri": "spotify:track:t1"}]
+
+        mock_api.get_playlist_tracks.side_effect = get_tracks
+
+        result, count = build_full_exclusion_set(mock_api, "target7", user.id)
+
+        assert result == {"spotify:track:t1"}
+        assert count == 1
+
     def test_handles_api_errors_gracefully(self, user, mock_api):
         """API errors should not crash, just return
         partial results."""
@@ -171,6 +241,60 @@ class TestBuildFullExclusionSet:
         assert isinstance(result, set)
 
 
+class TestUriIndex:
+    """The chain comes from the URI index when it answers."""
+
+    def test_uses_index_union(self, user, mock_api):
+        pair = PlaylistPair(
+            user_id=user.id,
+            production_playlist_id="target_ix",
+            archive_playlist_id="archive_ix",
+        )
+        db.session.add(pair)
+        db.session.add(
+            PendingRaidTrack(
+                user_id=user.id,
+                target_playlist_id="target_ix",
+                track_uri="spotify:track:d1",
+                track_name="Dismissed",
+                status=PendingRaidStatus.DISMISSED,
+            )
+        )
+        db.session.commit()
+        mock_api.get_indexed_playlist_uris.return_value = (
+            {"spotify:track:t1", "spotify:track:a1"},
+            {"target_ix": 7, "archive_ix": 1},
+        )
+
+        result, count = build_full_exclusion_set(
+            mock_api, "target_ix", user.id
+        )
+
+        assert result == {
+            "spotify:track:t1",
+            "spotify:track:a1",
+            "spotify:track:d1",
+        }
+        assert count == 7
+        mock_api.get_indexed_playlist_uris.assert_called_once_with(
+            ["target_ix", "archive_ix"]
+        )
+        mock_api.get_many_playlist_tracks.assert_not_called()
+
+    def test_index_failure_falls_back_to_reads(self, user, mock_api):
+        mock_api.get_indexed_playlist_uris.side_effect = Exception("down")
+        mock_api.get_playlist_tracks.return_value = [
+            {"uri": "spotify:track:t1"},
+        ]
+
+        result, count = build_full_exclusion_set(
+            mock_api, "target_fb", user.id
+        )
+
+        assert result == {"spotify:track:t1"}
+        assert count == 1
+
+
 class TestRollbackOnDbFailure:
     """Verify db.session.rollback() is called when DB queries fail."""
 
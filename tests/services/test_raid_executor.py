@@ -17,6 +17,7 @@ from shuffify.models.db import UpstreamSource
 from shuffify.services.executors.raid_executor import (
     _fetch_raid_sources_with_limits,
 )
+from shuffify.services.executors.working_set import PlaylistWorkingSet
 from shuffify.services.source_resolver.base import (
     ResolveAllResult,
     ResolveResult,
@@ -273,17 +274,14 @@ class TestAddToRaidPlaylistSnapshot:
             ), patch(
                 "shuffify.services.executors.raid_executor."
                 "PlaylistSnapshotService"
-            ) as mock_snap, patch(
-                "shuffify.services.executors.raid_executor."
-                "verify_playlist_state"
-            ):
+            ) as mock_snap:
                 mock_snap.is_auto_snapshot_enabled.return_value = True
                 _add_to_raid_playlist(
-                    api,
+                    PlaylistWorkingSet(api, 1),
                     user_id=1,
                     target_id="tgt",
                     uris=["spotify:track:new"],
-                    schedule_id=1,
+                    verify=False,
                 )
 
         mock_snap.auto_snapshot_if_enabled.assert_called_once()
@@ -328,3 +326,217 @@ class TestFetchProvenance:
         assert provenance["spotify:track:b"] == (
             "Cool Source", "src1",
         )
+
+
+class TestSourceChangeDetection:
+    """A raid probes each source's upstream version first and skips the
+    resolve (and the exclusion-set reads) for sources that can't offer
+    anything new."""
+
+    @pytest.fixture
+    def raid(self, db_app):
+        """A persisted playlist source, a schedule for its target and a
+        Spotify mock whose probe reports ``snap-1``."""
+        from shuffify.models.db import db
+        from shuffify.services.user_service import UserService
+
+        with db_app.app_context():
+            uid = UserService.upsert_from_spotify(
+                {"id": "probe_user", "display_name": "P", "images": []}
+            ).user.id
+            source = UpstreamSource(
+                user_id=uid,
+                target_playlist_id="tgt",
+                source_playlist_id="src1",
+                source_type="external",
+                raid_count=5,
+            )
+            db.session.add(source)
+            db.session.commit()
+
+            schedule = MagicMock(
+                id=1,
+                user_id=uid,
+                target_playlist_id="tgt",
+                target_playlist_name="Target",
+                source_playlist_ids=[],
+            )
+            api = MagicMock(spec=SpotifyAPI)
+            api.get_playlist_snapshot_id.return_value = "snap-1"
+            api.get_playlist_tracks.return_value = [
+                {"uri": "spotify:track:t"}
+            ]
+            api.get_tracks.return_value = []
+
+            with patch(
+                "shuffify.services.executors.raid_executor.SourceResolver"
+            ) as resolver_cls, patch(
+                "shuffify.services.executors.raid_executor."
+                "build_full_exclusion_set",
+                return_value=({"spotify:track:t"}, 1),
+            ) as exclusion, patch(
+                "shuffify.services.executors.raid_executor."
+                "_auto_snapshot_before_raid"
+            ), patch(
+                "shuffify.services.executors.raid_executor."
+                "_add_to_raid_playlist"
+            ), patch(
+                "shuffify.services.executors.raid_executor."
+                "PendingRaidService"
+            ) as pending:
+                pending.stage_tracks.side_effect = (
+                    lambda **kw: len(kw["tracks"])
+                )
+                yield {
+                    "source": source,
+                    "schedule": schedule,
+                    "api": api,
+                    "resolver": resolver_cls.return_value,
+                    "exclusion": exclusion,
+                }
+
+    @staticmethod
+    def _resolves_to(raid, uris, pathway="direct_api"):
+        raid["resolver"].resolve_all.side_effect = (
+            lambda sources, api, exclude_uris: ResolveAllResult(
+                new_uris=list(uris),
+                source_results=[
+                    (
+                        s,
+                        ResolveResult(
+                            track_uris=list(uris),
+                            pathway_name=pathway,
+                            success=True,
+                        ),
+                    )
+                    for s in sources
+                ],
+            )
+        )
+
+    def test_first_run_records_version_and_fresh_count(self, raid):
+        from shuffify.services.executors.raid_executor import execute_raid
+
+        self._resolves_to(raid, ["spotify:track:t", "spotify:track:n"])
+
+        result = execute_raid(raid["schedule"], raid["api"])
+
+        assert result["tracks_added"] == 1
+        assert "unchanged" not in result
+        assert raid["source"].last_content_version == "snap-1"
+        assert raid["source"].last_fresh_count == 0
+
+    def test_fresh_count_is_what_sampling_left_over(self, raid):
+        from shuffify.services.executors.raid_executor import execute_raid
+
+        raid["source"].raid_count = 2
+        self._resolves_to(
+            raid, [f"spotify:track:n{i}" for i in range(5)]
+        )
+
+        execute_raid(raid["schedule"], raid["api"])
+
+        assert raid["source"].last_fresh_count == 3
+
+    def test_source_drained_last_run_is_skipped_next_run(self, raid):
+        """Every fresh track fit under raid_count, so the same snapshot
+        has nothing left to give."""
+        from shuffify.services.executors.raid_executor import execute_raid
+
+        self._resolves_to(
+            raid, [f"spotify:track:n{i}" for i in range(3)]
+        )
+        execute_raid(raid["schedule"], raid["api"])
+
+        result = execute_raid(raid["schedule"], raid["api"])
+
+        assert result["unchanged"] is True
+        raid["resolver"].resolve_all.assert_called_once()
+
+    def test_unchanged_source_is_not_resolved(self, raid):
+        from shuffify.services.executors.raid_executor import execute_raid
+
+        source = raid["source"]
+        source.last_content_version = "snap-1"
+        source.last_resolve_status = "success"
+        source.last_fresh_count = 0
+
+        result = execute_raid(raid["schedule"], raid["api"])
+
+        assert result == {
+            "tracks_added": 0,
+            "tracks_total": 1,
+            "unchanged": True,
+        }
+        raid["resolver"].resolve_all.assert_not_called()
+        raid["exclusion"].assert_not_called()
+
+    def test_new_snapshot_is_resolved(self, raid):
+        from shuffify.services.executors.raid_executor import execute_raid
+
+        source = raid["source"]
+        source.last_content_version = "snap-0"
+        source.last_resolve_status = "success"
+        source.last_fresh_count = 0
+        self._resolves_to(raid, ["spotify:track:t"])
+
+        result = execute_raid(raid["schedule"], raid["api"])
+
+        assert "unchanged" not in result
+        raid["resolver"].resolve_all.assert_called_once()
+        assert source.last_content_version == "snap-1"
+
+    def test_leftover_fresh_tracks_keep_source_in_play(self, raid):
+        """raid_count capped last run, so the same snapshot still has
+        tracks to give."""
+        from shuffify.services.executors.raid_executor import execute_raid
+
+        source = raid["source"]
+        source.last_content_version = "snap-1"
+        source.last_resolve_status = "success"
+        source.last_fresh_count = 12
+        self._resolves_to(raid, ["spotify:track:n"])
+
+        result = execute_raid(raid["schedule"], raid["api"])
+
+        assert result["tracks_added"] == 1
+        raid["resolver"].resolve_all.assert_called_once()
+
+    def test_scraped_source_falls_back_to_content_hash(self, raid):
+        from shuffify.services.executors.raid_executor import execute_raid
+        from shuffify.services.source_resolver.base import content_hash
+        from shuffify.spotify.exceptions import SpotifyAPIError
+
+        raid["api"].get_playlist_snapshot_id.side_effect = (
+            SpotifyAPIError("forbidden")
+        )
+        uris = ["spotify:track:t"]
+        self._resolves_to(raid, uris, pathway="public_scraper")
+        execute_raid(raid["schedule"], raid["api"])
+        source = raid["source"]
+        assert source.last_content_version == content_hash(uris)
+
+        with patch(
+            "shuffify.services.executors.raid_executor."
+            "PublicScraperPathway.cached_content_hash",
+            return_value=content_hash(uris),
+        ):
+            result = execute_raid(raid["schedule"], raid["api"])
+
+        assert result["unchanged"] is True
+        raid["resolver"].resolve_all.assert_called_once()
+
+    def test_disabled_by_config(self, raid, db_app):
+        from shuffify.services.executors.raid_executor import execute_raid
+
+        source = raid["source"]
+        source.last_content_version = "snap-1"
+        source.last_resolve_status = "success"
+        source.last_fresh_count = 0
+        self._resolves_to(raid, ["spotify:track:t"])
+        db_app.config["RAID_SKIP_UNCHANGED_SOURCES"] = False
+
+        execute_raid(raid["schedule"], raid["api"])
+
+        raid["api"].get_playlist_snapshot_id.assert_not_called()
+        raid["resolver"].resolve_all.assert_called_once()
@@ -7,8 +7,7 @@ Covers:
   - Count drift raises with structured missing/extra
   - URI substitution (same count, wrong members) raises
   - Duplicates honored — multiset semantics, not set
-  - Paginated re-fetch via mocked api.get_playlist_tracks
-  - skip_cache=True is forwarded to the API call
+  - Live re-fetch via api.get_playlist_uris, never the track cache
   - Empty expected + empty actual is a clean pass
   - exception attributes carry playlist_id / phase / schedule_id
 """
@@ -24,16 +23,10 @@ from shuffify.services.executors import (
 from shuffify.spotify.api import SpotifyAPI
 
 
-def _tracks(uris):
-    return [{"uri": u, "name": u} for u in uris]
-
-
 class TestVerifyPlaylistStateMatch:
     def test_exact_match_returns_actual_uris(self):
         api = MagicMock()
-        api.get_playlist_tracks.return_value = _tracks(
-            ["u1", "u2", "u3"]
-        )
+        api.get_playlist_uris.return_value = ["u1", "u2", "u3"]
 
         result = verify_playlist_state(
             api, "p1", ["u1", "u2", "u3"], 42, "test",
@@ -43,7 +36,7 @@ class TestVerifyPlaylistStateMatch:
 
     def test_empty_expected_and_actual_passes(self):
         api = MagicMock()
-        api.get_playlist_tracks.return_value = []
+        api.get_playlist_uris.return_value = []
 
         result = verify_playlist_state(
             api, "p1", [], 42, "empty",
@@ -54,36 +47,31 @@ class TestVerifyPlaylistStateMatch:
     def test_order_does_not_matter_for_match(self):
         """Multiset compare ignores order."""
         api = MagicMock()
-        api.get_playlist_tracks.return_value = _tracks(
-            ["u3", "u1", "u2"]
-        )
+        api.get_playlist_uris.return_value = ["u3", "u1", "u2"]
 
         # No raise — same multiset.
         verify_playlist_state(
             api, "p1", ["u1", "u2", "u3"], 42, "test",
         )
 
-    def test_skip_cache_is_forwarded(self):
-        api = MagicMock()
-        api.get_playlist_tracks.return_value = _tracks(
-            ["u1"]
-        )
+    def test_reads_live_uris_only(self):
+        """Verification reads the URI-only, uncached view, never the
+        full (possibly cached) track objects."""
+        api = MagicMock(spec=SpotifyAPI)
+        api.get_playlist_uris.return_value = ["u1"]
 
         verify_playlist_state(
             api, "p1", ["u1"], 42, "test",
         )
 
-        api.get_playlist_tracks.assert_called_once_with(
-            "p1", skip_cache=True,
-        )
+        api.get_playlist_uris.assert_called_once_with("p1")
+        api.get_playlist_tracks.assert_not_called()
 
 
 class TestVerifyPlaylistStateDivergence:
     def test_count_drift_raises_with_missing(self):
         api = MagicMock()
-        api.get_playlist_tracks.return_value = _tracks(
-            ["u1", "u2"]
-        )
+        api.get_playlist_uris.return_value = ["u1", "u2"]
 
         with pytest.raises(PlaylistVerificationError) as ex:
             verify_playlist_state(
@@ -99,9 +87,7 @@ class TestVerifyPlaylistStateDivergence:
 
     def test_count_drift_raises_with_extra(self):
         api = MagicMock()
-        api.get_playlist_tracks.return_value = _tracks(
-            ["u1", "u2", "u3", "u4"]
-        )
+        api.get_playlist_uris.return_value = ["u1", "u2", "u3", "u4"]
 
         with pytest.raises(PlaylistVerificationError) as ex:
             verify_playlist_state(
@@ -118,9 +104,7 @@ class TestVerifyPlaylistStateDivergence:
         Multiset compare catches it.
         """
         api = MagicMock()
-        api.get_playlist_tracks.return_value = _tracks(
-            ["u1", "u2", "u4"]  # u3 → u4
-        )
+        api.get_playlist_uris.return_value = ["u1", "u2", "u4"]  # u3 → u4
 
         with pytest.raises(PlaylistVerificationError) as ex:
             verify_playlist_state(
@@ -136,9 +120,7 @@ class TestVerifyPlaylistStateDivergence:
         is a missing.
         """
         api = MagicMock()
-        api.get_playlist_tracks.return_value = _tracks(
-            ["u1", "u2"]
-        )
+        api.get_playlist_uris.return_value = ["u1", "u2"]
 
         with pytest.raises(PlaylistVerificationError) as ex:
             verify_playlist_state(
@@ -152,9 +134,7 @@ class TestVerifyPlaylistStateDivergence:
     def test_duplicates_in_actual_count_as_extra(self):
         """1 copy expected, 2 actual is an extra."""
         api = MagicMock()
-        api.get_playlist_tracks.return_value = _tracks(
-            ["u1", "u1", "u2"]
-        )
+        api.get_playlist_uris.return_value = ["u1", "u1", "u2"]
 
         with pytest.raises(PlaylistVerificationError) as ex:
             verify_playlist_state(
@@ -167,9 +147,7 @@ class TestVerifyPlaylistStateDivergence:
 
     def test_exception_message_contains_counts(self):
         api = MagicMock()
-        api.get_playlist_tracks.return_value = _tracks(
-            ["u1", "u2"]
-        )
+        api.get_playlist_uris.return_value = ["u1", "u2"]
 
         with pytest.raises(PlaylistVerificationError) as ex:
             verify_playlist_state(
@@ -193,9 +171,7 @@ class TestVerifyPlaylistStateOrdered:
 
     def test_ordered_rejects_reordering_with_same_multiset(self):
         api = MagicMock()
-        api.get_playlist_tracks.return_value = _tracks(
-            ["u1", "u2", "u3"]
-        )
+        api.get_playlist_uris.return_value = ["u1", "u2", "u3"]
 
         with pytest.raises(PlaylistVerificationError):
             verify_playlist_state(
@@ -205,9 +181,7 @@ class TestVerifyPlaylistStateOrdered:
 
     def test_ordered_passes_on_exact_sequence(self):
         api = MagicMock()
-        api.get_playlist_tracks.return_value = _tracks(
-            ["u1", "u2", "u3"]
-        )
+        api.get_playlist_uris.return_value = ["u1", "u2", "u3"]
 
         result = verify_playlist_state(
             api, "p1", ["u1", "u2", "u3"], 42, "shuffle",
@@ -220,9 +194,7 @@ class TestVerifyPlaylistStateOrdered:
         """Default (ordered=False) keeps multiset semantics so raid/rotate
         verification paths are unaffected."""
         api = MagicMock()
-        api.get_playlist_tracks.return_value = _tracks(
-            ["u3", "u1", "u2"]
-        )
+        api.get_playlist_uris.return_value = ["u3", "u1", "u2"]
 
         # No raise — multiset matches.
         verify_playlist_state(
@@ -236,29 +208,10 @@ class TestVerifyPlaylistStateAPIResilience:
         treat as empty.
         """
         api = MagicMock()
-        api.get_playlist_tracks.return_value = None
+        api.get_playlist_uris.return_value = None
 
         result = verify_playlist_state(
             api, "p1", [], 42, "test",
         )
 
         assert result == []
-
-    def test_filters_tracks_without_uri(self):
-        """Spotify can return placeholder items missing a
-        URI (e.g. local tracks). Those don't count toward
-        the actual set.
-        """
-        api = MagicMock(spec=SpotifyAPI)
-        api.get_playlist_tracks.return_value = [
-            {"uri": "u1", "name": "u1"},
-            {"uri": None, "name": "local"},
-            {"name": "broken"},
-            {"uri": "u2", "name": "u2"},
-        ]
-
-        result = verify_playlist_state(
-            api, "p1", ["u1", "u2"], 42, "test",
-        )
-
-        assert result == ["u1", "u2"]
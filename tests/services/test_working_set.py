@@ -0,0 +1,267 @@
+"""
+Tests for PlaylistWorkingSet and the combined jobs that share one.
+
+Covers:
+  - Reads are memoized per execution; a wider preset answers a narrower one
+  - Batch reads only fetch what the working set does not hold
+  - A recorded write replaces the playlist's known state
+  - verify() checks each written playlist once, against its final state
+  - RAID_AND_DRIP / RAID_AND_SHUFFLE read each playlist once
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shuffify.enums import IntervalValue, JobType, ScheduleType
+from shuffify.models.db import Schedule, db
+from shuffify.services.executors import (
+    JobExecutorService,
+    PlaylistVerificationError,
+)
+from shuffify.services.executors.working_set import PlaylistWorkingSet
+from shuffify.services.raid_link_service import RaidLinkService
+from shuffify.services.user_service import UserService
+from shuffify.spotify.api import SpotifyAPI
+
+
+def _fake_api(state):
+    """A SpotifyAPI mock whose reads and writes go through ``state``."""
+    api = MagicMock(spec=SpotifyAPI)
+
+    def get_tracks(pid, skip_cache=False, fields=None):
+        return [{"uri": u} for u in state[pid]]
+
+    def add_items(pid, uris, position=None):
+        if position is None:
+            state[pid].extend(uris)
+        else:
+            state[pid][position:position] = uris
+
+    def remove_items(pid, uris):
+        drop = set(uris)
+        state[pid] = [u for u in state[pid] if u not in drop]
+
+    def update_tracks(pid, uris, **kwargs):
+        state[pid] = list(uris)
+        return True
+
+    api.get_playlist_tracks.side_effect = get_tracks
+    api.get_many_playlist_tracks.side_effect = lambda ids, fields=None: {pid: get_tracks(pid) for pid in ids}
+    api.get_playlist_uris.side_effect = lambda pid: list(state[pid])
+    api.playlist_add_items.side_effect = add_items
+    api.playlist_remove_items.side_effect = remove_items
+    api.update_playlist_tracks.side_effect = update_tracks
+    api.get_tracks.return_value = []
+    return api
+
+
+# =========================================================================
+# Reads
+# =========================================================================
+
+
+class TestReads:
+    """Each playlist is fetched once per execution."""
+
+    def test_repeated_reads_are_memoized(self):
+        api = _fake_api({"p1": ["u1", "u2"]})
+        ws = PlaylistWorkingSet(api, schedule_id=1)
+
+        assert ws.get_playlist_uris("p1") == ["u1", "u2"]
+        assert ws.get_playlist_uris("p1") == ["u1", "u2"]
+
+        api.get_playlist_tracks.assert_called_once_with("p1", fields="uris_only")
+
+    def test_full_read_answers_uris_only_but_not_the_reverse(self):
+        api = _fake_api({"p1": ["u1"]})
+        ws = PlaylistWorkingSet(api, schedule_id=1)
+
+        ws.get_playlist_tracks("p1", fields="uris_only")
+        ws.get_playlist_tracks("p1")
+        ws.get_playlist_tracks("p1", fields="shuffle_minimal")
+        ws.get_playlist_uris("p1")
+
+        assert api.get_playlist_tracks.call_count == 2
+
+    def test_preferred_fields_widen_the_first_read(self):
+        api = _fake_api({"p1": ["u1"]})
+        ws = PlaylistWorkingSet(api, schedule_id=1)
+        ws.prefer_fields("p1", "shuffle_minimal")
+
+        ws.get_playlist_uris("p1")
+        ws.get_playlist_tracks("p1", fields="shuffle_minimal")
+
+        api.get_playlist_tracks.assert_called_once_with("p1", fields="shuffle_minimal")
+
+    def test_batch_read_fetches_only_misses(self):
+        api = _fake_api({"p1": ["u1"], "p2": ["u2"], "p3": ["u3"]})
+        ws = PlaylistWorkingSet(api, schedule_id=1)
+        ws.get_playlist_uris("p1")
+
+        result = ws.get_many_playlist_tracks(["p1", "p2", "p3"], fields="uris_only")
+
+        assert list(result) == ["p1", "p2", "p3"]
+        api.get_many_playlist_tracks.assert_called_once_with(["p2", "p3"], fields="uris_only")
+
+    def test_callers_cannot_mutate_the_held_read(self):
+        api = _fake_api({"p1": ["u1"]})
+        ws = PlaylistWorkingSet(api, schedule_id=1)
+
+        ws.get_playlist_tracks("p1").append({"uri": "junk"})
+
+        assert ws.get_playlist_uris("p1") == ["u1"]
+
+
+# =========================================================================
+# Writes and verification
+# =========================================================================
+
+
+class TestVerify:
+    """Recorded writes are verified once each, against their final state."""
+
+    def test_written_state_replaces_the_read(self):
+        api = _fake_api({"p1": ["u1"]})
+        ws = PlaylistWorkingSet(api, schedule_id=1)
+        ws.get_playlist_uris("p1")
+
+        ws.record_write("p1", ["u1", "u2"], "raid pull")
+
+        assert ws.get_playlist_uris("p1") == ["u1", "u2"]
+        assert ws.pending == ["p1"]
+
+    def test_only_the_last_write_per_playlist_is_verified(self):
+        state = {"p1": ["u2"]}
+        api = _fake_api(state)
+        ws = PlaylistWorkingSet(api, schedule_id=1)
+
+        ws.record_write("p1", ["u1", "u2"], "raid pull")
+        ws.record_write("p1", ["u2"], "drip raid")
+        ws.verify()
+
+        api.get_playlist_uris.assert_called_once_with("p1")
+        assert ws.pending == []
+
+    def test_divergence_raises_with_the_last_phase(self):
+        api = _fake_api({"p1": ["u1"], "p2": ["u2"]})
+        ws = PlaylistWorkingSet(api, schedule_id=7)
+
+        ws.record_write("p1", ["u1"], "raid pull")
+        ws.record_write("p2", ["u2", "u3"], "drip target", ordered=True)
+
+        with pytest.raises(PlaylistVerificationError) as exc_info:
+            ws.verify()
+
+        assert exc_info.value.playlist_id == "p2"
+        assert exc_info.value.phase == "drip target"
+        assert exc_info.value.schedule_id == 7
+
+    def test_verify_without_writes_reads_nothing(self):
+        api = _fake_api({})
+        PlaylistWorkingSet(api, schedule_id=1).verify()
+        api.get_playlist_uris.assert_not_called()
+
+
+# =========================================================================
+# Combined jobs
+# =========================================================================
+
+
+@pytest.fixture
+def user(db_app):
+    with db_app.app_context():
+        result = UserService.upsert_from_spotify({"id": "wsuser", "display_name": "WS User", "images": []})
+        yield result.user
+
+
+@pytest.fixture
+def raid_link(user):
+    return RaidLinkService.create_link(
+        user_id=user.id,
+        target_playlist_id="target",
+        raid_playlist_id="raid",
+        drip_count=2,
+        drip_enabled=True,
+    )
+
+
+def _schedule(user, job_type):
+    sched = Schedule(
+        user_id=user.id,
+        job_type=job_type,
+        target_playlist_id="target",
+        target_playlist_name="Target",
+        schedule_type=ScheduleType.INTERVAL,
+        schedule_value=IntervalValue.DAILY,
+        algorithm_name="BasicShuffle",
+        is_enabled=True,
+    )
+    db.session.add(sched)
+    db.session.commit()
+    return sched
+
+
+@pytest.fixture
+def raid_sources():
+    """Stub source resolution so the raid always finds two new tracks."""
+    new_uris = ["spotify:track:new1", "spotify:track:new2"]
+    with patch(
+        "shuffify.services.executors.raid_executor._load_sources",
+        return_value=[MagicMock()],
+    ), patch(
+        "shuffify.services.executors.raid_executor._fetch_raid_sources_with_limits",
+        return_value=(new_uris, {}),
+    ):
+        yield new_uris
+
+
+class TestCombinedJobs:
+    """A combined job reads each playlist once and verifies at the end."""
+
+    def test_raid_and_drip(self, user, raid_link, raid_sources):
+        state = {"target": ["spotify:track:t1"], "raid": ["spotify:track:r1"]}
+        api = _fake_api(state)
+        schedule = _schedule(user, JobType.RAID_AND_DRIP)
+
+        result = JobExecutorService._execute_job_type(schedule, api)
+
+        assert result["tracks_added"] == 2
+        assert result["tracks_dripped"] == 2
+        assert state["target"][2:] == ["spotify:track:t1"]
+        assert len(state["raid"]) == 1
+        # One batch read for the whole chain, nothing re-read by the drip.
+        api.get_many_playlist_tracks.assert_called_once_with(["target", "raid"], fields="uris_only")
+        api.get_playlist_tracks.assert_not_called()
+        # The raid playlist is verified once, in its post-drip state.
+        assert sorted(c.args[0] for c in api.get_playlist_uris.call_args_list) == ["raid", "target"]
+
+    def test_raid_write_divergence_fails_the_job(self, user, raid_link, raid_sources):
+        state = {"target": ["spotify:track:t1", "spotify:track:t2"], "raid": []}
+        api = _fake_api(state)
+        add_items = api.playlist_add_items.side_effect
+
+        def add_except_to_raid(pid, uris, position=None):
+            # The raid playlist write reports success but never lands.
+            if pid != "raid":
+                add_items(pid, uris, position)
+
+        api.playlist_add_items.side_effect = add_except_to_raid
+        schedule = _schedule(user, JobType.RAID_AND_SHUFFLE)
+
+        with pytest.raises(PlaylistVerificationError) as exc_info:
+            JobExecutorService._execute_job_type(schedule, api)
+
+        assert exc_info.value.playlist_id == "raid"
+
+    def test_raid_and_shuffle(self, user, raid_link, raid_sources):
+        state = {"target": [f"spotify:track:t{i}" for i in range(5)], "raid": []}
+        api = _fake_api(state)
+        schedule = _schedule(user, JobType.RAID_AND_SHUFFLE)
+
+        result = JobExecutorService._execute_job_type(schedule, api)
+
+        assert result["tracks_total"] == 5
+        api.get_playlist_tracks.assert_called_once_with("target", fields="shuffle_minimal")
+        api.get_many_playlist_tracks.assert_called_once_with(["raid"], fields="uris_only")
+        assert sorted(c.args[0] for c in api.get_playlist_uris.call_args_list) == ["raid", "target"]
@@ -0,0 +1,221 @@
+"""A small in-memory Spotify Web API served over real local HTTP.
+
+Used by the async client tests: retries, 401 refresh and concurrent
+pagination are only meaningfully exercised against a real socket. The
+server keeps playlists as ordered URI lists, pages them like Spotify
+(``total``/``limit``/``offset``/``next``), applies the item writes the
+clients send (replace, append/insert, remove, reorder) and bumps a
+snapshot_id on each one. A ``None`` in a playlist stands for an item whose
+track is gone from the catalog: it is served with ``"track": null`` and
+still occupies its position.
+
+Faults are scripted per request: ``server.fail("POST", "/playlists/pl1/items",
+status=500, times=1)`` answers the next matching request with a 500.
+"""
+
+import json
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+USER_ID = "fake-user"
+
+
+def track(uri):
+    """The track object the fake server returns for ``uri``."""
+    track_id = uri.rsplit(":", 1)[-1]
+    return {"id": track_id, "uri": uri, "name": f"Track {track_id}"}
+
+
+class FakeSpotifyServer(ThreadingHTTPServer):
+    """Local HTTP server holding playlists, tokens and scripted faults."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.lock = threading.Lock()
+        self.playlists = {}
+        self.snapshots = {}
+        self.valid_tokens = {"good-token"}
+        self.faults = deque()
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.page_delay = 0.0
+        self._thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def add_playlist(self, playlist_id, uris):
+        with self.lock:
+            self.playlists[playlist_id] = list(uris)
+            self.snapshots[playlist_id] = 1
+
+    def fail(self, method, path, status, times=1, headers=None, body=None):
+        """Answer the next ``times`` matching requests with ``status``."""
+        with self.lock:
+            for _ in range(times):
+                self.faults.append((method, path, status, headers or {}, body))
+
+    def calls(self, method=None, path=None):
+        """Recorded ``(method, path, query, body)`` tuples, filtered."""
+        return [
+            r
+            for r in self.requests
+            if (method is None or r[0] == method) and (path is None or r[1] == path)
+        ]
+
+    def snapshot_id(self, playlist_id):
+        return f"snap-{self.snapshots[playlist_id]}"
+
+    def _bump(self, playlist_id):
+        self.snapshots[playlist_id] += 1
+        return {"snapshot_id": self.snapshot_id(playlist_id)}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    # -----------------------------------------------------------------
+
+    def _send(self, status, payload=None, headers=None):
+        body = b"" if payload is None or status == 204 else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, str(value))
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _dispatch(self, method):
+        server = self.server
+        parts = urlsplit(self.path)
+        path = parts.path
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+
+        with server.lock:
+            server.requests.append((method, path, query, body))
+            fault = None
+            for i, (f_method, f_path, status, headers, f_body) in enumerate(server.faults):
+                if f_method == method and f_path == path:
+                    fault = (status, headers, f_body)
+                    del server.faults[i]
+                    break
+
+        token = self.headers.get("Authorization", "").removeprefix("Bearer ")
+        if token not in server.valid_tokens:
+            return self._send(401, {"error": {"status": 401, "message": "expired"}})
+        if fault is not None:
+            status, headers, f_body = fault
+            return self._send(status, f_body or {"error": {"message": "fault"}}, headers)
+
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            status, payload = self._route(method, path, query, body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+        self._send(status, payload)
+
+    def _route(self, method, path, query, body):
+        server = self.server
+        segments = path.strip("/").split("/")
+
+        if path == "/me":
+            return 200, {"id": USER_ID, "display_name": "Fake User"}
+
+        if path == "/tracks":
+            ids = query.get("ids", "").split(",")
+            return 200, {"tracks": [track(f"spotify:track:{i}") for i in ids if i]}
+
+        if segments[0] != "playlists" or segments[1] not in server.playlists:
+            return 404, {"error": {"status": 404, "message": "Not found"}}
+        playlist_id = segments[1]
+
+        if len(segments) == 2 and method == "GET":
+            with server.lock:
+                return 200, {"id": playlist_id, "snapshot_id": server.snapshot_id(playlist_id)}
+
+        if len(segments) == 3 and segments[2] == "items":
+            if method == "GET":
+                return 200, self._page(playlist_id, query)
+            with server.lock:
+                return 200, self._write(playlist_id, method, body)
+
+        return 404, {"error": {"status": 404, "message": "Not found"}}
+
+    def _page(self, playlist_id, query):
+        server = self.server
+        if server.page_delay:
+            threading.Event().wait(server.page_delay)
+        offset = int(query.get("offset", 0))
+        limit = int(query.get("limit", 20))
+        with server.lock:
+            uris = list(server.playlists[playlist_id])
+        window = uris[offset : offset + limit]
+        next_url = None
+        if offset + limit < len(uris):
+            next_url = f"{server.base_url}/playlists/{playlist_id}/items?offset={offset + limit}&limit={limit}"
+        return {
+            "items": [
+                {"added_at": "2026-01-01T00:00:00Z", "track": track(u) if u else None}
+                for u in window
+            ],
+            "total": len(uris),
+            "limit": limit,
+            "offset": offset,
+            "next": next_url,
+        }
+
+    def _write(self, playlist_id, method, body):
+        server = self.server
+        uris = server.playlists[playlist_id]
+        if method == "PUT" and "uris" in body:
+            uris[:] = body["uris"]
+        elif method == "PUT":
+            start, length = body["range_start"], body.get("range_length", 1)
+            moved = uris[start : start + length]
+            before = body["insert_before"]
+            del uris[start : start + length]
+            if before > start:
+                before -= length
+            uris[before:before] = moved
+        elif method == "POST":
+            position = body.get("position", len(uris))
+            uris[position:position] = body["uris"]
+        else:
+            drop = {item["uri"] for item in body["items"]}
+            uris[:] = [u for u in uris if u not in drop]
+        return server._bump(playlist_id)
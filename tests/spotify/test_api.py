@@ -261,7 +261,7 @@ class TestSpotifyAPIInit:
                 on_token_refresh=received.append,
             )
             with patch.object(
-                auth_manager, 'ensure_valid_token',
+                auth_manager, 'refresh_token',
                 return_value=new_token,
             ):
                 access_token = api._handle_token_refresh()
@@ -269,6 +269,36 @@ class TestSpotifyAPIInit:
         assert access_token == 'new_token_401'
         assert received[-1].access_token == 'new_token_401'
 
+    def test_401_force_refreshes_an_unexpired_token(
+        self, valid_token_info, auth_manager
+    ):
+        """A 401 means Spotify revoked the token early, so it is dropped
+        and refreshed even though its expiry says it is still good."""
+        new_token = TokenInfo(
+            access_token='replacement',
+            token_type='Bearer',
+            expires_at=time.time() + 3600,
+            refresh_token='new_refresh',
+        )
+        events = []
+        with patch('shuffify.spotify.api.SpotifyHTTPClient', autospec=True):
+            api = SpotifyAPI(
+                valid_token_info, auth_manager,
+                auto_refresh=True,
+                on_token_rejected=lambda t: events.append(('rejected', t.access_token)),
+            )
+            with patch.object(
+                auth_manager, 'refresh_token',
+                side_effect=lambda t: events.append(('refresh',)) or new_token,
+            ):
+                access_token = api._handle_token_refresh()
+
+        assert access_token == 'replacement'
+        assert events == [
+            ('rejected', valid_token_info.access_token),
+            ('refresh',),
+        ]
+
     def test_token_info_property(
         self, valid_token_info, auth_manager
     ):
@@ -427,6 +457,32 @@ class TestSpotifyAPIPlaylistOperations:
 
             assert len(result) == 2
 
+    def test_get_playlist_uris_requests_uri_fields_only(
+        self, valid_token_info, auth_manager,
+    ):
+        """URI-only reads use a field filter and skip empty items,
+        under either nested key."""
+        items = [
+            {'track': {'uri': 'spotify:track:a'}},
+            {'item': {'uri': 'spotify:track:b'}},
+            {'track': None},
+            {'item': {}},
+        ]
+
+        with patch(
+            'shuffify.spotify.api.SpotifyHTTPClient', autospec=True
+        ) as MockHTTP:
+            mock_http = MockHTTP.return_value
+            mock_http.get_all_pages.return_value = items
+
+            api = SpotifyAPI(valid_token_info, auth_manager)
+            result = api.get_playlist_uris('playlist123')
+
+        assert result == ['spotify:track:a', 'spotify:track:b']
+        assert mock_http.get_all_pages.call_args.kwargs['fields'] == (
+            'track(uri),item(uri)'
+        )
+
     def test_get_playlist_tracks_preserves_added_at(
         self, valid_token_info, auth_manager, sample_tracks
     ):
@@ -834,12 +890,16 @@ def mock_cache():
     cache.get_playlists.return_value = None
     cache.get_playlist.return_value = None
     cache.get_playlist_tracks.return_value = None
+    cache.get_playlist_tracks_at.return_value = None
     cache.get_audio_features.return_value = {}
+    cache.get_many_playlist_tracks.return_value = {}
     cache.set_user.return_value = True
     cache.set_playlists.return_value = True
     cache.set_playlist.return_value = True
     cache.set_playlist_tracks.return_value = True
+    cache.set_playlist_tracks_at.return_value = True
     cache.set_audio_features.return_value = True
+    cache.set_many_playlist_tracks.return_value = True
     cache.invalidate_playlist.return_value = True
     cache.invalidate_user_playlists.return_value = True
     return cache
@@ -981,6 +1041,226 @@ class TestSpotifyAPICaching:
             assert result == sample_tracks
             mock_http.get_all_pages.assert_not_called()
 
+    def test_get_playlist_tracks_reuses_unchanged_snapshot(
+        self, valid_token_info, auth_manager,
+        mock_cache, sample_tracks,
+    ):
+        """An expired entry whose snapshot_id still matches costs one
+        small request, not a page-in."""
+        mock_cache.get_playlist_tracks_at.return_value = sample_tracks
+
+        with patch(
+            'shuffify.spotify.api.SpotifyHTTPClient', autospec=True
+        ) as MockHTTP:
+            mock_http = MockHTTP.return_value
+            mock_http.get.return_value = {'snapshot_id': 'snap-1'}
+
+            api = SpotifyAPI(
+                valid_token_info, auth_manager,
+                cache=mock_cache,
+            )
+            result = api.get_playlist_tracks('pl1')
+
+        assert result == sample_tracks
+        mock_http.get.assert_called_once_with(
+            '/playlists/pl1', params={'fields': 'snapshot_id'}
+        )
+        mock_http.get_all_pages.assert_not_called()
+        mock_cache.get_playlist_tracks_at.assert_called_once_with(
+            'pl1', 'snap-1', fields=None
+        )
+        mock_cache.set_playlist_tracks.assert_called_once_with(
+            'pl1', sample_tracks, fields=None
+        )
+
+    def test_get_playlist_tracks_pages_in_changed_snapshot(
+        self, valid_token_info, auth_manager, mock_cache,
+    ):
+        """A new snapshot_id is paged in and cached under that snapshot."""
+        with patch(
+            'shuffify.spotify.api.SpotifyHTTPClient', autospec=True
+        ) as MockHTTP:
+            mock_http = MockHTTP.return_value
+            mock_http.get.return_value = {'snapshot_id': 'snap-2'}
+            mock_http.get_all_pages.return_value = [
+                {'track': {'uri': 'spotify:track:a'}},
+            ]
+
+            api = SpotifyAPI(
+                valid_token_info, auth_manager,
+                cache=mock_cache,
+            )
+            result = api.get_playlist_tracks('pl1')
+
+        assert result == [{'uri': 'spotify:track:a'}]
+        mock_cache.set_playlist_tracks_at.assert_called_once_with(
+            'pl1', 'snap-2', [{'uri': 'spotify:track:a'}], fields=None
+        )
+
+    def test_get_playlist_tracks_skip_cache_ignores_snapshot(
+        self, valid_token_info, auth_manager, mock_cache,
+    ):
+        """skip_cache pages in directly without a snapshot lookup."""
+        with patch(
+            'shuffify.spotify.api.SpotifyHTTPClient', autospec=True
+        ) as MockHTTP:
+            mock_http = MockHTTP.return_value
+            mock_http.get_all_pages.return_value = []
+
+            api = SpotifyAPI(
+                valid_token_info, auth_manager,
+                cache=mock_cache,
+            )
+            api.get_playlist_tracks('pl1', skip_cache=True)
+
+        mock_http.get.assert_not_called()
+        mock_cache.get_playlist_tracks_at.assert_not_called()
+
+    def test_get_playlist_uris_bypasses_cache(
+        self, valid_token_info, auth_manager, mock_cache,
+    ):
+        """Verification reads are live: the cache is neither read nor
+        written."""
+        with patch(
+            'shuffify.spotify.api.SpotifyHTTPClient', autospec=True
+        ) as MockHTTP:
+            MockHTTP.return_value.get_all_pages.return_value = []
+
+            api = SpotifyAPI(
+                valid_token_info, auth_manager,
+                cache=mock_cache,
+            )
+            api.get_playlist_uris('pl1')
+
+        assert not mock_cache.method_calls
+
+    def test_get_playlist_tracks_with_preset_uses_its_namespace(
+        self, valid_token_info, auth_manager, mock_cache,
+    ):
+        """A preset is sent as a field filter and cached under its own
+        namespace, never the full-track one."""
+        with patch(
+            'shuffify.spotify.api.SpotifyHTTPClient', autospec=True
+        ) as MockHTTP:
+            mock_http = MockHTTP.return_value
+            mock_http.get.return_value = {'snapshot_id': 'snap-1'}
+            mock_http.get_all_pages.return_value = [
+                {'added_at': '2026-01-01T00:00:00Z',
+                 'item': {'uri': 'spotify:track:a', 'name': 'A'}},
+            ]
+
+            api = SpotifyAPI(
+                valid_token_info, auth_manager,
+                cache=mock_cache,
+            )
+            result = api.get_playlist_tracks('pl1', fields='shuffle_minimal')
+
+        assert result == [{
+            'uri': 'spotify:track:a', 'name': 'A',
+            'added_at': '2026-01-01T00:00:00Z',
+        }]
+        item_fields = mock_http.get_all_pages.call_args.kwargs['fields']
+        assert item_fields.startswith('added_at,track(')
+        assert 'artists(name)' in item_fields
+        mock_cache.get_playlist_tracks.assert_called_once_with(
+            'pl1', fields='shuffle_minimal'
+        )
+        mock_cache.set_playlist_tracks.assert_called_once_with(
+            'pl1', result, fields='shuffle_minimal'
+        )
+
+    def test_get_playlist_tracks_rejects_unknown_preset(
+        self, valid_token_info, auth_manager,
+    ):
+        """An unknown preset fails instead of silently fetching everything."""
+        with patch(
+            'shuffify.spotify.api.SpotifyHTTPClient', autospec=True
+        ) as MockHTTP:
+            api = SpotifyAPI(valid_token_info, auth_manager)
+            with pytest.raises(SpotifyAPIError):
+                api.get_playlist_tracks('pl1', fields='everything')
+
+            MockHTTP.return_value.get_all_pages.assert_not_called()
+
+    def test_get_playlist_items_raw_expands_preset(
+        self, valid_token_info, auth_manager,
+    ):
+        """A preset name passed to the raw call becomes a full filter."""
+        with patch(
+            'shuffify.spotify.api.SpotifyHTTPClient', autospec=True
+        ) as MockHTTP:
+            mock_http = MockHTTP.return_value
+            mock_http.get.return_value = {'items': []}
+
+            api = SpotifyAPI(valid_token_info, auth_manager)
+            api.get_playlist_items_raw('pl1', fields='uris_only')
+
+        params = mock_http.get.call_args.kwargs['params']
+        assert params['fields'] == (
+            'items(track(uri),item(uri)),total,limit,offset,next'
+        )
+
+    def test_get_many_playlist_tracks_reads_and_writes_in_one_call_each(
+        self, valid_token_info, auth_manager,
+        mock_cache, sample_tracks,
+    ):
+        """Hits come from one batch read; misses are fetched and written
+        back with one batch write."""
+        mock_cache.get_many_playlist_tracks.return_value = {
+            'pl1': sample_tracks,
+        }
+
+        with patch(
+            'shuffify.spotify.api.SpotifyHTTPClient', autospec=True
+        ) as MockHTTP:
+            mock_http = MockHTTP.return_value
+            mock_http.get_all_pages.return_value = [
+                {'track': {'uri': 'spotify:track:new'}},
+            ]
+
+            api = SpotifyAPI(
+                valid_token_info, auth_manager,
+                cache=mock_cache,
+            )
+            result = api.get_many_playlist_tracks(['pl1', 'pl2', 'pl1'])
+
+        assert list(result) == ['pl1', 'pl2']
+        assert result['pl1'] == sample_tracks
+        assert result['pl2'] == [{'uri': 'spotify:track:new'}]
+        mock_cache.get_many_playlist_tracks.assert_called_once_with(
+            ['pl1', 'pl2'], fields=None
+        )
+        mock_cache.set_many_playlist_tracks.assert_called_once_with(
+            {'pl2': [{'uri': 'spotify:track:new'}]}, fields=None
+        )
+        mock_cache.get_playlist_tracks.assert_not_called()
+        mock_http.get_all_pages.assert_called_once()
+
+    def test_get_many_playlist_tracks_caches_fetched_before_failure(
+        self, valid_token_info, auth_manager, mock_cache,
+    ):
+        """A failed fetch raises, but playlists fetched before it are
+        still written to the cache."""
+        with patch(
+            'shuffify.spotify.api.SpotifyHTTPClient', autospec=True
+        ) as MockHTTP:
+            mock_http = MockHTTP.return_value
+            mock_http.get_all_pages.side_effect = [
+                [{'track': {'uri': 'spotify:track:a'}}],
+                SpotifyNotFoundError('gone'),
+            ]
+
+            api = SpotifyAPI(
+                valid_token_info, auth_manager,
+                cache=mock_cache,
+            )
+            with pytest.raises(SpotifyNotFoundError):
+                api.get_many_playlist_tracks(['pl1', 'pl2'])
+
+        mock_cache.set_many_playlist_tracks.assert_called_once_with(
+            {'pl1': [{'uri': 'spotify:track:a'}]}, fields=None
+        )
+
     def test_update_playlist_invalidates_cache(
         self, valid_token_info, auth_manager, mock_cache
     ):
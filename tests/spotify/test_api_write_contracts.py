@@ -329,6 +329,229 @@ class TestSpotifyPartialBatchErrorAttributes:
         assert "update" in s
 
 
+# ---------------------------------------------------------------------------
+# update_playlist_tracks with current_uris (diff writes)
+# ---------------------------------------------------------------------------
+
+
+def _serve_live(mock_http, uris, snapshot_id="s1"):
+    """Make the mocked client answer reads with a live playlist of ``uris``.
+
+    ``None`` stands for an item whose track is gone from the catalog.
+    """
+    def get(path, params=None):
+        if path.endswith("/items"):
+            return {"total": len(uris)}
+        return {"snapshot_id": snapshot_id}
+
+    mock_http.get.side_effect = get
+    mock_http.get_all_pages.return_value = [
+        {"track": {"uri": u} if u else None} for u in uris
+    ]
+
+
+class TestUpdatePlaylistTracksDiff:
+    """Passing the live order lets the write planner send only the diff."""
+
+    def test_drip_append_is_a_single_positioned_post(
+        self, token_info, auth_manager
+    ):
+        current = _three_batches()
+        desired = current + ["spotify:track:new"]
+        with patch("shuffify.spotify.api.SpotifyHTTPClient", autospec=True) as MockHTTP:
+            mock_http = MockHTTP.return_value
+            _serve_live(mock_http, current)
+            mock_http.post.return_value = {"snapshot_id": "s2"}
+
+            api = SpotifyAPI(token_info, auth_manager)
+            assert api.update_playlist_tracks(
+                "p1", desired, current_uris=current
+            ) is True
+
+            mock_http.put.assert_not_called()
+            mock_http.post.assert_called_once_with(
+                "/playlists/p1/items",
+                json={"uris": ["spotify:track:new"], "position": 250},
+            )
+
+    def test_identical_order_makes_no_call(self, token_info, auth_manager):
+        uris = _three_batches()
+        with patch("shuffify.spotify.api.SpotifyHTTPClient", autospec=True) as MockHTTP:
+            mock_http = MockHTTP.return_value
+            _serve_live(mock_http, uris)
+
+            api = SpotifyAPI(token_info, auth_manager)
+            assert api.update_playlist_tracks(
+                "p1", uris, current_uris=list(uris)
+            ) is True
+
+            mock_http.put.assert_not_called()
+            mock_http.post.assert_not_called()
+            mock_http.delete.assert_not_called()
+
+    def test_snapshot_id_is_chained_between_calls(
+        self, token_info, auth_manager
+    ):
+        current = _three_batches()
+        # Drop one track, then move the last one to the front.
+        kept = current[1:]
+        desired = [kept[-1]] + kept[:-1]
+        with patch("shuffify.spotify.api.SpotifyHTTPClient", autospec=True) as MockHTTP:
+            mock_http = MockHTTP.return_value
+            _serve_live(mock_http, current)
+            mock_http.delete.return_value = {"snapshot_id": "s2"}
+            mock_http.put.return_value = {"snapshot_id": "s3"}
+
+            api = SpotifyAPI(token_info, auth_manager)
+            api.update_playlist_tracks(
+                "p1", desired, current_uris=current, snapshot_id="s1"
+            )
+
+            delete_body = mock_http.delete.call_args.kwargs["json"]
+            assert delete_body["snapshot_id"] == "s1"
+            assert delete_body["items"] == [{"uri": current[0]}]
+            mock_http.put.assert_called_once_with(
+                "/playlists/p1/items",
+                json={
+                    "range_start": 248,
+                    "range_length": 1,
+                    "insert_before": 0,
+                    "snapshot_id": "s2",
+                },
+            )
+
+    def test_full_shuffle_falls_back_to_replace(
+        self, token_info, auth_manager
+    ):
+        current = _three_batches()
+        desired = current[::-1]
+        with patch("shuffify.spotify.api.SpotifyHTTPClient", autospec=True) as MockHTTP:
+            mock_http = MockHTTP.return_value
+            _serve_live(mock_http, current)
+
+            api = SpotifyAPI(token_info, auth_manager)
+            api.update_playlist_tracks("p1", desired, current_uris=current)
+
+            mock_http.put.assert_called_once_with(
+                "/playlists/p1/items", json={"uris": desired[:100]}
+            )
+            assert mock_http.post.call_count == 2
+            mock_http.get.assert_not_called()
+            mock_http.get_all_pages.assert_not_called()
+
+    def test_failure_reports_ops_as_batches(self, token_info, auth_manager):
+        current = _three_batches()
+        kept = current[1:]
+        desired = [kept[-1]] + kept[:-1]
+        with patch("shuffify.spotify.api.SpotifyHTTPClient", autospec=True) as MockHTTP:
+            mock_http = MockHTTP.return_value
+            _serve_live(mock_http, current)
+            mock_http.delete.return_value = {"snapshot_id": "s2"}
+            mock_http.put.side_effect = SpotifyAPIError(
+                "API error 502: bad gateway"
+            )
+            cache = MagicMock(spec=SpotifyCache)
+
+            api = SpotifyAPI(token_info, auth_manager, cache=cache)
+            with pytest.raises(SpotifyPartialBatchError) as exc_info:
+                api.update_playlist_tracks(
+                    "p1", desired, current_uris=current
+                )
+
+            exc = exc_info.value
+            assert exc.method == "update"
+            assert exc.completed_batches == 1
+            assert exc.total_batches == 2
+            assert exc.completed_uris == [current[0]]
+            assert exc.remaining_uris == [kept[-1]]
+            # The DELETE landed, so cached tracks are stale.
+            cache.invalidate_playlist.assert_called_with("p1")
+
+    def test_known_snapshot_skips_the_position_read(
+        self, token_info, auth_manager
+    ):
+        current = _three_batches()
+        with patch("shuffify.spotify.api.SpotifyHTTPClient", autospec=True) as MockHTTP:
+            mock_http = MockHTTP.return_value
+            _serve_live(mock_http, current)
+            mock_http.post.return_value = {"snapshot_id": "s2"}
+
+            api = SpotifyAPI(token_info, auth_manager)
+            api.update_playlist_tracks(
+                "p1", current + ["spotify:track:new"],
+                current_uris=current, snapshot_id="s1",
+            )
+
+            mock_http.get_all_pages.assert_not_called()
+            mock_http.post.assert_called_once()
+
+    def test_stale_current_uris_are_replanned_from_live_positions(
+        self, token_info, auth_manager
+    ):
+        live = _three_batches()
+        # The caller's copy predates an outside edit that appended a track.
+        stale = live[:-1]
+        desired = [live[-1]] + live[:-1]
+        with patch("shuffify.spotify.api.SpotifyHTTPClient", autospec=True) as MockHTTP:
+            mock_http = MockHTTP.return_value
+            _serve_live(mock_http, live)
+            mock_http.put.return_value = {"snapshot_id": "s2"}
+
+            api = SpotifyAPI(token_info, auth_manager)
+            api.update_playlist_tracks("p1", desired, current_uris=stale)
+
+            mock_http.put.assert_called_once_with(
+                "/playlists/p1/items",
+                json={
+                    "range_start": 249,
+                    "range_length": 1,
+                    "insert_before": 0,
+                    "snapshot_id": "s1",
+                },
+            )
+
+    def test_item_without_track_forces_full_replace(
+        self, token_info, auth_manager
+    ):
+        """A null item still holds a position that filtered URIs skip."""
+        letters = [f"spotify:track:{c}" for c in "ABCDEFGH"]
+        live = letters[:1] + [None] + letters[1:]
+        desired = letters[-1:] + letters[:-1]
+        with patch("shuffify.spotify.api.SpotifyHTTPClient", autospec=True) as MockHTTP:
+            mock_http = MockHTTP.return_value
+            _serve_live(mock_http, live)
+
+            api = SpotifyAPI(token_info, auth_manager)
+            api.update_playlist_tracks(
+                "p1", desired, current_uris=letters, snapshot_id="s1"
+            )
+
+            mock_http.put.assert_called_once_with(
+                "/playlists/p1/items", json={"uris": desired}
+            )
+            mock_http.delete.assert_not_called()
+
+    def test_playlist_changing_during_the_read_forces_full_replace(
+        self, token_info, auth_manager
+    ):
+        current = _three_batches()
+        desired = current + ["spotify:track:new"]
+        with patch("shuffify.spotify.api.SpotifyHTTPClient", autospec=True) as MockHTTP:
+            mock_http = MockHTTP.return_value
+            _serve_live(mock_http, current)
+            snapshots = iter(["s1", "s2"])
+            mock_http.get.side_effect = lambda path, params=None: {
+                "snapshot_id": next(snapshots)
+            }
+
+            api = SpotifyAPI(token_info, auth_manager)
+            api.update_playlist_tracks("p1", desired, current_uris=current)
+
+            mock_http.put.assert_called_once_with(
+                "/playlists/p1/items", json={"uris": desired[:100]}
+            )
+
+
 # ---------------------------------------------------------------------------
 # Endpoint + request-body shape (SR-030)
 #
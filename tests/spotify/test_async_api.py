@@ -0,0 +1,289 @@
+"""Tests for AsyncSpotifyAPI, against a local fake Spotify server."""
+
+import asyncio
+import inspect
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import redis
+
+from shuffify.spotify.api import SpotifyAPI
+from shuffify.spotify.async_api import AsyncSpotifyAPI
+from shuffify.spotify.auth import SpotifyAuthManager, TokenInfo
+from shuffify.spotify.cache import SpotifyCache
+from shuffify.spotify.exceptions import (
+    SpotifyNotFoundError,
+    SpotifyPartialBatchError,
+    SpotifyTokenExpiredError,
+)
+
+from .fake_spotify import FakeSpotifyServer
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = FakeSpotifyServer().start()
+    monkeypatch.setattr("shuffify.spotify.async_http_client.BASE_URL", server.base_url)
+    monkeypatch.setattr("shuffify.spotify.async_http_client._calculate_backoff_delay", lambda attempt: 0)
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
+def _token(access_token="good-token", expires_in=3600):
+    return TokenInfo(access_token=access_token, token_type="Bearer", expires_at=time.time() + expires_in)
+
+
+def _run(call, token=None, **kwargs):
+    async def main():
+        async with AsyncSpotifyAPI(token or _token(), **kwargs) as api:
+            return await call(api)
+
+    return asyncio.run(main())
+
+
+def _uris(n, prefix="t"):
+    return [f"spotify:track:{prefix}{i}" for i in range(n)]
+
+
+# =========================================================================
+# Surface
+# =========================================================================
+
+
+class TestSurface:
+    """Every public SpotifyAPI method has a coroutine twin."""
+
+    def test_public_methods_are_mirrored(self):
+        public = {
+            name
+            for name, member in inspect.getmembers(SpotifyAPI, inspect.isfunction)
+            if not name.startswith("_")
+        }
+        for name in public:
+            method = getattr(AsyncSpotifyAPI, name, None)
+            assert inspect.iscoroutinefunction(method), name
+            assert list(inspect.signature(method).parameters) == list(
+                inspect.signature(getattr(SpotifyAPI, name)).parameters
+            ), name
+
+
+# =========================================================================
+# Reads
+# =========================================================================
+
+
+class TestReads:
+    """Reads return what SpotifyAPI would."""
+
+    def test_get_playlist_tracks_unwraps_items(self, server):
+        server.add_playlist("pl1", _uris(250))
+
+        tracks = _run(lambda api: api.get_playlist_tracks("pl1"))
+
+        assert [t["uri"] for t in tracks] == _uris(250)
+        assert tracks[0]["added_at"] == "2026-01-01T00:00:00Z"
+
+    def test_get_playlist_uris_uses_uris_only_preset(self, server):
+        server.add_playlist("pl1", _uris(3))
+
+        assert _run(lambda api: api.get_playlist_uris("pl1")) == _uris(3)
+        query = server.calls("GET", "/playlists/pl1/items")[0][2]
+        assert query["fields"].startswith("items(track(uri),item(uri))")
+
+    def test_get_many_fetches_playlists_concurrently(self, server):
+        for n in range(6):
+            server.add_playlist(f"pl{n}", _uris(10, prefix=f"p{n}-"))
+        server.page_delay = 0.05
+
+        result = _run(lambda api: api.get_many_playlist_tracks([f"pl{n}" for n in range(6)]))
+
+        assert [t["uri"] for t in result["pl3"]] == _uris(10, prefix="p3-")
+        assert server.max_in_flight > 1
+
+    def test_get_many_caches_what_succeeded_before_raising(self, server):
+        server.add_playlist("pl1", _uris(2))
+        cache = MagicMock(spec=SpotifyCache)
+        cache.get_many_playlist_tracks.return_value = {}
+        cache.get_playlist_tracks_at.return_value = None
+
+        with pytest.raises(SpotifyNotFoundError):
+            _run(lambda api: api.get_many_playlist_tracks(["pl1", "missing"]), cache=cache)
+
+        fetched = cache.set_many_playlist_tracks.call_args.args[0]
+        assert list(fetched) == ["pl1"]
+
+    def test_snapshot_hit_skips_paging(self, server):
+        server.add_playlist("pl1", _uris(2))
+        cache = MagicMock(spec=SpotifyCache)
+        cache.get_playlist_tracks.return_value = None
+        cache.get_playlist_tracks_at.return_value = [{"uri": "cached"}]
+
+        tracks = _run(lambda api: api.get_playlist_tracks("pl1"), cache=cache)
+
+        assert tracks == [{"uri": "cached"}]
+        assert server.calls("GET", "/playlists/pl1/items") == []
+        cache.get_playlist_tracks_at.assert_called_once_with("pl1", "snap-1", fields=None)
+
+    def test_get_tracks_batches_ids(self, server):
+        tracks = _run(lambda api: api.get_tracks(_uris(120)))
+        assert [t["uri"] for t in tracks] == _uris(120)
+        assert len(server.calls("GET", "/tracks")) == 3
+
+    def test_user_playlists_with_redis_cache(self, server):
+        fake_redis = MagicMock(spec=redis.Redis)
+        fake_redis.get.return_value = None
+        user = _run(lambda api: api.get_current_user(), cache=SpotifyCache(fake_redis))
+        assert user["id"] == "fake-user"
+        assert fake_redis.setex.called
+
+    def test_cache_calls_run_off_the_event_loop(self, server):
+        """A slow Redis must hold up only the coroutine waiting on it."""
+        server.add_playlist("pl1", _uris(2))
+        fake_redis = MagicMock(spec=redis.Redis)
+        threads = []
+
+        def get(key):
+            threads.append(threading.get_ident())
+            return None
+
+        fake_redis.get.side_effect = get
+        fake_redis.setex.side_effect = lambda *a: threads.append(threading.get_ident())
+
+        async def main():
+            loop_thread = threading.get_ident()
+            async with AsyncSpotifyAPI(_token(), cache=SpotifyCache(fake_redis)) as api:
+                await api.get_playlist_tracks("pl1")
+            return loop_thread
+
+        loop_thread = asyncio.run(main())
+
+        assert threads
+        assert loop_thread not in threads
+
+
+# =========================================================================
+# Writes
+# =========================================================================
+
+
+class TestWrites:
+    """Batched writes land in order and report partial failures."""
+
+    def test_update_replaces_in_batches(self, server):
+        server.add_playlist("pl1", _uris(5, prefix="old"))
+
+        assert _run(lambda api: api.update_playlist_tracks("pl1", _uris(230))) is True
+        assert server.playlists["pl1"] == _uris(230)
+        assert [c[0] for c in server.calls(path="/playlists/pl1/items")] == ["PUT", "POST", "POST"]
+
+    def test_update_failure_reports_partial_batch(self, server):
+        server.add_playlist("pl1", [])
+        server.fail("POST", "/playlists/pl1/items", status=403)
+
+        with pytest.raises(SpotifyPartialBatchError) as exc_info:
+            _run(lambda api: api.update_playlist_tracks("pl1", _uris(230)))
+
+        err = exc_info.value
+        assert err.method == "update"
+        assert err.completed_batches == 1
+        assert err.total_batches == 3
+        assert err.completed_uris == _uris(100)
+        assert err.remaining_uris == _uris(230)[100:]
+
+    def test_update_with_current_uris_sends_diff(self, server):
+        current = _uris(300)
+        server.add_playlist("pl1", current)
+        desired = current + ["spotify:track:new"]
+
+        _run(lambda api: api.update_playlist_tracks("pl1", desired, current_uris=current, snapshot_id="snap-1"))
+
+        assert server.playlists["pl1"] == desired
+        writes = [c[0] for c in server.calls(path="/playlists/pl1/items") if c[0] != "GET"]
+        assert writes == ["POST"]
+
+    def test_update_plans_against_live_item_positions(self, server):
+        """A catalog-removed item shifts positions the caller's URIs skip."""
+        letters = [f"spotify:track:{c}" for c in "ABCDEFGH"]
+        server.add_playlist("pl1", letters[:1] + [None] + letters[1:])
+        desired = letters[-1:] + letters[:-1]
+
+        _run(lambda api: api.update_playlist_tracks("pl1", desired, current_uris=letters))
+
+        assert server.playlists["pl1"] == desired
+
+    def test_update_replans_when_the_snapshot_moved(self, server):
+        current = _uris(300)
+        server.add_playlist("pl1", current)
+        # Edited in the Spotify app after the caller read it.
+        server.playlists["pl1"].insert(0, "spotify:track:outside")
+        server.snapshots["pl1"] += 1
+        desired = current + ["spotify:track:new"]
+
+        _run(lambda api: api.update_playlist_tracks("pl1", desired, current_uris=current, snapshot_id="snap-1"))
+
+        assert server.playlists["pl1"] == desired
+
+    def test_add_items_preserves_position_per_batch(self, server):
+        server.add_playlist("pl1", ["spotify:track:head", "spotify:track:tail"])
+
+        _run(lambda api: api.playlist_add_items("pl1", _uris(150), position=1))
+
+        assert server.playlists["pl1"] == ["spotify:track:head", *_uris(150), "spotify:track:tail"]
+
+    def test_remove_items_partial_failure(self, server):
+        server.add_playlist("pl1", _uris(150))
+        server.fail("DELETE", "/playlists/pl1/items", status=500, times=5)
+
+        with pytest.raises(SpotifyPartialBatchError) as exc_info:
+            _run(lambda api: api.playlist_remove_items("pl1", _uris(150)))
+
+        assert exc_info.value.method == "remove"
+        assert exc_info.value.completed_batches == 0
+        assert server.playlists["pl1"] == _uris(150)
+
+
+# =========================================================================
+# Tokens
+# =========================================================================
+
+
+class TestTokens:
+    """Expired tokens are refreshed off the loop, once."""
+
+    def _auth(self):
+        auth = MagicMock(spec=SpotifyAuthManager)
+        auth.ensure_valid_token.return_value = _token()
+        auth.refresh_token.return_value = _token()
+        return auth
+
+    def test_expired_token_without_refresh_raises(self):
+        with pytest.raises(SpotifyTokenExpiredError):
+            AsyncSpotifyAPI(_token(expires_in=-10), auto_refresh=False)
+
+    def test_expired_token_is_refreshed_before_first_request(self, server):
+        auth = self._auth()
+        persisted = []
+
+        user = _run(
+            lambda api: api.get_current_user(),
+            token=_token("stale", expires_in=-10),
+            auth_manager=auth,
+            on_token_refresh=persisted.append,
+        )
+
+        assert user["id"] == "fake-user"
+        assert [t.access_token for t in persisted] == ["good-token"]
+
+    def test_401_refreshes_through_auth_manager(self, server):
+        auth = self._auth()
+
+        user = _run(lambda api: api.get_current_user(), token=_token("revoked"), auth_manager=auth)
+
+        assert user["id"] == "fake-user"
+        # The token had not expired; the 401 alone forces the refresh.
+        auth.refresh_token.assert_called_once()
+        auth.ensure_valid_token.assert_not_called()
@@ -0,0 +1,208 @@
+"""Tests for AsyncSpotifyHTTPClient, against a local fake Spotify server."""
+
+import asyncio
+
+import pytest
+
+from shuffify.spotify.async_http_client import AsyncSpotifyHTTPClient
+from shuffify.spotify.exceptions import (
+    SpotifyAPIError,
+    SpotifyNotFoundError,
+    SpotifyRateLimitError,
+    SpotifyTokenExpiredError,
+)
+from shuffify.spotify.http_client import MAX_PAGE_WORKERS, MAX_RETRIES
+from shuffify.spotify.rate_governor import RateGovernor
+
+from .fake_spotify import FakeSpotifyServer
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = FakeSpotifyServer().start()
+    monkeypatch.setattr("shuffify.spotify.async_http_client.BASE_URL", server.base_url)
+    # Retries are the behaviour under test, not the wait between them.
+    monkeypatch.setattr("shuffify.spotify.async_http_client._calculate_backoff_delay", lambda attempt: 0)
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
+def _run(coro_fn, token="good-token", on_token_refresh=None):
+    async def main():
+        async with AsyncSpotifyHTTPClient(token, on_token_refresh=on_token_refresh) as http:
+            return await coro_fn(http)
+
+    return asyncio.run(main())
+
+
+def _uris(n):
+    return [f"spotify:track:t{i}" for i in range(n)]
+
+
+# =========================================================================
+# Requests and errors
+# =========================================================================
+
+
+class TestRequests:
+    """Status handling mirrors SpotifyHTTPClient."""
+
+    def test_get_returns_json(self, server):
+        assert _run(lambda http: http.get("/me"))["id"] == "fake-user"
+
+    def test_not_found_raises(self, server):
+        with pytest.raises(SpotifyNotFoundError):
+            _run(lambda http: http.get("/playlists/missing"))
+
+    def test_client_error_raises_with_message(self, server):
+        server.add_playlist("pl1", [])
+        server.fail("GET", "/playlists/pl1", status=400, body={"error": {"message": "bad"}})
+        with pytest.raises(SpotifyAPIError, match="API error 400: bad"):
+            _run(lambda http: http.get("/playlists/pl1"))
+
+    def test_server_error_is_retried(self, server):
+        server.add_playlist("pl1", [])
+        server.fail("GET", "/playlists/pl1", status=502, times=2)
+        assert _run(lambda http: http.get("/playlists/pl1"))["id"] == "pl1"
+        assert len(server.calls("GET", "/playlists/pl1")) == 3
+
+    def test_server_error_gives_up_after_max_retries(self, server):
+        server.add_playlist("pl1", [])
+        server.fail("GET", "/playlists/pl1", status=500, times=MAX_RETRIES + 1)
+        with pytest.raises(SpotifyAPIError, match="Server error 500"):
+            _run(lambda http: http.get("/playlists/pl1"))
+
+    def test_rate_limit_is_retried(self, server):
+        server.add_playlist("pl1", [])
+        server.fail("GET", "/playlists/pl1", status=429, headers={"Retry-After": "0"})
+        assert _run(lambda http: http.get("/playlists/pl1"))["id"] == "pl1"
+
+    def test_rate_limit_exhausted_carries_retry_after(self, server):
+        server.add_playlist("pl1", [])
+        server.fail(
+            "GET", "/playlists/pl1", status=429, times=MAX_RETRIES + 1, headers={"Retry-After": "0"}
+        )
+        with pytest.raises(SpotifyRateLimitError) as exc_info:
+            _run(lambda http: http.get("/playlists/pl1"))
+        assert exc_info.value.retry_after == 0
+
+    def test_rate_limit_cools_down_governor(self, server, monkeypatch):
+        governor = RateGovernor(rate=1000, burst=1000)
+        monkeypatch.setattr("shuffify.spotify.http_client._rate_governor", governor)
+        server.add_playlist("pl1", [])
+        server.fail("GET", "/playlists/pl1", status=429, headers={"Retry-After": "0"})
+
+        _run(lambda http: http.get("/playlists/pl1"))
+
+        assert governor.metrics()["requests_acquired"] == 2
+
+    def test_network_error_is_retried_then_raised(self, monkeypatch):
+        monkeypatch.setattr("shuffify.spotify.async_http_client.BASE_URL", "http://127.0.0.1:9")
+        monkeypatch.setattr("shuffify.spotify.async_http_client._calculate_backoff_delay", lambda attempt: 0)
+        with pytest.raises(SpotifyAPIError, match="Network error"):
+            _run(lambda http: http.get("/me"))
+
+    def test_no_content_returns_none(self, server):
+        server.fail("DELETE", "/me", status=204)
+        assert _run(lambda http: http.delete("/me")) is None
+
+
+# =========================================================================
+# Token refresh
+# =========================================================================
+
+
+class TestTokenRefresh:
+    """A 401 triggers exactly one refresh, sync or async."""
+
+    def test_sync_refresh_callback(self, server):
+        refreshes = []
+
+        def refresh():
+            refreshes.append(1)
+            return "good-token"
+
+        result = _run(lambda http: http.get("/me"), token="stale", on_token_refresh=refresh)
+
+        assert result["id"] == "fake-user"
+        assert refreshes == [1]
+
+    def test_async_refresh_callback(self, server):
+        async def refresh():
+            return "good-token"
+
+        result = _run(lambda http: http.get("/me"), token="stale", on_token_refresh=refresh)
+        assert result["id"] == "fake-user"
+
+    def test_refresh_that_does_not_help_raises(self, server):
+        with pytest.raises(SpotifyTokenExpiredError):
+            _run(lambda http: http.get("/me"), token="stale", on_token_refresh=lambda: "still-stale")
+
+    def test_failing_refresh_raises_token_expired(self, server):
+        def refresh():
+            raise RuntimeError("auth down")
+
+        with pytest.raises(SpotifyTokenExpiredError):
+            _run(lambda http: http.get("/me"), token="stale", on_token_refresh=refresh)
+
+    def test_without_callback_raises(self, server):
+        with pytest.raises(SpotifyTokenExpiredError):
+            _run(lambda http: http.get("/me"), token="stale")
+
+    def test_concurrent_401s_refresh_once(self, server):
+        server.add_playlist("pl1", _uris(500))
+        refreshes = []
+
+        async def refresh():
+            refreshes.append(1)
+            await asyncio.sleep(0.05)
+            return "good-token"
+
+        items = _run(
+            lambda http: http.get_all_pages("/playlists/pl1/items", params={"limit": 50}, parallel=True),
+            token="stale",
+            on_token_refresh=refresh,
+        )
+
+        assert len(items) == 500
+        assert refreshes == [1]
+
+
+# =========================================================================
+# Pagination
+# =========================================================================
+
+
+class TestPagination:
+    """Sequential and concurrent paging return items in playlist order."""
+
+    def test_sequential_follows_next(self, server):
+        server.add_playlist("pl1", _uris(45))
+        items = _run(lambda http: http.get_all_pages("/playlists/pl1/items", params={"limit": 10}))
+        assert [i["track"]["uri"] for i in items] == _uris(45)
+
+    def test_parallel_preserves_order_and_caps_concurrency(self, server):
+        server.add_playlist("pl1", _uris(1000))
+        server.page_delay = 0.02
+
+        items = _run(
+            lambda http: http.get_all_pages("/playlists/pl1/items", params={"limit": 50}, parallel=True)
+        )
+
+        assert [i["track"]["uri"] for i in items] == _uris(1000)
+        assert 1 < server.max_in_flight <= MAX_PAGE_WORKERS
+
+    def test_parallel_page_error_propagates(self, server):
+        server.add_playlist("pl1", _uris(300))
+        server.fail("GET", "/playlists/pl1/items", status=403)
+
+        with pytest.raises(SpotifyAPIError, match="API error 403"):
+            _run(lambda http: http.get_all_pages("/playlists/pl1/items", params={"limit": 50}, parallel=True))
+
+    def test_fields_are_wrapped_with_paging_fields(self, server):
+        server.add_playlist("pl1", _uris(3))
+        _run(lambda http: http.get_all_pages("/playlists/pl1/items", fields="track(uri)"))
+        query = server.calls("GET", "/playlists/pl1/items")[0][2]
+        assert query["fields"] == "items(track(uri)),total,limit,offset,next"
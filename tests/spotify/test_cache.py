@@ -252,6 +252,79 @@ class TestSpotifyCacheTracksOperations:
 
         assert result is True
 
+    def test_snapshot_tracks_are_keyed_by_snapshot(self):
+        """Tracks cached at a snapshot are stored under that snapshot
+        with the long snapshot TTL."""
+        mock_redis = Mock(spec=redis.Redis)
+        cache = SpotifyCache(mock_redis, snapshot_ttl=3600)
+
+        cache.set_playlist_tracks_at('pl1', 'snap-1', [{'id': 't1'}])
+
+        mock_redis.setex.assert_called_once_with(
+            'shuffify:cache:tracks_at:pl1:snap-1', 3600, b'[{"id": "t1"}]'
+        )
+
+    def test_snapshot_tracks_miss_for_other_snapshot(self):
+        """A different snapshot is a different key."""
+        mock_redis = Mock(spec=redis.Redis)
+        mock_redis.get.return_value = None
+        cache = SpotifyCache(mock_redis)
+
+        assert cache.get_playlist_tracks_at('pl1', 'snap-2') is None
+        mock_redis.get.assert_called_once_with('shuffify:cache:tracks_at:pl1:snap-2')
+
+    def test_invalidate_playlist_keeps_snapshot_tracks(self):
+        """Snapshot-keyed entries cannot go stale, so a write leaves them."""
+        mock_redis = Mock(spec=redis.Redis)
+        cache = SpotifyCache(mock_redis)
+
+        cache.invalidate_playlist('pl1')
+
+        deleted = mock_redis.delete.call_args.args
+        assert not any('tracks_at' in key for key in deleted)
+
+    def test_preset_tracks_use_their_own_namespace(self):
+        """Projected track lists never share a key with full ones."""
+        mock_redis = Mock(spec=redis.Redis)
+        mock_redis.get.return_value = None
+        cache = SpotifyCache(mock_redis)
+
+        cache.set_playlist_tracks('pl1', [{'uri': 'u1'}], fields='uris_only')
+        cache.get_playlist_tracks('pl1', fields='uris_only')
+
+        assert mock_redis.setex.call_args.args[0] == (
+            'shuffify:cache:tracks.uris_only:pl1'
+        )
+        mock_redis.get.assert_called_once_with('shuffify:cache:tracks.uris_only:pl1')
+
+    def test_preset_snapshot_tracks_use_long_ttl(self):
+        """Preset namespaces keep their kind's TTL in batch writes."""
+        mock_redis = Mock(spec=redis.Redis)
+        pipe = mock_redis.pipeline.return_value
+        cache = SpotifyCache(mock_redis, playlist_ttl=60, snapshot_ttl=3600)
+
+        cache.set_many_playlist_tracks({'pl1': []}, fields='shuffle_minimal')
+
+        key, ttl, _ = pipe.setex.call_args.args
+        assert key == 'shuffify:cache:tracks.shuffle_minimal:pl1'
+        assert ttl == 60
+        assert cache._ttl_for('tracks_at.shuffle_minimal') == 3600
+
+    def test_invalidate_playlist_clears_every_preset(self):
+        """A write invalidates full and projected track lists alike."""
+        mock_redis = Mock(spec=redis.Redis)
+        cache = SpotifyCache(mock_redis)
+
+        cache.invalidate_playlist('pl1')
+
+        deleted = set(mock_redis.delete.call_args.args)
+        assert {
+            'shuffify:cache:tracks:pl1',
+            'shuffify:cache:tracks.uris_only:pl1',
+            'shuffify:cache:tracks.shuffle_minimal:pl1',
+            'shuffify:cache:tracks.workshop_display:pl1',
+        } <= deleted
+
 
 class TestSpotifyCacheAudioFeaturesOperations:
     """Test audio features cache operations."""
@@ -324,6 +397,123 @@ class TestSpotifyCacheAudioFeaturesOperations:
         mock_redis.pipeline.assert_not_called()
 
 
+class TestSpotifyCacheBatchOperations:
+    """Test multi-get / multi-set across namespaces."""
+
+    def test_get_many_is_one_mget_across_namespaces(self):
+        """Entries from different namespaces come back from one MGET."""
+        mock_redis = Mock(spec=redis.Redis)
+        mock_redis.mget.return_value = [
+            json.dumps({'id': 'u1'}).encode('utf-8'),
+            None,
+            json.dumps([{'id': 't1'}]).encode('utf-8'),
+        ]
+
+        cache = SpotifyCache(mock_redis)
+        result = cache.get_many(
+            [('user', 'u1'), ('playlists', 'u1'), ('tracks', 'pl1')]
+        )
+
+        assert result == {
+            ('user', 'u1'): {'id': 'u1'},
+            ('tracks', 'pl1'): [{'id': 't1'}],
+        }
+        mock_redis.mget.assert_called_once_with([
+            'shuffify:cache:user:u1',
+            'shuffify:cache:playlists:u1',
+            'shuffify:cache:tracks:pl1',
+        ])
+        mock_redis.get.assert_not_called()
+
+    def test_get_many_collapses_duplicates(self):
+        mock_redis = Mock(spec=redis.Redis)
+        mock_redis.mget.return_value = [None]
+
+        cache = SpotifyCache(mock_redis)
+        cache.get_many([('tracks', 'pl1'), ('tracks', 'pl1')])
+
+        mock_redis.mget.assert_called_once_with(['shuffify:cache:tracks:pl1'])
+
+    def test_get_many_empty(self):
+        mock_redis = Mock(spec=redis.Redis)
+        cache = SpotifyCache(mock_redis)
+
+        assert cache.get_many([]) == {}
+        mock_redis.mget.assert_not_called()
+
+    def test_get_many_redis_error(self):
+        mock_redis = Mock(spec=redis.Redis)
+        mock_redis.mget.side_effect = redis.RedisError("down")
+        cache = SpotifyCache(mock_redis)
+
+        assert cache.get_many([('user', 'u1')]) == {}
+
+    def test_set_many_pipelines_with_namespace_ttls(self):
+        """One pipeline; each entry keeps its namespace's default TTL."""
+        mock_redis = Mock(spec=redis.Redis)
+        mock_pipe = MagicMock()
+        mock_redis.pipeline.return_value = mock_pipe
+
+        cache = SpotifyCache(
+            mock_redis, playlist_ttl=60, user_ttl=600, default_ttl=300
+        )
+        result = cache.set_many({
+            ('user', 'u1'): {'id': 'u1'},
+            ('tracks', 'pl1'): [],
+            ('search', 'q'): [],
+        })
+
+        assert result is True
+        ttls = [c.args[1] for c in mock_pipe.setex.call_args_list]
+        assert ttls == [600, 60, 300]
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        mock_pipe.execute.assert_called_once()
+
+    def test_set_many_explicit_ttl(self):
+        mock_redis = Mock(spec=redis.Redis)
+        mock_pipe = MagicMock()
+        mock_redis.pipeline.return_value = mock_pipe
+
+        cache = SpotifyCache(mock_redis)
+        cache.set_many({('user', 'u1'): {}, ('tracks', 'pl1'): []}, ttl=5)
+
+        assert [c.args[1] for c in mock_pipe.setex.call_args_list] == [5, 5]
+
+    def test_set_many_redis_error(self):
+        mock_redis = Mock(spec=redis.Redis)
+        mock_pipe = MagicMock()
+        mock_pipe.execute.side_effect = redis.RedisError("down")
+        mock_redis.pipeline.return_value = mock_pipe
+
+        cache = SpotifyCache(mock_redis)
+        assert cache.set_many({('user', 'u1'): {}}) is False
+
+    def test_set_many_empty(self):
+        mock_redis = Mock(spec=redis.Redis)
+        cache = SpotifyCache(mock_redis)
+
+        assert cache.set_many({}) is True
+        mock_redis.pipeline.assert_not_called()
+
+    def test_playlist_tracks_helpers_use_tracks_namespace(self):
+        mock_redis = Mock(spec=redis.Redis)
+        mock_redis.mget.return_value = [
+            json.dumps([{'id': 't1'}]).encode('utf-8'),
+            None,
+        ]
+        mock_pipe = MagicMock()
+        mock_redis.pipeline.return_value = mock_pipe
+
+        cache = SpotifyCache(mock_redis)
+        assert cache.get_many_playlist_tracks(['pl1', 'pl2']) == {
+            'pl1': [{'id': 't1'}]
+        }
+        cache.set_many_playlist_tracks({'pl2': [{'id': 't2'}]})
+
+        key = mock_pipe.setex.call_args.args[0]
+        assert key == 'shuffify:cache:tracks:pl2'
+
+
 class TestSpotifyCacheInvalidation:
     """Test cache invalidation operations."""
 
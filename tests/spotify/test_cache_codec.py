@@ -0,0 +1,237 @@
+"""Tests for SpotifyCache codecs and track projection."""
+
+import json
+import sys
+from unittest.mock import Mock
+
+import pytest
+import redis
+
+from shuffify.spotify.cache import SpotifyCache
+from shuffify.spotify.cache_codec import (
+    CACHE_FORMAT_VERSION,
+    JsonCodec,
+    ZlibCodec,
+    build_codec,
+    cache_format_tag,
+    project_track,
+    resolve_codec,
+)
+
+MARKETS = [f"{chr(65 + i // 26)}{chr(65 + i % 26)}" for i in range(180)]
+
+
+def _full_track(i=1):
+    """A track object shaped like the Web API's, markets and all."""
+    return {
+        "id": f"track{i}",
+        "uri": f"spotify:track:track{i}",
+        "name": f"Track {i}",
+        "duration_ms": 200000 + i,
+        "is_local": False,
+        "added_at": "2026-01-01T00:00:00Z",
+        "explicit": False,
+        "popularity": 50,
+        "preview_url": f"https://p.scdn.co/mp3-preview/{i}",
+        "href": f"https://api.spotify.com/v1/tracks/track{i}",
+        "available_markets": MARKETS,
+        "external_ids": {"isrc": f"USRC1{i:07d}"},
+        "external_urls": {"spotify": f"https://open.spotify.com/track/track{i}"},
+        "artists": [
+            {
+                "id": f"artist{i}",
+                "name": f"Artist {i}",
+                "uri": f"spotify:artist:artist{i}",
+                "href": f"https://api.spotify.com/v1/artists/artist{i}",
+                "type": "artist",
+                "external_urls": {"spotify": f"https://open.spotify.com/artist/artist{i}"},
+            }
+        ],
+        "album": {
+            "id": f"album{i}",
+            "name": f"Album {i}",
+            "uri": f"spotify:album:album{i}",
+            "available_markets": MARKETS,
+            "release_date": "2020-01-01",
+            "images": [
+                {"url": f"https://i.scdn.co/image/{i}-640", "height": 640, "width": 640},
+                {"url": f"https://i.scdn.co/image/{i}-300", "height": 300, "width": 300},
+            ],
+        },
+    }
+
+
+# =========================================================================
+# Codecs
+# =========================================================================
+
+
+class TestCodecs:
+    """Round trips and spec parsing."""
+
+    @pytest.mark.parametrize("spec", ["json", "json+zlib"])
+    def test_round_trip(self, spec):
+        codec = build_codec(spec)
+        data = {"tracks": [_full_track(i) for i in range(20)], "n": 1}
+        assert codec.decode(codec.encode(data)) == data
+        assert codec.name == spec
+
+    def test_msgpack_round_trip(self):
+        pytest.importorskip("msgpack")
+        codec = build_codec("msgpack+zlib")
+        data = [_full_track(i) for i in range(20)]
+        assert codec.decode(codec.encode(data)) == data
+
+    def test_small_values_are_not_compressed(self):
+        codec = ZlibCodec(JsonCodec(), threshold=1024)
+        payload = codec.encode({"id": "u1"})
+        assert payload[:1] == b"\x00"
+        assert codec.decode(payload) == {"id": "u1"}
+
+    def test_large_values_are_compressed(self):
+        codec = ZlibCodec(JsonCodec())
+        data = [_full_track(i) for i in range(50)]
+        payload = codec.encode(data)
+        assert payload[:1] == b"\x01"
+        assert len(payload) < len(JsonCodec().encode(data)) / 4
+
+    def test_unknown_header_is_rejected(self):
+        with pytest.raises(ValueError):
+            ZlibCodec(JsonCodec()).decode(b"\x09{}")
+
+    @pytest.mark.parametrize("spec", ["", "xml", "json+zstd", "json+zlib+zlib"])
+    def test_unknown_spec_is_rejected(self, spec):
+        with pytest.raises(ValueError):
+            build_codec(spec)
+
+    def test_missing_msgpack_falls_back_to_json_zlib(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "msgpack", None)
+        codec = resolve_codec("msgpack+zlib")
+        assert codec.name == "json+zlib"
+
+
+# =========================================================================
+# Format tag
+# =========================================================================
+
+
+class TestFormatTag:
+    """The key tag changes with every setting that changes the bytes."""
+
+    def test_legacy_json_has_no_tag(self):
+        assert cache_format_tag(JsonCodec(), project_tracks=False) == ""
+
+    def test_tag_names_version_codec_and_projection(self):
+        codec = ZlibCodec(JsonCodec())
+        assert cache_format_tag(codec, project_tracks=False) == (
+            f"v{CACHE_FORMAT_VERSION}.json+zlib"
+        )
+        assert cache_format_tag(codec, project_tracks=True) == (
+            f"v{CACHE_FORMAT_VERSION}.json+zlib.slim"
+        )
+        assert cache_format_tag(JsonCodec(), project_tracks=True) == (
+            f"v{CACHE_FORMAT_VERSION}.json.slim"
+        )
+
+
+# =========================================================================
+# Projection
+# =========================================================================
+
+
+class TestProjectTrack:
+    """Only the fields the app reads survive."""
+
+    def test_keeps_read_fields(self):
+        slim = project_track(_full_track())
+
+        assert slim["id"] == "track1"
+        assert slim["uri"] == "spotify:track:track1"
+        assert slim["name"] == "Track 1"
+        assert slim["duration_ms"] == 200001
+        assert slim["is_local"] is False
+        assert slim["added_at"] == "2026-01-01T00:00:00Z"
+        assert slim["external_urls"] == {"spotify": "https://open.spotify.com/track/track1"}
+        assert slim["artists"] == [
+            {
+                "id": "artist1",
+                "name": "Artist 1",
+                "uri": "spotify:artist:artist1",
+                "external_urls": {"spotify": "https://open.spotify.com/artist/artist1"},
+            }
+        ]
+        assert slim["album"]["name"] == "Album 1"
+        assert slim["album"]["images"][0]["url"] == "https://i.scdn.co/image/1-640"
+
+    def test_drops_unread_fields(self):
+        slim = project_track(_full_track())
+
+        for dropped in ("available_markets", "external_ids", "href", "preview_url", "popularity"):
+            assert dropped not in slim
+        assert "available_markets" not in slim["album"]
+        assert "href" not in slim["artists"][0]
+
+    def test_missing_fields_stay_missing(self):
+        assert project_track({"uri": "spotify:track:x"}) == {"uri": "spotify:track:x"}
+
+    def test_projected_list_is_much_smaller(self):
+        tracks = [_full_track(i) for i in range(100)]
+        full = len(json.dumps(tracks))
+        slim = len(json.dumps([project_track(t) for t in tracks]))
+        assert slim < full / 3
+
+
+# =========================================================================
+# SpotifyCache integration
+# =========================================================================
+
+
+class TestSpotifyCacheWithCodec:
+    """SpotifyCache uses the codec, the tag and the projection."""
+
+    def test_keys_carry_format_tag(self):
+        cache = SpotifyCache(
+            Mock(spec=redis.Redis), codec=ZlibCodec(JsonCodec()), project_tracks=True
+        )
+        assert cache._make_key("tracks", "pl1") == (
+            f"shuffify:cache:v{CACHE_FORMAT_VERSION}.json+zlib.slim:tracks:pl1"
+        )
+
+    def test_default_keys_are_unchanged(self):
+        cache = SpotifyCache(Mock(spec=redis.Redis))
+        assert cache._make_key("tracks", "pl1") == "shuffify:cache:tracks:pl1"
+
+    def test_tracks_are_projected_and_round_trip(self):
+        mock_redis = Mock(spec=redis.Redis)
+        cache = SpotifyCache(
+            mock_redis, codec=ZlibCodec(JsonCodec()), project_tracks=True
+        )
+        tracks = [_full_track(i) for i in range(30)]
+
+        cache.set_playlist_tracks("pl1", tracks)
+        stored = mock_redis.setex.call_args.args[2]
+        mock_redis.get.return_value = stored
+
+        assert cache.get_playlist_tracks("pl1") == [project_track(t) for t in tracks]
+
+    def test_batch_write_projects_tracks_only(self):
+        mock_redis = Mock(spec=redis.Redis)
+        pipe = mock_redis.pipeline.return_value
+        cache = SpotifyCache(mock_redis, codec=JsonCodec(), project_tracks=True)
+        playlist = {"id": "pl1", "available_markets": MARKETS}
+
+        cache.set_many({("tracks", "pl1"): [_full_track()], ("playlist", "pl1"): playlist})
+
+        stored = {c.args[0]: json.loads(c.args[2]) for c in pipe.setex.call_args_list}
+        tag = f"v{CACHE_FORMAT_VERSION}.json.slim"
+        assert "available_markets" not in stored[f"shuffify:cache:{tag}:tracks:pl1"][0]
+        assert stored[f"shuffify:cache:{tag}:playlist:pl1"] == playlist
+
+    def test_clear_all_covers_every_format(self):
+        mock_redis = Mock(spec=redis.Redis)
+        mock_redis.scan.return_value = (0, [])
+        cache = SpotifyCache(mock_redis, codec=ZlibCodec(JsonCodec()))
+
+        cache.clear_all()
+
+        assert mock_redis.scan.call_args.kwargs["match"] == "shuffify:cache:*"
@@ -0,0 +1,47 @@
+"""Tests for playlist-item field presets."""
+
+import pytest
+
+from shuffify.spotify.fields import (
+    PLAYLIST_ITEM_PRESETS,
+    page_fields,
+    playlist_item_fields,
+    tracks_namespace,
+)
+
+
+class TestPresets:
+    """Every preset is usable against both response shapes."""
+
+    @pytest.mark.parametrize("preset", sorted(PLAYLIST_ITEM_PRESETS))
+    def test_names_both_nested_shapes(self, preset):
+        fields = playlist_item_fields(preset)
+        assert "track(" in fields
+        assert "item(" in fields
+
+    @pytest.mark.parametrize("preset", sorted(PLAYLIST_ITEM_PRESETS))
+    def test_keeps_uri(self, preset):
+        assert "uri" in playlist_item_fields(preset)
+
+    def test_ordering_presets_keep_added_at(self):
+        assert playlist_item_fields("shuffle_minimal").startswith("added_at,")
+        assert playlist_item_fields("workshop_display").startswith("added_at,")
+
+    def test_unknown_preset_is_rejected(self):
+        with pytest.raises(ValueError):
+            playlist_item_fields("everything")
+
+
+class TestHelpers:
+    """Page wrapping and cache namespaces."""
+
+    def test_page_fields_adds_paging(self):
+        assert page_fields("track(uri)") == (
+            "items(track(uri)),total,limit,offset,next"
+        )
+
+    def test_namespaces(self):
+        assert tracks_namespace() == "tracks"
+        assert tracks_namespace("uris_only") == "tracks.uris_only"
+        assert tracks_namespace(snapshot=True) == "tracks_at"
+        assert tracks_namespace("uris_only", snapshot=True) == "tracks_at.uris_only"
@@ -507,6 +507,171 @@ class TestPagination:
         call_args = session.request.call_args
         assert call_args[1].get("params") or call_args[0]
 
+    @patch("shuffify.spotify.http_client.requests.Session")
+    def test_fields_are_wrapped_with_paging_fields(self, mock_session_cls):
+        session = mock_session_cls.return_value
+        session.headers = {}
+        session.request.return_value = _mock_response(200, {
+            "items": [{"track": {"uri": "spotify:track:1"}}],
+            "next": None,
+        })
+
+        client = SpotifyHTTPClient("token")
+        client._session = session
+        client.get_all_pages(
+            "/playlists/pl1/items", params={"limit": 100},
+            fields="track(uri)",
+        )
+
+        params = session.request.call_args.kwargs["params"]
+        assert params == {
+            "limit": 100,
+            "fields": "items(track(uri)),total,limit,offset,next",
+        }
+
+
+class TestParallelPagination:
+    """Tests for get_all_pages(parallel=True)."""
+
+    @staticmethod
+    def _page_for(params, total=250, limit=100):
+        offset = (params or {}).get("offset", 0)
+        items = [{"id": str(i)} for i in range(offset, min(offset + limit, total))]
+        has_next = offset + limit < total
+        return _mock_response(200, {
+            "items": items,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next": f"{BASE_URL}/x?offset={offset + limit}" if has_next else None,
+        })
+
+    @patch("shuffify.spotify.http_client.requests.Session")
+    def test_fetches_offset_windows_and_preserves_order(self, mock_session_cls):
+        session = mock_session_cls.return_value
+        session.headers = {}
+        session.request.side_effect = (
+            lambda method, url, params=None, json=None, timeout=None: self._page_for(params)
+        )
+
+        client = SpotifyHTTPClient("token")
+        client._session = session
+        items = client.get_all_pages(
+            "/playlists/p/items", params={"limit": 100}, parallel=True,
+        )
+
+        assert [i["id"] for i in items] == [str(i) for i in range(250)]
+        offsets = sorted(
+            (c.kwargs["params"] or {}).get("offset", 0)
+            for c in session.request.call_args_list
+        )
+        assert offsets == [0, 100, 200]
+        # Every request targets the relative path, never a ``next`` URL.
+        for c in session.request.call_args_list:
+            assert c.args[1] == f"{BASE_URL}/playlists/p/items"
+
+    @patch("shuffify.spotify.http_client.requests.Session")
+    def test_single_page_makes_one_request(self, mock_session_cls):
+        session = mock_session_cls.return_value
+        session.headers = {}
+        session.request.return_value = self._page_for({}, total=3)
+
+        client = SpotifyHTTPClient("token")
+        client._session = session
+        items = client.get_all_pages("/me/playlists", parallel=True)
+
+        assert len(items) == 3
+        assert session.request.call_count == 1
+
+    @patch("shuffify.spotify.http_client.requests.Session")
+    def test_without_total_falls_back_to_next_links(self, mock_session_cls):
+        session = mock_session_cls.return_value
+        session.headers = {}
+        session.request.side_effect = [
+            _mock_response(200, {
+                "items": [{"id": "1"}],
+                "next": f"{BASE_URL}/me/playlists?offset=1",
+            }),
+            _mock_response(200, {"items": [{"id": "2"}], "next": None}),
+        ]
+
+        client = SpotifyHTTPClient("token")
+        client._session = session
+        items = client.get_all_pages("/me/playlists", parallel=True)
+
+        assert [i["id"] for i in items] == ["1", "2"]
+        assert session.request.call_args_list[1].args[1] == (
+            f"{BASE_URL}/me/playlists?offset=1"
+        )
+
+    @patch("shuffify.spotify.http_client.time.sleep")
+    @patch("shuffify.spotify.http_client.requests.Session")
+    def test_page_retries_on_429(self, mock_session_cls, mock_sleep):
+        session = mock_session_cls.return_value
+        session.headers = {}
+        throttled = {"done": False}
+        lock = threading.Lock()
+
+        def respond(method, url, params=None, json=None, timeout=None):
+            with lock:
+                if (params or {}).get("offset") == 100 and not throttled["done"]:
+                    throttled["done"] = True
+                    return _mock_response(429, headers={"Retry-After": "1"})
+            return self._page_for(params)
+
+        session.request.side_effect = respond
+
+        client = SpotifyHTTPClient("token")
+        client._session = session
+        items = client.get_all_pages("/playlists/p/items", parallel=True)
+
+        assert len(items) == 250
+        mock_sleep.assert_called_once()
+
+    @patch("shuffify.spotify.http_client.time.sleep")
+    @patch("shuffify.spotify.http_client.requests.Session")
+    def test_exhausted_page_error_propagates(self, mock_session_cls, mock_sleep):
+        session = mock_session_cls.return_value
+        session.headers = {}
+
+        def respond(method, url, params=None, json=None, timeout=None):
+            if (params or {}).get("offset") == 200:
+                return _mock_response(503)
+            return self._page_for(params)
+
+        session.request.side_effect = respond
+
+        client = SpotifyHTTPClient("token")
+        client._session = session
+
+        with pytest.raises(SpotifyAPIError, match="Server error"):
+            client.get_all_pages("/playlists/p/items", parallel=True)
+
+    @patch("shuffify.spotify.http_client.requests.Session")
+    def test_concurrent_401s_refresh_once(self, mock_session_cls):
+        session = mock_session_cls.return_value
+        session.headers = {}
+        client = SpotifyHTTPClient("old-token", on_token_refresh=None)
+
+        def respond(method, url, params=None, json=None, timeout=None):
+            if (params or {}).get("offset", 0) and client._access_token == "old-token":
+                return _mock_response(401)
+            return self._page_for(params, total=500)
+
+        session.request.side_effect = respond
+        refresh_calls = []
+
+        def refresh():
+            refresh_calls.append(1)
+            return "new-token"
+
+        client._on_token_refresh = refresh
+        client._session = session
+        items = client.get_all_pages("/playlists/p/items", parallel=True)
+
+        assert len(items) == 500
+        assert len(refresh_calls) == 1
+
 
 # =========================================================================
 # Close
@@ -0,0 +1,280 @@
+"""Tests for the in-process LocalCacheTier and its SpotifyCache wiring."""
+
+import json
+import os
+import threading
+from unittest.mock import MagicMock, Mock
+
+import pytest
+import redis
+
+from shuffify.spotify.cache import SpotifyCache
+from shuffify.spotify.local_cache import DEFAULT_CHANNEL, LocalCacheTier
+
+# =========================================================================
+# Helpers
+# =========================================================================
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _tier(max_bytes=1000, ttl=10, redis_client=None):
+    clock = FakeClock()
+    return LocalCacheTier(max_bytes=max_bytes, ttl=ttl, redis_client=redis_client, clock=clock), clock
+
+
+def _encoded(data):
+    return json.dumps(data).encode("utf-8")
+
+
+# =========================================================================
+# LRU and TTL
+# =========================================================================
+
+
+class TestLocalCacheTier:
+    """Byte bound, LRU order and TTLs."""
+
+    def test_round_trip(self):
+        tier, _ = _tier()
+        tier.set("k", b"value")
+        assert tier.get("k") == b"value"
+
+    def test_evicts_least_recently_used_past_byte_limit(self):
+        tier, _ = _tier(max_bytes=10)
+        tier.set("a", b"aaaa")
+        tier.set("b", b"bbbb")
+        tier.get("a")  # a is now most recent
+        tier.set("c", b"cccc")
+
+        assert tier.get("b") is None
+        assert tier.get("a") == b"aaaa"
+        assert tier.get("c") == b"cccc"
+        assert tier.metrics()["bytes"] == 8
+        assert tier.metrics()["evictions"] == 1
+
+    def test_oversized_value_is_not_stored(self):
+        tier, _ = _tier(max_bytes=4)
+        tier.set("big", b"12345")
+        assert tier.get("big") is None
+        assert tier.metrics()["bytes"] == 0
+
+    def test_replacing_a_key_updates_size(self):
+        tier, _ = _tier()
+        tier.set("k", b"1234")
+        tier.set("k", b"12")
+        assert tier.metrics()["bytes"] == 2
+
+    def test_tier_ttl_expires_entries(self):
+        tier, clock = _tier(ttl=10)
+        tier.set("k", b"v")
+        clock.now += 9.9
+        assert tier.get("k") == b"v"
+        clock.now += 0.2
+        assert tier.get("k") is None
+        assert tier.metrics()["bytes"] == 0
+
+    def test_shorter_entry_ttl_wins(self):
+        tier, clock = _tier(ttl=10)
+        tier.set("k", b"v", ttl=2)
+        clock.now += 3
+        assert tier.get("k") is None
+
+    def test_metrics_count_hits_and_misses(self):
+        tier, _ = _tier()
+        tier.set("k", b"v")
+        tier.get("k")
+        tier.get("missing")
+        metrics = tier.metrics()
+        assert metrics["local_hits"] == 1
+        assert metrics["local_misses"] == 1
+
+    def test_rejects_bad_settings(self):
+        with pytest.raises(ValueError):
+            LocalCacheTier(max_bytes=0)
+        with pytest.raises(ValueError):
+            LocalCacheTier(ttl=0)
+
+    def test_state_is_rebuilt_after_fork(self, monkeypatch):
+        tier, _ = _tier()
+        tier.set("k", b"v")
+        child_pid = os.getpid() + 1
+        monkeypatch.setattr("shuffify.spotify.local_cache.os.getpid", lambda: child_pid)
+        assert tier.get("k") is None
+
+
+# =========================================================================
+# Invalidation
+# =========================================================================
+
+
+class TestInvalidation:
+    """Evictions reach every worker through pub/sub."""
+
+    def test_invalidate_evicts_and_publishes(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        tier, _ = _tier(redis_client=fake_redis)
+        tier._listener = Mock()  # no background thread in this test
+        tier.set("a", b"1")
+        tier.set("b", b"2")
+
+        tier.invalidate(["a", "b"])
+
+        assert tier.get("a") is None
+        fake_redis.publish.assert_called_once_with(DEFAULT_CHANNEL, "a\nb")
+
+    def test_invalidate_all_publishes_wildcard(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        tier, _ = _tier(redis_client=fake_redis)
+        tier.invalidate_all()
+        fake_redis.publish.assert_called_once_with(DEFAULT_CHANNEL, "*")
+
+    def test_publish_error_is_swallowed(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        fake_redis.publish.side_effect = redis.ConnectionError("down")
+        tier, _ = _tier(redis_client=fake_redis)
+        tier.set("a", b"1")
+        tier.invalidate(["a"])
+        assert tier.get("a") is None
+
+    def test_received_message_evicts_named_keys(self):
+        tier, _ = _tier()
+        tier.set("a", b"1")
+        tier.set("b", b"2")
+
+        tier._handle_message({"type": "message", "data": b"a"})
+
+        assert tier.get("a") is None
+        assert tier.get("b") == b"2"
+        assert tier.metrics()["invalidations_received"] == 1
+
+    def test_received_wildcard_clears_everything(self):
+        tier, _ = _tier()
+        tier.set("a", b"1")
+        tier._handle_message({"type": "message", "data": b"*"})
+        assert tier.metrics()["entries"] == 0
+
+    def test_listener_applies_messages_from_other_workers(self):
+        release = threading.Event()
+        delivered = threading.Event()
+
+        def listen():
+            yield {"type": "message", "data": b"shared-key"}
+            delivered.set()
+            release.wait(timeout=5)
+
+        pubsub = MagicMock()
+        pubsub.listen.side_effect = listen
+        fake_redis = MagicMock(spec=redis.Redis)
+        fake_redis.pubsub.return_value = pubsub
+        tier = LocalCacheTier(redis_client=fake_redis)
+
+        tier.get("anything")  # starts the listener
+        assert delivered.wait(timeout=5)
+        tier.set("other", b"x")
+
+        pubsub.subscribe.assert_called_once_with(DEFAULT_CHANNEL)
+        assert tier.metrics()["invalidations_received"] == 1
+        assert tier.metrics()["listening"] is True
+        release.set()
+
+
+# =========================================================================
+# SpotifyCache integration
+# =========================================================================
+
+
+class TestSpotifyCacheLocalTier:
+    """SpotifyCache reads the local tier first and keeps it coherent."""
+
+    def _cache(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        tier, _ = _tier(max_bytes=100_000, redis_client=fake_redis)
+        tier._listener = Mock()
+        return SpotifyCache(fake_redis, local_tier=tier), fake_redis, tier
+
+    def test_repeat_read_skips_redis(self):
+        cache, fake_redis, tier = self._cache()
+        fake_redis.get.return_value = _encoded([{"uri": "spotify:track:1"}])
+
+        first = cache.get_playlist_tracks("pl1")
+        second = cache.get_playlist_tracks("pl1")
+
+        assert first == second == [{"uri": "spotify:track:1"}]
+        assert first is not second  # each caller gets its own copy
+        fake_redis.get.assert_called_once()
+        metrics = tier.metrics()
+        assert metrics["local_hits"] == 1
+        assert metrics["redis_hits"] == 1
+
+    def test_redis_miss_is_counted_and_not_stored(self):
+        cache, fake_redis, tier = self._cache()
+        fake_redis.get.return_value = None
+
+        assert cache.get_user("u1") is None
+        assert cache.get_user("u1") is None
+
+        assert fake_redis.get.call_count == 2
+        assert tier.metrics()["redis_misses"] == 2
+
+    def test_write_populates_local_tier(self):
+        cache, fake_redis, _ = self._cache()
+        cache.set_playlist("pl1", {"id": "pl1"})
+
+        assert cache.get_playlist("pl1") == {"id": "pl1"}
+        fake_redis.get.assert_not_called()
+
+    def test_batch_read_only_fetches_local_misses(self):
+        cache, fake_redis, _ = self._cache()
+        cache.set_user("u1", {"id": "u1"})
+        fake_redis.mget.return_value = [_encoded([])]
+
+        result = cache.get_many([("user", "u1"), ("tracks", "pl1")])
+
+        assert result == {("user", "u1"): {"id": "u1"}, ("tracks", "pl1"): []}
+        fake_redis.mget.assert_called_once_with(["shuffify:cache:tracks:pl1"])
+
+    def test_pipelined_writes_populate_local_tier(self):
+        cache, fake_redis, _ = self._cache()
+        cache.set_many({("tracks", "pl1"): [{"uri": "x"}]})
+
+        assert cache.get_playlist_tracks("pl1") == [{"uri": "x"}]
+        fake_redis.get.assert_not_called()
+
+    def test_invalidate_playlist_evicts_and_publishes(self):
+        cache, fake_redis, _ = self._cache()
+        cache.set_playlist_tracks("pl1", [{"uri": "x"}])
+        fake_redis.get.return_value = None
+
+        cache.invalidate_playlist("pl1")
+
+        assert cache.get_playlist_tracks("pl1") is None
+        channel, message = fake_redis.publish.call_args.args
+        assert channel == DEFAULT_CHANNEL
+        assert "shuffify:cache:tracks:pl1" in message.split("\n")
+
+    def test_invalidate_deletes_in_redis_before_publishing(self):
+        """Another worker told to evict must not re-read the old value."""
+        cache, fake_redis, _ = self._cache()
+        order = []
+        fake_redis.delete.side_effect = lambda *keys: order.append("delete")
+        fake_redis.publish.side_effect = lambda *args: order.append("publish")
+
+        cache.invalidate_playlist("pl1")
+        cache.invalidate_user_playlists("u1")
+
+        assert order == ["delete", "publish", "delete", "publish"]
+
+    def test_invalidate_evicts_locally_when_redis_is_down(self):
+        cache, fake_redis, tier = self._cache()
+        cache.set_playlists("u1", [{"id": "pl1"}])
+        fake_redis.delete.side_effect = redis.ConnectionError("down")
+
+        assert cache.invalidate_user_playlists("u1") is False
+        assert tier.get("shuffify:cache:playlists:u1") is None
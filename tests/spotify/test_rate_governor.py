@@ -0,0 +1,303 @@
+"""Tests for the process-wide Spotify RateGovernor."""
+
+import asyncio
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+
+from shuffify.spotify.http_client import SpotifyHTTPClient, set_rate_governor
+from shuffify.spotify.rate_governor import RateGovernor
+
+# =========================================================================
+# Helpers
+# =========================================================================
+
+
+class FakeClock:
+    """A monotonic clock that only advances when something sleeps."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _governor(rate=2, burst=2, redis_client=None):
+    clock = FakeClock()
+    gov = RateGovernor(
+        rate=rate,
+        burst=burst,
+        redis_client=redis_client,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    return gov, clock
+
+
+def _mock_response(status_code=200, json_data=None, headers=None):
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.ok = 200 <= status_code < 300
+    resp.json.return_value = json_data or {}
+    resp.headers = headers or {}
+    resp.text = ""
+    return resp
+
+
+@pytest.fixture(autouse=True)
+def _no_global_governor():
+    """Never leak an installed governor into other test modules."""
+    set_rate_governor(None)
+    yield
+    set_rate_governor(None)
+
+
+# =========================================================================
+# Token bucket
+# =========================================================================
+
+
+class TestTokenBucket:
+    """Tests for the in-process bucket."""
+
+    def test_burst_is_free(self):
+        gov, clock = _governor(rate=2, burst=3)
+        for _ in range(3):
+            assert gov.acquire() == 0
+        assert clock.sleeps == []
+
+    def test_waits_for_refill_after_burst(self):
+        gov, clock = _governor(rate=2, burst=1)
+        gov.acquire()
+        waited = gov.acquire()
+        assert waited == pytest.approx(0.5)
+
+    def test_refills_while_idle(self):
+        gov, clock = _governor(rate=2, burst=2)
+        gov.acquire()
+        gov.acquire()
+        clock.now += 10  # idle far longer than a full refill
+        assert gov.acquire() == 0
+        assert gov.acquire() == 0
+
+    def test_rejects_bad_settings(self):
+        with pytest.raises(ValueError):
+            RateGovernor(rate=0, burst=1)
+        with pytest.raises(ValueError):
+            RateGovernor(rate=1, burst=0)
+
+
+# =========================================================================
+# Cool-down
+# =========================================================================
+
+
+class TestCoolDown:
+    """A Retry-After holds back every caller, not just the one that saw it."""
+
+    def test_acquire_waits_out_cool_down(self):
+        gov, clock = _governor(rate=100, burst=100)
+        gov.cool_down(3)
+        waited = gov.acquire()
+        assert waited == pytest.approx(3)
+        # Waited in short slices so a change elsewhere is seen promptly.
+        assert max(clock.sleeps) <= 1.0
+
+    def test_shorter_cool_down_does_not_shorten(self):
+        gov, clock = _governor(rate=100, burst=100)
+        gov.cool_down(5)
+        gov.cool_down(1)
+        assert gov.metrics()["cool_down_remaining_seconds"] == pytest.approx(5)
+
+    def test_zero_is_ignored(self):
+        gov, _ = _governor()
+        gov.cool_down(0)
+        assert gov.metrics()["cool_downs"] == 0
+
+
+# =========================================================================
+# Metrics
+# =========================================================================
+
+
+class TestMetrics:
+    """Queue depth and wait-time counters."""
+
+    def test_counts_delayed_requests_and_wait_time(self):
+        gov, _ = _governor(rate=1, burst=1)
+        gov.acquire()
+        gov.acquire()
+        metrics = gov.metrics()
+        assert metrics["backend"] == "local"
+        assert metrics["requests_acquired"] == 2
+        assert metrics["requests_delayed"] == 1
+        assert metrics["total_wait_seconds"] == pytest.approx(1)
+        assert metrics["max_wait_seconds"] == pytest.approx(1)
+        assert metrics["queue_depth"] == 0
+
+    def test_queue_depth_counts_blocked_threads(self):
+        release = threading.Event()
+        entered = threading.Barrier(3)
+
+        def blocking_sleep(_seconds):
+            release.wait(timeout=5)
+
+        gov = RateGovernor(rate=1, burst=1, sleep=blocking_sleep)
+        gov.acquire()  # drain the bucket
+
+        def waiter():
+            entered.wait()
+            gov.acquire()
+
+        threads = [threading.Thread(target=waiter) for _ in range(2)]
+        for t in threads:
+            t.start()
+        entered.wait()
+        for _ in range(50):
+            if gov.metrics()["queue_depth"] == 2:
+                break
+            threading.Event().wait(0.01)
+
+        assert gov.metrics()["queue_depth"] == 2
+        release.set()
+        for t in threads:
+            t.join(timeout=5)
+        assert gov.metrics()["max_queue_depth"] == 2
+        assert gov.metrics()["queue_depth"] == 0
+
+    def test_state_is_rebuilt_after_fork(self, monkeypatch):
+        gov, _ = _governor()
+        gov.acquire()
+        child_pid = os.getpid() + 1
+        monkeypatch.setattr(
+            "shuffify.spotify.rate_governor.os.getpid", lambda: child_pid
+        )
+        assert gov.metrics()["requests_acquired"] == 0
+
+
+# =========================================================================
+# Redis backend
+# =========================================================================
+
+
+class TestRedisBackend:
+    """The shared budget lives in Redis; errors fall back to local."""
+
+    def test_acquire_uses_shared_bucket(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        fake_redis.eval.return_value = 0
+        gov, _ = _governor(redis_client=fake_redis)
+
+        assert gov.acquire() == 0
+        args = fake_redis.eval.call_args.args
+        assert args[1] == 2
+        assert args[2] == "shuffify:ratelimit:bucket"
+        assert args[3] == "shuffify:ratelimit:cooldown"
+        assert gov.backend == "redis"
+
+    def test_waits_for_the_time_redis_reports(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        fake_redis.eval.side_effect = [250, 0]
+        gov, clock = _governor(redis_client=fake_redis)
+
+        assert gov.acquire() == pytest.approx(0.25)
+        assert clock.sleeps == [pytest.approx(0.25)]
+
+    def test_cool_down_is_published(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        gov, _ = _governor(redis_client=fake_redis)
+        gov.cool_down(4)
+        args = fake_redis.eval.call_args.args
+        assert args[2] == "shuffify:ratelimit:cooldown"
+        assert args[3] == 4000
+
+    def test_async_acquire_reserves_off_the_event_loop(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        threads = []
+
+        def eval_(*args):
+            threads.append(threading.get_ident())
+            return 0
+
+        fake_redis.eval.side_effect = eval_
+        gov, _ = _governor(redis_client=fake_redis)
+
+        async def main():
+            await gov.acquire_async()
+            await gov.cool_down_async(3)
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(main())
+
+        assert len(threads) == 2
+        assert loop_thread not in threads
+
+    def test_redis_error_falls_back_to_local_bucket(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        fake_redis.eval.side_effect = redis.ConnectionError("down")
+        gov, _ = _governor(rate=2, burst=2, redis_client=fake_redis)
+
+        assert gov.acquire() == 0
+        assert gov.metrics()["redis_errors"] == 1
+
+
+# =========================================================================
+# HTTP client integration
+# =========================================================================
+
+
+class TestHTTPClientIntegration:
+    """Every request passes through the installed governor."""
+
+    @patch("shuffify.spotify.http_client.requests.Session")
+    def test_each_request_acquires(self, mock_session_cls):
+        session = mock_session_cls.return_value
+        session.headers = {}
+        session.request.return_value = _mock_response(200, {"ok": True})
+        governor = MagicMock()
+        set_rate_governor(governor)
+
+        client = SpotifyHTTPClient("token")
+        client._session = session
+        client.get("/me")
+        client.get("/me")
+
+        assert governor.acquire.call_count == 2
+
+    @patch("shuffify.spotify.http_client.time.sleep")
+    @patch("shuffify.spotify.http_client.requests.Session")
+    def test_429_sets_global_cool_down(self, mock_session_cls, mock_sleep):
+        session = mock_session_cls.return_value
+        session.headers = {}
+        session.request.side_effect = [
+            _mock_response(429, headers={"Retry-After": "7"}),
+            _mock_response(200, {"ok": True}),
+        ]
+        governor = MagicMock()
+        set_rate_governor(governor)
+
+        client = SpotifyHTTPClient("token")
+        client._session = session
+        assert client.get("/me") == {"ok": True}
+
+        governor.cool_down.assert_called_once_with(7)
+        assert governor.acquire.call_count == 2
+
+    @patch("shuffify.spotify.http_client.requests.Session")
+    def test_no_governor_by_default(self, mock_session_cls):
+        session = mock_session_cls.return_value
+        session.headers = {}
+        session.request.return_value = _mock_response(200, {"ok": True})
+
+        client = SpotifyHTTPClient("token")
+        client._session = session
+        assert client.get("/me") == {"ok": True}
@@ -0,0 +1,262 @@
+"""Tests for SingleFlight and its use by SpotifyAPI.get_playlist_tracks."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import redis
+
+from shuffify.spotify.api import SpotifyAPI
+from shuffify.spotify.auth import TokenInfo
+from shuffify.spotify.single_flight import SingleFlight, set_single_flight
+
+from .fake_spotify import FakeSpotifyServer
+
+# =========================================================================
+# Helpers
+# =========================================================================
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def _run_concurrently(n, target):
+    """Start ``n`` threads on ``target`` and collect results in order."""
+    results = [None] * n
+    errors = [None] * n
+
+    def run(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+    return results, errors
+
+
+# =========================================================================
+# In-process coalescing
+# =========================================================================
+
+
+class TestInProcess:
+    """Concurrent callers for one key share the leader's fetch."""
+
+    def test_concurrent_callers_share_one_fetch(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(timeout=5)
+            return [{"uri": "spotify:track:1"}]
+
+        timer = threading.Timer(0.2, release.set)
+        timer.start()
+        results, errors = _run_concurrently(5, lambda: flight.do("k", fetch))
+
+        assert calls == [1]
+        assert errors == [None] * 5
+        assert all(r == [{"uri": "spotify:track:1"}] for r in results)
+        assert flight.metrics()["coalesced"] == 4
+
+    def test_followers_get_independent_copies(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        threading.Timer(0.2, release.set).start()
+
+        def fetch():
+            release.wait(timeout=5)
+            return [{"uri": "a"}]
+
+        results, _ = _run_concurrently(3, lambda: flight.do("k", fetch))
+
+        results[0].append("mutated")
+        results[1][0]["uri"] = "changed"
+        assert results[2] == [{"uri": "a"}]
+
+    def test_leader_error_is_not_shared_or_cached(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        threading.Timer(0.2, release.set).start()
+
+        def failing():
+            release.wait(timeout=5)
+            raise RuntimeError("spotify down")
+
+        _, errors = _run_concurrently(3, lambda: flight.do("k", failing))
+
+        assert all(isinstance(e, RuntimeError) for e in errors)
+        assert flight.metrics()["fetches"] == 3
+        assert flight.do("k", lambda: "fresh") == "fresh"
+        assert flight.metrics()["in_flight"] == 0
+
+    def test_followers_fetch_for_themselves_when_the_leader_fails(self):
+        """One user's expired token must not fail another user's read."""
+        flight = SingleFlight()
+        leader_started = threading.Event()
+        release = threading.Event()
+        followers = []
+
+        def leader_fetch():
+            leader_started.set()
+            release.wait(timeout=5)
+            raise RuntimeError("token expired")
+
+        def follow():
+            followers.append(flight.do("k", lambda: ["own"]))
+
+        leader = threading.Thread(
+            target=lambda: pytest.raises(RuntimeError, flight.do, "k", leader_fetch)
+        )
+        leader.start()
+        assert leader_started.wait(timeout=5)
+        threads = [threading.Thread(target=follow) for _ in range(2)]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+        release.set()
+        for t in threads + [leader]:
+            t.join(timeout=5)
+
+        assert followers == [["own"], ["own"]]
+        assert flight.metrics()["coalesced"] == 2
+
+    def test_distinct_keys_do_not_coalesce(self):
+        flight = SingleFlight()
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+        assert flight.metrics()["fetches"] == 2
+
+    def test_rejects_bad_wait_timeout(self):
+        with pytest.raises(ValueError):
+            SingleFlight(wait_timeout=0)
+
+
+# =========================================================================
+# Cross-process lock
+# =========================================================================
+
+
+class TestRedisLock:
+    """Leaders in other workers are waited on through Redis."""
+
+    def _flight(self, fake_redis):
+        clock = FakeClock()
+        return SingleFlight(redis_client=fake_redis, wait_timeout=1.0, clock=clock, sleep=clock.sleep)
+
+    def test_lock_holder_fetches_and_releases(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        fake_redis.set.return_value = True
+        flight = self._flight(fake_redis)
+
+        assert flight.do("tracks:pl1", lambda: ["fetched"], peek=lambda: None) == ["fetched"]
+
+        assert fake_redis.set.call_args.kwargs == {"nx": True, "px": 1000}
+        fake_redis.eval.assert_called_once()
+        assert fake_redis.eval.call_args.args[2] == "shuffify:flight:tracks:pl1"
+
+    def test_waits_for_other_workers_published_result(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        fake_redis.set.return_value = False
+        peeks = iter([None, None, ["from cache"]])
+        flight = self._flight(fake_redis)
+        fetch = MagicMock(return_value=["fetched"])
+
+        assert flight.do("k", fetch, peek=lambda: next(peeks)) == ["from cache"]
+
+        fetch.assert_not_called()
+        fake_redis.eval.assert_not_called()
+        assert flight.metrics()["remote_hits"] == 1
+
+    def test_fetches_after_waiting_out_a_dead_holder(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        fake_redis.set.return_value = False
+        flight = self._flight(fake_redis)
+
+        assert flight.do("k", lambda: ["fetched"], peek=lambda: None) == ["fetched"]
+        assert flight.metrics()["wait_timeouts"] == 1
+
+    def test_redis_error_falls_back_to_fetching(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        fake_redis.set.side_effect = redis.ConnectionError("down")
+        flight = self._flight(fake_redis)
+
+        assert flight.do("k", lambda: ["fetched"], peek=lambda: None) == ["fetched"]
+        assert flight.metrics()["redis_errors"] == 1
+
+    def test_without_peek_coalesces_in_process_only(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        flight = self._flight(fake_redis)
+
+        assert flight.do("k", lambda: 1) == 1
+        fake_redis.set.assert_not_called()
+
+
+# =========================================================================
+# SpotifyAPI integration
+# =========================================================================
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = FakeSpotifyServer().start()
+    monkeypatch.setattr("shuffify.spotify.http_client.BASE_URL", server.base_url)
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
+class TestGetPlaylistTracksCoalescing:
+    """A cold playlist read by many threads is paged in once."""
+
+    def _api(self):
+        token = TokenInfo(access_token="good-token", token_type="Bearer", expires_at=time.time() + 3600)
+        return SpotifyAPI(token, auto_refresh=False)
+
+    def _item_reads(self, server):
+        return len(server.calls("GET", "/playlists/pl1/items"))
+
+    def test_concurrent_reads_share_one_fetch(self, server):
+        server.add_playlist("pl1", [f"spotify:track:t{i}" for i in range(150)])
+        server.page_delay = 0.1
+        set_single_flight(SingleFlight())
+
+        results, errors = _run_concurrently(6, lambda: self._api().get_playlist_tracks("pl1"))
+
+        assert errors == [None] * 6
+        assert all(len(r) == 150 for r in results)
+        assert self._item_reads(server) == 2  # two pages, fetched once
+
+    def test_without_single_flight_each_reader_fetches(self, server):
+        server.add_playlist("pl1", [f"spotify:track:t{i}" for i in range(150)])
+        server.page_delay = 0.1
+
+        _run_concurrently(3, lambda: self._api().get_playlist_tracks("pl1"))
+
+        assert self._item_reads(server) == 6
+
+    def test_skip_cache_never_joins_a_flight(self, server):
+        server.add_playlist("pl1", ["spotify:track:a"])
+        flight = SingleFlight()
+        set_single_flight(flight)
+
+        self._api().get_playlist_tracks("pl1", skip_cache=True)
+
+        assert flight.metrics()["fetches"] == 0
@@ -0,0 +1,346 @@
+"""
+Tests for the per-playlist URI index used by raid dedupe.
+
+Covers:
+  - SpotifyCache's index commands (metadata, rebuild, update script, union)
+  - SpotifyAPI.get_indexed_playlist_uris: unchanged playlists are answered
+    by a snapshot check, changed ones are re-read and re-indexed
+  - Our own writes carry into the index under the snapshot they returned,
+    unless the playlist was edited elsewhere since the index was built
+"""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+import redis
+
+from shuffify.spotify.api import SpotifyAPI
+from shuffify.spotify.async_api import AsyncSpotifyAPI
+from shuffify.spotify.auth import TokenInfo
+from shuffify.spotify.cache import SpotifyCache
+
+from .fake_spotify import FakeSpotifyServer
+
+
+def _uris(*ids):
+    return [f"spotify:track:{i}" for i in ids]
+
+
+# =============================================================================
+# SpotifyCache
+# =============================================================================
+
+
+@pytest.fixture
+def mock_redis():
+    return Mock(spec=redis.Redis)
+
+
+class TestCacheIndexCommands:
+    def test_meta_decodes_snapshots_and_counts(self, mock_redis):
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [[b"snap-1", b"12"], [None, None]]
+        cache = SpotifyCache(mock_redis, uri_index=True)
+
+        meta = cache.get_uri_index_meta(["pl1", "pl2"])
+
+        assert meta == {"pl1": ("snap-1", 12)}
+        pipe.hmget.assert_any_call(
+            "shuffify:cache:uri_index_meta:pl1", "snapshot_id", "count"
+        )
+
+    def test_rebuild_replaces_set_and_sets_ttl(self, mock_redis):
+        pipe = mock_redis.pipeline.return_value
+        cache = SpotifyCache(mock_redis, uri_index=True, uri_index_ttl=600)
+
+        assert cache.set_uri_index("pl1", _uris("a", "b", "a"), "snap-1")
+
+        set_key = "shuffify:cache:uri_index:pl1"
+        meta_key = "shuffify:cache:uri_index_meta:pl1"
+        pipe.delete.assert_called_once_with(set_key)
+        pipe.sadd.assert_called_once_with(set_key, *_uris("a", "b"))
+        pipe.hset.assert_called_once_with(
+            meta_key, mapping={"snapshot_id": "snap-1", "count": 3}
+        )
+        pipe.expire.assert_any_call(set_key, 600)
+        pipe.expire.assert_any_call(meta_key, 600)
+
+    def test_update_sends_added_then_removed(self, mock_redis):
+        mock_redis.eval.return_value = 1
+        cache = SpotifyCache(mock_redis, uri_index=True)
+
+        updated = cache.update_uri_index(
+            "pl1",
+            "snap-2",
+            added=_uris("c"),
+            removed=_uris("a", "b"),
+            base_snapshot_id="snap-1",
+        )
+
+        assert updated is True
+        args = mock_redis.eval.call_args.args
+        assert args[1:] == (
+            2,
+            "shuffify:cache:uri_index:pl1",
+            "shuffify:cache:uri_index_meta:pl1",
+            "snap-2",
+            "0",
+            "snap-1",
+            1,
+            *_uris("c", "a", "b"),
+        )
+
+    def test_union_requires_every_index(self, mock_redis):
+        pipe = mock_redis.pipeline.return_value
+        cache = SpotifyCache(mock_redis, uri_index=True)
+
+        pipe.execute.return_value = [1, 1, {b"spotify:track:a"}]
+        assert cache.union_uri_index(["pl1", "pl2"]) == {"spotify:track:a"}
+
+        pipe.execute.return_value = [1, 0, {b"spotify:track:a"}]
+        assert cache.union_uri_index(["pl1", "pl2"]) is None
+
+    def test_redis_errors_degrade(self, mock_redis):
+        mock_redis.pipeline.return_value.execute.side_effect = (
+            redis.ConnectionError("down")
+        )
+        mock_redis.eval.side_effect = redis.ConnectionError("down")
+        cache = SpotifyCache(mock_redis, uri_index=True)
+
+        assert cache.get_uri_index_meta(["pl1"]) == {}
+        assert cache.set_uri_index("pl1", [], "snap-1") is False
+        assert cache.update_uri_index("pl1", "snap-2") is False
+        assert cache.union_uri_index(["pl1"]) is None
+
+    def test_disabled_by_default(self, mock_redis):
+        assert SpotifyCache(mock_redis).uri_index_enabled is False
+
+
+# =============================================================================
+# SpotifyAPI
+# =============================================================================
+
+
+class InMemoryIndexCache(SpotifyCache):
+    """SpotifyCache whose URI index lives in dicts (same semantics as the
+    Redis script), over a Redis mock that misses every other read."""
+
+    def __init__(self):
+        fake_redis = Mock(spec=redis.Redis)
+        fake_redis.get.return_value = None
+        fake_redis.mget.side_effect = lambda keys: [None] * len(keys)
+        super().__init__(fake_redis, uri_index=True)
+        self.sets = {}
+        self.meta = {}
+
+    def get_uri_index_meta(self, playlist_ids):
+        return {pid: self.meta[pid] for pid in playlist_ids if pid in self.meta}
+
+    def set_uri_index(self, playlist_id, uris, snapshot_id, track_count=None):
+        self.sets[playlist_id] = set(uris)
+        self.meta[playlist_id] = (snapshot_id, len(uris))
+        return True
+
+    def update_uri_index(
+        self,
+        playlist_id,
+        snapshot_id,
+        added=(),
+        removed=(),
+        replace=False,
+        base_snapshot_id=None,
+    ):
+        if playlist_id not in self.meta:
+            return False
+        if not replace and self.meta[playlist_id][0] != base_snapshot_id:
+            del self.sets[playlist_id], self.meta[playlist_id]
+            return False
+        members = set() if replace else self.sets[playlist_id]
+        count = 0 if replace else self.meta[playlist_id][1]
+        count -= len(members & set(removed))
+        members = (members - set(removed)) | set(added)
+        self.sets[playlist_id] = members
+        self.meta[playlist_id] = (snapshot_id, count + len(added))
+        return True
+
+    def union_uri_index(self, playlist_ids):
+        if not all(pid in self.meta for pid in playlist_ids):
+            return None
+        return set().union(*(self.sets[pid] for pid in playlist_ids))
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = FakeSpotifyServer().start()
+    monkeypatch.setattr("shuffify.spotify.http_client.BASE_URL", server.base_url)
+    monkeypatch.setattr("shuffify.spotify.async_http_client.BASE_URL", server.base_url)
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
+def _token():
+    return TokenInfo(
+        access_token="good-token",
+        token_type="Bearer",
+        expires_at=time.time() + 3600,
+    )
+
+
+def _api(cache):
+    return SpotifyAPI(_token(), auto_refresh=False, cache=cache)
+
+
+def _item_reads(server, playlist_id):
+    return len(server.calls("GET", f"/playlists/{playlist_id}/items"))
+
+
+class TestIndexedPlaylistUris:
+    def test_first_read_builds_index(self, server):
+        server.add_playlist("target", _uris("a", "b"))
+        server.add_playlist("archive", _uris("c"))
+        cache = InMemoryIndexCache()
+
+        uris, counts = _api(cache).get_indexed_playlist_uris(["target", "archive"])
+
+        assert uris == set(_uris("a", "b", "c"))
+        assert counts == {"target": 2, "archive": 1}
+        assert cache.meta["target"] == ("snap-1", 2)
+
+    def test_unchanged_playlists_are_not_read_again(self, server):
+        server.add_playlist("target", _uris("a", "b"))
+        cache = InMemoryIndexCache()
+        api = _api(cache)
+        api.get_indexed_playlist_uris(["target"])
+
+        api.get_indexed_playlist_uris(["target"])
+
+        assert _item_reads(server, "target") == 1
+
+    def test_our_writes_keep_index_current(self, server):
+        server.add_playlist("target", _uris("a", "b"))
+        cache = InMemoryIndexCache()
+        api = _api(cache)
+        api.get_indexed_playlist_uris(["target"])
+
+        api.playlist_add_items("target", _uris("c"))
+        api.playlist_remove_items("target", _uris("a"))
+        uris, counts = api.get_indexed_playlist_uris(["target"])
+
+        assert uris == set(_uris("b", "c"))
+        assert counts == {"target": 2}
+        assert _item_reads(server, "target") == 1
+
+    def test_full_replace_keeps_index_current(self, server):
+        server.add_playlist("target", _uris("a", "b"))
+        cache = InMemoryIndexCache()
+        api = _api(cache)
+        api.get_indexed_playlist_uris(["target"])
+
+        api.update_playlist_tracks("target", _uris("d", "e", "f"))
+        uris, _ = api.get_indexed_playlist_uris(["target"])
+
+        assert uris == set(_uris("d", "e", "f"))
+        assert _item_reads(server, "target") == 1
+
+    def test_outside_change_triggers_reindex(self, server):
+        server.add_playlist("target", _uris("a"))
+        cache = InMemoryIndexCache()
+        api = _api(cache)
+        api.get_indexed_playlist_uris(["target"])
+
+        # Edited in the Spotify app: new snapshot, index never told.
+        with server.lock:
+            server.playlists["target"].append("spotify:track:x")
+            server.snapshots["target"] += 1
+        uris, _ = api.get_indexed_playlist_uris(["target"])
+
+        assert uris == set(_uris("a", "x"))
+        assert _item_reads(server, "target") == 2
+
+    def test_outside_edit_then_our_add_reindexes(self, server):
+        server.add_playlist("target", _uris("a"))
+        cache = InMemoryIndexCache()
+        api = _api(cache)
+        api.get_indexed_playlist_uris(["target"])
+
+        # Edited in the Spotify app, then written to by us: the add's
+        # snapshot must not vouch for an index that never saw "x".
+        with server.lock:
+            server.playlists["target"].append("spotify:track:x")
+            server.snapshots["target"] += 1
+        api.playlist_add_items("target", _uris("c"))
+        uris, counts = api.get_indexed_playlist_uris(["target"])
+
+        assert uris == set(_uris("a", "x", "c"))
+        assert counts == {"target": 3}
+        assert _item_reads(server, "target") == 2
+
+    def test_outside_edit_then_our_remove_reindexes(self, server):
+        server.add_playlist("target", _uris("a", "b"))
+        cache = InMemoryIndexCache()
+        api = _api(cache)
+        api.get_indexed_playlist_uris(["target"])
+
+        with server.lock:
+            server.playlists["target"].append("spotify:track:x")
+            server.snapshots["target"] += 1
+        api.playlist_remove_items("target", _uris("a"))
+        uris, _ = api.get_indexed_playlist_uris(["target"])
+
+        assert uris == set(_uris("b", "x"))
+
+    def test_writes_without_index_create_nothing(self, server):
+        server.add_playlist("other", _uris("a"))
+        cache = InMemoryIndexCache()
+
+        _api(cache).playlist_add_items("other", _uris("b"))
+
+        assert cache.meta == {}
+
+    def test_disabled_index_returns_none(self, server):
+        server.add_playlist("target", _uris("a"))
+        cache = InMemoryIndexCache()
+        cache._uri_index = False
+
+        assert _api(cache).get_indexed_playlist_uris(["target"]) is None
+        assert server.calls("GET", "/playlists/target") == []
+
+
+class TestAsyncIndexedPlaylistUris:
+    def test_mirrors_sync_behaviour(self, server):
+        server.add_playlist("target", _uris("a", "b"))
+        cache = InMemoryIndexCache()
+
+        async def main():
+            async with AsyncSpotifyAPI(_token(), auto_refresh=False, cache=cache) as api:
+                await api.get_indexed_playlist_uris(["target"])
+                await api.playlist_add_items("target", _uris("c"))
+                return await api.get_indexed_playlist_uris(["target"])
+
+        uris, counts = asyncio.run(main())
+
+        assert uris == set(_uris("a", "b", "c"))
+        assert counts == {"target": 3}
+        assert _item_reads(server, "target") == 1
+
+    def test_outside_edit_then_our_add_reindexes(self, server):
+        server.add_playlist("target", _uris("a"))
+        cache = InMemoryIndexCache()
+
+        async def main():
+            async with AsyncSpotifyAPI(_token(), auto_refresh=False, cache=cache) as api:
+                await api.get_indexed_playlist_uris(["target"])
+                with server.lock:
+                    server.playlists["target"].append("spotify:track:x")
+                    server.snapshots["target"] += 1
+                await api.playlist_add_items("target", _uris("c"))
+                return await api.get_indexed_playlist_uris(["target"])
+
+        uris, counts = asyncio.run(main())
+
+        assert uris == set(_uris("a", "x", "c"))
+        assert counts == {"target": 3}
@@ -0,0 +1,198 @@
+"""Tests for the playlist write planner."""
+
+import random
+
+import pytest
+
+from shuffify.spotify.write_planner import (
+    OP_INSERT,
+    OP_REMOVE,
+    OP_REORDER,
+    apply_ops,
+    full_replace_cost,
+    plan_playlist_write,
+)
+
+
+def _uris(n, prefix="t"):
+    return [f"spotify:track:{prefix}{i:05d}" for i in range(n)]
+
+
+def _assert_plan_reaches(current, desired, plan):
+    assert not plan.full_replace
+    assert apply_ops(current, plan.ops) == desired
+    assert plan.call_count == len(plan.ops)
+
+
+# =========================================================================
+# Cost model
+# =========================================================================
+
+
+class TestFullReplaceCost:
+    """One PUT plus one POST per further 100 URIs."""
+
+    @pytest.mark.parametrize(
+        "count,expected", [(0, 1), (1, 1), (100, 1), (101, 2), (2000, 20)]
+    )
+    def test_cost(self, count, expected):
+        assert full_replace_cost(count) == expected
+
+
+# =========================================================================
+# Diff plans
+# =========================================================================
+
+
+class TestDiffPlans:
+    """Small edits become a handful of calls."""
+
+    def test_identical_lists_need_no_calls(self):
+        uris = _uris(500)
+        plan = plan_playlist_write(uris, list(uris))
+        assert plan.ops == []
+        assert plan.full_replace is False
+        assert plan.call_count == 0
+
+    def test_drip_append_is_one_post(self):
+        current = _uris(2000)
+        desired = current + _uris(3, prefix="new")
+        plan = plan_playlist_write(current, desired)
+
+        _assert_plan_reaches(current, desired, plan)
+        assert [op.kind for op in plan.ops] == [OP_INSERT]
+        assert plan.ops[0].position == 2000
+
+    def test_insert_in_the_middle_uses_final_position(self):
+        current = _uris(10)
+        desired = current[:4] + ["spotify:track:x"] + current[4:]
+        plan = plan_playlist_write(current, desired)
+
+        _assert_plan_reaches(current, desired, plan)
+        assert plan.ops[0].position == 4
+
+    def test_removal_is_one_delete(self):
+        current = _uris(300)
+        desired = current[:50] + current[51:]
+        plan = plan_playlist_write(current, desired)
+
+        _assert_plan_reaches(current, desired, plan)
+        assert [op.kind for op in plan.ops] == [OP_REMOVE]
+
+    def test_moving_one_track_is_one_reorder(self):
+        current = _uris(1000)
+        desired = current[1:600] + [current[0]] + current[600:]
+        plan = plan_playlist_write(current, desired)
+
+        _assert_plan_reaches(current, desired, plan)
+        assert [op.kind for op in plan.ops] == [OP_REORDER]
+
+    def test_mixed_edit_runs_removes_then_moves_then_inserts(self):
+        current = _uris(400)
+        desired = (
+            [current[399]]
+            + current[:10]
+            + _uris(2, prefix="new")
+            + current[11:399]
+        )
+        plan = plan_playlist_write(current, desired)
+
+        _assert_plan_reaches(current, desired, plan)
+        assert [op.kind for op in plan.ops] == [OP_REMOVE, OP_REORDER, OP_INSERT]
+
+    def test_large_insert_run_is_chunked_at_batch_size(self):
+        current = _uris(1000)
+        desired = current[:500] + _uris(150, prefix="new") + current[500:]
+        plan = plan_playlist_write(current, desired)
+
+        _assert_plan_reaches(current, desired, plan)
+        assert [op.position for op in plan.ops] == [500, 600]
+
+    def test_added_duplicate_copy_is_inserted(self):
+        current = _uris(5)
+        desired = current + [current[2]]
+        plan = plan_playlist_write(current, desired)
+
+        _assert_plan_reaches(current, desired, plan)
+
+    def test_clearing_a_small_playlist_is_one_delete(self):
+        current = _uris(40)
+        plan = plan_playlist_write(current, [])
+
+        _assert_plan_reaches(current, [], plan)
+
+
+# =========================================================================
+# Full-replace fallback
+# =========================================================================
+
+
+class TestFullReplaceFallback:
+    """The diff is only used when it costs no more than PUT+POST."""
+
+    def test_full_shuffle_falls_back(self):
+        current = _uris(1000)
+        desired = list(current)
+        random.Random(7).shuffle(desired)
+        plan = plan_playlist_write(current, desired)
+
+        assert plan.full_replace is True
+        assert plan.ops == []
+        assert plan.call_count == 10
+
+    def test_shuffle_with_most_positions_locked_uses_diff(self):
+        current = _uris(1000)
+        desired = list(current)
+        # Only five unlocked tracks trade places.
+        desired[10], desired[500] = desired[500], desired[10]
+        desired[20], desired[900] = desired[900], desired[20]
+        plan = plan_playlist_write(current, desired)
+
+        _assert_plan_reaches(current, desired, plan)
+        assert plan.call_count <= 4
+
+    def test_partial_duplicate_removal_falls_back(self):
+        # DELETE by URI would drop both copies.
+        current = ["spotify:track:a", "spotify:track:b", "spotify:track:a"]
+        desired = ["spotify:track:a", "spotify:track:b"]
+        plan = plan_playlist_write(current, desired)
+
+        assert plan.full_replace is True
+
+    def test_replacing_every_track_falls_back(self):
+        current = _uris(300)
+        desired = _uris(300, prefix="new")
+        plan = plan_playlist_write(current, desired)
+
+        assert plan.full_replace is True
+        assert plan.call_count == 3
+
+
+# =========================================================================
+# Replay
+# =========================================================================
+
+
+class TestApplyOps:
+    """apply_ops follows Spotify's insert_before convention."""
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_random_small_edits_round_trip(self, seed):
+        rng = random.Random(seed)
+        current = _uris(rng.randint(0, 60))
+        desired = [u for u in current if rng.random() > 0.1]
+        for _ in range(rng.randint(0, 3)):
+            i, j = rng.randrange(len(desired) + 1), rng.randrange(len(desired) + 1)
+            if i < len(desired):
+                desired.insert(j, desired.pop(i))
+        for k in range(rng.randint(0, 3)):
+            desired.insert(rng.randrange(len(desired) + 1), f"spotify:track:new{k}")
+
+        plan = plan_playlist_write(current, desired, batch_size=5)
+
+        if not plan.full_replace:
+            assert apply_ops(current, plan.ops) == desired
+
+    def test_forward_move_accounts_for_removed_range(self):
+        ops = plan_playlist_write(["a", "b", "c", "d"], ["b", "c", "d", "a"]).ops
+        assert apply_ops(["a", "b", "c", "d"], ops) == ["b", "c", "d", "a"]
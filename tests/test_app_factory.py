@@ -265,6 +265,192 @@ class TestGetSpotifyCache:
         # Clean up
         shuffify._redis_client = None
 
+    def test_get_spotify_cache_uses_configured_codec(self):
+        """CACHE_CODEC and CACHE_TRACK_PROJECTION reach the cache and its
+        key format; the codec is resolved once and reused."""
+        from flask import Flask
+
+        import shuffify
+
+        shuffify._redis_client = Mock(spec=redis.Redis)
+        app = Flask(__name__)
+        app.config["CACHE_CODEC"] = "json+zlib"
+        app.config["CACHE_TRACK_PROJECTION"] = True
+
+        with app.app_context():
+            first = shuffify.get_spotify_cache()
+            second = shuffify.get_spotify_cache()
+
+        assert first._codec.name == "json+zlib"
+        assert first._codec is second._codec
+        assert ".json+zlib.slim:" in first._make_key("tracks", "pl1")
+
+        shuffify._redis_client = None
+
+
+class TestRateGovernorInit:
+    """Tests for _init_rate_governor."""
+
+    def _app(self, **config):
+        from flask import Flask
+
+        app = Flask(__name__)
+        app.config.update(config)
+        return app
+
+    def test_disabled_installs_nothing(self):
+        from shuffify import _init_rate_governor
+        from shuffify.spotify.http_client import get_rate_governor
+
+        app = self._app(SPOTIFY_RATE_LIMIT_ENABLED=False)
+        assert _init_rate_governor(app, None) is None
+        assert get_rate_governor() is None
+
+    def test_enabled_installs_local_governor_without_redis(self):
+        from shuffify import _init_rate_governor
+        from shuffify.spotify.http_client import get_rate_governor
+
+        app = self._app(
+            SPOTIFY_RATE_LIMIT_ENABLED=True,
+            SPOTIFY_RATE_LIMIT_PER_SECOND=3,
+            SPOTIFY_RATE_LIMIT_BURST=9,
+        )
+        governor = _init_rate_governor(app, None)
+
+        assert get_rate_governor() is governor
+        assert governor.backend == "local"
+        assert governor.metrics()["burst"] == 9
+
+    def test_enabled_shares_bucket_through_redis(self):
+        from shuffify import _init_rate_governor
+
+        app = self._app(SPOTIFY_RATE_LIMIT_ENABLED=True)
+        governor = _init_rate_governor(app, Mock(spec=redis.Redis))
+
+        assert governor.backend == "redis"
+
+    def test_testing_config_disables_governor(self):
+        from config import TestConfig
+
+        assert TestConfig.SPOTIFY_RATE_LIMIT_ENABLED is False
+
+
+class TestSingleFlightInit:
+    """Tests for _init_single_flight."""
+
+    def _app(self, **config):
+        from flask import Flask
+
+        app = Flask(__name__)
+        app.config.update(config)
+        return app
+
+    def test_disabled_installs_nothing(self):
+        from shuffify import _init_single_flight
+        from shuffify.spotify.single_flight import get_single_flight
+
+        app = self._app(SPOTIFY_SINGLE_FLIGHT_ENABLED=False)
+        assert _init_single_flight(app, Mock(spec=redis.Redis)) is None
+        assert get_single_flight() is None
+
+    def test_enabled_is_local_unless_redis_is_opted_in(self):
+        from shuffify import _init_single_flight
+        from shuffify.spotify.single_flight import get_single_flight
+
+        app = self._app(SPOTIFY_SINGLE_FLIGHT_ENABLED=True)
+        flight = _init_single_flight(app, Mock(spec=redis.Redis))
+
+        assert get_single_flight() is flight
+        assert flight.backend == "local"
+
+    def test_redis_backend_when_opted_in(self):
+        from shuffify import _init_single_flight
+
+        app = self._app(SPOTIFY_SINGLE_FLIGHT_ENABLED=True, SPOTIFY_SINGLE_FLIGHT_REDIS=True)
+        assert _init_single_flight(app, Mock(spec=redis.Redis)).backend == "redis"
+
+    def test_testing_config_disables_single_flight(self):
+        from config import TestConfig
+
+        assert TestConfig.SPOTIFY_SINGLE_FLIGHT_ENABLED is False
+
+
+class TestAccessTokenCacheInit:
+    """Tests for _init_access_token_cache."""
+
+    def _app(self, **config):
+        from flask import Flask
+
+        app = Flask(__name__)
+        app.config.update(config)
+        return app
+
+    def test_disabled_returns_none(self):
+        from shuffify import _init_access_token_cache
+
+        app = self._app(ACCESS_TOKEN_CACHE_ENABLED=False)
+        assert _init_access_token_cache(app, None) is None
+
+    def test_enabled_without_redis_is_local(self):
+        from shuffify import _init_access_token_cache
+
+        app = self._app(ACCESS_TOKEN_CACHE_ENABLED=True, ACCESS_TOKEN_REFRESH_MARGIN=300)
+        cache = _init_access_token_cache(app, None)
+
+        assert cache.backend == "local"
+        assert cache.refresh_margin == 300
+
+    def test_enabled_with_redis_is_shared(self):
+        from shuffify import _init_access_token_cache
+
+        app = self._app(ACCESS_TOKEN_CACHE_ENABLED=True)
+        cache = _init_access_token_cache(app, Mock(spec=redis.Redis))
+
+        assert cache.backend == "redis"
+
+    def test_testing_config_disables_cache(self):
+        from config import TestConfig
+
+        assert TestConfig.ACCESS_TOKEN_CACHE_ENABLED is False
+
+
+class TestLocalCacheTierInit:
+    """Tests for _init_local_cache_tier."""
+
+    def _app(self, **config):
+        from flask import Flask
+
+        app = Flask(__name__)
+        app.config.update(config)
+        return app
+
+    def test_disabled_returns_none(self):
+        from shuffify import _init_local_cache_tier
+
+        app = self._app(CACHE_LOCAL_TIER_ENABLED=False)
+        assert _init_local_cache_tier(app, Mock(spec=redis.Redis)) is None
+
+    def test_without_redis_returns_none(self):
+        from shuffify import _init_local_cache_tier
+
+        app = self._app(CACHE_LOCAL_TIER_ENABLED=True)
+        assert _init_local_cache_tier(app, None) is None
+
+    def test_enabled_builds_tier_from_config(self):
+        from shuffify import _init_local_cache_tier
+
+        app = self._app(
+            CACHE_LOCAL_TIER_ENABLED=True, CACHE_LOCAL_MAX_BYTES=4096, CACHE_LOCAL_TTL=5
+        )
+        tier = _init_local_cache_tier(app, Mock(spec=redis.Redis))
+
+        assert tier.metrics()["max_bytes"] == 4096
+
+    def test_testing_config_disables_tier(self):
+        from config import TestConfig
+
+        assert TestConfig.CACHE_LOCAL_TIER_ENABLED is False
+
 
 class TestRedisClientCreation:
     """Tests for _create_redis_client function."""
@@ -54,7 +54,7 @@ BASELINE = {
     "services/test_job_executor_rotate.py": 12,
     "services/test_job_executor_service.py": 2,
     "services/test_playlist_lock.py": 1,
-    "services/test_verify_playlist_state.py": 14,
+    "services/test_verify_playlist_state.py": 13,
     "spotify/test_api.py": 37,
     "spotify/test_api_search.py": 4,
     "spotify/test_api_write_contracts.py": 18,
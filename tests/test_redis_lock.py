@@ -0,0 +1,78 @@
+"""Tests for the shared SET NX PX lock helper."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import redis
+
+from shuffify import redis_lock
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def _acquire(fake_redis, ready=lambda: None, timeout=1.0):
+    clock = FakeClock()
+    return redis_lock.acquire_or_wait(
+        fake_redis, "lock:k", timeout, ready, clock, clock.sleep
+    )
+
+
+class TestAcquireOrWait:
+    def test_free_lock_is_taken_with_ttl(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        fake_redis.set.return_value = True
+
+        attempt = _acquire(fake_redis, timeout=2.5)
+
+        assert attempt.owner is not None
+        assert not attempt.waited
+        args, kwargs = fake_redis.set.call_args
+        assert args == ("lock:k", attempt.owner)
+        assert kwargs == {"nx": True, "px": 2500}
+
+    def test_held_lock_returns_what_the_holder_published(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        fake_redis.set.return_value = False
+        published = iter([None, []])
+
+        attempt = _acquire(fake_redis, ready=lambda: next(published))
+
+        # An empty result is still a result.
+        assert attempt.result == []
+        assert attempt.owner is None
+        assert attempt.waited and not attempt.timed_out
+
+    def test_gives_up_waiting_at_the_timeout(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        fake_redis.set.return_value = False
+
+        attempt = _acquire(fake_redis)
+
+        assert attempt.timed_out
+        assert fake_redis.set.call_count == 21  # first try, then 20 polls
+
+    def test_redis_errors_propagate(self):
+        fake_redis = MagicMock(spec=redis.Redis)
+        fake_redis.set.side_effect = redis.ConnectionError("down")
+
+        with pytest.raises(redis.ConnectionError):
+            _acquire(fake_redis)
+
+
+def test_release_only_deletes_our_own_lock():
+    fake_redis = MagicMock(spec=redis.Redis)
+
+    redis_lock.release(fake_redis, "lock:k", "owner-1")
+
+    fake_redis.eval.assert_called_once_with(
+        redis_lock.RELEASE_SCRIPT, 1, "lock:k", "owner-1"
+    )
@@ -18,6 +18,7 @@ from shuffify.scheduler import (
     _on_job_executed,
     _on_job_missed,
     _parse_schedule,
+    _register_existing_jobs,
     _try_acquire_scheduler_lock,
     add_job_for_schedule,
     get_scheduler,
@@ -37,6 +38,8 @@ def reset_scheduler():
     """Reset global scheduler state between tests."""
     scheduler_module._scheduler = None
     scheduler_module._lock_connection = None
+    scheduler_module._fire_planner = None
+    scheduler_module._fire_histogram.clear()
     scheduler_module._metrics = {
         "jobs_executed": 0,
         "jobs_failed": 0,
@@ -54,6 +57,10 @@ def reset_scheduler():
         except Exception:
             pass
     scheduler_module._scheduler = None
+    scheduler_module._fire_planner = None
+    if scheduler_module._dispatcher is not None:
+        scheduler_module._dispatcher.shutdown()
+        scheduler_module._dispatcher = None
     if scheduler_module._lock_connection is not None:
         try:
             scheduler_module._lock_connection.close()
@@ -313,6 +320,36 @@ class TestExecuteScheduledJob:
         mock_logger.error.assert_called_once()
         assert "failed" in mock_logger.error.call_args[0][0].lower()
 
+    def test_queues_on_dispatcher_when_enabled(self, db_app):
+        from shuffify.models.db import Schedule, User, db
+
+        user = User(spotify_id="dispatch_user", display_name="D")
+        db.session.add(user)
+        db.session.flush()
+        schedule = Schedule(
+            user_id=user.id,
+            job_type="raid",
+            target_playlist_id="pl1",
+            schedule_type="interval",
+            schedule_value="daily",
+        )
+        db.session.add(schedule)
+        db.session.commit()
+        schedule_id, user_id = schedule.id, user.id
+
+        scheduler_module._app = db_app
+        scheduler_module._dispatcher = MagicMock()
+        with patch(
+            "shuffify.services.executors.JobExecutorService"
+        ) as mock_executor:
+            result = _execute_scheduled_job(schedule_id)
+
+        assert result is scheduler_module._DISPATCHED
+        scheduler_module._dispatcher.submit.assert_called_once_with(
+            schedule_id, user_id, "raid"
+        )
+        mock_executor.execute.assert_not_called()
+
 
 # =============================================================================
 # Event listeners
@@ -402,6 +439,7 @@ class TestConfigurablePool:
         """Pool size should come from config."""
         app.config["SCHEDULER_ENABLED"] = True
         app.config["SCHEDULER_THREAD_POOL_SIZE"] = 15
+        app.config["SCHEDULER_FAIR_SHARE_ENABLED"] = False
         app.debug = False
         monkeypatch.setenv("WERKZEUG_RUN_MAIN", "true")
 
@@ -419,6 +457,7 @@ class TestConfigurablePool:
         """Pool size should default to 10 if not configured."""
         app.config["SCHEDULER_ENABLED"] = True
         app.config.pop("SCHEDULER_THREAD_POOL_SIZE", None)
+        app.config["SCHEDULER_FAIR_SHARE_ENABLED"] = False
         app.debug = False
         monkeypatch.setenv("WERKZEUG_RUN_MAIN", "true")
 
@@ -432,6 +471,24 @@ class TestConfigurablePool:
             init_scheduler(app)
             mock_pool.assert_called_once_with(max_workers=10)
 
+    def test_fair_share_dispatcher_gets_pool_size(self, app, monkeypatch):
+        """With fair-share dispatch the pool size goes to the dispatcher."""
+        app.config["SCHEDULER_ENABLED"] = True
+        app.config["SCHEDULER_THREAD_POOL_SIZE"] = 6
+        app.config["SCHEDULER_FAIR_SHARE_ENABLED"] = True
+        app.debug = False
+        monkeypatch.setenv("WERKZEUG_RUN_MAIN", "true")
+
+        with patch.object(
+            scheduler_module, '_register_existing_jobs'
+        ), patch.object(
+            scheduler_module, '_cleanup_stale_executions'
+        ):
+            init_scheduler(app)
+
+        assert scheduler_module._dispatcher.workers == 6
+        assert get_scheduler_metrics()["queue"]["queued"] == 0
+
 
 # =============================================================================
 # Advisory lock
@@ -554,6 +611,21 @@ class TestSchedulerMetrics:
         _on_job_error(event)
         assert scheduler_module._metrics["jobs_failed"] == 1
 
+    def test_dispatched_jobs_count_when_they_finish(self):
+        """With fair-share dispatch, the enqueue is not an execution."""
+        event = Mock()
+        event.job_id = "schedule_1"
+        event.retval = scheduler_module._DISPATCHED
+        _on_job_executed(event)
+        assert scheduler_module._metrics["jobs_executed"] == 0
+        assert scheduler_module._metrics["last_execution_at"] is None
+
+        scheduler_module._on_dispatched_job_done(1, None)
+        scheduler_module._on_dispatched_job_done(2, RuntimeError("boom"))
+        assert scheduler_module._metrics["jobs_executed"] == 1
+        assert scheduler_module._metrics["jobs_failed"] == 1
+        assert scheduler_module._metrics["last_execution_at"] is not None
+
     def test_missed_event_increments_counter(self):
         """Missed execution should increment counter."""
         event = Mock()
@@ -684,3 +756,116 @@ class TestStaleCleanup:
 
         db.session.refresh(recent_exec)
         assert recent_exec.status == "running"
+
+
+# =============================================================================
+# Boot reconcile (_register_existing_jobs)
+# =============================================================================
+
+class TestReconcileExistingJobs:
+    """Tests for the jobstore reconcile at startup."""
+
+    @pytest.fixture
+    def paused_scheduler(self, tmp_path):
+        from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+        from apscheduler.schedulers.background import BackgroundScheduler
+
+        store = SQLAlchemyJobStore(url=f"sqlite:///{tmp_path}/jobs.db")
+        sched = BackgroundScheduler(
+            jobstores={"default": store},
+            job_defaults=scheduler_module.JOB_DEFAULTS,
+            timezone=timezone.utc,
+        )
+        sched.start(paused=True)
+        scheduler_module._scheduler = sched
+        yield sched, store
+
+    def _add_schedules(self, count):
+        from shuffify.models.db import Schedule, User, db
+
+        user = User(spotify_id="reconcile_user", display_name="R")
+        db.session.add(user)
+        db.session.flush()
+        schedules = [
+            Schedule(
+                user_id=user.id,
+                job_type="shuffle",
+                target_playlist_id=f"pl{i}",
+                schedule_type="interval",
+                schedule_value="daily",
+            )
+            for i in range(count)
+        ]
+        db.session.add_all(schedules)
+        db.session.commit()
+        return schedules
+
+    def test_registers_missing_jobs(self, db_app, paused_scheduler):
+        sched, store = paused_scheduler
+        schedules = self._add_schedules(3)
+
+        _register_existing_jobs(store)
+
+        assert {job.id for job in sched.get_jobs()} == {
+            f"schedule_{s.id}" for s in schedules
+        }
+        job = sched.get_job(f"schedule_{schedules[0].id}")
+        assert job.args == (schedules[0].id,)
+        assert job.trigger.interval.days == 1
+
+    def test_only_changed_jobs_are_rewritten(self, db_app, paused_scheduler):
+        from shuffify.models.db import db
+
+        sched, store = paused_scheduler
+        unchanged, edited, disabled = self._add_schedules(3)
+        _register_existing_jobs(store)
+        kept_run_time = sched.get_job(f"schedule_{unchanged.id}").next_run_time
+
+        edited.schedule_value = "weekly"
+        disabled.is_enabled = False
+        db.session.commit()
+
+        with patch.object(
+            scheduler_module,
+            "_write_jobs_batched",
+            wraps=scheduler_module._write_jobs_batched,
+        ) as write:
+            _register_existing_jobs(store)
+
+        _, stale_ids, rewritten = write.call_args.args
+        assert stale_ids == [f"schedule_{disabled.id}"]
+        assert [row.id for row in rewritten] == [edited.id]
+        assert sched.get_job(f"schedule_{disabled.id}") is None
+        assert sched.get_job(f"schedule_{edited.id}").trigger.interval.days == 7
+        assert (
+            sched.get_job(f"schedule_{unchanged.id}").next_run_time
+            == kept_run_time
+        )
+
+    def test_enabling_smoothing_rewrites_and_reserves(
+        self, db_app, paused_scheduler
+    ):
+        from shuffify.scheduler_smoothing import FirePlanner, OffsetTrigger
+
+        sched, store = paused_scheduler
+        schedules = self._add_schedules(2)
+        _register_existing_jobs(store)
+
+        scheduler_module._fire_planner = FirePlanner(300)
+        _register_existing_jobs(store)
+        assert all(
+            isinstance(job.trigger, OffsetTrigger) for job in sched.get_jobs()
+        )
+
+        # A restart with the same config keeps the jobs and re-reserves
+        # their slots in the fresh planner.
+        scheduler_module._fire_planner = FirePlanner(300)
+        with patch.object(scheduler_module, "_write_jobs_batched") as write:
+            _register_existing_jobs(store)
+
+        _, _, rewritten = write.call_args.args
+        assert rewritten == []
+        assert sum(
+            sum(slots.values())
+            for slots in scheduler_module._fire_planner.load().values()
+        ) == len(schedules)
@@ -0,0 +1,205 @@
+"""
+Tests for FairShareDispatcher (shuffify.scheduler_dispatch).
+
+Covers:
+  - Users take turns; a user's backlog doesn't hold up other users
+  - Cheap job types are weighted ahead of raids
+  - Heavy job types never take the reserved workers
+  - Duplicate submissions are coalesced
+  - Queue-wait metrics per job type
+  - Worker threads run submitted jobs
+"""
+
+import threading
+
+import pytest
+
+from shuffify.scheduler_dispatch import (
+    DEFAULT_JOB_TYPE_WEIGHTS,
+    FairShareDispatcher,
+    parse_weights,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _dispatcher(workers=4, reserved_workers=1, clock=None):
+    return FairShareDispatcher(
+        run=lambda schedule_id: None,
+        workers=workers,
+        reserved_workers=reserved_workers,
+        clock=clock or FakeClock(),
+        start=False,
+    )
+
+
+def _drain(dispatcher, limit=100):
+    """Take jobs one at a time, finishing each before the next."""
+    order = []
+    for _ in range(limit):
+        with dispatcher._cond:
+            job = dispatcher._take()
+            if job is None:
+                return order
+            dispatcher._finish(job)
+        order.append(job.schedule_id)
+    return order
+
+
+class TestOrdering:
+    def test_users_take_turns(self):
+        dispatcher = _dispatcher()
+        for schedule_id in range(1, 6):
+            dispatcher.submit(schedule_id, user_id=1, job_type="shuffle")
+        dispatcher.submit(100, user_id=2, job_type="shuffle")
+
+        order = _drain(dispatcher)
+
+        assert order.index(100) <= 1
+
+    def test_cheap_jobs_run_ahead_of_raids(self):
+        dispatcher = _dispatcher()
+        for schedule_id in range(1, 5):
+            dispatcher.submit(schedule_id, user_id=schedule_id, job_type="raid")
+        dispatcher.submit(50, user_id=50, job_type="shuffle")
+        dispatcher.submit(51, user_id=50, job_type="shuffle")
+
+        order = _drain(dispatcher)
+
+        # Each raid costs its user a full stride; the shuffle user's two
+        # jobs together cost half of one.
+        assert order[:2] == [50, 51]
+
+    def test_own_shuffle_not_stuck_behind_own_raids(self):
+        dispatcher = _dispatcher()
+        for schedule_id in range(1, 6):
+            dispatcher.submit(schedule_id, user_id=1, job_type="raid")
+        dispatcher.submit(9, user_id=1, job_type="shuffle")
+
+        assert _drain(dispatcher).index(9) <= 1
+
+
+class TestCapacity:
+    def test_raids_leave_reserved_workers_free(self):
+        dispatcher = _dispatcher(workers=3, reserved_workers=1)
+        for schedule_id in range(1, 5):
+            dispatcher.submit(schedule_id, user_id=schedule_id, job_type="raid")
+        dispatcher.submit(9, user_id=9, job_type="shuffle")
+
+        with dispatcher._cond:
+            started = [dispatcher._take() for _ in range(3)]
+
+        assert sorted(job.job_type for job in started) == ["raid", "raid", "shuffle"]
+        assert dispatcher.metrics()["heavy_running"] == 2
+        with dispatcher._cond:
+            assert dispatcher._take() is None
+
+    def test_duplicate_submission_is_coalesced(self):
+        dispatcher = _dispatcher()
+        assert dispatcher.submit(1, user_id=1, job_type="shuffle") is True
+        assert dispatcher.submit(1, user_id=1, job_type="shuffle") is False
+
+        with dispatcher._cond:
+            job = dispatcher._take()
+        assert dispatcher.submit(1, user_id=1, job_type="shuffle") is False
+
+        with dispatcher._cond:
+            dispatcher._finish(job)
+        assert dispatcher.submit(1, user_id=1, job_type="shuffle") is True
+
+
+class TestMetrics:
+    def test_wait_times_per_job_type(self):
+        clock = FakeClock()
+        dispatcher = _dispatcher(clock=clock)
+        dispatcher.submit(1, user_id=1, job_type="raid")
+        dispatcher.submit(2, user_id=2, job_type="shuffle")
+        clock.now = 3.0
+        _drain(dispatcher)
+
+        metrics = dispatcher.metrics()
+        assert metrics["queued"] == 0
+        assert metrics["wait_seconds"]["raid"] == {
+            "count": 1,
+            "avg_seconds": 3.0,
+            "max_seconds": 3.0,
+        }
+        assert metrics["wait_seconds"]["shuffle"]["count"] == 1
+
+
+class TestWorkers:
+    def test_workers_run_submitted_jobs(self):
+        ran = []
+        done = threading.Event()
+
+        def run(schedule_id):
+            ran.append(schedule_id)
+            if len(ran) == 3:
+                done.set()
+
+        dispatcher = FairShareDispatcher(run, workers=2)
+        try:
+            for schedule_id in (1, 2, 3):
+                dispatcher.submit(schedule_id, user_id=schedule_id, job_type="drip")
+            assert done.wait(5)
+        finally:
+            dispatcher.shutdown(wait=True)
+
+        assert sorted(ran) == [1, 2, 3]
+
+    def test_failing_job_does_not_kill_worker(self):
+        done = threading.Event()
+
+        def run(schedule_id):
+            if schedule_id == 1:
+                raise RuntimeError("boom")
+            done.set()
+
+        dispatcher = FairShareDispatcher(run, workers=1)
+        try:
+            dispatcher.submit(1, user_id=1, job_type="shuffle")
+            dispatcher.submit(2, user_id=1, job_type="shuffle")
+            assert done.wait(5)
+        finally:
+            dispatcher.shutdown(wait=True)
+
+    def test_on_done_reports_each_outcome(self):
+        outcomes = []
+        done = threading.Event()
+
+        def run(schedule_id):
+            if schedule_id == 1:
+                raise RuntimeError("boom")
+
+        def on_done(schedule_id, error):
+            outcomes.append((schedule_id, type(error).__name__ if error else None))
+            if len(outcomes) == 2:
+                done.set()
+
+        dispatcher = FairShareDispatcher(run, workers=1, on_done=on_done)
+        try:
+            dispatcher.submit(1, user_id=1, job_type="shuffle")
+            dispatcher.submit(2, user_id=1, job_type="shuffle")
+            assert done.wait(5)
+        finally:
+            dispatcher.shutdown(wait=True)
+
+        assert outcomes == [(1, "RuntimeError"), (2, None)]
+
+
+class TestParseWeights:
+    def test_overrides_listed_types_only(self):
+        weights = parse_weights("shuffle=8, raid=0.5")
+        assert weights["shuffle"] == 8.0
+        assert weights["raid"] == 0.5
+        assert weights["drip"] == DEFAULT_JOB_TYPE_WEIGHTS["drip"]
+
+    def test_rejects_non_positive(self):
+        with pytest.raises(ValueError):
+            parse_weights("raid=0")
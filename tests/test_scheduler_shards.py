@@ -0,0 +1,281 @@
+"""
+Tests for sharded scheduling (shuffify.scheduler_shards) and the
+scheduler's sharded job sync.
+
+Covers:
+  - shard_for is stable and in range
+  - Workers split the shards fairly and every shard has one owner
+  - A joining worker is handed shards; a dead worker's shards are taken over
+  - A lock-connection failure gives up every shard
+  - _sync_sharded_jobs registers only owned, enabled schedules
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+import shuffify.scheduler as scheduler_module
+from shuffify.scheduler_shards import (
+    MEMBER_LOCK_CLASS,
+    ShardCoordinator,
+    shard_for,
+)
+
+
+class FakeLockServer:
+    """In-memory stand-in for Postgres session-level advisory locks."""
+
+    def __init__(self):
+        self.holders = {}
+
+    def session(self):
+        return FakeLocks(self)
+
+
+class FakeLocks:
+    def __init__(self, server):
+        self.server = server
+        self.closed = False
+
+    def try_lock(self, namespace, key):
+        holder = self.server.holders.get((namespace, key))
+        if holder is not None and holder is not self:
+            return False
+        self.server.holders[(namespace, key)] = self
+        return True
+
+    def unlock(self, namespace, key):
+        if self.server.holders.get((namespace, key)) is self:
+            del self.server.holders[(namespace, key)]
+
+    def count_holders(self, namespace):
+        return sum(1 for ns, _ in self.server.holders if ns == namespace)
+
+    def close(self):
+        self.closed = True
+        for lock, holder in list(self.server.holders.items()):
+            if holder is self:
+                del self.server.holders[lock]
+
+
+def _worker(server, shard_count=16):
+    return ShardCoordinator(server.session, shard_count=shard_count)
+
+
+def _rebalance_all(workers, rounds=2):
+    # Workers shed before others can claim, so it takes a couple of
+    # rounds to converge, as it would across rebalance ticks.
+    for _ in range(rounds):
+        for worker in workers:
+            worker.rebalance()
+
+
+def _assert_partition(workers, shard_count):
+    owned = [w.owned for w in workers]
+    assert sum(len(o) for o in owned) == shard_count
+    assert frozenset().union(*owned) == set(range(shard_count))
+
+
+# =============================================================================
+# shard_for
+# =============================================================================
+
+
+class TestShardFor:
+    def test_stable_and_in_range(self):
+        shards = {shard_for(f"pl{i}", 16) for i in range(200)}
+        assert shards <= set(range(16))
+        assert len(shards) > 8
+        assert shard_for("pl1", 16) == shard_for("pl1", 16)
+
+
+# =============================================================================
+# ShardCoordinator
+# =============================================================================
+
+
+class TestShardCoordinator:
+    def test_single_worker_owns_every_shard(self):
+        worker = _worker(FakeLockServer())
+        gained, lost = worker.rebalance()
+
+        assert worker.owned == set(range(16))
+        assert gained == set(range(16))
+        assert lost == set()
+
+    def test_workers_split_shards_fairly(self):
+        server = FakeLockServer()
+        workers = [_worker(server) for _ in range(3)]
+        _rebalance_all(workers)
+
+        _assert_partition(workers, 16)
+        assert all(len(w.owned) <= 6 for w in workers)
+
+    def test_joining_worker_is_handed_shards(self):
+        server = FakeLockServer()
+        first = _worker(server)
+        first.rebalance()
+        second = _worker(server)
+
+        _rebalance_all([second, first, second])
+
+        _assert_partition([first, second], 16)
+        assert len(first.owned) == len(second.owned) == 8
+
+    def test_released_shards_reported_before_unlock(self):
+        server = FakeLockServer()
+        first = _worker(server)
+        first.rebalance()
+        _worker(server).rebalance()  # joins, finds nothing free yet
+
+        seen = []
+
+        def before_release(shards):
+            # Still held while the caller drops their jobs.
+            assert all(
+                server.holders[(ns, key)] is first._locks
+                for ns, key in server.holders
+                if key in shards and ns != MEMBER_LOCK_CLASS
+            )
+            seen.append(set(shards))
+
+        _, lost = first.rebalance(before_release=before_release)
+
+        assert seen == [lost]
+        assert len(lost) == 8
+
+    def test_dead_worker_shards_are_taken_over(self):
+        server = FakeLockServer()
+        workers = [_worker(server) for _ in range(2)]
+        _rebalance_all(workers)
+
+        workers[1].leave()
+        workers[0].rebalance()
+
+        assert workers[0].owned == set(range(16))
+
+    def test_connection_failure_gives_up_all_shards(self):
+        server = FakeLockServer()
+        worker = _worker(server)
+        worker.rebalance()
+        worker._locks.count_holders = MagicMock(
+            side_effect=RuntimeError("connection lost")
+        )
+
+        dropped = []
+        gained, lost = worker.rebalance(before_release=dropped.append)
+
+        assert worker.owned == set()
+        assert lost == set(range(16))
+        assert dropped == [set(range(16))]
+        assert server.holders == {}
+
+    def test_rejects_zero_shards(self):
+        with pytest.raises(ValueError):
+            ShardCoordinator(FakeLockServer().session, shard_count=0)
+
+
+# =============================================================================
+# Scheduler integration
+# =============================================================================
+
+
+@pytest.fixture
+def sharded_scheduler():
+    """A mock scheduler wired to a two-worker shard ring (this worker first)."""
+    server = FakeLockServer()
+    coordinator = _worker(server, shard_count=4)
+    other = _worker(server, shard_count=4)
+    _rebalance_all([coordinator, other])
+
+    scheduler_module._scheduler = MagicMock()
+    scheduler_module._shard_coordinator = coordinator
+    scheduler_module._sharded_jobs.clear()
+    yield scheduler_module._scheduler, coordinator
+    scheduler_module._scheduler = None
+    scheduler_module._shard_coordinator = None
+    scheduler_module._sharded_jobs.clear()
+
+
+def _add_schedules(count, **overrides):
+    from shuffify.models.db import Schedule, User, db
+
+    user = User(spotify_id="shard_user", display_name="Shard")
+    db.session.add(user)
+    db.session.flush()
+    schedules = []
+    for i in range(count):
+        schedule = Schedule(
+            user_id=user.id,
+            job_type="shuffle",
+            target_playlist_id=f"pl{i}",
+            schedule_type="interval",
+            schedule_value="daily",
+            **overrides,
+        )
+        db.session.add(schedule)
+        schedules.append(schedule)
+    db.session.commit()
+    return schedules
+
+
+class TestShardedJobSync:
+    def test_registers_only_owned_schedules(self, db_app, sharded_scheduler):
+        scheduler, coordinator = sharded_scheduler
+        schedules = _add_schedules(20)
+
+        scheduler_module._sync_sharded_jobs()
+
+        expected = {
+            f"schedule_{s.id}"
+            for s in schedules
+            if coordinator.owns(s.target_playlist_id)
+        }
+        registered = {
+            call.kwargs["id"] for call in scheduler.add_job.call_args_list
+        }
+        assert registered == expected
+        assert 0 < len(expected) < 20
+
+    def test_unchanged_jobs_are_left_alone(self, db_app, sharded_scheduler):
+        scheduler, _ = sharded_scheduler
+        _add_schedules(20)
+
+        scheduler_module._sync_sharded_jobs()
+        first = scheduler.add_job.call_count
+        scheduler_module._sync_sharded_jobs()
+
+        assert scheduler.add_job.call_count == first
+
+    def test_disabled_schedule_is_removed(self, db_app, sharded_scheduler):
+        from shuffify.models.db import db
+
+        scheduler, coordinator = sharded_scheduler
+        schedules = _add_schedules(20)
+        scheduler_module._sync_sharded_jobs()
+
+        owned = next(
+            s for s in schedules if coordinator.owns(s.target_playlist_id)
+        )
+        owned.is_enabled = False
+        db.session.commit()
+        scheduler_module._sync_sharded_jobs()
+
+        scheduler.remove_job.assert_any_call(f"schedule_{owned.id}")
+        assert f"schedule_{owned.id}" not in scheduler_module._sharded_jobs
+
+    def test_add_job_skips_schedules_owned_elsewhere(self, sharded_scheduler):
+        scheduler, coordinator = sharded_scheduler
+        foreign = next(
+            f"pl{i}" for i in range(100) if not coordinator.owns(f"pl{i}")
+        )
+        schedule = MagicMock(
+            id=7,
+            target_playlist_id=foreign,
+            schedule_type="interval",
+            schedule_value="daily",
+        )
+
+        scheduler_module.add_job_for_schedule(schedule)
+
+        scheduler.add_job.assert_not_called()
@@ -0,0 +1,208 @@
+"""
+Tests for firing-time smoothing (shuffify.scheduler_smoothing) and its
+scheduler integration.
+
+Covers:
+  - OffsetTrigger shifts every firing and survives pickling
+  - FirePlanner offsets are deterministic, stay in the window, and spread
+    colliding schedules within the per-slot budget
+  - FireHistogram counts firings per minute and keeps a bounded history
+  - add_job_for_schedule wraps triggers when smoothing is on
+"""
+
+import pickle
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+import shuffify.scheduler as scheduler_module
+from shuffify.scheduler_smoothing import (
+    FireHistogram,
+    FirePlanner,
+    OffsetTrigger,
+)
+
+UTC = timezone.utc
+
+
+def _daily_at_nine():
+    return CronTrigger(hour=9, minute=0, timezone=UTC)
+
+
+# =============================================================================
+# OffsetTrigger
+# =============================================================================
+
+
+class TestOffsetTrigger:
+    def test_shifts_each_firing(self):
+        trigger = OffsetTrigger(_daily_at_nine(), 150)
+        now = datetime(2026, 1, 1, 8, 0, tzinfo=UTC)
+
+        first = trigger.get_next_fire_time(None, now)
+        second = trigger.get_next_fire_time(first, first)
+
+        assert first == datetime(2026, 1, 1, 9, 2, 30, tzinfo=UTC)
+        assert second == first + timedelta(days=1)
+
+    def test_fires_after_base_time_within_offset(self):
+        # 09:01 is past the base firing but before the shifted one.
+        trigger = OffsetTrigger(_daily_at_nine(), 150)
+        now = datetime(2026, 1, 1, 9, 1, tzinfo=UTC)
+
+        assert trigger.get_next_fire_time(None, now) == datetime(
+            2026, 1, 1, 9, 2, 30, tzinfo=UTC
+        )
+
+    def test_pickles(self):
+        trigger = OffsetTrigger(IntervalTrigger(hours=6, timezone=UTC), 42)
+        restored = pickle.loads(pickle.dumps(trigger))
+
+        assert restored.offset_seconds == 42
+        assert str(restored) == str(trigger)
+
+
+# =============================================================================
+# FirePlanner
+# =============================================================================
+
+
+class TestFirePlanner:
+    def test_offset_is_deterministic_and_in_window(self):
+        offsets = [
+            FirePlanner(300).offset_for(17, _daily_at_nine()) for _ in range(3)
+        ]
+        assert len(set(offsets)) == 1
+        assert 0 <= offsets[0] < 300
+
+    def test_colliding_schedules_respect_budget(self):
+        planner = FirePlanner(300, slot_seconds=60, budget=4)
+        offsets = [
+            planner.offset_for(i, _daily_at_nine()) for i in range(20)
+        ]
+
+        per_slot = {}
+        for offset in offsets:
+            per_slot[offset // 60] = per_slot.get(offset // 60, 0) + 1
+        assert per_slot == {0: 4, 1: 4, 2: 4, 3: 4, 4: 4}
+
+    def test_overflow_goes_to_least_loaded_slot(self):
+        planner = FirePlanner(120, slot_seconds=60, budget=1)
+        for i in range(5):
+            planner.offset_for(i, _daily_at_nine())
+
+        (bucket,) = planner.load()
+        assert sorted(planner.load()[bucket].values()) == [2, 3]
+
+    def test_schedules_due_at_other_minutes_do_not_compete(self):
+        planner = FirePlanner(60, slot_seconds=60, budget=1)
+        planner.offset_for(1, _daily_at_nine())
+        planner.offset_for(2, CronTrigger(hour=10, minute=0, timezone=UTC))
+
+        assert all(
+            count == 1
+            for slots in planner.load().values()
+            for count in slots.values()
+        )
+
+    def test_replanning_releases_the_old_slot(self):
+        planner = FirePlanner(300, budget=1)
+        planner.offset_for(1, _daily_at_nine())
+        planner.offset_for(1, _daily_at_nine())
+
+        assert sum(
+            sum(slots.values()) for slots in planner.load().values()
+        ) == 1
+
+        planner.forget(1)
+        assert planner.load() == {}
+
+    def test_rejects_empty_window(self):
+        with pytest.raises(ValueError):
+            FirePlanner(0)
+
+
+# =============================================================================
+# FireHistogram
+# =============================================================================
+
+
+class TestFireHistogram:
+    def test_counts_per_minute(self):
+        histogram = FireHistogram()
+        base = datetime(2026, 1, 1, 9, 0, tzinfo=UTC)
+        for seconds in (0, 10, 59, 61):
+            histogram.record(base + timedelta(seconds=seconds))
+
+        assert histogram.snapshot() == {
+            "2026-01-01T09:00": 3,
+            "2026-01-01T09:01": 1,
+        }
+
+    def test_keeps_bounded_history(self):
+        histogram = FireHistogram(minutes=3)
+        base = datetime(2026, 1, 1, 9, 0, tzinfo=UTC)
+        for minute in (4, 0, 1, 3, 2):
+            histogram.record(base + timedelta(minutes=minute))
+
+        assert list(histogram.snapshot()) == [
+            "2026-01-01T09:02",
+            "2026-01-01T09:03",
+            "2026-01-01T09:04",
+        ]
+
+
+# =============================================================================
+# Scheduler integration
+# =============================================================================
+
+
+@pytest.fixture
+def smoothed_scheduler():
+    mock_sched = MagicMock()
+    mock_sched.timezone = UTC
+    scheduler_module._scheduler = mock_sched
+    scheduler_module._fire_planner = FirePlanner(300)
+    scheduler_module._fire_histogram.clear()
+    yield mock_sched
+    scheduler_module._scheduler = None
+    scheduler_module._fire_planner = None
+    scheduler_module._fire_histogram.clear()
+
+
+class TestSchedulerIntegration:
+    def test_add_job_wraps_trigger_in_offset(self, smoothed_scheduler):
+        schedule = Mock(id=5, schedule_type="cron", schedule_value="0 9 * * *")
+
+        scheduler_module.add_job_for_schedule(schedule)
+
+        trigger = smoothed_scheduler.add_job.call_args.kwargs["trigger"]
+        assert isinstance(trigger, OffsetTrigger)
+        assert isinstance(trigger.trigger, CronTrigger)
+        assert 0 <= trigger.offset_seconds < 300
+
+    def test_remove_job_releases_slot(self, smoothed_scheduler):
+        schedule = Mock(id=5, schedule_type="interval", schedule_value="daily")
+        scheduler_module.add_job_for_schedule(schedule)
+
+        scheduler_module.remove_job_for_schedule(5)
+
+        assert scheduler_module._fire_planner.load() == {}
+
+    def test_submitted_schedule_jobs_feed_histogram(self, smoothed_scheduler):
+        run_time = datetime(2026, 1, 1, 9, 3, tzinfo=UTC)
+        scheduler_module._on_job_submitted(
+            Mock(job_id="schedule_5", scheduled_run_times=[run_time])
+        )
+        scheduler_module._on_job_submitted(
+            Mock(
+                job_id=scheduler_module.SHARD_REBALANCE_JOB_ID,
+                scheduled_run_times=[run_time],
+            )
+        )
+
+        metrics = scheduler_module.get_scheduler_metrics()
+        assert metrics["fires_per_minute"] == {"2026-01-01T09:03": 1}
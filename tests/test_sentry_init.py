@@ -636,6 +636,10 @@ class TestSecretPolicyDoesNotRot:
         "SESSION_KEY_PREFIX",  # ditto
         "SPOTIFY_REDIRECT_URI",  # public; registered in the Spotify dashboard
         "SENTRY_DSN",  # write-only ingest key, public by Sentry's own design
+        "ACCESS_TOKEN_CACHE_ENABLED",  # a feature flag
+        "ACCESS_TOKEN_REFRESH_MARGIN",  # seconds
+        "CACHE_URI_INDEX_ENABLED",  # a feature flag (track URIs, not a URL)
+        "CACHE_URI_INDEX_TTL",  # seconds
     }
 
     def test_every_secret_shaped_config_attr_is_classified(self):